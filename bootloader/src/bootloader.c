@@ -43,6 +43,8 @@
 #define COMMAND_STATE       2
 #define UPDATING_STATE      3
 #define DUMPING_STATE       4
+#define STREAMING_STATE     5
+#define UPDATING_RLE_STATE  6
 
 // How long to wait for an ISP connection before booting into APROM
 #define Timer0Out_Counter 200 // About 1 second
@@ -59,6 +61,8 @@ volatile uint16_t __data g_timer0Counter;
 volatile uint16_t __data g_checksum; // spec doesn't specify length of checksum, but ISP tools check for a 16-bit number
 volatile uint16_t __data g_totalchecksum; // spec doesn't specify length of checksum, but ISP tools check for a 16-bit number
 volatile uint8_t __data g_packNo[2] = {0,0};
+volatile uint8_t __data g_streamWindow;
+volatile uint16_t __data g_rleRun;
 volatile __bit bUartDataReady;
 volatile __bit g_timer0Over;
 volatile __bit g_timer1Over;
@@ -331,7 +335,7 @@ void Timer0_ISR(void) __interrupt(1)
 
 unsigned int __xdata start_address, end_address;
 
-void dump(void)
+void read_chunk(void)
 {
   uint16_t addr;
   for (count = 8; count < 64; count++)
@@ -342,56 +346,138 @@ void dump(void)
     IAPAH = (addr >> 8) & 0xff;
     ISP_SET_IAPGO;
     uart_txbuf[count] = IAPFD;
-    // g_totalchecksum+=uart_txbuf[count];
+    g_totalchecksum += uart_txbuf[count];
     if (++current_address == end_address)
     {
       g_state = COMMAND_STATE;
       break;
     }
   }
+}
+
+void dump(void)
+{
+  read_chunk();
   Package_checksum();
   Send_64byte_To_UART0();
 }
 
-void update(uint8_t start_count)
+// Send up to g_streamWindow data packets without waiting for the host in between
+void stream(void)
 {
-  for (count = start_count; count < PACKSIZE; count++)
+  uint8_t n = g_streamWindow;
+  do
+  {
+    read_chunk();
+    Package_checksum();
+    uart_txbuf[0] = LOBYTE(g_totalchecksum);
+    uart_txbuf[1] = HIBYTE(g_totalchecksum);
+    Send_64byte_To_UART0();
+  } while (--n && g_state == STREAMING_STATE);
+}
+
+void erase_ap(uint16_t addr, uint16_t end_addr);
+
+// Erase the page containing addr, unless it is already blank
+void prepare_page(uint16_t addr)
+{
+  uint8_t i;
+  addr &= PAGE_MASK;
+  IAPCN = BYTE_READ_AP;
+  IAPAL = LOBYTE(addr);
+  IAPAH = HIBYTE(addr);
+  for (i = 0; i < PAGE_SIZE; i++)
+  {
+    ISP_SET_IAPGO;
+    if (IAPFD != 0xFF)
+    {
+      erase_ap(addr, addr + PAGE_SIZE);
+      return;
+    }
+    IAPAL++;
+  }
+}
+
+// Program one byte at current_address; 0xFF is skipped, since the page is erased before its first byte
+void program_byte(uint8_t b)
+{
+  // erase each page just before its first byte is written
+  if ((current_address & ~PAGE_MASK) == 0 || current_address == start_address)
+    prepare_page(current_address);
+  if (b != 0xFF)
   {
-    // g_timer0Counter=Timer0Out_Counter;
     IAPCN = BYTE_PROGRAM_AP; // Program byte
     IAPAL = current_address & 0xff;
     IAPAH = (current_address >> 8) & 0xff;
-    IAPFD = uart_rcvbuf[count];
+    IAPFD = b;
 
     ISP_SET_IAPGO;
 
     IAPCN = BYTE_READ_AP; // Verify program byte
 
-    if (IAPFD != uart_rcvbuf[count]) // if not correct
+    if (IAPFD != b) // if not correct
       while (1)
         ; // Error state, loop forever
     // if (CHPCON==0x43)              //if error flag set, program error stop ISP
     // while(1);
+  }
 
-    g_totalchecksum = g_totalchecksum + uart_rcvbuf[count];
-    current_address++;
+  g_totalchecksum = g_totalchecksum + b;
+  current_address++;
 
-    if (current_address == end_address)
-    {
-      g_state = COMMAND_STATE;
-      // Specification implies that this shouldn't boot the APROM after programming.
-      // if (start_count != INITIAL_UPDATE_PKT_START){
-      //   g_timer0Over =1; // boot APROM
-      // }
-      break;
-    }
+  if (current_address == end_address)
+  {
+    g_state = COMMAND_STATE;
+    // Specification implies that this shouldn't boot the APROM after programming.
+    // if (start_count != INITIAL_UPDATE_PKT_START){
+    //   g_timer0Over =1; // boot APROM
+    // }
   }
+}
+
+void send_update_ack(void)
+{
   Package_checksum();
   uart_txbuf[8] = g_totalchecksum & 0xff;
   uart_txbuf[9] = (g_totalchecksum >> 8) & 0xff;
   Send_64byte_To_UART0();
 }
 
+void update(uint8_t start_count)
+{
+  for (count = start_count; count < PACKSIZE && g_state == UPDATING_STATE; count++)
+  {
+    // g_timer0Counter=Timer0Out_Counter;
+    program_byte(uart_rcvbuf[count]);
+  }
+  send_update_ack();
+}
+
+// Expand the 0xFF run-length tokens of a CMD_UPDATE_RLE packet (see isp_common.h)
+void update_rle(uint8_t start_count)
+{
+  uint8_t token;
+  count = start_count;
+  while (count < PACKSIZE && g_state == UPDATING_RLE_STATE)
+  {
+    token = uart_rcvbuf[count++];
+    if (token == RLE_END)
+      break;
+    if (token & RLE_RUN)
+    {
+      g_rleRun = ((uint16_t)(token & 0x7F) << 8) | uart_rcvbuf[count++];
+      while (g_rleRun-- && g_state == UPDATING_RLE_STATE)
+        program_byte(0xFF);
+    }
+    else
+    {
+      while (token-- && g_state == UPDATING_RLE_STATE)
+        program_byte(uart_rcvbuf[count++]);
+    }
+  }
+  send_update_ack();
+}
+
 void set_addrs(void)
 {
   start_address = uart_rcvbuf[8];
@@ -520,6 +606,16 @@ void main(void)
         update(8);
         goto _end_of_switch;
       }
+      else if (g_state == STREAMING_STATE)
+      {
+        stream();
+        goto _end_of_switch;
+      }
+      else if (g_state == UPDATING_RLE_STATE)
+      {
+        update_rle(8);
+        goto _end_of_switch;
+      }
 
       switch (cmd)
       {
@@ -552,6 +648,13 @@ _CONN_COMMON:
         break;
       }
 
+      case CMD_GET_CAPS:
+      {
+        Package_checksum();
+        uart_txbuf[8] = CAP_LAZY_ERASE | CAP_STREAM_READ | CAP_RLE_UPDATE;
+        Send_64byte_To_UART0();
+        break;
+      }
       case CMD_GET_FWVER:
       {
         Package_checksum();
@@ -676,7 +779,17 @@ _CONN_COMMON:
         dump();
         break;
       }
+      case CMD_STREAM_READ:
+      {
+        set_addrs();
+        g_totalchecksum = 0;
+        g_streamWindow = uart_rcvbuf[STREAM_WINDOW_START] ? uart_rcvbuf[STREAM_WINDOW_START] : STREAM_DEFAULT_WINDOW;
+        g_state = STREAMING_STATE;
+        stream();
+        break;
+      }
       case CMD_UPDATE_APROM:
+      case CMD_UPDATE_RLE:
       {
         // g_timer0Counter=Timer0Out_Counter;
         set_addrs();
@@ -686,10 +799,19 @@ _CONN_COMMON:
           send_fail_packet();
           break;
         }
-        erase_ap((start_address & PAGE_MASK), end_address);
+        // pages are erased by program_byte() as their data arrives
+        set_IAPUEN_APUEN;
         g_totalchecksum = 0;
-        g_state = UPDATING_STATE;
-        update(16);
+        if (cmd == CMD_UPDATE_RLE)
+        {
+          g_state = UPDATING_RLE_STATE;
+          update_rle(16);
+        }
+        else
+        {
+          g_state = UPDATING_STATE;
+          update(16);
+        }
         break;
       }
       case CMD_ISP_PAGE_ERASE:
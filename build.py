@@ -226,6 +226,7 @@ def build(setup_kwargs):
                     "sources": [
                         "nuvo51icp/n51_icp.c",
                         "nuvo51icp/rpi.c",
+                        "nuvo51icp/rt_linux.c",
                         "nuvo51icp/main.c",
                     ],
                     "shared": True,
@@ -240,6 +241,7 @@ def build(setup_kwargs):
                     "sources": [
                         "nuvo51icp/n51_icp.c",
                         "nuvo51icp/rpi-pigpio.c",
+                        "nuvo51icp/rt_linux.c",
                         "nuvo51icp/main.c",
                     ],
                     "shared": True,
@@ -131,4 +131,9 @@ void N51PGM_print(const char * msg){
 #endif
 }
 
+int N51PGM_set_realtime(uint8_t enable, int cpu){
+    // nothing preempts the sketch, so it is always in "real-time mode"
+    return 0;
+}
+
 } // extern "C"
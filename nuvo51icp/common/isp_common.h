@@ -25,6 +25,15 @@
 #define CMD_GET_BANDGAP          0xb5 // non-official
 #define CMD_ISP_PAGE_ERASE       0xD5 // non-official
 #define CMD_GET_PID              0xeb // non-official
+#define CMD_STREAM_READ          0xa7 // non-official, see STREAM_* below
+#define CMD_UPDATE_RLE           0xa8 // non-official, see RLE_* below
+#define CMD_GET_CAPS             0xb6 // non-official, returns the CAP_* flags below in the first data byte
+
+// Capability flags returned by CMD_GET_CAPS
+#define CAP_LAZY_ERASE           0x01 // CMD_UPDATE_APROM erases each page just before writing it, skipping blank pages
+#define CAP_STREAM_READ          0x02 // CMD_STREAM_READ is supported
+#define CAP_RLE_UPDATE           0x04 // CMD_UPDATE_RLE is supported
+#define CAP_PIPELINED            0x08 // update packets are acknowledged before they are written, and reads are prefetched
 
 // Arduino ISP-to-ICP bridge only
 #define CMD_UPDATE_WHOLE_ROM     0xE1 // non-official
@@ -70,4 +79,22 @@
 #define DUMP_DATA_START          PKT_HEADER_END //(DUMP_PKT_CHECKSUM_START + DUMP_PKT_CHECKSUM_SIZE)
 #define DUMP_DATA_SIZE           56  //(PACKSIZE - DUMP_DATA_START)
 
+// CMD_STREAM_READ takes the same address and length as CMD_READ_ROM, plus a window size at STREAM_WINDOW_START.
+// The device answers with up to `window` data packets back-to-back, then waits for a CMD_FORMAT2_CONTINUATION
+// from the host before sending the next window. Instead of the command checksum, bytes 0-1 of every data packet
+// hold the 16-bit sum of all data bytes sent so far.
+#define STREAM_WINDOW_START      16
+#define STREAM_DEFAULT_WINDOW    16
+
+// CMD_UPDATE_RLE works like CMD_UPDATE_APROM, but the packet data is a stream of 0xFF run-length tokens; the length
+// is the expanded size. Tokens never span packets:
+//   0x00            end of the packet
+//   0x01 - 0x7F     literal: that many data bytes follow
+//   0x80 - 0xFF, n  run of ((token & 0x7F) << 8 | n) bytes of 0xFF, which are not written (the flash is erased)
+// The checksum in the ACK is the 16-bit sum of the expanded bytes.
+#define RLE_END                  0x00
+#define RLE_RUN                  0x80
+#define RLE_FLAGS_START          10   // in the first packet's address field
+#define RLE_FLAG_MASS_ERASE      0x01 // mass erase first, like CMD_UPDATE_WHOLE_ROM (ICP bridge only)
+
 #define CHECK_SEQUENCE_NO 1 // TODO: turn this on when we know the sequence number is working
\ No newline at end of file
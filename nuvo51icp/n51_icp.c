@@ -50,6 +50,10 @@ static uint32_t page_erase_hold_time = DEFAULT_PAGE_ERASE_HOLD_TIME;
 static uint32_t mass_erase_time = DEFAULT_MASS_ERASE_TIME;
 static uint32_t mass_erase_hold_time = DEFAULT_MASS_ERASE_HOLD_TIME;
 
+// Byte write timing, tracked in real-time mode
+static uint8_t track_jitter = 0;
+static uint32_t max_jitter = 0;
+
 #define ENTRY_BIT_DELAY 60
 
 // ICP Commands
@@ -370,9 +374,25 @@ uint32_t N51ICP_write_flash(uint32_t addr, uint32_t len, uint8_t *data)
 		return 0;
 	}
 	N51ICP_send_command(ICP_CMD_WRITE_FLASH, addr);
+	if (!track_jitter) {
+		for (uint32_t i = 0; i < len; i++) {
+			N51ICP_write_byte(data[i], i == (len-1), program_time, program_hold_time);
+		}
+		return addr + len;
+	}
+	// Every byte takes the same steps, so the fastest one is the baseline; anything slower was held up
+	uint64_t fastest = UINT64_MAX, slowest = 0;
 	for (uint32_t i = 0; i < len; i++) {
+		uint64_t start = N51PGM_get_time();
 		N51ICP_write_byte(data[i], i == (len-1), program_time, program_hold_time);
+		uint64_t elapsed = N51PGM_get_time() - start;
+		if (elapsed < fastest)
+			fastest = elapsed;
+		if (elapsed > slowest)
+			slowest = elapsed;
 	}
+	if (slowest - fastest > max_jitter)
+		max_jitter = slowest - fastest;
 
 	return addr + len;
 }
@@ -389,6 +409,23 @@ void N51ICP_page_erase(uint32_t addr)
 	N51ICP_write_byte(0xff, 1, page_erase_time, page_erase_hold_time);
 }
 
+int N51ICP_set_realtime(uint8_t enable, int cpu)
+{
+	track_jitter = enable;
+	max_jitter = 0;
+	return N51PGM_set_realtime(enable, cpu);
+}
+
+uint32_t N51ICP_get_max_jitter(void)
+{
+	return max_jitter;
+}
+
+void N51ICP_reset_jitter(void)
+{
+	max_jitter = 0;
+}
+
 void N51ICP_set_program_time(uint32_t delay_us, uint32_t hold_us)
 {
 	program_time = delay_us;
@@ -113,6 +113,30 @@ void N51ICP_set_page_erase_time(uint32_t delay_us, uint32_t hold_us);
 */
 void N51ICP_set_mass_erase_time(uint32_t delay_us, uint32_t hold_us);
 
+/**
+ * @brief     Enter or leave real-time mode.
+ * 
+ * @details   Runs the calling thread in real-time mode (see N51PGM_set_realtime()) and tracks the timing of every
+ *            byte written by N51ICP_write_flash().
+ * 
+ * @param enable If 1, enter real-time mode. If 0, leave it.
+ * @param cpu The CPU to pin the calling thread to, or -1 to leave the affinity alone.
+ * @return 0 on success, <0 if the PGM couldn't enter real-time mode (jitter is still tracked)
+ */
+int N51ICP_set_realtime(uint8_t enable, int cpu);
+
+/**
+ * @brief     Worst byte write jitter seen since real-time mode was entered or N51ICP_reset_jitter() was called.
+ * 
+ * @return    How much longer (in microseconds) the slowest byte of a write took than the fastest one.
+ */
+uint32_t N51ICP_get_max_jitter(void);
+
+/**
+ * @brief     Reset the jitter returned by N51ICP_get_max_jitter().
+ */
+void N51ICP_reset_jitter(void);
+
 /**
  * @brief      Puts the target chip into ICP mode.
  * 
@@ -57,6 +57,17 @@ uint64_t N51PGM_get_time(void);
 // Device-specific print function
 void N51PGM_print(const char *msg);
 
+/**
+ * Run the calling thread in real-time mode, or return it to normal scheduling. (Optionally implemented)
+ * 
+ * Locks the process memory, raises the thread to SCHED_FIFO and, if cpu >= 0, pins it to that CPU.
+ * 
+ * @param enable If 1, enter real-time mode. If 0, leave it.
+ * @param cpu The CPU to pin the thread to (ideally one isolated with isolcpus=), or -1 to leave the affinity alone.
+ * @return 0 on success, <0 on failure or if not supported.
+ */
+int N51PGM_set_realtime(uint8_t enable, int cpu);
+
 
 #ifdef __cplusplus
 }
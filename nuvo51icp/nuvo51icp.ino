@@ -27,6 +27,11 @@
 #ifndef CACHED_ROM_READ
 #define CACHED_ROM_READ 1
 #endif
+// Acknowledge each CMD_UPDATE_APROM continuation packet before writing it, and receive the next packet while
+// writing; set to 0 if your board's serial port drops bytes while the ICP lines are being bit-banged
+#ifndef PIPELINED_UPDATE
+#define PIPELINED_UPDATE 1
+#endif
 // connection timeout in milliseconds; 0 to disable
 #define CONNECTION_TIMEOUT 0
 
@@ -62,6 +67,7 @@
 #define COMMAND_STATE           4
 #define UPDATING_STATE          5
 #define DUMPING_STATE           6
+#define STREAMING_STATE         7
 
 uint8_t state;
 unsigned char rx_buf[PACKSIZE];
@@ -71,8 +77,13 @@ uint32_t g_packno = 0;
 int update_addr = 0x0000;
 uint32_t update_size = 0;
 uint16_t g_update_checksum = 0;
+bool lazy_erase = false;     // erase each page just before it is first written (CMD_UPDATE_APROM on an unlocked chip)
+uint32_t lazy_erase_end = 0; // pages below this address have already been prepared
+bool rle_update = false;     // the update packets hold CMD_UPDATE_RLE tokens
 int dump_addr = 0x0000;
 uint32_t dump_size = 0;
+uint8_t stream_window = STREAM_DEFAULT_WINDOW;
+uint16_t g_stream_checksum = 0;
 uint8_t cid;
 uint32_t saved_device_id;
 uint8_t connected = 0;
@@ -80,12 +91,20 @@ uint8_t just_connected = 0;
 unsigned long last_read_time = 0;
 unsigned long curr_time = 0;
 
+// Double buffering for reads: the next chunk is read over ICP while the UART is still sending the current packet
+unsigned char read_ahead_buf[DUMP_DATA_SIZE];
+int read_ahead_addr = 0;
+int read_ahead_len = 0;
 #if CACHED_ROM_READ
 byte read_buff[MAX_FLASH_SIZE];
-bool read_buff_valid = false;
-#define INVALIDATE_CACHE read_buff_valid = false
+uint8_t read_buff_valid[MAX_FLASH_SIZE / PAGE_SIZE / 8]; // one bit per page, filled as the pages are first read
+#define INVALIDATE_CACHE do { read_ahead_len = 0; memset(read_buff_valid, 0, sizeof(read_buff_valid)); } while (0)
 #else
-#define INVALIDATE_CACHE
+#define INVALIDATE_CACHE read_ahead_len = 0
+#endif
+#if PIPELINED_UPDATE
+unsigned char pending_buf[SEQ_UPDATE_PKT_SIZE];
+bool rx_during_write = false; // rx_buf is free to receive the next packet while the current one is written
 #endif
 
 #define XSTR(x) STR(x)
@@ -276,17 +295,127 @@ void send_pkt() {
 }
 
 
+// Move received bytes from the UART into rx_buf while a packet is being written to flash, so that the UART's own
+// buffer doesn't overflow. The last byte is left for loop() to read, which then handles the packet as usual.
+void poll_rx()
+{
+#if PIPELINED_UPDATE
+  while (rx_during_write && rx_bufhead < PACKSIZE - 1 && Serial.available())
+    rx_buf[rx_bufhead++] = Serial.read();
+#endif
+}
+
+// Erase the page at addr, unless it is already blank
+void prepare_page(uint32_t addr)
+{
+  unsigned char page[PAGE_SIZE];
+  N51ICP_read_flash(addr, PAGE_SIZE, page);
+  for (int i = 0; i < PAGE_SIZE; i++) {
+    if (page[i] != 0xFF) {
+      DEBUG_PRINT("erasing page 0x%04x\n", addr);
+      N51ICP_page_erase(addr);
+      return;
+    }
+  }
+}
+
+// erase the pages the update is about to write to, rather than the whole range up front
+void prepare_pages(uint32_t end_addr)
+{
+  while (lazy_erase && lazy_erase_end < end_addr) {
+    prepare_page(lazy_erase_end);
+    lazy_erase_end += PAGE_SIZE;
+    poll_rx();
+  }
+}
+
 void update(unsigned char* data, int len)
 {
   int n = len > update_size ? update_size : len;
+  prepare_pages((uint32_t)update_addr + n);
   DEBUG_PRINT("writing %d bytes to flash at addr 0x%04x\n", n, update_addr);
-  update_addr = N51ICP_write_flash(update_addr, n, data);
+  // write in small pieces so poll_rx() keeps up with the UART
+  for (int i = 0; i < n; i += 8) {
+    update_addr = N51ICP_write_flash(update_addr, n - i > 8 ? 8 : n - i, &data[i]);
+    poll_rx();
+  }
   // update the checksum
   for (int i = 0; i < n; i++)
     g_update_checksum += data[i];
   update_size -= n;
 }
 
+// Skip over n bytes of 0xFF; the flash they land on is erased, so there is nothing to write
+void update_skip(uint32_t n)
+{
+  if (n > update_size)
+    n = update_size;
+  prepare_pages((uint32_t)update_addr + n);
+  update_addr += n;
+  g_update_checksum += 0xFF * n;
+  update_size -= n;
+}
+
+// Expand the 0xFF run-length tokens of a CMD_UPDATE_RLE packet (see isp_common.h)
+void update_rle(unsigned char* data, int len)
+{
+  int i = 0;
+  while (i < len && update_size > 0) {
+    uint8_t token = data[i++];
+    if (token == RLE_END)
+      break;
+    if (token & RLE_RUN) {
+      if (i >= len)
+        break;
+      update_skip(((uint32_t)(token & 0x7F) << 8) | data[i++]);
+    } else {
+      int n = token > len - i ? len - i : token;
+      update(&data[i], n);
+      i += n;
+    }
+  }
+}
+
+void update_packet(unsigned char* data, int len)
+{
+  if (rle_update)
+    update_rle(data, len);
+  else
+    update(data, len);
+}
+
+#if PIPELINED_UPDATE
+// What update_packet() will add to g_update_checksum, worked out without touching the flash so the packet can be
+// acknowledged before it is written
+uint16_t packet_sum(unsigned char* data, int len)
+{
+  uint16_t sum = 0;
+  uint32_t left = update_size;
+  int i = 0;
+  while (i < len && left > 0) {
+    uint32_t n = len - i;
+    if (rle_update) {
+      uint8_t token = data[i++];
+      if (token == RLE_END || ((token & RLE_RUN) && i >= len))
+        break;
+      if (token & RLE_RUN) {
+        n = ((uint32_t)(token & 0x7F) << 8) | data[i++];
+        n = n > left ? left : n;
+        sum += 0xFF * n;
+        left -= n;
+        continue;
+      }
+      n = token > len - i ? len - i : token;
+    }
+    n = n > left ? left : n;
+    for (uint32_t j = 0; j < n; j++)
+      sum += data[i++];
+    left -= n;
+  }
+  return sum;
+}
+#endif
+
 
 
 uint32_t get_aprom_size(){
@@ -296,34 +425,44 @@ uint32_t get_aprom_size(){
   return flash_info_get_aprom_size(flash_info, get_ldrom_size(&flags));
 }
 
-void dump()
+// Read n bytes of flash at addr, through the ROM cache if there is one
+void read_chunk(int addr, int n, unsigned char * buf)
 {
-  unsigned char * data_buf = tx_buf + DUMP_DATA_START;
-  int n = DUMP_DATA_SIZE > dump_size ? dump_size : DUMP_DATA_SIZE;
-
-  // uint16_t checksum = 0;
-
 #if CACHED_ROM_READ
-  // hack to make reads faster
-  if (!read_buff_valid) {
-    uint32_t device_id = N51ICP_read_device_id();
-    const flash_info_t * flash_info = get_flash_info(device_id);
-    if (flash_info == NULL) {
-      DEBUG_PRINT("Failed to get flash info for device 0x%04x\n", N51ICP_read_device_id());
-      fail_pkt();
-      return;
+  // only the pages this chunk touches are read over ICP, so the first reply isn't held up by caching the whole ROM
+  for (uint32_t page = addr & PAGE_MASK; page < (uint32_t)addr + n; page += PAGE_SIZE) {
+    uint8_t bit = 1 << ((page / PAGE_SIZE) & 7);
+    if (!(read_buff_valid[page / PAGE_SIZE / 8] & bit)) {
+      N51ICP_read_flash(page, PAGE_SIZE, &read_buff[page]);
+      read_buff_valid[page / PAGE_SIZE / 8] |= bit;
     }
-    DEBUG_PRINT("Caching rom...\n");
-    // we're going to read the entire thing into memory
-    uint32_t read_chunk = flash_info->memory_size;
-    N51ICP_read_flash(0, flash_info->memory_size, read_buff);
-    read_buff_valid = true;
   }
-  memcpy(data_buf, &read_buff[dump_addr], n);
-  dump_addr += n;
+  memcpy(buf, &read_buff[addr], n);
 #else
-  dump_addr = N51ICP_read_flash(dump_addr, n, data_buf);
+  N51ICP_read_flash(addr, n, buf);
 #endif
+}
+
+// Read the chunk the next dump() will send while the packet that was just queued is still going out over the UART
+void read_ahead()
+{
+  read_ahead_len = dump_size > DUMP_DATA_SIZE ? DUMP_DATA_SIZE : dump_size;
+  read_ahead_addr = dump_addr;
+  if (read_ahead_len > 0)
+    read_chunk(read_ahead_addr, read_ahead_len, read_ahead_buf);
+}
+
+void dump()
+{
+  unsigned char * data_buf = tx_buf + DUMP_DATA_START;
+  int n = DUMP_DATA_SIZE > dump_size ? dump_size : DUMP_DATA_SIZE;
+
+  if (read_ahead_len >= n && read_ahead_addr == dump_addr)
+    memcpy(data_buf, read_ahead_buf, n);
+  else
+    read_chunk(dump_addr, n, data_buf);
+  read_ahead_len = 0;
+  dump_addr += n;
   dump_size -= n;
 }
 
@@ -352,6 +491,9 @@ const char * cmd_enum_to_string(int cmd)
     case CMD_GET_CID: return "CMD_GET_CID";
     case CMD_GET_UCID: return "CMD_GET_UCID";
     case CMD_ISP_PAGE_ERASE: return "CMD_ISP_PAGE_ERASE";
+    case CMD_GET_CAPS: return "CMD_GET_CAPS";
+    case CMD_STREAM_READ: return "CMD_STREAM_READ";
+    case CMD_UPDATE_RLE: return "CMD_UPDATE_RLE";
     case CMD_ISP_MASS_ERASE: return "CMD_ISP_MASS_ERASE";
     default: return "UNKNOWN";
   }
@@ -402,7 +544,26 @@ int read_ldrom_size() {
   return get_ldrom_size(&flags);
 }
 
-void start_dump(int addr, int size){
+// Send up to stream_window data packets without waiting for the host in between
+void stream(){
+  for (int i = 0; i < stream_window && dump_size > 0; i++) {
+    int n = dump_size > DUMP_DATA_SIZE ? DUMP_DATA_SIZE : dump_size;
+    dump();
+    for (int j = 0; j < n; j++)
+      g_stream_checksum += tx_buf[DUMP_DATA_START + j];
+    prep_pkt();
+    tx_buf[0] = g_stream_checksum & 0xff;
+    tx_buf[1] = (g_stream_checksum >> 8) & 0xff;
+    tx_buf[2] = 0;
+    tx_buf[3] = 0;
+    tx_pkt();
+    read_ahead();
+  }
+  if (dump_size == 0)
+    state = COMMAND_STATE;
+}
+
+void start_dump(int addr, int size, bool streaming = false){
   config_flags flags;
   read_config(&flags);
   uint8_t cid = N51ICP_read_cid();
@@ -426,11 +587,18 @@ void start_dump(int addr, int size){
 
   dump_addr = addr;
   dump_size = size;
-  
+  if (streaming) {
+    g_stream_checksum = 0;
+    state = STREAMING_STATE;
+    stream();
+    return;
+  }
+
   dump();
   if (dump_size > 0)
     state = DUMPING_STATE;
   send_pkt();
+  read_ahead();
 }
 
 void reset_buf() {
@@ -522,21 +690,41 @@ void loop()
     if (state == WAITING_FOR_SYNCNO && cmd != CMD_SYNC_PACKNO && cmd != CMD_CONNECT) {
       // No syncno command, just skip to command state
       state = COMMAND_STATE;
-    } else if ((state == DUMPING_STATE || state == UPDATING_STATE) && cmd != CMD_FORMAT2_CONTINUATION) {
+    } else if ((state == DUMPING_STATE || state == UPDATING_STATE || state == STREAMING_STATE) && cmd != CMD_FORMAT2_CONTINUATION) {
       state = COMMAND_STATE;
+    } else if (state == STREAMING_STATE) {
+      stream();
+      return;
     } else if (state == DUMPING_STATE) {
       dump();
       if (dump_size == 0)
         state = COMMAND_STATE;
       send_pkt();
+      read_ahead();
       return;
     } else if (state == UPDATING_STATE) {
-      update(&rx_buf[8], SEQ_UPDATE_PKT_SIZE);
+#if PIPELINED_UPDATE
+      // acknowledge the packet first, then write it while the host sends the next one
+      memcpy(pending_buf, &rx_buf[SEQ_UPDATE_PKT_START], SEQ_UPDATE_PKT_SIZE);
+      uint16_t checksum = g_update_checksum;
+      g_update_checksum += packet_sum(pending_buf, SEQ_UPDATE_PKT_SIZE);
+      add_g_total_checksum();
+      send_pkt();
+      g_update_checksum = checksum;
+      rx_during_write = true;
+      update_packet(pending_buf, SEQ_UPDATE_PKT_SIZE);
+      rx_during_write = false;
+      if (update_size == 0) {
+        state = COMMAND_STATE;
+      }
+#else
+      update_packet(&rx_buf[SEQ_UPDATE_PKT_START], SEQ_UPDATE_PKT_SIZE);
       if (update_size == 0) {
         state = COMMAND_STATE;
       }
       add_g_total_checksum();
       send_pkt();
+#endif
       return;
     }
     switch (cmd) {
@@ -562,6 +750,16 @@ void loop()
           send_pkt();
           DEBUG_PRINT("Connected!\n");
         } break;
+      case CMD_GET_CAPS:
+        tx_buf[8] = CAP_LAZY_ERASE | CAP_STREAM_READ | CAP_RLE_UPDATE;
+#if PIPELINED_UPDATE
+        tx_buf[8] |= CAP_PIPELINED;
+#endif
+        tx_buf[9] = 0;
+        tx_buf[10] = 0;
+        tx_buf[11] = 0;
+        send_pkt();
+        break;
       case CMD_GET_FWVER:
         tx_buf[8] = FW_VERSION;
         tx_buf[9] = 0;
@@ -717,55 +915,46 @@ void loop()
         DEBUG_PRINT("CMD_READ_ROM (addr: %d, size: %d) \n", dump_addr, dump_size);
         start_dump(dump_addr, dump_size);
         break;
-
-      case CMD_UPDATE_WHOLE_ROM:
-        g_update_checksum = 0;
-        DEBUG_PRINT("CMD_UPDATE_WHOLE_ROM\n");
-        INVALIDATE_CACHE;
-        // preserved_ldrom_sz = 0;
-        if (!mass_erase_checked(true)) break;
-        update_addr = (rx_buf[9] << 8) | rx_buf[8];
-        update_size = (rx_buf[13] << 8) | rx_buf[12];
-        if (update_size == 0){
-          fail_pkt();
-          break;
-        }
-        DEBUG_PRINT("flashing %d bytes\n", update_size);
-        update(&rx_buf[16], 48);
-        add_g_total_checksum();
-        if (update_size > 0)
-          state = UPDATING_STATE;
-        send_pkt();
+      case CMD_STREAM_READ:
+        dump_addr = (rx_buf[9] << 8) | rx_buf[8];
+        dump_size = (rx_buf[13] << 8) | rx_buf[12];
+        stream_window = rx_buf[STREAM_WINDOW_START] ? rx_buf[STREAM_WINDOW_START] : STREAM_DEFAULT_WINDOW;
+        DEBUG_PRINT("CMD_STREAM_READ (addr: %d, size: %d, window: %d) \n", dump_addr, dump_size, stream_window);
+        start_dump(dump_addr, dump_size, true);
         break;
 
-      case CMD_UPDATE_APROM: {
+      case CMD_UPDATE_WHOLE_ROM:
+      case CMD_UPDATE_APROM:
+      case CMD_UPDATE_RLE: {
         g_update_checksum = 0;
+        rle_update = (cmd == CMD_UPDATE_RLE);
         update_addr = (rx_buf[9] << 8) | rx_buf[8];
         update_size = (rx_buf[13] << 8) | rx_buf[12];
-        DEBUG_PRINT("CMD_UPDATE_APROM (addr: %d, size: %d)\n", update_addr, update_size);
+        DEBUG_PRINT("%s (addr: %d, size: %d)\n", cmd_enum_to_string(cmd), update_addr, update_size);
         if (update_size == 0){
           fail_pkt();
           break;
         }
-        read_config(&flags);
-        
-        cid = N51ICP_read_cid();
-        int ldrom_size = get_ldrom_size(&flags);
         INVALIDATE_CACHE;
-        // Specification states that we need to erase the aprom when we receive this command
-        if (flags.LOCK != 0 && cid != 0xFF) {
-          // device is not locked, we need to erase only the areas we're going to write to
-          uint16_t start_addr = update_addr & PAGE_MASK;
-          uint16_t end_addr = (start_addr + update_size);
-          for (uint16_t curr_addr = update_addr; curr_addr < end_addr; curr_addr += PAGE_SIZE){
-            N51ICP_page_erase(curr_addr);
-          }
-        } else { // device is locked, we'll need to do a mass erase
+        lazy_erase = false;
+        if (cmd == CMD_UPDATE_WHOLE_ROM || (rle_update && (rx_buf[RLE_FLAGS_START] & RLE_FLAG_MASS_ERASE))) {
+          // preserved_ldrom_sz = 0;
           if (!mass_erase_checked(true)) break;
+        } else {
+          read_config(&flags);
+          cid = N51ICP_read_cid();
+          // Specification states that we need to erase the aprom when we receive this command
+          if (flags.LOCK != 0 && cid != 0xFF) {
+            // device is not locked, we need to erase only the areas we're going to write to;
+            // update() erases each page as the data for it arrives, skipping pages that are already blank
+            lazy_erase = true;
+            lazy_erase_end = update_addr & PAGE_MASK;
+          } else { // device is locked, we'll need to do a mass erase
+            if (!mass_erase_checked(true)) break;
+          }
         }
-        read_config(&flags);
         DEBUG_PRINT("flashing %d bytes\n", update_size);
-        update(&rx_buf[16], 48);
+        update_packet(&rx_buf[INITIAL_UPDATE_PKT_START], INITIAL_UPDATE_PKT_SIZE);
         add_g_total_checksum();
         if (update_size > 0)
           state = UPDATING_STATE;
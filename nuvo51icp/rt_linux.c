@@ -0,0 +1,86 @@
+/*
+ * nuvo51icp, an ICP flasher for the Nuvoton NuMicro 8051 line of chips
+ *
+ * Copyright (c) 2023-2024 Nikita Lita
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining
+ * a copy of this software and associated documentation files (the
+ * "Software"), to deal in the Software without restriction, including
+ * without limitation the rights to use, copy, modify, merge, publish,
+ * distribute, sublicense, and/or sell copies of the Software, and to
+ * permit persons to whom the Software is furnished to do so, subject to
+ * the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included
+ * in all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+ * EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+ * MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+ * IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY
+ * CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+ * TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+ * SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+// Real-time mode for the Linux PGM backends (rpi.c, rpi-pigpio.c)
+#ifdef RPI
+
+#define _GNU_SOURCE
+#include <sched.h>
+#include <stdio.h>
+#include <string.h>
+#include <errno.h>
+#include <sys/mman.h>
+
+#include "n51_pgm.h"
+
+static uint8_t rt_enabled = 0;
+static int saved_policy;
+static struct sched_param saved_param;
+static cpu_set_t saved_affinity;
+
+int N51PGM_set_realtime(uint8_t enable, int cpu)
+{
+	if (!enable) {
+		if (!rt_enabled)
+			return 0;
+		sched_setscheduler(0, saved_policy, &saved_param);
+		sched_setaffinity(0, sizeof(saved_affinity), &saved_affinity);
+		munlockall();
+		rt_enabled = 0;
+		return 0;
+	}
+	if (!rt_enabled) {
+		saved_policy = sched_getscheduler(0);
+		sched_getparam(0, &saved_param);
+		sched_getaffinity(0, sizeof(saved_affinity), &saved_affinity);
+	}
+	int ret = 0;
+	// a page fault in the middle of a byte stalls the clock as badly as being preempted
+	if (mlockall(MCL_CURRENT | MCL_FUTURE) < 0) {
+		fprintf(stderr, "mlockall failed: %s\n", strerror(errno));
+		ret = -1;
+	}
+	if (cpu >= 0) {
+		cpu_set_t set;
+		CPU_ZERO(&set);
+		CPU_SET(cpu, &set);
+		if (sched_setaffinity(0, sizeof(set), &set) < 0) {
+			fprintf(stderr, "Pinning to CPU %d failed: %s\n", cpu, strerror(errno));
+			ret = -1;
+		}
+	}
+	// one below the maximum, so the kernel's own real-time threads (e.g. watchdogs) still run
+	struct sched_param param;
+	memset(&param, 0, sizeof(param));
+	param.sched_priority = sched_get_priority_max(SCHED_FIFO) - 1;
+	if (sched_setscheduler(0, SCHED_FIFO, &param) < 0) {
+		fprintf(stderr, "Setting SCHED_FIFO failed: %s\n", strerror(errno));
+		ret = -1;
+	}
+	rt_enabled = 1;
+	return ret;
+}
+
+#endif
@@ -110,14 +110,28 @@ void N51PGM_set_trigger(void)
 	printf("N51PGM_set_trigger() called\n");
 }
 
+static uint64_t stub_time = 0;
+
 uint32_t N51PGM_usleep(uint32_t usec)
 {
+	stub_time += usec;
 	return usec;
 }
 
+uint64_t N51PGM_get_time(void)
+{
+	return stub_time;
+}
+
 void N51PGM_print(const char *msg)
 {
 	printf("%s", msg);
 }
 
+int N51PGM_set_realtime(uint8_t enable, int cpu)
+{
+	printf("N51PGM_set_realtime(%d, %d) called\n", enable, cpu);
+	return -1;
+}
+
 #endif
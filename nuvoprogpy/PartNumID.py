@@ -101,2361 +101,2387 @@ class ChipType(Enum):
     def is_8051(self):
         return self.value >= 0x80 and self.value <= 0xA0
 
-PartNumIDs = {
-    0xFFFFFFFF: ["UNKNOWN", ChipType.UNKNOWN],
-    0x00010000: ["NUC100LE3AN", ChipType.NUC100AN],
-    0x00010001: ["NUC100LE2AN", ChipType.NUC100AN],
-    0x00010002: ["NUC100LE1AN", ChipType.NUC100AN],
-    0x00010003: ["NUC100LD3AN", ChipType.NUC100AN],
-    0x00010004: ["NUC100LD2AN", ChipType.NUC100AN],
-    0x00010005: ["NUC100LD1AN", ChipType.NUC100AN],
-    0x00010006: ["NUC100LC3AN", ChipType.NUC100AN],
-    0x00010007: ["NUC100LC2AN", ChipType.NUC100AN],
-    0x00010008: ["NUC100LC1AN", ChipType.NUC100AN],
-    0x00010009: ["NUC100RE3AN", ChipType.NUC100AN],
-    0x00010010: ["NUC100RE2AN", ChipType.NUC100AN],
-    0x00010011: ["NUC100RE1AN", ChipType.NUC100AN],
-    0x00010012: ["NUC100RD3AN", ChipType.NUC100AN],
-    0x00010013: ["NUC100RD2AN", ChipType.NUC100AN],
-    0x00010014: ["NUC100RD1AN", ChipType.NUC100AN],
-    0x00010015: ["NUC100RC3AN", ChipType.NUC100AN],
-    0x00010016: ["NUC100RC2AN", ChipType.NUC100AN],
-    0x00010017: ["NUC100RC1AN", ChipType.NUC100AN],
-    0x00010019: ["NUC100VE2AN", ChipType.NUC100AN],
-    0x00010020: ["NUC100VE1AN", ChipType.NUC100AN],
-    0x00010021: ["NUC100VD3AN", ChipType.NUC100AN],
-    0x00010022: ["NUC100VD2AN", ChipType.NUC100AN],
-    0x00010023: ["NUC100VD1AN", ChipType.NUC100AN],
-    0x00010024: ["NUC100VC3AN", ChipType.NUC100AN],
-    0x00010025: ["NUC100VC2AN", ChipType.NUC100AN],
-    0x00010026: ["NUC100VC1AN", ChipType.NUC100AN],
-    0x00010031: ["NUC100SD2AN", ChipType.NUC100AN],
-    0x00010100: ["NUC101LE3AN", ChipType.NUC100AN],
-    0x00010101: ["NUC101LE2AN", ChipType.NUC100AN],
-    0x00010102: ["NUC101LE1AN", ChipType.NUC100AN],
-    0x00010103: ["NUC101LD3AN", ChipType.NUC100AN],
-    0x00010104: ["NUC101LD2AN", ChipType.NUC100AN],
-    0x00010105: ["NUC101LD1AN", ChipType.NUC100AN],
-    0x00010106: ["NUC101LC3AN", ChipType.NUC100AN],
-    0x00010107: ["NUC101LC2AN", ChipType.NUC100AN],
-    0x00010108: ["NUC101LC1AN", ChipType.NUC100AN],
-    0x00010109: ["NUC101RE3AN", ChipType.NUC100AN],
-    0x00010110: ["NUC101RE2AN", ChipType.NUC100AN],
-    0x00010111: ["NUC101RE1AN", ChipType.NUC100AN],
-    0x00010112: ["NUC101RD3AN", ChipType.NUC100AN],
-    0x00010113: ["NUC101RD2AN", ChipType.NUC100AN],
-    0x00010114: ["NUC101RD1AN", ChipType.NUC100AN],
-    0x00010115: ["NUC101RC3AN", ChipType.NUC100AN],
-    0x00010116: ["NUC101RC2AN", ChipType.NUC100AN],
-    0x00010117: ["NUC101RC1AN", ChipType.NUC100AN],
-    0x00010118: ["NUC101VE3AN", ChipType.NUC100AN],
-    0x00010119: ["NUC101VE2AN", ChipType.NUC100AN],
-    0x00010120: ["NUC101VE1AN", ChipType.NUC100AN],
-    0x00010121: ["NUC101VD3AN", ChipType.NUC100AN],
-    0x00010122: ["NUC101VD2AN", ChipType.NUC100AN],
-    0x00010123: ["NUC101VD1AN", ChipType.NUC100AN],
-    0x00010124: ["NUC101VC3AN", ChipType.NUC100AN],
-    0x00010125: ["NUC101VC2AN", ChipType.NUC100AN],
-    0x00010126: ["NUC101VC1AN", ChipType.NUC100AN],
-    0x00010200: ["NUC102LE3AN", ChipType.NUC100AN],
-    0x00010201: ["NUC102LE2AN", ChipType.NUC100AN],
-    0x00010202: ["NUC102LE1AN", ChipType.NUC100AN],
-    0x00010203: ["NUC102LD3AN", ChipType.NUC100AN],
-    0x00010204: ["NUC102LD2AN", ChipType.NUC100AN],
-    0x00010205: ["NUC102LD1AN", ChipType.NUC100AN],
-    0x00010206: ["NUC102LC3AN", ChipType.NUC100AN],
-    0x00010207: ["NUC102LC2AN", ChipType.NUC100AN],
-    0x00010208: ["NUC102LC1AN", ChipType.NUC100AN],
-    0x00010209: ["NUC102RE3AN", ChipType.NUC100AN],
-    0x00010210: ["NUC102RE2AN", ChipType.NUC100AN],
-    0x00010211: ["NUC102RE1AN", ChipType.NUC100AN],
-    0x00010212: ["NUC102RD3AN", ChipType.NUC100AN],
-    0x00010213: ["NUC102RD2AN", ChipType.NUC100AN],
-    0x00010214: ["NUC102RD1AN", ChipType.NUC100AN],
-    0x00010215: ["NUC102RC3AN", ChipType.NUC100AN],
-    0x00010216: ["NUC102RC2AN", ChipType.NUC100AN],
-    0x00010217: ["NUC102RC1AN", ChipType.NUC100AN],
-    0x00010218: ["NUC102SE3AN", ChipType.NUC100AN],
-    0x00010219: ["NUC102SE2AN", ChipType.NUC100AN],
-    0x00010220: ["NUC102SE1AN", ChipType.NUC100AN],
-    0x00010221: ["NUC102SD3AN", ChipType.NUC100AN],
-    0x00010222: ["NUC102SD2AN", ChipType.NUC100AN],
-    0x00010223: ["NUC102SD1AN", ChipType.NUC100AN],
-    0x00010224: ["NUC102SC3AN", ChipType.NUC100AN],
-    0x00010225: ["NUC102SC2AN", ChipType.NUC100AN],
-    0x00010226: ["NUC102SC1AN", ChipType.NUC100AN],
-    0x00010227: ["NUC102ZE3AN", ChipType.NUC100AN],
-    0x00010228: ["NUC102ZE2AN", ChipType.NUC100AN],
-    0x00010229: ["NUC102ZE1AN", ChipType.NUC100AN],
-    0x00010230: ["NUC102ZD3AN", ChipType.NUC100AN],
-    0x00010231: ["NUC102ZD2AN", ChipType.NUC100AN],
-    0x00010232: ["NUC102ZD1AN", ChipType.NUC100AN],
-    0x00010233: ["NUC102ZC3AN", ChipType.NUC100AN],
-    0x00010234: ["NUC102ZC2AN", ChipType.NUC100AN],
-    0x00010235: ["NUC102ZC1AN", ChipType.NUC100AN],
-    0x00010236: ["NUC102ZB3AN", ChipType.NUC100AN],
-    0x00010237: ["NUC102ZB2AN", ChipType.NUC100AN],
-    0x00010238: ["NUC102ZB1AN", ChipType.NUC100AN],
-    0x00010239: ["NUC102ZA3AN", ChipType.NUC100AN],
-    0x00010240: ["NUC102ZA2AN", ChipType.NUC100AN],
-    0x00010241: ["NUC102ZA1AN", ChipType.NUC100AN],
-    0x00010242: ["NUC102LB3AN", ChipType.NUC100AN],
-    0x00010243: ["NUC102LB2AN", ChipType.NUC100AN],
-    0x00010244: ["NUC102LB1AN", ChipType.NUC100AN],
-    0x00010245: ["NUC102LA3AN", ChipType.NUC100AN],
-    0x00010246: ["NUC102LA2AN", ChipType.NUC100AN],
-    0x00010247: ["NUC102LA1AN", ChipType.NUC100AN],
-    0x00010248: ["NUC102RB3AN", ChipType.NUC100AN],
-    0x00010249: ["NUC102RB2AN", ChipType.NUC100AN],
-    0x00010250: ["NUC102RB1AN", ChipType.NUC100AN],
-    0x00010251: ["NUC102RA3AN", ChipType.NUC100AN],
-    0x00010252: ["NUC102RA2AN", ChipType.NUC100AN],
-    0x00010253: ["NUC102RA1AN", ChipType.NUC100AN],
-    0x00010254: ["NUC102SB3AN", ChipType.NUC100AN],
-    0x00010255: ["NUC102SB2AN", ChipType.NUC100AN],
-    0x00010256: ["NUC102SB1AN", ChipType.NUC100AN],
-    0x00010257: ["NUC102SA3AN", ChipType.NUC100AN],
-    0x00010258: ["NUC102SA2AN", ChipType.NUC100AN],
-    0x00010259: ["NUC102SA1AN", ChipType.NUC100AN],
-    0x00010260: ["NUC102LA0AN", ChipType.NUC100AN],
-    0x00010261: ["NUC102LB0AN", ChipType.NUC100AN],
-    0x00010262: ["NUC102LC0AN", ChipType.NUC100AN],
-    0x00010263: ["NUC102LD0AN", ChipType.NUC100AN],
-    0x00010264: ["NUC102RA0AN", ChipType.NUC100AN],
-    0x00010265: ["NUC102RB0AN", ChipType.NUC100AN],
-    0x00010266: ["NUC102RC0AN", ChipType.NUC100AN],
-    0x00010267: ["NUC102RD0AN", ChipType.NUC100AN],
-    0x00010268: ["NUC102SA0AN", ChipType.NUC100AN],
-    0x00010269: ["NUC102SB0AN", ChipType.NUC100AN],
-    0x00010270: ["NUC102SC0AN", ChipType.NUC100AN],
-    0x00010271: ["NUC102SD0AN", ChipType.NUC100AN],
-    0x00010272: ["NUC102ZA0AN", ChipType.NUC100AN],
-    0x00010273: ["NUC102ZB0AN", ChipType.NUC100AN],
-    0x00010274: ["NUC102ZC0AN", ChipType.NUC100AN],
-    0x00010275: ["NUC102ZD0AN", ChipType.NUC100AN],
-    0x00010276: ["NUC102YD3AN", ChipType.NUC100AN],
-    0x00010277: ["NUC102YD2AN", ChipType.NUC100AN],
-    0x00010278: ["NUC102YD1AN", ChipType.NUC100AN],
-    0x00010279: ["NUC102YD0AN", ChipType.NUC100AN],
-    0x00010280: ["NUC102YC3AN", ChipType.NUC100AN],
-    0x00010281: ["NUC102YC2AN", ChipType.NUC100AN],
-    0x00010282: ["NUC102YC1AN", ChipType.NUC100AN],
-    0x00010283: ["NUC102YC0AN", ChipType.NUC100AN],
-    0x00010284: ["NUC102YB3AN", ChipType.NUC100AN],
-    0x00010285: ["NUC102YB2AN", ChipType.NUC100AN],
-    0x00010286: ["NUC102YB1AN", ChipType.NUC100AN],
-    0x00010287: ["NUC102YB0AN", ChipType.NUC100AN],
-    0x00010288: ["NUC102YA3AN", ChipType.NUC100AN],
-    0x00010289: ["NUC102YA2AN", ChipType.NUC100AN],
-    0x00010290: ["NUC102YA1AN", ChipType.NUC100AN],
-    0x00010291: ["NUC102YA0AN", ChipType.NUC100AN],
-    0x00012001: ["NUC120LE2AN", ChipType.NUC100AN],
-    0x00012002: ["NUC120LE1AN", ChipType.NUC100AN],
-    0x00012003: ["NUC120LD3AN", ChipType.NUC100AN],
-    0x00012004: ["NUC120LD2AN", ChipType.NUC100AN],
-    0x00012005: ["NUC120LD1AN", ChipType.NUC100AN],
-    0x00012006: ["NUC120LC3AN", ChipType.NUC100AN],
-    0x00012007: ["NUC120LC2AN", ChipType.NUC100AN],
-    0x00012008: ["NUC120LC1AN", ChipType.NUC100AN],
-    0x00012009: ["NUC120RE3AN", ChipType.NUC100AN],
-    0x00012010: ["NUC120RE2AN", ChipType.NUC100AN],
-    0x00012011: ["NUC120RE1AN", ChipType.NUC100AN],
-    0x00012012: ["NUC120RD3AN", ChipType.NUC100AN],
-    0x00012013: ["NUC120RD2AN", ChipType.NUC100AN],
-    0x00012014: ["NUC120RD1AN", ChipType.NUC100AN],
-    0x00012015: ["NUC120RC3AN", ChipType.NUC100AN],
-    0x00012016: ["NUC120RC2AN", ChipType.NUC100AN],
-    0x00012017: ["NUC120RC1AN", ChipType.NUC100AN],
-    0x00012018: ["NUC120VE3AN", ChipType.NUC100AN],
-    0x00012019: ["NUC120VE2AN", ChipType.NUC100AN],
-    0x00012020: ["NUC120VE1AN", ChipType.NUC100AN],
-    0x00012021: ["NUC120VD3AN", ChipType.NUC100AN],
-    0x00012022: ["NUC120VD2AN", ChipType.NUC100AN],
-    0x00012023: ["NUC120VD1AN", ChipType.NUC100AN],
-    0x00012024: ["NUC120VC3AN", ChipType.NUC100AN],
-    0x00012025: ["NUC120VC2AN", ChipType.NUC100AN],
-    0x00012026: ["NUC120VC1AN", ChipType.NUC100AN],
-    0x00013001: ["NUC130LE2AN", ChipType.NUC100AN],
-    0x00013002: ["NUC130LE1AN", ChipType.NUC100AN],
-    0x00013003: ["NUC130LD3AN", ChipType.NUC100AN],
-    0x00013004: ["NUC130LD2AN", ChipType.NUC100AN],
-    0x00013005: ["NUC130LD1AN", ChipType.NUC100AN],
-    0x00013006: ["NUC130LC3AN", ChipType.NUC100AN],
-    0x00013007: ["NUC130LC2AN", ChipType.NUC100AN],
-    0x00013008: ["NUC130LC1AN", ChipType.NUC100AN],
-    0x00013009: ["NUC130RE3AN", ChipType.NUC100AN],
-    0x00013010: ["NUC130RE2AN", ChipType.NUC100AN],
-    0x00013011: ["NUC130RE1AN", ChipType.NUC100AN],
-    0x00013012: ["NUC130RD3AN", ChipType.NUC100AN],
-    0x00013013: ["NUC130RD2AN", ChipType.NUC100AN],
-    0x00013014: ["NUC130RD1AN", ChipType.NUC100AN],
-    0x00013015: ["NUC130RC3AN", ChipType.NUC100AN],
-    0x00013016: ["NUC130RC2AN", ChipType.NUC100AN],
-    0x00013017: ["NUC130RC1AN", ChipType.NUC100AN],
-    0x00013018: ["NUC130VE3AN", ChipType.NUC100AN],
-    0x00013019: ["NUC130VE2AN", ChipType.NUC100AN],
-    0x00013020: ["NUC130VE1AN", ChipType.NUC100AN],
-    0x00013021: ["NUC130VD3AN", ChipType.NUC100AN],
-    0x00013022: ["NUC130VD2AN", ChipType.NUC100AN],
-    0x00013023: ["NUC130VD1AN", ChipType.NUC100AN],
-    0x00013024: ["NUC130VC3AN", ChipType.NUC100AN],
-    0x00013025: ["NUC130VC2AN", ChipType.NUC100AN],
-    0x00013026: ["NUC130VC1AN", ChipType.NUC100AN],
-    0x00014000: ["NUC140LE3AN", ChipType.NUC100AN],
-    0x00014001: ["NUC140LE2AN", ChipType.NUC100AN],
-    0x00014002: ["NUC140LE1AN", ChipType.NUC100AN],
-    0x00014003: ["NUC140LD3AN", ChipType.NUC100AN],
-    0x00014004: ["NUC140LD2AN", ChipType.NUC100AN],
-    0x00014005: ["NUC140LD1AN", ChipType.NUC100AN],
-    0x00014006: ["NUC140LC3AN", ChipType.NUC100AN],
-    0x00014007: ["NUC140LC2AN", ChipType.NUC100AN],
-    0x00014008: ["NUC140LC1AN", ChipType.NUC100AN],
-    0x00014009: ["NUC140RE3AN", ChipType.NUC100AN],
-    0x00014010: ["NUC140RE2AN", ChipType.NUC100AN],
-    0x00014011: ["NUC140RE1AN", ChipType.NUC100AN],
-    0x00014012: ["NUC140RD3AN", ChipType.NUC100AN],
-    0x00014013: ["NUC140RD2AN", ChipType.NUC100AN],
-    0x00014014: ["NUC140RD1AN", ChipType.NUC100AN],
-    0x00014015: ["NUC140RC3AN", ChipType.NUC100AN],
-    0x00014016: ["NUC140RC2AN", ChipType.NUC100AN],
-    0x00014017: ["NUC140RC1AN", ChipType.NUC100AN],
-    0x00014018: ["NUC140VE3AN", ChipType.NUC100AN],
-    0x00014019: ["NUC140VE2AN", ChipType.NUC100AN],
-    0x00014020: ["NUC140VE1AN", ChipType.NUC100AN],
-    0x00014021: ["NUC140VD3AN", ChipType.NUC100AN],
-    0x00014022: ["NUC140VD2AN", ChipType.NUC100AN],
-    0x00014023: ["NUC140VD1AN", ChipType.NUC100AN],
-    0x00014024: ["NUC140VC3AN", ChipType.NUC100AN],
-    0x00014025: ["NUC140VC2AN", ChipType.NUC100AN],
-    0x00014026: ["NUC140VC1AN", ChipType.NUC100AN],
-    0x00100018: ["NUC100VE3AN", ChipType.NUC100AN],
-    0x00120000: ["NUC120LE3AN", ChipType.NUC100AN],
-    0x00130000: ["NUC130LE3AN", ChipType.NUC100AN],
-    0x10010004: ["NUC100LD2BN", ChipType.NUC100BN],
-    0x10010005: ["NUC100LD1BN", ChipType.NUC100BN],
-    0x10010007: ["NUC100LC2BN", ChipType.NUC100BN],
-    0x10010008: ["NUC100LC1BN", ChipType.NUC100BN],
-    0x10010013: ["NUC100RD2BN", ChipType.NUC100BN],
-    0x10010014: ["NUC100RD1BN", ChipType.NUC100BN],
-    0x10010016: ["NUC100RC2BN", ChipType.NUC100BN],
-    0x10010017: ["NUC100RC1BN", ChipType.NUC100BN],
-    0x10010027: ["NUC100LD0BN", ChipType.NUC100BN],
-    0x10010028: ["NUC100LC0BN", ChipType.NUC100BN],
-    0x10010029: ["NUC100LB2BN", ChipType.NUC100BN],
-    0x10010030: ["NUC100LB1BN", ChipType.NUC100BN],
-    0x10010031: ["NUC100LB0BN", ChipType.NUC100BN],
-    0x10010032: ["NUC100LA2BN", ChipType.NUC100BN],
-    0x10010033: ["NUC100LA1BN", ChipType.NUC100BN],
-    0x10010034: ["NUC100LA0BN", ChipType.NUC100BN],
-    0x10010035: ["NUC100RD0BN", ChipType.NUC100BN],
-    0x10010036: ["NUC100RC0BN", ChipType.NUC100BN],
-    0x10010037: ["NUC100RB2BN", ChipType.NUC100BN],
-    0x10010038: ["NUC100RB1BN", ChipType.NUC100BN],
-    0x10010039: ["NUC100RB0BN", ChipType.NUC100BN],
-    0x10010040: ["NUC100RA2BN", ChipType.NUC100BN],
-    0x10010041: ["NUC100RA1BN", ChipType.NUC100BN],
-    0x10010042: ["NUC100RA0BN", ChipType.NUC100BN],
-    0x10010104: ["NUC101LD2BN", ChipType.NUC100BN],
-    0x10010105: ["NUC101LD1BN", ChipType.NUC100BN],
-    0x10010107: ["NUC101LC2BN", ChipType.NUC100BN],
-    0x10010108: ["NUC101LC1BN", ChipType.NUC100BN],
-    0x10010113: ["NUC101RD2BN", ChipType.NUC100BN],
-    0x10010114: ["NUC101RD1BN", ChipType.NUC100BN],
-    0x10010116: ["NUC101RC2BN", ChipType.NUC100BN],
-    0x10010117: ["NUC101RC1BN", ChipType.NUC100BN],
-    0x10010127: ["NUC101LD0BN", ChipType.NUC100BN],
-    0x10010128: ["NUC101LC0BN", ChipType.NUC100BN],
-    0x10010129: ["NUC101LB2BN", ChipType.NUC100BN],
-    0x10010130: ["NUC101LB1BN", ChipType.NUC100BN],
-    0x10010131: ["NUC101LB0BN", ChipType.NUC100BN],
-    0x10010132: ["NUC101LA2BN", ChipType.NUC100BN],
-    0x10010133: ["NUC101LA1BN", ChipType.NUC100BN],
-    0x10010134: ["NUC101LA0BN", ChipType.NUC100BN],
-    0x10010135: ["NUC101RD0BN", ChipType.NUC100BN],
-    0x10010136: ["NUC101RC0BN", ChipType.NUC100BN],
-    0x10010137: ["NUC101RB2BN", ChipType.NUC100BN],
-    0x10010138: ["NUC101RB1BN", ChipType.NUC100BN],
-    0x10010139: ["NUC101RB0BN", ChipType.NUC100BN],
-    0x10010140: ["NUC101RA2BN", ChipType.NUC100BN],
-    0x10010141: ["NUC101RA1BN", ChipType.NUC100BN],
-    0x10010142: ["NUC101RA0BN", ChipType.NUC100BN],
-    0x10010143: ["NUC101YD2BN", ChipType.NUC100BN],
-    0x10010144: ["NUC101YD1BN", ChipType.NUC100BN],
-    0x10010145: ["NUC101YD0BN", ChipType.NUC100BN],
-    0x10010146: ["NUC101YC2BN", ChipType.NUC100BN],
-    0x10010147: ["NUC101YC1BN", ChipType.NUC100BN],
-    0x10010148: ["NUC101YC0BN", ChipType.NUC100BN],
-    0x10010149: ["NUC101YB2BN", ChipType.NUC100BN],
-    0x10010150: ["NUC101YB1BN", ChipType.NUC100BN],
-    0x10010151: ["NUC101YB0BN", ChipType.NUC100BN],
-    0x10010152: ["NUC101YA2BN", ChipType.NUC100BN],
-    0x10010153: ["NUC101YA1BN", ChipType.NUC100BN],
-    0x10010154: ["NUC101YA0BN", ChipType.NUC100BN],
-    0x10012004: ["NUC120LD2BN", ChipType.NUC100BN],
-    0x10012005: ["NUC120LD1BN", ChipType.NUC100BN],
-    0x10012007: ["NUC120LC2BN", ChipType.NUC100BN],
-    0x10012008: ["NUC120LC1BN", ChipType.NUC100BN],
-    0x10012013: ["NUC120RD2BN", ChipType.NUC100BN],
-    0x10012014: ["NUC120RD1BN", ChipType.NUC100BN],
-    0x10012016: ["NUC120RC2BN", ChipType.NUC100BN],
-    0x10012017: ["NUC120RC1BN", ChipType.NUC100BN],
-    0x10012027: ["NUC120LD0BN", ChipType.NUC100BN],
-    0x10012028: ["NUC120LC0BN", ChipType.NUC100BN],
-    0x10012029: ["NUC120LB2BN", ChipType.NUC100BN],
-    0x10012030: ["NUC120LB1BN", ChipType.NUC100BN],
-    0x10012031: ["NUC120LB0BN", ChipType.NUC100BN],
-    0x10012032: ["NUC120LA2BN", ChipType.NUC100BN],
-    0x10012033: ["NUC120LA1BN", ChipType.NUC100BN],
-    0x10012034: ["NUC120LA0BN", ChipType.NUC100BN],
-    0x10012035: ["NUC120RD0BN", ChipType.NUC100BN],
-    0x10012036: ["NUC120RC0BN", ChipType.NUC100BN],
-    0x10012037: ["NUC120RB2BN", ChipType.NUC100BN],
-    0x10012038: ["NUC120RB1BN", ChipType.NUC100BN],
-    0x10012039: ["NUC120RB0BN", ChipType.NUC100BN],
-    0x10012040: ["NUC120RA2BN", ChipType.NUC100BN],
-    0x10012041: ["NUC120RA1BN", ChipType.NUC100BN],
-    0x10012042: ["NUC120RA0BN", ChipType.NUC100BN],
-    0x10013004: ["NUC130LD2BN", ChipType.NUC100BN],
-    0x10013005: ["NUC130LD1BN", ChipType.NUC100BN],
-    0x10013007: ["NUC130LC2BN", ChipType.NUC100BN],
-    0x10013008: ["NUC130LC1BN", ChipType.NUC100BN],
-    0x10013013: ["NUC130RD2BN", ChipType.NUC100BN],
-    0x10013014: ["NUC130RD1BN", ChipType.NUC100BN],
-    0x10013016: ["NUC130RC2BN", ChipType.NUC100BN],
-    0x10013017: ["NUC130RC1BN", ChipType.NUC100BN],
-    0x10013027: ["NUC130LD0BN", ChipType.NUC100BN],
-    0x10013028: ["NUC130LC0BN", ChipType.NUC100BN],
-    0x10013029: ["NUC130LB2BN", ChipType.NUC100BN],
-    0x10013030: ["NUC130LB1BN", ChipType.NUC100BN],
-    0x10013031: ["NUC130LB0BN", ChipType.NUC100BN],
-    0x10013032: ["NUC130LA2BN", ChipType.NUC100BN],
-    0x10013033: ["NUC130LA1BN", ChipType.NUC100BN],
-    0x10013034: ["NUC130LA0BN", ChipType.NUC100BN],
-    0x10013035: ["NUC130RD0BN", ChipType.NUC100BN],
-    0x10013036: ["NUC130RC0BN", ChipType.NUC100BN],
-    0x10013037: ["NUC130RB2BN", ChipType.NUC100BN],
-    0x10013038: ["NUC130RB1BN", ChipType.NUC100BN],
-    0x10013039: ["NUC130RB0BN", ChipType.NUC100BN],
-    0x10013040: ["NUC130RA2BN", ChipType.NUC100BN],
-    0x10013041: ["NUC130RA1BN", ChipType.NUC100BN],
-    0x10013042: ["NUC130RA0BN", ChipType.NUC100BN],
-    0x10014004: ["NUC140LD2BN", ChipType.NUC100BN],
-    0x10014005: ["NUC140LD1BN", ChipType.NUC100BN],
-    0x10014007: ["NUC140LC2BN", ChipType.NUC100BN],
-    0x10014008: ["NUC140LC1BN", ChipType.NUC100BN],
-    0x10014013: ["NUC140RD2BN", ChipType.NUC100BN],
-    0x10014014: ["NUC140RD1BN", ChipType.NUC100BN],
-    0x10014016: ["NUC140RC2BN", ChipType.NUC100BN],
-    0x10014017: ["NUC140RC1BN", ChipType.NUC100BN],
-    0x10014027: ["NUC140LD0BN", ChipType.NUC100BN],
-    0x10014028: ["NUC140LC0BN", ChipType.NUC100BN],
-    0x10014029: ["NUC140LB2BN", ChipType.NUC100BN],
-    0x10014030: ["NUC140LB1BN", ChipType.NUC100BN],
-    0x10014031: ["NUC140LB0BN", ChipType.NUC100BN],
-    0x10014032: ["NUC140LA2BN", ChipType.NUC100BN],
-    0x10014033: ["NUC140LA1BN", ChipType.NUC100BN],
-    0x10014034: ["NUC140LA0BN", ChipType.NUC100BN],
-    0x10014035: ["NUC140RD0BN", ChipType.NUC100BN],
-    0x10014036: ["NUC140RC0BN", ChipType.NUC100BN],
-    0x10014037: ["NUC140RB2BN", ChipType.NUC100BN],
-    0x10014038: ["NUC140RB1BN", ChipType.NUC100BN],
-    0x10014039: ["NUC140RB0BN", ChipType.NUC100BN],
-    0x10014040: ["NUC140RA2BN", ChipType.NUC100BN],
-    0x10014041: ["NUC140RA1BN", ChipType.NUC100BN],
-    0x10014042: ["NUC140RA0BN", ChipType.NUC100BN],
-    0x00005100: ["M051LAN", ChipType.M051AN],
-    0x00005101: ["M051PAN", ChipType.M051AN],
-    0x00005102: ["M051YAN", ChipType.M051AN],
-    0x00005103: ["M051ZAN", ChipType.M051AN],
-    0x00005200: ["M052LAN", ChipType.M051AN],
-    0x00005201: ["M052PAN", ChipType.M051AN],
-    0x00005202: ["M052YAN", ChipType.M051AN],
-    0x00005203: ["M052ZAN", ChipType.M051AN],
-    0x00005400: ["M054LAN", ChipType.M051AN],
-    0x00005401: ["M054PAN", ChipType.M051AN],
-    0x00005402: ["M054YAN", ChipType.M051AN],
-    0x00005403: ["M054ZAN", ChipType.M051AN],
-    0x00005800: ["M058LAN", ChipType.M051AN],
-    0x00005801: ["M058PAN", ChipType.M051AN],
-    0x00005802: ["M058YAN", ChipType.M051AN],
-    0x00005803: ["M058ZAN", ChipType.M051AN],
-    0x00005A00: ["M0516LAN", ChipType.M051AN],
-    0x00005A01: ["M0516PAN", ChipType.M051AN],
-    0x00005A02: ["M0516YAN", ChipType.M051AN],
-    0x00005A03: ["M0516ZAN", ChipType.M051AN],
-    0x20010000: ["NUC100LE3CN", ChipType.NUC100CN],
-    0x20010001: ["NUC100LE2CN", ChipType.NUC100CN],
-    0x20010002: ["NUC100LE1CN", ChipType.NUC100CN],
-    0x20010003: ["NUC100LD3CN", ChipType.NUC100CN],
-    0x20010004: ["NUC100LD2CN", ChipType.NUC100CN],
-    0x20010005: ["NUC100LD1CN", ChipType.NUC100CN],
-    0x20010006: ["NUC100LC3CN", ChipType.NUC100CN],
-    0x20010007: ["NUC100LC2CN", ChipType.NUC100CN],
-    0x20010008: ["NUC100LC1CN", ChipType.NUC100CN],
-    0x20010009: ["NUC100RE3CN", ChipType.NUC100CN],
-    0x20010010: ["NUC100RE2CN", ChipType.NUC100CN],
-    0x20010011: ["NUC100RE1CN", ChipType.NUC100CN],
-    0x20010012: ["NUC100RD3CN", ChipType.NUC100CN],
-    0x20010013: ["NUC100RD2CN", ChipType.NUC100CN],
-    0x20010014: ["NUC100RD1CN", ChipType.NUC100CN],
-    0x20010015: ["NUC100RC3CN", ChipType.NUC100CN],
-    0x20010016: ["NUC100RC2CN", ChipType.NUC100CN],
-    0x20010017: ["NUC100RC1CN", ChipType.NUC100CN],
-    0x20010018: ["NUC100VE3CN", ChipType.NUC100CN],
-    0x20010019: ["NUC100VE2CN", ChipType.NUC100CN],
-    0x20010020: ["NUC100VE1CN", ChipType.NUC100CN],
-    0x20010021: ["NUC100VD3CN", ChipType.NUC100CN],
-    0x20010022: ["NUC100VD2CN", ChipType.NUC100CN],
-    0x20010023: ["NUC100VD1CN", ChipType.NUC100CN],
-    0x20010024: ["NUC100VC3CN", ChipType.NUC100CN],
-    0x20010025: ["NUC100VC2CN", ChipType.NUC100CN],
-    0x20010026: ["NUC100VC1CN", ChipType.NUC100CN],
-    0x20010100: ["NUC101LE3CN", ChipType.NUC100CN],
-    0x20010101: ["NUC101LE2CN", ChipType.NUC100CN],
-    0x20010102: ["NUC101LE1CN", ChipType.NUC100CN],
-    0x20010103: ["NUC101LD3CN", ChipType.NUC100CN],
-    0x20010104: ["NUC101LD2CN", ChipType.NUC100CN],
-    0x20010105: ["NUC101LD1CN", ChipType.NUC100CN],
-    0x20010106: ["NUC101LC3CN", ChipType.NUC100CN],
-    0x20010107: ["NUC101LC2CN", ChipType.NUC100CN],
-    0x20010108: ["NUC101LC1CN", ChipType.NUC100CN],
-    0x20010109: ["NUC101RE3CN", ChipType.NUC100CN],
-    0x20010110: ["NUC101RE2CN", ChipType.NUC100CN],
-    0x20010111: ["NUC101RE1CN", ChipType.NUC100CN],
-    0x20010112: ["NUC101RD3CN", ChipType.NUC100CN],
-    0x20010113: ["NUC101RD2CN", ChipType.NUC100CN],
-    0x20010114: ["NUC101RD1CN", ChipType.NUC100CN],
-    0x20010115: ["NUC101RC3CN", ChipType.NUC100CN],
-    0x20010116: ["NUC101RC2CN", ChipType.NUC100CN],
-    0x20010117: ["NUC101RC1CN", ChipType.NUC100CN],
-    0x20010118: ["NUC101VE3CN", ChipType.NUC100CN],
-    0x20010119: ["NUC101VE2CN", ChipType.NUC100CN],
-    0x20010120: ["NUC101VE1CN", ChipType.NUC100CN],
-    0x20010121: ["NUC101VD3CN", ChipType.NUC100CN],
-    0x20010122: ["NUC101VD2CN", ChipType.NUC100CN],
-    0x20010123: ["NUC101VD1CN", ChipType.NUC100CN],
-    0x20010124: ["NUC101VC3CN", ChipType.NUC100CN],
-    0x20010125: ["NUC101VC2CN", ChipType.NUC100CN],
-    0x20010126: ["NUC101VC1CN", ChipType.NUC100CN],
-    0x20012000: ["NUC120LE3CN", ChipType.NUC100CN],
-    0x20012001: ["NUC120LE2CN", ChipType.NUC100CN],
-    0x20012002: ["NUC120LE1CN", ChipType.NUC100CN],
-    0x20012003: ["NUC120LD3CN", ChipType.NUC100CN],
-    0x20012004: ["NUC120LD2CN", ChipType.NUC100CN],
-    0x20012005: ["NUC120LD1CN", ChipType.NUC100CN],
-    0x20012006: ["NUC120LC3CN", ChipType.NUC100CN],
-    0x20012007: ["NUC120LC2CN", ChipType.NUC100CN],
-    0x20012008: ["NUC120LC1CN", ChipType.NUC100CN],
-    0x20012009: ["NUC120RE3CN", ChipType.NUC100CN],
-    0x20012010: ["NUC120RE2CN", ChipType.NUC100CN],
-    0x20012011: ["NUC120RE1CN", ChipType.NUC100CN],
-    0x20012012: ["NUC120RD3CN", ChipType.NUC100CN],
-    0x20012013: ["NUC120RD2CN", ChipType.NUC100CN],
-    0x20012014: ["NUC120RD1CN", ChipType.NUC100CN],
-    0x20012015: ["NUC120RC3CN", ChipType.NUC100CN],
-    0x20012016: ["NUC120RC2CN", ChipType.NUC100CN],
-    0x20012017: ["NUC120RC1CN", ChipType.NUC100CN],
-    0x20012018: ["NUC120VE3CN", ChipType.NUC100CN],
-    0x20012019: ["NUC120VE2CN", ChipType.NUC100CN],
-    0x20012020: ["NUC120VE1CN", ChipType.NUC100CN],
-    0x20012021: ["NUC120VD3CN", ChipType.NUC100CN],
-    0x20012022: ["NUC120VD2CN", ChipType.NUC100CN],
-    0x20012023: ["NUC120VD1CN", ChipType.NUC100CN],
-    0x20012024: ["NUC120VC3CN", ChipType.NUC100CN],
-    0x20012025: ["NUC120VC2CN", ChipType.NUC100CN],
-    0x20012026: ["NUC120VC1CN", ChipType.NUC100CN],
-    0x20013000: ["NUC130LE3CN", ChipType.NUC100CN],
-    0x20013001: ["NUC130LE2CN", ChipType.NUC100CN],
-    0x20013002: ["NUC130LE1CN", ChipType.NUC100CN],
-    0x20013003: ["NUC130LD3CN", ChipType.NUC100CN],
-    0x20013004: ["NUC130LD2CN", ChipType.NUC100CN],
-    0x20013005: ["NUC130LD1CN", ChipType.NUC100CN],
-    0x20013006: ["NUC130LC3CN", ChipType.NUC100CN],
-    0x20013007: ["NUC130LC2CN", ChipType.NUC100CN],
-    0x20013008: ["NUC130LC1CN", ChipType.NUC100CN],
-    0x20013009: ["NUC130RE3CN", ChipType.NUC100CN],
-    0x20013010: ["NUC130RE2CN", ChipType.NUC100CN],
-    0x20013011: ["NUC130RE1CN", ChipType.NUC100CN],
-    0x20013012: ["NUC130RD3CN", ChipType.NUC100CN],
-    0x20013013: ["NUC130RD2CN", ChipType.NUC100CN],
-    0x20013014: ["NUC130RD1CN", ChipType.NUC100CN],
-    0x20013015: ["NUC130RC3CN", ChipType.NUC100CN],
-    0x20013016: ["NUC130RC2CN", ChipType.NUC100CN],
-    0x20013017: ["NUC130RC1CN", ChipType.NUC100CN],
-    0x20013018: ["NUC130VE3CN", ChipType.NUC100CN],
-    0x20013019: ["NUC130VE2CN", ChipType.NUC100CN],
-    0x20013020: ["NUC130VE1CN", ChipType.NUC100CN],
-    0x20013021: ["NUC130VD3CN", ChipType.NUC100CN],
-    0x20013022: ["NUC130VD2CN", ChipType.NUC100CN],
-    0x20013023: ["NUC130VD1CN", ChipType.NUC100CN],
-    0x20013024: ["NUC130VC3CN", ChipType.NUC100CN],
-    0x20013025: ["NUC130VC2CN", ChipType.NUC100CN],
-    0x20013026: ["NUC130VC1CN", ChipType.NUC100CN],
-    0x20014000: ["NUC140LE3CN", ChipType.NUC100CN],
-    0x20014001: ["NUC140LE2CN", ChipType.NUC100CN],
-    0x20014002: ["NUC140LE1CN", ChipType.NUC100CN],
-    0x20014003: ["NUC140LD3CN", ChipType.NUC100CN],
-    0x20014004: ["NUC140LD2CN", ChipType.NUC100CN],
-    0x20014005: ["NUC140LD1CN", ChipType.NUC100CN],
-    0x20014006: ["NUC140LC3CN", ChipType.NUC100CN],
-    0x20014007: ["NUC140LC2CN", ChipType.NUC100CN],
-    0x20014008: ["NUC140LC1CN", ChipType.NUC100CN],
-    0x20014009: ["NUC140RE3CN", ChipType.NUC100CN],
-    0x20014010: ["NUC140RE2CN", ChipType.NUC100CN],
-    0x20014011: ["NUC140RE1CN", ChipType.NUC100CN],
-    0x20014012: ["NUC140RD3CN", ChipType.NUC100CN],
-    0x20014013: ["NUC140RD2CN", ChipType.NUC100CN],
-    0x20014014: ["NUC140RD1CN", ChipType.NUC100CN],
-    0x20014015: ["NUC140RC3CN", ChipType.NUC100CN],
-    0x20014016: ["NUC140RC2CN", ChipType.NUC100CN],
-    0x20014017: ["NUC140RC1CN", ChipType.NUC100CN],
-    0x20014018: ["NUC140VE3CN", ChipType.NUC100CN],
-    0x20014019: ["NUC140VE2CN", ChipType.NUC100CN],
-    0x20014020: ["NUC140VE1CN", ChipType.NUC100CN],
-    0x20014021: ["NUC140VD3CN", ChipType.NUC100CN],
-    0x20014022: ["NUC140VD2CN", ChipType.NUC100CN],
-    0x20014023: ["NUC140VD1CN", ChipType.NUC100CN],
-    0x20014024: ["NUC140VC3CN", ChipType.NUC100CN],
-    0x20014025: ["NUC140VC2CN", ChipType.NUC100CN],
-    0x20014026: ["NUC140VC1CN", ChipType.NUC100CN],
-    0x00012200: ["NUC122LE3AN", ChipType.NUC122AN],
-    0x00012201: ["NUC122LE2AN", ChipType.NUC122AN],
-    0x00012202: ["NUC122LE1AN", ChipType.NUC122AN],
-    0x00012203: ["NUC122LD3AN", ChipType.NUC122AN],
-    0x00012204: ["NUC122LD2AN", ChipType.NUC122AN],
-    0x00012205: ["NUC122LD1AN", ChipType.NUC122AN],
-    0x00012206: ["NUC122LC3AN", ChipType.NUC122AN],
-    0x00012207: ["NUC122LC2AN", ChipType.NUC122AN],
-    0x00012208: ["NUC122LC1AN", ChipType.NUC122AN],
-    0x00012209: ["NUC122RE3AN", ChipType.NUC122AN],
-    0x00012210: ["NUC122RE2AN", ChipType.NUC122AN],
-    0x00012211: ["NUC122RE1AN", ChipType.NUC122AN],
-    0x00012212: ["NUC122RD3AN", ChipType.NUC122AN],
-    0x00012213: ["NUC122RD2AN", ChipType.NUC122AN],
-    0x00012214: ["NUC122RD1AN", ChipType.NUC122AN],
-    0x00012215: ["NUC122RC3AN", ChipType.NUC122AN],
-    0x00012216: ["NUC122RC2AN", ChipType.NUC122AN],
-    0x00012217: ["NUC122RC1AN", ChipType.NUC122AN],
-    0x00012218: ["NUC122SE3AN", ChipType.NUC122AN],
-    0x00012219: ["NUC122SE2AN", ChipType.NUC122AN],
-    0x00012220: ["NUC122SE1AN", ChipType.NUC122AN],
-    0x00012221: ["NUC122SD3AN", ChipType.NUC122AN],
-    0x00012222: ["NUC122SD2AN", ChipType.NUC122AN],
-    0x00012223: ["NUC122SD1AN", ChipType.NUC122AN],
-    0x00012224: ["NUC122SC3AN", ChipType.NUC122AN],
-    0x00012225: ["NUC122SC2AN", ChipType.NUC122AN],
-    0x00012226: ["NUC122SC1AN", ChipType.NUC122AN],
-    0x00012227: ["NUC122ZE3AN", ChipType.NUC122AN],
-    0x00012228: ["NUC122ZE2AN", ChipType.NUC122AN],
-    0x00012229: ["NUC122ZE1AN", ChipType.NUC122AN],
-    0x00012230: ["NUC122ZD3AN", ChipType.NUC122AN],
-    0x00012231: ["NUC122ZD2AN", ChipType.NUC122AN],
-    0x00012232: ["NUC122ZD1AN", ChipType.NUC122AN],
-    0x00012233: ["NUC122ZC3AN", ChipType.NUC122AN],
-    0x00012234: ["NUC122ZC2AN", ChipType.NUC122AN],
-    0x00012235: ["NUC122ZC1AN", ChipType.NUC122AN],
-    0x00012236: ["NUC122ZB3AN", ChipType.NUC122AN],
-    0x00012237: ["NUC122ZB2AN", ChipType.NUC122AN],
-    0x00012238: ["NUC122ZB1AN", ChipType.NUC122AN],
-    0x00012239: ["NUC122ZA3AN", ChipType.NUC122AN],
-    0x00012240: ["NUC122ZA2AN", ChipType.NUC122AN],
-    0x00012241: ["NUC122ZA1AN", ChipType.NUC122AN],
-    0x00012242: ["NUC122LB3AN", ChipType.NUC122AN],
-    0x00012243: ["NUC122LB2AN", ChipType.NUC122AN],
-    0x00012244: ["NUC122LB1AN", ChipType.NUC122AN],
-    0x00012245: ["NUC122LA3AN", ChipType.NUC122AN],
-    0x00012246: ["NUC122LA2AN", ChipType.NUC122AN],
-    0x00012247: ["NUC122LA1AN", ChipType.NUC122AN],
-    0x00012248: ["NUC122RB3AN", ChipType.NUC122AN],
-    0x00012249: ["NUC122RB2AN", ChipType.NUC122AN],
-    0x00012250: ["NUC122RB1AN", ChipType.NUC122AN],
-    0x00012251: ["NUC122RA3AN", ChipType.NUC122AN],
-    0x00012252: ["NUC122RA2AN", ChipType.NUC122AN],
-    0x00012253: ["NUC122RA1AN", ChipType.NUC122AN],
-    0x00012254: ["NUC122SB3AN", ChipType.NUC122AN],
-    0x00012255: ["NUC122SB2AN", ChipType.NUC122AN],
-    0x00012256: ["NUC122SB1AN", ChipType.NUC122AN],
-    0x00012257: ["NUC122SA3AN", ChipType.NUC122AN],
-    0x00012258: ["NUC122SA2AN", ChipType.NUC122AN],
-    0x00012259: ["NUC122SA1AN", ChipType.NUC122AN],
-    0x00012260: ["NUC122LA0AN", ChipType.NUC122AN],
-    0x00012261: ["NUC122LB0AN", ChipType.NUC122AN],
-    0x00012262: ["NUC122LC0AN", ChipType.NUC122AN],
-    0x00012263: ["NUC122LD0AN", ChipType.NUC122AN],
-    0x00012264: ["NUC122RA0AN", ChipType.NUC122AN],
-    0x00012265: ["NUC122RB0AN", ChipType.NUC122AN],
-    0x00012266: ["NUC122RC0AN", ChipType.NUC122AN],
-    0x00012267: ["NUC122RD0AN", ChipType.NUC122AN],
-    0x00012268: ["NUC122SA0AN", ChipType.NUC122AN],
-    0x00012269: ["NUC122SB0AN", ChipType.NUC122AN],
-    0x00012270: ["NUC122SC0AN", ChipType.NUC122AN],
-    0x00012271: ["NUC122SD0AN", ChipType.NUC122AN],
-    0x00012272: ["NUC122ZA0AN", ChipType.NUC122AN],
-    0x00012273: ["NUC122ZB0AN", ChipType.NUC122AN],
-    0x00012274: ["NUC122ZC0AN", ChipType.NUC122AN],
-    0x00012275: ["NUC122ZD0AN", ChipType.NUC122AN],
-    0x00012276: ["NUC122YD3AN", ChipType.NUC122AN],
-    0x00012277: ["NUC122YD2AN", ChipType.NUC122AN],
-    0x00012278: ["NUC122YD1AN", ChipType.NUC122AN],
-    0x00012279: ["NUC122YD0AN", ChipType.NUC122AN],
-    0x00012280: ["NUC122YC3AN", ChipType.NUC122AN],
-    0x00012281: ["NUC122YC2AN", ChipType.NUC122AN],
-    0x00012282: ["NUC122YC1AN", ChipType.NUC122AN],
-    0x00012283: ["NUC122YC0AN", ChipType.NUC122AN],
-    0x00012284: ["NUC122YB3AN", ChipType.NUC122AN],
-    0x00012285: ["NUC122YB2AN", ChipType.NUC122AN],
-    0x00012286: ["NUC122YB1AN", ChipType.NUC122AN],
-    0x00012287: ["NUC122YB0AN", ChipType.NUC122AN],
-    0x00012288: ["NUC122YA3AN", ChipType.NUC122AN],
-    0x00012289: ["NUC122YA2AN", ChipType.NUC122AN],
-    0x00012290: ["NUC122YA1AN", ChipType.NUC122AN],
-    0x00012291: ["NUC122YA0AN", ChipType.NUC122AN],
-    0x10012222: ["NUC122SD2BN", ChipType.NUC122AN],
-    0x00020000: ["NUC200LE3AN", ChipType.NUC100DN],
-    0x00020001: ["NUC200LE2AN", ChipType.NUC100DN],
-    0x00020002: ["NUC200LE1AN", ChipType.NUC100DN],
-    0x00020003: ["NUC200LD3AN", ChipType.NUC100DN],
-    0x00020004: ["NUC200LD2AN", ChipType.NUC100DN],
-    0x00020005: ["NUC200LD1AN", ChipType.NUC100DN],
-    0x00020006: ["NUC200LC3AN", ChipType.NUC100DN],
-    0x00020007: ["NUC200LC2AN", ChipType.NUC100DN],
-    0x00020008: ["NUC200LC1AN", ChipType.NUC100DN],
-    0x00020009: ["NUC200RE3AN", ChipType.NUC100DN],
-    0x00020010: ["NUC200RE2AN", ChipType.NUC100DN],
-    0x00020011: ["NUC200RE1AN", ChipType.NUC100DN],
-    0x00020012: ["NUC200RD3AN", ChipType.NUC100DN],
-    0x00020013: ["NUC200RD2AN", ChipType.NUC100DN],
-    0x00020014: ["NUC200RD1AN", ChipType.NUC100DN],
-    0x00020015: ["NUC200RC3AN", ChipType.NUC100DN],
-    0x00020016: ["NUC200RC2AN", ChipType.NUC100DN],
-    0x00020017: ["NUC200RC1AN", ChipType.NUC100DN],
-    0x00020018: ["NUC200VE3AN", ChipType.NUC100DN],
-    0x00020019: ["NUC200VE2AN", ChipType.NUC100DN],
-    0x00020020: ["NUC200VE1AN", ChipType.NUC100DN],
-    0x00020021: ["NUC200VD3AN", ChipType.NUC100DN],
-    0x00020022: ["NUC200VD2AN", ChipType.NUC100DN],
-    0x00020023: ["NUC200VD1AN", ChipType.NUC100DN],
-    0x00020024: ["NUC200VC3AN", ChipType.NUC100DN],
-    0x00020025: ["NUC200VC2AN", ChipType.NUC100DN],
-    0x00020026: ["NUC200VC1AN", ChipType.NUC100DN],
-    0x00020027: ["NUC200SE3AN", ChipType.NUC100DN],
-    0x00020028: ["NUC200SE2AN", ChipType.NUC100DN],
-    0x00020029: ["NUC200SE1AN", ChipType.NUC100DN],
-    0x00020030: ["NUC200SD3AN", ChipType.NUC100DN],
-    0x00020031: ["NUC200SD2AN", ChipType.NUC100DN],
-    0x00020032: ["NUC200SD1AN", ChipType.NUC100DN],
-    0x00020033: ["NUC200SC3AN", ChipType.NUC100DN],
-    0x00020034: ["NUC200SC2AN", ChipType.NUC100DN],
-    0x00020035: ["NUC200SC1AN", ChipType.NUC100DN],
-    0x00022000: ["NUC220LE3AN", ChipType.NUC100DN],
-    0x00022001: ["NUC220LE2AN", ChipType.NUC100DN],
-    0x00022002: ["NUC220LE1AN", ChipType.NUC100DN],
-    0x00022003: ["NUC220LD3AN", ChipType.NUC100DN],
-    0x00022004: ["NUC220LD2AN", ChipType.NUC100DN],
-    0x00022005: ["NUC220LD1AN", ChipType.NUC100DN],
-    0x00022006: ["NUC220LC3AN", ChipType.NUC100DN],
-    0x00022007: ["NUC220LC2AN", ChipType.NUC100DN],
-    0x00022008: ["NUC220LC1AN", ChipType.NUC100DN],
-    0x00022009: ["NUC220RE3AN", ChipType.NUC100DN],
-    0x00022010: ["NUC220RE2AN", ChipType.NUC100DN],
-    0x00022011: ["NUC220RE1AN", ChipType.NUC100DN],
-    0x00022012: ["NUC220RD3AN", ChipType.NUC100DN],
-    0x00022013: ["NUC220RD2AN", ChipType.NUC100DN],
-    0x00022014: ["NUC220RD1AN", ChipType.NUC100DN],
-    0x00022015: ["NUC220RC3AN", ChipType.NUC100DN],
-    0x00022016: ["NUC220RC2AN", ChipType.NUC100DN],
-    0x00022017: ["NUC220RC1AN", ChipType.NUC100DN],
-    0x00022018: ["NUC220VE3AN", ChipType.NUC100DN],
-    0x00022019: ["NUC220VE2AN", ChipType.NUC100DN],
-    0x00022020: ["NUC220VE1AN", ChipType.NUC100DN],
-    0x00022021: ["NUC220VD3AN", ChipType.NUC100DN],
-    0x00022022: ["NUC220VD2AN", ChipType.NUC100DN],
-    0x00022023: ["NUC220VD1AN", ChipType.NUC100DN],
-    0x00022024: ["NUC220VC3AN", ChipType.NUC100DN],
-    0x00022025: ["NUC220VC2AN", ChipType.NUC100DN],
-    0x00022026: ["NUC220VC1AN", ChipType.NUC100DN],
-    0x00022027: ["NUC220SE3AN", ChipType.NUC100DN],
-    0x00022028: ["NUC220SE2AN", ChipType.NUC100DN],
-    0x00022029: ["NUC220SE1AN", ChipType.NUC100DN],
-    0x00022030: ["NUC220SD3AN", ChipType.NUC100DN],
-    0x00022031: ["NUC220SD2AN", ChipType.NUC100DN],
-    0x00022032: ["NUC220SD1AN", ChipType.NUC100DN],
-    0x00022033: ["NUC220SC3AN", ChipType.NUC100DN],
-    0x00022034: ["NUC220SC2AN", ChipType.NUC100DN],
-    0x00022035: ["NUC220SC1AN", ChipType.NUC100DN],
-    0x30010000: ["NUC100LE3DN", ChipType.NUC100DN],
-    0x30010001: ["NUC100LE2DN", ChipType.NUC100DN],
-    0x30010002: ["NUC100LE1DN", ChipType.NUC100DN],
-    0x30010003: ["NUC100LD3DN", ChipType.NUC100DN],
-    0x30010004: ["NUC100LD2DN", ChipType.NUC100DN],
-    0x30010005: ["NUC100LD1DN", ChipType.NUC100DN],
-    0x30010006: ["NUC100LC3DN", ChipType.NUC100DN],
-    0x30010007: ["NUC100LC2DN", ChipType.NUC100DN],
-    0x30010008: ["NUC100LC1DN", ChipType.NUC100DN],
-    0x30010009: ["NUC100RE3DN", ChipType.NUC100DN],
-    0x30010010: ["NUC100RE2DN", ChipType.NUC100DN],
-    0x30010011: ["NUC100RE1DN", ChipType.NUC100DN],
-    0x30010012: ["NUC100RD3DN", ChipType.NUC100DN],
-    0x30010013: ["NUC100RD2DN", ChipType.NUC100DN],
-    0x30010014: ["NUC100RD1DN", ChipType.NUC100DN],
-    0x30010015: ["NUC100RC3DN", ChipType.NUC100DN],
-    0x30010016: ["NUC100RC2DN", ChipType.NUC100DN],
-    0x30010017: ["NUC100RC1DN", ChipType.NUC100DN],
-    0x30010018: ["NUC100VE3DN", ChipType.NUC100DN],
-    0x30010019: ["NUC100VE2DN", ChipType.NUC100DN],
-    0x30010020: ["NUC100VE1DN", ChipType.NUC100DN],
-    0x30010021: ["NUC100VD3DN", ChipType.NUC100DN],
-    0x30010022: ["NUC100VD2DN", ChipType.NUC100DN],
-    0x30010023: ["NUC100VD1DN", ChipType.NUC100DN],
-    0x30010024: ["NUC100VC3DN", ChipType.NUC100DN],
-    0x30010025: ["NUC100VC2DN", ChipType.NUC100DN],
-    0x30010026: ["NUC100VC1DN", ChipType.NUC100DN],
-    0x30010027: ["NUC100SE3DN", ChipType.NUC100DN],
-    0x30010028: ["NUC100SE2DN", ChipType.NUC100DN],
-    0x30010029: ["NUC100SE1DN", ChipType.NUC100DN],
-    0x30010030: ["NUC100SD3DN", ChipType.NUC100DN],
-    0x30010031: ["NUC100SD2DN", ChipType.NUC100DN],
-    0x30010032: ["NUC100SD1DN", ChipType.NUC100DN],
-    0x30010033: ["NUC100SC3DN", ChipType.NUC100DN],
-    0x30010034: ["NUC100SC2DN", ChipType.NUC100DN],
-    0x30010035: ["NUC100SC1DN", ChipType.NUC100DN],
-    0x30012000: ["NUC120LE3DN", ChipType.NUC100DN],
-    0x30012001: ["NUC120LE2DN", ChipType.NUC100DN],
-    0x30012002: ["NUC120LE1DN", ChipType.NUC100DN],
-    0x30012003: ["NUC120LD3DN", ChipType.NUC100DN],
-    0x30012004: ["NUC120LD2DN", ChipType.NUC100DN],
-    0x30012005: ["NUC120LD1DN", ChipType.NUC100DN],
-    0x30012006: ["NUC120LC3DN", ChipType.NUC100DN],
-    0x30012007: ["NUC120LC2DN", ChipType.NUC100DN],
-    0x30012008: ["NUC120LC1DN", ChipType.NUC100DN],
-    0x30012018: ["NUC120VE3DN", ChipType.NUC100DN],
-    0x30012019: ["NUC120VE2DN", ChipType.NUC100DN],
-    0x30012020: ["NUC120VE1DN", ChipType.NUC100DN],
-    0x30012021: ["NUC120VD3DN", ChipType.NUC100DN],
-    0x30012022: ["NUC120VD2DN", ChipType.NUC100DN],
-    0x30012023: ["NUC120VD1DN", ChipType.NUC100DN],
-    0x30012024: ["NUC120VC3DN", ChipType.NUC100DN],
-    0x30012025: ["NUC120VC2DN", ChipType.NUC100DN],
-    0x30012026: ["NUC120VC1DN", ChipType.NUC100DN],
-    0x30012027: ["NUC120RE3DN", ChipType.NUC100DN],
-    0x30012028: ["NUC120RE2DN", ChipType.NUC100DN],
-    0x30012029: ["NUC120RE1DN", ChipType.NUC100DN],
-    0x30012030: ["NUC120RD3DN", ChipType.NUC100DN],
-    0x30012031: ["NUC120RD2DN", ChipType.NUC100DN],
-    0x30012032: ["NUC120RD1DN", ChipType.NUC100DN],
-    0x30012033: ["NUC120RC3DN", ChipType.NUC100DN],
-    0x30012034: ["NUC120RC2DN", ChipType.NUC100DN],
-    0x30012035: ["NUC120RC1DN", ChipType.NUC100DN],
-    0x30013000: ["NUC130LE3DN", ChipType.NUC100DN],
-    0x30013001: ["NUC130LE2DN", ChipType.NUC100DN],
-    0x30013002: ["NUC130LE1DN", ChipType.NUC100DN],
-    0x30013003: ["NUC130LD3DN", ChipType.NUC100DN],
-    0x30013004: ["NUC130LD2DN", ChipType.NUC100DN],
-    0x30013005: ["NUC130LD1DN", ChipType.NUC100DN],
-    0x30013006: ["NUC130LC3DN", ChipType.NUC100DN],
-    0x30013007: ["NUC130LC2DN", ChipType.NUC100DN],
-    0x30013008: ["NUC130LC1DN", ChipType.NUC100DN],
-    0x30013018: ["NUC130VE3DN", ChipType.NUC100DN],
-    0x30013019: ["NUC130VE2DN", ChipType.NUC100DN],
-    0x30013020: ["NUC130VE1DN", ChipType.NUC100DN],
-    0x30013021: ["NUC130VD3DN", ChipType.NUC100DN],
-    0x30013022: ["NUC130VD2DN", ChipType.NUC100DN],
-    0x30013023: ["NUC130VD1DN", ChipType.NUC100DN],
-    0x30013024: ["NUC130VC3DN", ChipType.NUC100DN],
-    0x30013025: ["NUC130VC2DN", ChipType.NUC100DN],
-    0x30013026: ["NUC130VC1DN", ChipType.NUC100DN],
-    0x30013027: ["NUC130RE3DN", ChipType.NUC100DN],
-    0x30013028: ["NUC130RE2DN", ChipType.NUC100DN],
-    0x30013029: ["NUC130RE1DN", ChipType.NUC100DN],
-    0x30013030: ["NUC130RD3DN", ChipType.NUC100DN],
-    0x30013031: ["NUC130RD2DN", ChipType.NUC100DN],
-    0x30013032: ["NUC130RD1DN", ChipType.NUC100DN],
-    0x30013033: ["NUC130RC3DN", ChipType.NUC100DN],
-    0x30013034: ["NUC130RC2DN", ChipType.NUC100DN],
-    0x30013035: ["NUC130RC1DN", ChipType.NUC100DN],
-    0x30014000: ["NUC140LE3DN", ChipType.NUC100DN],
-    0x30014001: ["NUC140LE2DN", ChipType.NUC100DN],
-    0x30014002: ["NUC140LE1DN", ChipType.NUC100DN],
-    0x30014003: ["NUC140LD3DN", ChipType.NUC100DN],
-    0x30014004: ["NUC140LD2DN", ChipType.NUC100DN],
-    0x30014005: ["NUC140LD1DN", ChipType.NUC100DN],
-    0x30014006: ["NUC140LC3DN", ChipType.NUC100DN],
-    0x30014007: ["NUC140LC2DN", ChipType.NUC100DN],
-    0x30014008: ["NUC140LC1DN", ChipType.NUC100DN],
-    0x30014018: ["NUC140VE3DN", ChipType.NUC100DN],
-    0x30014019: ["NUC140VE2DN", ChipType.NUC100DN],
-    0x30014020: ["NUC140VE1DN", ChipType.NUC100DN],
-    0x30014021: ["NUC140VD3DN", ChipType.NUC100DN],
-    0x30014022: ["NUC140VD2DN", ChipType.NUC100DN],
-    0x30014023: ["NUC140VD1DN", ChipType.NUC100DN],
-    0x30014024: ["NUC140VC3DN", ChipType.NUC100DN],
-    0x30014025: ["NUC140VC2DN", ChipType.NUC100DN],
-    0x30014026: ["NUC140VC1DN", ChipType.NUC100DN],
-    0x30014027: ["NUC140RE3DN", ChipType.NUC100DN],
-    0x30014028: ["NUC140RE2DN", ChipType.NUC100DN],
-    0x30014029: ["NUC140RE1DN", ChipType.NUC100DN],
-    0x30014030: ["NUC140RD3DN", ChipType.NUC100DN],
-    0x30014031: ["NUC140RD2DN", ChipType.NUC100DN],
-    0x30014032: ["NUC140RD1DN", ChipType.NUC100DN],
-    0x30014033: ["NUC140RC3DN", ChipType.NUC100DN],
-    0x30014034: ["NUC140RC2DN", ChipType.NUC100DN],
-    0x30014035: ["NUC140RC1DN", ChipType.NUC100DN],
-    0x00100000: ["N512DC4", ChipType.NANO100AN],
-    0x00100001: ["N512LC4", ChipType.NANO100AN],
-    0x00100002: ["NANO100AN_MISSINGNO0", ChipType.NANO100AN],
-    0x00100003: ["N512MC4", ChipType.NANO100AN],
-    0x00100004: ["NANO100AN_MISSINGNO1", ChipType.NANO100AN],
-    0x00100005: ["N512SC4", ChipType.NANO100AN],
-    0x00100006: ["NANO100AN_MISSINGNO2", ChipType.NANO100AN],
-    0x00100007: ["NANO100AN_MISSINGNO3", ChipType.NANO100AN],
-    0x00110000: ["Nano100VF3AN", ChipType.NANO100AN],
-    0x00110001: ["Nano100VF2AN", ChipType.NANO100AN],
-    0x00110002: ["Nano100SF3AN", ChipType.NANO100AN],
-    0x00110003: ["Nano100SF2AN", ChipType.NANO100AN],
-    0x00110004: ["Nano100LF3AN", ChipType.NANO100AN],
-    0x00110005: ["Nano100LF2AN", ChipType.NANO100AN],
-    0x00110006: ["Nano100VE3AN", ChipType.NANO100AN],
-    0x00110007: ["Nano100VE2AN", ChipType.NANO100AN],
-    0x00110008: ["Nano100SE3AN", ChipType.NANO100AN],
-    0x00110009: ["Nano100SE2AN", ChipType.NANO100AN],
-    0x00110010: ["Nano100LE3AN", ChipType.NANO100AN],
-    0x00110011: ["Nano100LE2AN", ChipType.NANO100AN],
-    0x00110012: ["Nano100VD3AN", ChipType.NANO100AN],
-    0x00110013: ["Nano100VD2AN", ChipType.NANO100AN],
-    0x00110014: ["Nano100VD1AN", ChipType.NANO100AN],
-    0x00110015: ["Nano100SD3AN", ChipType.NANO100AN],
-    0x00110016: ["Nano100SD2AN", ChipType.NANO100AN],
-    0x00110017: ["Nano100SD1AN", ChipType.NANO100AN],
-    0x00110018: ["Nano100LD3AN", ChipType.NANO100AN],
-    0x00110019: ["Nano100LD2AN", ChipType.NANO100AN],
-    0x00110020: ["Nano100LD1AN", ChipType.NANO100AN],
-    0x00110021: ["Nano100VC2AN", ChipType.NANO100AN],
-    0x00110022: ["Nano100VC1AN", ChipType.NANO100AN],
-    0x00110023: ["Nano100SC2AN", ChipType.NANO100AN],
-    0x00110024: ["Nano100SC1AN", ChipType.NANO100AN],
-    0x00110025: ["Nano100LC2AN", ChipType.NANO100AN],
-    0x00110026: ["Nano100LC1AN", ChipType.NANO100AN],
-    0x00110027: ["Nano100ZD3AN", ChipType.NANO100AN],
-    0x00110028: ["Nano100ZD2AN", ChipType.NANO100AN],
-    0x00110029: ["Nano100ZC2AN", ChipType.NANO100AN],
-    0x00111000: ["Nano110VF3AN", ChipType.NANO100AN],
-    0x00111001: ["Nano110VF2AN", ChipType.NANO100AN],
-    0x00111002: ["Nano110SF3AN", ChipType.NANO100AN],
-    0x00111003: ["Nano110SF2AN", ChipType.NANO100AN],
-    0x00111006: ["Nano110VE3AN", ChipType.NANO100AN],
-    0x00111007: ["Nano110VE2AN", ChipType.NANO100AN],
-    0x00111008: ["Nano110SE3AN", ChipType.NANO100AN],
-    0x00111009: ["Nano110SE2AN", ChipType.NANO100AN],
-    0x00111012: ["Nano110VD3AN", ChipType.NANO100AN],
-    0x00111013: ["Nano110VD2AN", ChipType.NANO100AN],
-    0x00111014: ["Nano110VD1AN", ChipType.NANO100AN],
-    0x00111015: ["Nano110SD3AN", ChipType.NANO100AN],
-    0x00111016: ["Nano110SD2AN", ChipType.NANO100AN],
-    0x00111017: ["Nano110SD1AN", ChipType.NANO100AN],
-    0x00111021: ["Nano110VC2AN", ChipType.NANO100AN],
-    0x00111022: ["Nano110VC1AN", ChipType.NANO100AN],
-    0x00111023: ["Nano110SC2AN", ChipType.NANO100AN],
-    0x00111024: ["Nano110SC1AN", ChipType.NANO100AN],
-    0x00112000: ["Nano120VF3AN", ChipType.NANO100AN],
-    0x00112001: ["Nano120VF2AN", ChipType.NANO100AN],
-    0x00112002: ["Nano120SF3AN", ChipType.NANO100AN],
-    0x00112003: ["Nano120SF2AN", ChipType.NANO100AN],
-    0x00112004: ["Nano120LF3AN", ChipType.NANO100AN],
-    0x00112005: ["Nano120LF2AN", ChipType.NANO100AN],
-    0x00112006: ["Nano120VE3AN", ChipType.NANO100AN],
-    0x00112007: ["Nano120VE2AN", ChipType.NANO100AN],
-    0x00112008: ["Nano120SE3AN", ChipType.NANO100AN],
-    0x00112009: ["Nano120SE2AN", ChipType.NANO100AN],
-    0x00112010: ["Nano120LE3AN", ChipType.NANO100AN],
-    0x00112011: ["Nano120LE2AN", ChipType.NANO100AN],
-    0x00112012: ["Nano120VD3AN", ChipType.NANO100AN],
-    0x00112013: ["Nano120VD2AN", ChipType.NANO100AN],
-    0x00112014: ["Nano120VD1AN", ChipType.NANO100AN],
-    0x00112015: ["Nano120SD3AN", ChipType.NANO100AN],
-    0x00112016: ["Nano120SD2AN", ChipType.NANO100AN],
-    0x00112017: ["Nano120SD1AN", ChipType.NANO100AN],
-    0x00112018: ["Nano120LD3AN", ChipType.NANO100AN],
-    0x00112019: ["Nano120LD2AN", ChipType.NANO100AN],
-    0x00112020: ["Nano120LD1AN", ChipType.NANO100AN],
-    0x00112021: ["Nano120VC2AN", ChipType.NANO100AN],
-    0x00112022: ["Nano120VC1AN", ChipType.NANO100AN],
-    0x00112023: ["Nano120SC2AN", ChipType.NANO100AN],
-    0x00112024: ["Nano120SC1AN", ChipType.NANO100AN],
-    0x00112025: ["Nano120LC2AN", ChipType.NANO100AN],
-    0x00112026: ["Nano120LC1AN", ChipType.NANO100AN],
-    0x00112027: ["Nano120ZD3AN", ChipType.NANO100AN],
-    0x00112028: ["Nano120ZD2AN", ChipType.NANO100AN],
-    0x00112029: ["Nano120ZC2AN", ChipType.NANO100AN],
-    0x00113000: ["Nano130VF3AN", ChipType.NANO100AN],
-    0x00113001: ["Nano130VF2AN", ChipType.NANO100AN],
-    0x00113002: ["Nano130SF3AN", ChipType.NANO100AN],
-    0x00113003: ["Nano130SF2AN", ChipType.NANO100AN],
-    0x00113006: ["Nano130VE3AN", ChipType.NANO100AN],
-    0x00113007: ["Nano130VE2AN", ChipType.NANO100AN],
-    0x00113008: ["Nano130SE3AN", ChipType.NANO100AN],
-    0x00113009: ["Nano130SE2AN", ChipType.NANO100AN],
-    0x00113012: ["Nano130VD3AN", ChipType.NANO100AN],
-    0x00113013: ["Nano130VD2AN", ChipType.NANO100AN],
-    0x00113014: ["Nano130VD1AN", ChipType.NANO100AN],
-    0x00113015: ["Nano130SD3AN", ChipType.NANO100AN],
-    0x00113016: ["Nano130SD2AN", ChipType.NANO100AN],
-    0x00113017: ["Nano130SD1AN", ChipType.NANO100AN],
-    0x00113021: ["Nano130VC2AN", ChipType.NANO100AN],
-    0x00113022: ["Nano130VC1AN", ChipType.NANO100AN],
-    0x00113023: ["Nano130SC2AN", ChipType.NANO100AN],
-    0x00113024: ["Nano130SC1AN", ChipType.NANO100AN],
-    0x10005100: ["M051LBN", ChipType.M051BN],
-    0x10005101: ["M051PBN", ChipType.M051BN],
-    0x10005102: ["M051YBN", ChipType.M051BN],
-    0x10005103: ["M051ZBN", ChipType.M051BN],
-    0x10005200: ["M052LBN", ChipType.M051BN],
-    0x10005201: ["M052PBN", ChipType.M051BN],
-    0x10005202: ["M052YBN", ChipType.M051BN],
-    0x10005203: ["M052ZBN", ChipType.M051BN],
-    0x10005204: ["M052TBN", ChipType.M051BN],
-    0x10005205: ["M052XBN", ChipType.M051BN],
-    0x10005400: ["M054LBN", ChipType.M051BN],
-    0x10005401: ["M054PBN", ChipType.M051BN],
-    0x10005402: ["M054YBN", ChipType.M051BN],
-    0x10005403: ["M054ZBN", ChipType.M051BN],
-    0x10005404: ["M054TBN", ChipType.M051BN],
-    0x10005405: ["M054XBN", ChipType.M051BN],
-    0x10005406: ["M051BN_MISSINGNO0", ChipType.M051BN],
-    0x10005800: ["M058LBN", ChipType.M051BN],
-    0x10005801: ["M058PBN", ChipType.M051BN],
-    0x10005802: ["M058YBN", ChipType.M051BN],
-    0x10005803: ["M058ZBN", ChipType.M051BN],
-    0x10005804: ["M058TBN", ChipType.M051BN],
-    0x10005805: ["M058XBN", ChipType.M051BN],
-    0x10005A00: ["M0516LBN", ChipType.M051BN],
-    0x10005A01: ["M0516PBN", ChipType.M051BN],
-    0x10005A02: ["M0516YBN", ChipType.M051BN],
-    0x10005A03: ["M0516ZBN", ChipType.M051BN],
-    0x10005A04: ["M0516TBN", ChipType.M051BN],
-    0x10005A05: ["M0516XBN", ChipType.M051BN],
-    0x00205100: ["MINI51LAN", ChipType.MINI51AN],
-    0x00205101: ["MINI51QAN", ChipType.MINI51AN],
-    0x00205102: ["MINI51", ChipType.MINI51AN],
-    0x00205103: ["MINI51ZAN", ChipType.MINI51AN],
-    0x00205104: ["MINI51TAN", ChipType.MINI51AN],
-    0x00205200: ["MINI52LAN", ChipType.MINI51AN],
-    0x00205201: ["MINI52QAN", ChipType.MINI51AN],
-    0x00205202: ["MINI52", ChipType.MINI51AN],
-    0x00205203: ["MINI52ZAN", ChipType.MINI51AN],
-    0x00205204: ["MINI52TAN", ChipType.MINI51AN],
-    0x00205400: ["MINI54LAN", ChipType.MINI51AN],
-    0x00205401: ["MINI54QAN", ChipType.MINI51AN],
-    0x00205402: ["MINI54", ChipType.MINI51AN],
-    0x00205403: ["MINI54ZAN", ChipType.MINI51AN],
-    0x00205404: ["MINI54TAN", ChipType.MINI51AN],
-    0x00010300: ["NUC103SB2AN0", ChipType.NUC123AN],
-    0x00010301: ["NUC103SB2AN1", ChipType.NUC123AN],
-    0x00010302: ["NUC103SB3AN0", ChipType.NUC123AN],
-    0x00010303: ["NUC103SB4AN0", ChipType.NUC123AN],
-    0x00010304: ["NUC103SC2AN0", ChipType.NUC123AN],
-    0x00010305: ["NUC103SC2AN1", ChipType.NUC123AN],
-    0x00010306: ["NUC103SC3AN0", ChipType.NUC123AN],
-    0x00010307: ["NUC103SC4AN0", ChipType.NUC123AN],
-    0x00010308: ["NUC103SC2AN2", ChipType.NUC123AN],
-    0x00010309: ["NUC103SC2AN3", ChipType.NUC123AN],
-    0x00010310: ["NUC103SC3AN2", ChipType.NUC123AN],
-    0x00010311: ["NUC103SC4AN2", ChipType.NUC123AN],
-    0x00010312: ["NUC103SD2AN0", ChipType.NUC123AN],
-    0x00010313: ["NUC103SD2AN1", ChipType.NUC123AN],
-    0x00010314: ["NUC103SD3AN0", ChipType.NUC123AN],
-    0x00010315: ["NUC103SD4AN0", ChipType.NUC123AN],
-    0x00010316: ["NUC103SE2AN0", ChipType.NUC123AN],
-    0x00010317: ["NUC103SE2AN1", ChipType.NUC123AN],
-    0x00010318: ["NUC103SE3AN0", ChipType.NUC123AN],
-    0x00010319: ["NUC103SE4AN0", ChipType.NUC123AN],
-    0x00010320: ["NUC103LB2AN0", ChipType.NUC123AN],
-    0x00010321: ["NUC103LB2AN1", ChipType.NUC123AN],
-    0x00010322: ["NUC103LB3AN0", ChipType.NUC123AN],
-    0x00010323: ["NUC103LB4AN0", ChipType.NUC123AN],
-    0x00010324: ["NUC103LC2AN0", ChipType.NUC123AN],
-    0x00010325: ["NUC103LC2AN1", ChipType.NUC123AN],
-    0x00010326: ["NUC103LC3AN0", ChipType.NUC123AN],
-    0x00010327: ["NUC103LC4AN0", ChipType.NUC123AN],
-    0x00010328: ["NUC103LC2AN2", ChipType.NUC123AN],
-    0x00010329: ["NUC103LC2AN3", ChipType.NUC123AN],
-    0x00010330: ["NUC103LC3AN2", ChipType.NUC123AN],
-    0x00010331: ["NUC103LC4AN2", ChipType.NUC123AN],
-    0x00010332: ["NUC103LD2AN0", ChipType.NUC123AN],
-    0x00010333: ["NUC103LD2AN1", ChipType.NUC123AN],
-    0x00010334: ["NUC103LD3AN0", ChipType.NUC123AN],
-    0x00010335: ["NUC103LD4AN0", ChipType.NUC123AN],
-    0x00010336: ["NUC103LE2AN0", ChipType.NUC123AN],
-    0x00010337: ["NUC103LE2AN1", ChipType.NUC123AN],
-    0x00010338: ["NUC103LE3AN0", ChipType.NUC123AN],
-    0x00010339: ["NUC103LE4AN0", ChipType.NUC123AN],
-    0x00010340: ["NUC103ZB2AN0", ChipType.NUC123AN],
-    0x00010341: ["NUC103ZB2AN1", ChipType.NUC123AN],
-    0x00010342: ["NUC103ZB3AN0", ChipType.NUC123AN],
-    0x00010343: ["NUC103ZB4AN0", ChipType.NUC123AN],
-    0x00010344: ["NUC103ZC2AN0", ChipType.NUC123AN],
-    0x00010345: ["NUC103ZC2AN1", ChipType.NUC123AN],
-    0x00010346: ["NUC103ZC3AN0", ChipType.NUC123AN],
-    0x00010347: ["NUC103ZC4AN0", ChipType.NUC123AN],
-    0x00010348: ["NUC103ZC2AN2", ChipType.NUC123AN],
-    0x00010349: ["NUC103ZC2AN3", ChipType.NUC123AN],
-    0x00010350: ["NUC103ZC3AN2", ChipType.NUC123AN],
-    0x00010351: ["NUC103ZC4AN2", ChipType.NUC123AN],
-    0x00010352: ["NUC103ZD2AN0", ChipType.NUC123AN],
-    0x00010353: ["NUC103ZD2AN1", ChipType.NUC123AN],
-    0x00010354: ["NUC103ZD3AN0", ChipType.NUC123AN],
-    0x00010355: ["NUC103ZD4AN0", ChipType.NUC123AN],
-    0x00010356: ["NUC103ZE2AN0", ChipType.NUC123AN],
-    0x00010357: ["NUC103ZE2AN1", ChipType.NUC123AN],
-    0x00010358: ["NUC103ZE3AN0", ChipType.NUC123AN],
-    0x00010359: ["NUC103ZE4AN0", ChipType.NUC123AN],
-    0x00010500: ["NUC105SB2AN0", ChipType.NUC123AN],
-    0x00010501: ["NUC105SB2AN1", ChipType.NUC123AN],
-    0x00010502: ["NUC105SB3AN0", ChipType.NUC123AN],
-    0x00010503: ["NUC105SB4AN0", ChipType.NUC123AN],
-    0x00010504: ["NUC105SC2AN0", ChipType.NUC123AN],
-    0x00010505: ["NUC105SC2AN1", ChipType.NUC123AN],
-    0x00010506: ["NUC105SC3AN0", ChipType.NUC123AN],
-    0x00010507: ["NUC105SC4AN0", ChipType.NUC123AN],
-    0x00010508: ["NUC105SC2AN2", ChipType.NUC123AN],
-    0x00010509: ["NUC105SC2AN3", ChipType.NUC123AN],
-    0x00010510: ["NUC105SC3AN2", ChipType.NUC123AN],
-    0x00010511: ["NUC105SC4AN2", ChipType.NUC123AN],
-    0x00010512: ["NUC105SD2AN0", ChipType.NUC123AN],
-    0x00010513: ["NUC105SD2AN1", ChipType.NUC123AN],
-    0x00010514: ["NUC105SD3AN0", ChipType.NUC123AN],
-    0x00010515: ["NUC105SD4AN0", ChipType.NUC123AN],
-    0x00010516: ["NUC105SE2AN0", ChipType.NUC123AN],
-    0x00010517: ["NUC105SE2AN1", ChipType.NUC123AN],
-    0x00010518: ["NUC105SE3AN0", ChipType.NUC123AN],
-    0x00010519: ["NUC105SE4AN0", ChipType.NUC123AN],
-    0x00010520: ["NUC105LB2AN0", ChipType.NUC123AN],
-    0x00010521: ["NUC105LB2AN1", ChipType.NUC123AN],
-    0x00010522: ["NUC105LB3AN0", ChipType.NUC123AN],
-    0x00010523: ["NUC105LB4AN0", ChipType.NUC123AN],
-    0x00010524: ["NUC105LC2AN0", ChipType.NUC123AN],
-    0x00010525: ["NUC105LC2AN1", ChipType.NUC123AN],
-    0x00010526: ["NUC105LC3AN0", ChipType.NUC123AN],
-    0x00010527: ["NUC105LC4AN0", ChipType.NUC123AN],
-    0x00010528: ["NUC105LC2AN2", ChipType.NUC123AN],
-    0x00010529: ["NUC105LC2AN3", ChipType.NUC123AN],
-    0x00010530: ["NUC105LC3AN2", ChipType.NUC123AN],
-    0x00010531: ["NUC105LC4AN2", ChipType.NUC123AN],
-    0x00010532: ["NUC105LD2AN0", ChipType.NUC123AN],
-    0x00010533: ["NUC105LD2AN1", ChipType.NUC123AN],
-    0x00010534: ["NUC105LD3AN0", ChipType.NUC123AN],
-    0x00010535: ["NUC105LD4AN0", ChipType.NUC123AN],
-    0x00010536: ["NUC105LE2AN0", ChipType.NUC123AN],
-    0x00010537: ["NUC105LE2AN1", ChipType.NUC123AN],
-    0x00010538: ["NUC105LE3AN0", ChipType.NUC123AN],
-    0x00010539: ["NUC105LE4AN0", ChipType.NUC123AN],
-    0x00010540: ["NUC105ZB2AN0", ChipType.NUC123AN],
-    0x00010541: ["NUC105ZB2AN1", ChipType.NUC123AN],
-    0x00010542: ["NUC105ZB3AN0", ChipType.NUC123AN],
-    0x00010543: ["NUC105ZB4AN0", ChipType.NUC123AN],
-    0x00010544: ["NUC105ZC2AN0", ChipType.NUC123AN],
-    0x00010545: ["NUC105ZC2AN1", ChipType.NUC123AN],
-    0x00010546: ["NUC105ZC3AN0", ChipType.NUC123AN],
-    0x00010547: ["NUC105ZC4AN0", ChipType.NUC123AN],
-    0x00010548: ["NUC105ZC2AN2", ChipType.NUC123AN],
-    0x00010549: ["NUC105ZC2AN3", ChipType.NUC123AN],
-    0x00010550: ["NUC105ZC3AN2", ChipType.NUC123AN],
-    0x00010551: ["NUC105ZC4AN2", ChipType.NUC123AN],
-    0x00010552: ["NUC105ZD2AN0", ChipType.NUC123AN],
-    0x00010553: ["NUC105ZD2AN1", ChipType.NUC123AN],
-    0x00010554: ["NUC105ZD3AN0", ChipType.NUC123AN],
-    0x00010555: ["NUC105ZD4AN0", ChipType.NUC123AN],
-    0x00010556: ["NUC105ZE2AN0", ChipType.NUC123AN],
-    0x00010557: ["NUC105ZE2AN1", ChipType.NUC123AN],
-    0x00010558: ["NUC105ZE3AN0", ChipType.NUC123AN],
-    0x00010559: ["NUC105ZE4AN0", ChipType.NUC123AN],
-    0x00012300: ["NUC123SB2AN0", ChipType.NUC123AN],
-    0x00012301: ["NUC123SB2AN1", ChipType.NUC123AN],
-    0x00012302: ["NUC123SB3AN0", ChipType.NUC123AN],
-    0x00012303: ["NUC123SB4AN0", ChipType.NUC123AN],
-    0x00012304: ["NUC123SC2AN0", ChipType.NUC123AN],
-    0x00012305: ["NUC123SC2AN1", ChipType.NUC123AN],
-    0x00012306: ["NUC123SC3AN0", ChipType.NUC123AN],
-    0x00012307: ["NUC123SC4AN0", ChipType.NUC123AN],
-    0x00012308: ["NUC123SC2AN2", ChipType.NUC123AN],
-    0x00012309: ["NUC123SC2AN3", ChipType.NUC123AN],
-    0x00012310: ["NUC123SC3AN2", ChipType.NUC123AN],
-    0x00012311: ["NUC123SC4AN2", ChipType.NUC123AN],
-    0x00012312: ["NUC123SD2AN0", ChipType.NUC123AN],
-    0x00012313: ["NUC123SD2AN1", ChipType.NUC123AN],
-    0x00012314: ["NUC123SD3AN0", ChipType.NUC123AN],
-    0x00012315: ["NUC123SD4AN0", ChipType.NUC123AN],
-    0x00012316: ["NUC123SE2AN0", ChipType.NUC123AN],
-    0x00012317: ["NUC123SE2AN1", ChipType.NUC123AN],
-    0x00012318: ["NUC123SE3AN0", ChipType.NUC123AN],
-    0x00012319: ["NUC123SE4AN0", ChipType.NUC123AN],
-    0x00012320: ["NUC123LB2AN0", ChipType.NUC123AN],
-    0x00012321: ["NUC123LB2AN1", ChipType.NUC123AN],
-    0x00012322: ["NUC123LB3AN0", ChipType.NUC123AN],
-    0x00012323: ["NUC123LB4AN0", ChipType.NUC123AN],
-    0x00012324: ["NUC123LC2AN0", ChipType.NUC123AN],
-    0x00012325: ["NUC123LC2AN1", ChipType.NUC123AN],
-    0x00012326: ["NUC123LC3AN0", ChipType.NUC123AN],
-    0x00012327: ["NUC123LC4AN0", ChipType.NUC123AN],
-    0x00012328: ["NUC123LC2AN2", ChipType.NUC123AN],
-    0x00012329: ["NUC123LC2AN3", ChipType.NUC123AN],
-    0x00012330: ["NUC123LC3AN2", ChipType.NUC123AN],
-    0x00012331: ["NUC123LC4AN2", ChipType.NUC123AN],
-    0x00012332: ["NUC123LD2AN0", ChipType.NUC123AN],
-    0x00012333: ["NUC123LD2AN1", ChipType.NUC123AN],
-    0x00012334: ["NUC123LD3AN0", ChipType.NUC123AN],
-    0x00012335: ["NUC123LD4AN0", ChipType.NUC123AN],
-    0x00012336: ["NUC123LE2AN0", ChipType.NUC123AN],
-    0x00012337: ["NUC123LE2AN1", ChipType.NUC123AN],
-    0x00012338: ["NUC123LE3AN0", ChipType.NUC123AN],
-    0x00012339: ["NUC123LE4AN0", ChipType.NUC123AN],
-    0x00012340: ["NUC123ZB2AN0", ChipType.NUC123AN],
-    0x00012341: ["NUC123ZB2AN1", ChipType.NUC123AN],
-    0x00012342: ["NUC123ZB3AN0", ChipType.NUC123AN],
-    0x00012343: ["NUC123ZB4AN0", ChipType.NUC123AN],
-    0x00012344: ["NUC123ZC2AN0", ChipType.NUC123AN],
-    0x00012345: ["NUC123ZC2AN1", ChipType.NUC123AN],
-    0x00012346: ["NUC123ZC3AN0", ChipType.NUC123AN],
-    0x00012347: ["NUC123ZC4AN0", ChipType.NUC123AN],
-    0x00012348: ["NUC123ZC2AN2", ChipType.NUC123AN],
-    0x00012349: ["NUC123ZC2AN3", ChipType.NUC123AN],
-    0x00012350: ["NUC123ZC3AN2", ChipType.NUC123AN],
-    0x00012351: ["NUC123ZC4AN2", ChipType.NUC123AN],
-    0x00012352: ["NUC123ZD2AN0", ChipType.NUC123AN],
-    0x00012353: ["NUC123ZD2AN1", ChipType.NUC123AN],
-    0x00012354: ["NUC123ZD3AN0", ChipType.NUC123AN],
-    0x00012355: ["NUC123ZD4AN0", ChipType.NUC123AN],
-    0x00012356: ["NUC123ZE2AN0", ChipType.NUC123AN],
-    0x00012357: ["NUC123ZE2AN1", ChipType.NUC123AN],
-    0x00012358: ["NUC123ZE3AN0", ChipType.NUC123AN],
-    0x00012359: ["NUC123ZE4AN0", ChipType.NUC123AN],
-    0x00012361: ["PA2828Q", ChipType.NUC123AN],
-    0x00040001: ["NUC400JI8AE", ChipType.NUC400AE],
-    0x00040002: ["NUC400JH8AE", ChipType.NUC400AE],
-    0x00040003: ["NUC400JG8AE", ChipType.NUC400AE],
-    0x00040004: ["NUC400KI8AE", ChipType.NUC400AE],
-    0x00040005: ["NUC400KH8AE", ChipType.NUC400AE],
-    0x00040006: ["NUC400KG8AE", ChipType.NUC400AE],
-    0x00040007: ["NUC400VI8AE", ChipType.NUC400AE],
-    0x00040008: ["NUC400VH8AE", ChipType.NUC400AE],
-    0x00040009: ["NUC400VG8AE", ChipType.NUC400AE],
-    0x00040010: ["NUC400RI8AE", ChipType.NUC400AE],
-    0x00040011: ["NUC400RH8AE", ChipType.NUC400AE],
-    0x00040012: ["NUC400RG8AE", ChipType.NUC400AE],
-    0x00041001: ["NUC410JI8AE", ChipType.NUC400AE],
-    0x00041002: ["NUC410JH8AE", ChipType.NUC400AE],
-    0x00041003: ["NUC410JG8AE", ChipType.NUC400AE],
-    0x00041004: ["NUC410KI8AE", ChipType.NUC400AE],
-    0x00041005: ["NUC410KH8AE", ChipType.NUC400AE],
-    0x00041006: ["NUC410KG8AE", ChipType.NUC400AE],
-    0x00041007: ["NUC410VI8AE", ChipType.NUC400AE],
-    0x00041008: ["NUC410VH8AE", ChipType.NUC400AE],
-    0x00041009: ["NUC410VG8AE", ChipType.NUC400AE],
-    0x00041010: ["NUC410RI8AE", ChipType.NUC400AE],
-    0x00041011: ["NUC410RH8AE", ChipType.NUC400AE],
-    0x00041012: ["NUC410RG8AE", ChipType.NUC400AE],
-    0x00042201: ["NUC422JI8AE", ChipType.NUC400AE],
-    0x00042202: ["NUC422JH8AE", ChipType.NUC400AE],
-    0x00042203: ["NUC422JG8AE", ChipType.NUC400AE],
-    0x00042204: ["NUC422KI8AE", ChipType.NUC400AE],
-    0x00042205: ["NUC422KH8AE", ChipType.NUC400AE],
-    0x00042206: ["NUC422KG8AE", ChipType.NUC400AE],
-    0x00042207: ["NUC422VI8AE", ChipType.NUC400AE],
-    0x00042208: ["NUC422VH8AE", ChipType.NUC400AE],
-    0x00042209: ["NUC422VG8AE", ChipType.NUC400AE],
-    0x00042210: ["NUC422RI8AE", ChipType.NUC400AE],
-    0x00042211: ["NUC422RH8AE", ChipType.NUC400AE],
-    0x00042212: ["NUC422RG8AE", ChipType.NUC400AE],
-    0x00043001: ["NUC430JI8AE", ChipType.NUC400AE],
-    0x00043002: ["NUC430JH8AE", ChipType.NUC400AE],
-    0x00043003: ["NUC430JG8AE", ChipType.NUC400AE],
-    0x00043004: ["NUC430KI8AE", ChipType.NUC400AE],
-    0x00043005: ["NUC430KH8AE", ChipType.NUC400AE],
-    0x00043006: ["NUC430KG8AE", ChipType.NUC400AE],
-    0x00043007: ["NUC430VI8AE", ChipType.NUC400AE],
-    0x00043008: ["NUC430VH8AE", ChipType.NUC400AE],
-    0x00043009: ["NUC430VG8AE", ChipType.NUC400AE],
-    0x00043010: ["NUC430RI8AE", ChipType.NUC400AE],
-    0x00043011: ["NUC430RH8AE", ChipType.NUC400AE],
-    0x00043012: ["NUC430RG8AE", ChipType.NUC400AE],
-    0x00044201: ["NUC442JI8AE", ChipType.NUC400AE],
-    0x00044202: ["NUC442JH8AE", ChipType.NUC400AE],
-    0x00044203: ["NUC442JG8AE", ChipType.NUC400AE],
-    0x00044204: ["NUC442KI8AE", ChipType.NUC400AE],
-    0x00044205: ["NUC442KH8AE", ChipType.NUC400AE],
-    0x00044206: ["NUC442KG8AE", ChipType.NUC400AE],
-    0x00044207: ["NUC442VI8AE", ChipType.NUC400AE],
-    0x00044208: ["NUC442VH8AE", ChipType.NUC400AE],
-    0x00044209: ["NUC442VG8AE", ChipType.NUC400AE],
-    0x00044210: ["NUC442RI8AE", ChipType.NUC400AE],
-    0x00044211: ["NUC442RH8AE", ChipType.NUC400AE],
-    0x00044212: ["NUC442RG8AE", ChipType.NUC400AE],
-    0x00045201: ["NUC452JI8AE", ChipType.NUC400AE],
-    0x00045202: ["NUC452JH8AE", ChipType.NUC400AE],
-    0x00045203: ["NUC452JG8AE", ChipType.NUC400AE],
-    0x00045204: ["NUC452KI8AE", ChipType.NUC400AE],
-    0x00045205: ["NUC452KH8AE", ChipType.NUC400AE],
-    0x00045206: ["NUC452KG8AE", ChipType.NUC400AE],
-    0x00045207: ["NUC452VI8AE", ChipType.NUC400AE],
-    0x00045208: ["NUC452VH8AE", ChipType.NUC400AE],
-    0x00045209: ["NUC452VG8AE", ChipType.NUC400AE],
-    0x00046001: ["NUC460JI8AE", ChipType.NUC400AE],
-    0x00046002: ["NUC460JH8AE", ChipType.NUC400AE],
-    0x00046003: ["NUC460JG8AE", ChipType.NUC400AE],
-    0x00046004: ["NUC460KI8AE", ChipType.NUC400AE],
-    0x00046005: ["NUC460KH8AE", ChipType.NUC400AE],
-    0x00046006: ["NUC460KG8AE", ChipType.NUC400AE],
-    0x00046007: ["NUC460VI8AE", ChipType.NUC400AE],
-    0x00046008: ["NUC460VH8AE", ChipType.NUC400AE],
-    0x00046009: ["NUC460VG8AE", ChipType.NUC400AE],
-    0x00046010: ["NUC460RI8AE", ChipType.NUC400AE],
-    0x00046011: ["NUC460RH8AE", ChipType.NUC400AE],
-    0x00046012: ["NUC460RG8AE", ChipType.NUC400AE],
-    0x00047201: ["NUC472HI8AE", ChipType.NUC400AE],
-    0x00047202: ["NUC472HH8AE", ChipType.NUC400AE],
-    0x00047203: ["NUC472HG8AE", ChipType.NUC400AE],
-    0x00047204: ["NUC472JI8AE", ChipType.NUC400AE],
-    0x00047205: ["NUC472JH8AE", ChipType.NUC400AE],
-    0x00047206: ["NUC472JG8AE", ChipType.NUC400AE],
-    0x00047207: ["NUC472KI8AE", ChipType.NUC400AE],
-    0x00047208: ["NUC472KH8AE", ChipType.NUC400AE],
-    0x00047209: ["NUC472KG8AE", ChipType.NUC400AE],
-    0x00047210: ["NUC472VI8AE", ChipType.NUC400AE],
-    0x00047211: ["NUC472VH8AE", ChipType.NUC400AE],
-    0x00047212: ["NUC472VG8AE", ChipType.NUC400AE],
-    0x00005410: ["M054SLAN", ChipType.M058SAN],
-    0x00005413: ["M054SZAN", ChipType.M058SAN],
-    0x00005414: ["M054STAN", ChipType.M058SAN],
-    0x00005416: ["M054SSAN", ChipType.M058SAN],
-    0x00005810: ["M058SLAN", ChipType.M058SAN],
-    0x00005813: ["M058SZAN", ChipType.M058SAN],
-    0x00005814: ["M058STAN", ChipType.M058SAN],
-    0x00005816: ["M058SSAN", ChipType.M058SAN],
-    0x00005818: ["M058SFAN", ChipType.M058SAN],
-    0x00005910: ["M059SLAN", ChipType.M058SAN],
-    0x00005913: ["M059SZAN", ChipType.M058SAN],
-    0x00005914: ["M059STAN", ChipType.M058SAN],
-    0x00005916: ["M059SSAN", ChipType.M058SAN],
-    0x00110201: ["Nano102ZB0AN", ChipType.NANO102AN],
-    0x00110202: ["Nano102ZB1AN", ChipType.NANO102AN],
-    0x00110203: ["Nano102ZC1AN", ChipType.NANO102AN],
-    0x00110204: ["Nano102ZC2AN", ChipType.NANO102AN],
-    0x00110205: ["Nano102LB0AN", ChipType.NANO102AN],
-    0x00110206: ["Nano102LB1AN", ChipType.NANO102AN],
-    0x00110207: ["Nano102LC1AN", ChipType.NANO102AN],
-    0x00110208: ["Nano102LC2AN", ChipType.NANO102AN],
-    0x00110209: ["Nano102SB0AN", ChipType.NANO102AN],
-    0x00110210: ["Nano102SB1AN", ChipType.NANO102AN],
-    0x00110211: ["Nano102SC1AN", ChipType.NANO102AN],
-    0x00110212: ["Nano102SC2AN", ChipType.NANO102AN],
-    0x00111201: ["Nano112LB0AN", ChipType.NANO102AN],
-    0x00111202: ["Nano112LB1AN", ChipType.NANO102AN],
-    0x00111203: ["Nano112LC1AN", ChipType.NANO102AN],
-    0x00111204: ["Nano112LC2AN", ChipType.NANO102AN],
-    0x00111205: ["Nano112SB0AN", ChipType.NANO102AN],
-    0x00111206: ["Nano112SB1AN", ChipType.NANO102AN],
-    0x00111207: ["Nano112SC1AN", ChipType.NANO102AN],
-    0x00111208: ["Nano112SC2AN", ChipType.NANO102AN],
-    0x00111209: ["Nano112RB0AN", ChipType.NANO102AN],
-    0x00111210: ["Nano112RB1AN", ChipType.NANO102AN],
-    0x00111211: ["Nano112RC1AN", ChipType.NANO102AN],
-    0x00111212: ["Nano112RC2AN", ChipType.NANO102AN],
-    0x00111213: ["Nano112VB0AN", ChipType.NANO102AN],
-    0x00111214: ["Nano112VB1AN", ChipType.NANO102AN],
-    0x00111215: ["Nano112VC1AN", ChipType.NANO102AN],
-    0x00111216: ["Nano112VC2AN", ChipType.NANO102AN],
-    0x00505500: ["MINI55LDE", ChipType.MINI55],
-    0x00505503: ["MINI55ZDE", ChipType.MINI55],
-    0x00505504: ["MINI55TDE", ChipType.MINI55],
-    0x00505600: ["NVS06AL", ChipType.MINI55],
-    0x00605200: ["NM1200LAAE", ChipType.MINI55],
-    0x00605204: ["NM1200TAAE", ChipType.MINI55],
-    0x00605207: ["NM1100XAAE", ChipType.MINI55],
-    0x00605208: ["NM1100FAAE", ChipType.MINI55],
-    0x00605400: ["NM1200LBAE", ChipType.MINI55],
-    0x00605403: ["NM1200ZBAE", ChipType.MINI55],
-    0x00605404: ["NM1200TBAE", ChipType.MINI55],
-    0x00605407: ["NM1100XBAE", ChipType.MINI55],
-    0x00605408: ["NM1100FBAE", ChipType.MINI55],
-    0x0060540A: ["NM1100DBAE", ChipType.MINI55],
-    0x00605411: ["T32S200", ChipType.MINI55],
-    0x00682010: ["NM18200S", ChipType.MINI55],
-    0x00682011: ["NM18201S", ChipType.MINI55],
-    0x00682012: ["NM18202S", ChipType.MINI55],
-    0x00682020: ["NM1820ZB0AE", ChipType.MINI55],
-    0x00682030: ["NM18200D", ChipType.MINI55],
-    0x00682031: ["NM18201D", ChipType.MINI55],
-    0x00682040: ["NM18200Y", ChipType.MINI55],
-    0x00682041: ["NM18201Y", ChipType.MINI55],
-    0x00682042: ["NM18202Y", ChipType.MINI55],
-    0x00682100: ["NM1821FB0AE", ChipType.MINI55],
-    0x00682320: ["NM1823EB0AE", ChipType.MINI55],
-    0x00682330: ["NM1823ZB0AE", ChipType.MINI55],
-    0x00682340: ["NM1823LB0AE", ChipType.MINI55],
-    0x00682410: ["NM1824FB0AE", ChipType.MINI55],
-    0x00682710: ["NM1827UB0AE", ChipType.MINI55],
-    0x00682720: ["NM1827MB0AE", ChipType.MINI55],
-    0x00682721: ["NM1827UW", ChipType.MINI55],
-    0x00845000: ["M451MLG6AE", ChipType.M451HD],
-    0x00845001: ["M451MLE6AE", ChipType.M451HD],
-    0x00845020: ["M451MRG6AE", ChipType.M451HD],
-    0x00845021: ["M451MRE6AE", ChipType.M451HD],
-    0x00845100: ["M451LG6AE", ChipType.M451HD],
-    0x00845101: ["M451LE6AE", ChipType.M451HD],
-    0x00845120: ["M451RG6AE", ChipType.M451HD],
-    0x00845121: ["M451RE6AE", ChipType.M451HD],
-    0x00845130: ["M451VG6AE", ChipType.M451HD],
-    0x00845131: ["M451VE6AE", ChipType.M451HD],
-    0x00845200: ["M452LG6AE", ChipType.M451HD],
-    0x00845201: ["M452LE6AE", ChipType.M451HD],
-    0x00845210: ["M452SG6AE", ChipType.M451HD],
-    0x00845211: ["M452SE6AE", ChipType.M451HD],
-    0x00845220: ["M452RG6AE", ChipType.M451HD],
-    0x00845221: ["M452RE6AE", ChipType.M451HD],
-    0x00845230: ["M452VG6AE", ChipType.M451HD],
-    0x00845231: ["M452VE6AE", ChipType.M451HD],
-    0x00845300: ["M453LG6AE", ChipType.M451HD],
-    0x00845301: ["M453LE6AE", ChipType.M451HD],
-    0x00845320: ["M453RG6AE", ChipType.M451HD],
-    0x00845321: ["M453RE6AE", ChipType.M451HD],
-    0x00845330: ["M453VG6AE", ChipType.M451HD],
-    0x00845331: ["M453VE6AE", ChipType.M451HD],
-    0x00845400: ["M4TKLG6AE", ChipType.M451HD],
-    0x00845401: ["M4TKLE6AE", ChipType.M451HD],
-    0x00845420: ["M4TKRG6AE", ChipType.M451HD],
-    0x00845421: ["M4TKRE6AE", ChipType.M451HD],
-    0x00845430: ["M4TKVG6AE", ChipType.M451HD],
-    0x00845431: ["M4TKVE6AE", ChipType.M451HD],
-    0x00845700: ["M4LEDLG6AE", ChipType.M451HD],
-    0x00845701: ["M4LEDLE6AE", ChipType.M451HD],
-    0x00845720: ["M4LEDRG6AE", ChipType.M451HD],
-    0x00845721: ["M4LEDRE6AE", ChipType.M451HD],
-    0x00032003: ["NM1320LC2AE", ChipType.M0518],
-    0x00034003: ["NM1340D", ChipType.M0518],
-    0x00295A30: ["NUC029LDE", ChipType.M0518],
-    0x00295A31: ["NUC029SDE", ChipType.M0518],
-    0x00295A37: ["NUC029MDE", ChipType.M0518],
-    0x10013100: ["NUC131LD2AE", ChipType.M0518],
-    0x10013103: ["NUC131LC2AE", ChipType.M0518],
-    0x10013110: ["NUC131SD2AE", ChipType.M0518],
-    0x10013113: ["NUC131SC2AE", ChipType.M0518],
-    0x10013120: ["NUC131RD2AE", ChipType.M0518],
-    0x10013123: ["NUC131RC2AE", ChipType.M0518],
-    0x100131B0: ["NUC131FAE", ChipType.M0518],
-    0x10051800: ["M0518LD2AE", ChipType.M0518],
-    0x10051803: ["M0518LC2AE", ChipType.M0518],
-    0x10051810: ["M0518SD2AE", ChipType.M0518],
-    0x10051813: ["M0518SC2AE", ChipType.M0518],
-    0x100A8610: ["M0A86SD2AE", ChipType.M0518],
-    0xF0013100: ["NUC131LD2AEU", ChipType.M0518],
-    0xF0013103: ["NUC131LC2AEU", ChipType.M0518],
-    0xF0013110: ["NUC131SD2AEU", ChipType.M0518],
-    0xF0013113: ["NUC131SC2AEU", ChipType.M0518],
-    0x00A05800: ["MINI58LDE", ChipType.MINI58],
-    0x00A05801: ["MINI58QDE", ChipType.MINI58],
-    0x00A05803: ["MINI58ZDE", ChipType.MINI58],
-    0x00A05804: ["MINI58TDE", ChipType.MINI58],
-    0x00A05805: ["MINI58FDE", ChipType.MINI58],
-    0x00A05806: ["MINI58FHC", ChipType.MINI58],
-    0x00295C52: ["NUC029KGE", ChipType.M0564],
-    0x00C05204: ["NUC126LG4AE", ChipType.M0564],
-    0x00C05205: ["NUC126LE4AE", ChipType.M0564],
-    0x00C05206: ["NUC126NE4AE", ChipType.M0564],
-    0x00C05212: ["NUC126SG4AE", ChipType.M0564],
-    0x00C05213: ["NUC126SE4AE", ChipType.M0564],
-    0x00C05230: ["NUC126KG4AE", ChipType.M0564],
-    0x00C05231: ["NUC126VG4AE", ChipType.M0564],
-    0x00C56404: ["M0564LG4AE", ChipType.M0564],
-    0x00C56405: ["M0564LE4AE", ChipType.M0564],
-    0x00C56412: ["M0564SG4AE", ChipType.M0564],
-    0x00C56413: ["M0564SE4AE", ChipType.M0564],
-    0x00C56431: ["M0564VG4AE", ChipType.M0564],
-    0x00C56440: ["M0564KG4AE", ChipType.M0564],
-    0x01607130: ["M071VG4AE", ChipType.M0564],
-    0x01607170: ["M071QG4AE", ChipType.M0564],
-    0x01607171: ["M071QE4AE", ChipType.M0564],
-    0x00110301: ["Nano103SD3AE", ChipType.NANO103],
-    0x00110302: ["Nano103SD2AE", ChipType.NANO103],
-    0x00110303: ["Nano103SD1AE", ChipType.NANO103],
-    0x00110304: ["Nano103LD3AE", ChipType.NANO103],
-    0x00110305: ["Nano103LD2AE", ChipType.NANO103],
-    0x00110306: ["Nano103LD1AE", ChipType.NANO103],
-    0x00110307: ["Nano103ZD3AE", ChipType.NANO103],
-    0x00110308: ["Nano103ZD2AE", ChipType.NANO103],
-    0x00110309: ["Nano103ZD1AE", ChipType.NANO103],
-    0x00110310: ["Nano103SC2AE", ChipType.NANO103],
-    0x00110311: ["Nano103SC1AE", ChipType.NANO103],
-    0x00110312: ["Nano103LC2AE", ChipType.NANO103],
-    0x00110313: ["Nano103LC1AE", ChipType.NANO103],
-    0x00110314: ["Nano103ZC2AE", ChipType.NANO103],
-    0x00110315: ["Nano103ZC1AE", ChipType.NANO103],
-    0x00110316: ["Nano103SC3AE", ChipType.NANO103],
-    0x00110317: ["Nano103LC3AE", ChipType.NANO103],
-    0x00110318: ["Nano103ZC3AE", ChipType.NANO103],
-    0x00110320: ["YM0232A03S", ChipType.NANO103],
-    0x00012105: ["NUC121SC2AE", ChipType.NUC121],
-    0x00012125: ["NUC121LC2AE", ChipType.NUC121],
-    0x00012145: ["NUC121ZC2AE", ChipType.NUC121],
-    0x00012160: ["NUC121Y25CN", ChipType.NUC121],
-    0x00012180: ["NUC121WC2AE", ChipType.NUC121],
-    0x00012505: ["NUC125SC2AE", ChipType.NUC121],
-    0x00012525: ["NUC125LC2AE", ChipType.NUC121],
-    0x00012545: ["NUC125ZC2AE", ChipType.NUC121],
-    0x00295B40: ["NUC029LEE", ChipType.NUC2201],
-    0x00295B41: ["NUC029SEE", ChipType.NUC2201],
-    0x01607112: ["M071SE3AE", ChipType.NUC2201],
-    0x01607113: ["M071SD3AE", ChipType.NUC2201],
-    0x01607192: ["M071R1E3AE", ChipType.NUC2201],
-    0x01607193: ["M071R1D3AE", ChipType.NUC2201],
-    0x20024000: ["NUC2201LE3AE", ChipType.NUC2201],
-    0x20024027: ["NUC2201SE3AE", ChipType.NUC2201],
-    0x00E45200: ["M4521LE6AE", ChipType.M4521],
-    0x00E45201: ["M4521LD6AE", ChipType.M4521],
-    0x00E45210: ["M4521SE6AE", ChipType.M4521],
-    0x00E45211: ["M4521SD6AE", ChipType.M4521],
-    0x00E45220: ["M4521RE6AE", ChipType.M4521],
-    0x00E45221: ["M4521RD6AE", ChipType.M4521],
-    0x01647112: ["M471SE6AE", ChipType.M4521],
-    0x01647113: ["M471SD6AE", ChipType.M4521],
-    0x01647192: ["M471R1E6AE", ChipType.M4521],
-    0x01647193: ["M471R1D6AE", ChipType.M4521],
-    0x016471A3: ["M471MD6AE", ChipType.M4521],
-    0x01131CA0: ["M031EC1AE", ChipType.M031_32K],
-    0x01131CB0: ["M031FC1AE", ChipType.M031_32K],
-    0x01131CE0: ["M031TC1AE", ChipType.M031_32K],
-    0x01131E00: ["M031LE3AE", ChipType.M031_128K],
-    0x01131E10: ["M031SE3AE", ChipType.M031_128K],
-    0x01131E90: ["M031BTYE3AN", ChipType.M031_128K],
-    0x01131EE0: ["M031TE3AE", ChipType.M031_128K],
-    0x01132E00: ["M032LE3AE", ChipType.M031_128K],
-    0x01132E10: ["M032SE3AE", ChipType.M031_128K],
-    0x01131D00: ["M031LD2AE", ChipType.M031_64K],
-    0x01131D01: ["M031LC2AE", ChipType.M031_64K],
-    0x01131D10: ["M031SD2AE", ChipType.M031_64K],
-    0x01131D11: ["M031SC2AE", ChipType.M031_64K],
-    0x01131D90: ["M031BTYD2AN", ChipType.M031_64K],
-    0x01131DE0: ["M031TD2AE", ChipType.M031_64K],
-    0x01131BA0: ["M031EB0AE", ChipType.M031_16K],
-    0x01131BB0: ["M031FB0AE", ChipType.M031_16K],
-    0x01131BE0: ["M031TB0AE", ChipType.M031_16K],
-    0x00295C50: ["NUC029LGE", ChipType.NUC1261],
-    0x00295C51: ["NUC029SGE", ChipType.NUC1261],
-    0x01205204: ["NUC1261LG4AE", ChipType.NUC1261],
-    0x01205205: ["NUC1261LE4AE", ChipType.NUC1261],
-    0x01205206: ["NUC1261NE4AE", ChipType.NUC1261],
-    0x01205212: ["NUC1261SG4AE", ChipType.NUC1261],
-    0x01205213: ["NUC1261SE4AE", ChipType.NUC1261],
-    0x01256404: ["M05641LG4AE", ChipType.NUC1261],
-    0x01256405: ["M05641LE4AE", ChipType.NUC1261],
-    0x01256412: ["M05641SG4AE", ChipType.NUC1261],
-    0x01256413: ["M05641SE4AE", ChipType.NUC1261],
-    0x01131100: ["M031LIAAE", ChipType.M031_512K],
-    0x01131110: ["M031SIAAE", ChipType.M031_512K],
-    0x01131140: ["M031KIAAE", ChipType.M031_512K],
-    0x01132100: ["M032LIAAE", ChipType.M031_512K],
-    0x01132110: ["M032SIAAE", ChipType.M031_512K],
-    0x01132140: ["M032KIAAE", ChipType.M031_512K],
-    0x01131600: ["M031LG8AE", ChipType.M031_256K],
-    0x01131601: ["M031LG6AE", ChipType.M031_256K],
-    0x01131610: ["M031SG8AE", ChipType.M031_256K],
-    0x01131611: ["M031SG6AE", ChipType.M031_256K],
-    0x01131640: ["M031KG8AE", ChipType.M031_256K],
-    0x01131641: ["M031KG6AE", ChipType.M031_256K],
-    0x01132600: ["M032LG8AE", ChipType.M031_256K],
-    0x01132601: ["M032LG6AE", ChipType.M031_256K],
-    0x01132610: ["M032SG8AE", ChipType.M031_256K],
-    0x01132611: ["M032SG6AE", ChipType.M031_256K],
-    0x01132640: ["M032KG8AE", ChipType.M031_256K],
-    0x01132641: ["M032KG6AE", ChipType.M031_256K],
-    0x016071A4: ["M071MD2AE", ChipType.NUC1311],
-    0x016071A5: ["M071MC2AE", ChipType.NUC1311],
-    0x11413100: ["NUC1311LD2AE", ChipType.NUC1311],
-    0x11413101: ["NUC1311LC2AE", ChipType.NUC1311],
-    0x11413103: ["M0515LDE", ChipType.NUC1311],
-    0x01130D00: ["M030LD2AE", ChipType.M032D],
-    0x01130DB0: ["M030FD2AE", ChipType.M032D],
-    0x01130DE0: ["M030TD2AE", ChipType.M032D],
-    0x01132CA0: ["M032EC1AE", ChipType.M032D],
-    0x01132CB0: ["M032FC1AE", ChipType.M032D],
-    0x01132CE0: ["M032TC1AE", ChipType.M032D],
-    0x01132D00: ["M032LD2AE", ChipType.M032D],
-    0x01132D01: ["M032LC2AE", ChipType.M032D],
-    0x01132DE0: ["M032TD2AE", ChipType.M032D],
-    0x01132DE1: ["M032TC2AE", ChipType.M032D],
-    0x015A2120: ["M0A21OC1AC", ChipType.M0A21],
-    0x015A2121: ["M0A21OB1AC", ChipType.M0A21],
-    0x015A21A0: ["M0A21EC1AC", ChipType.M0A21],
-    0x015A21A1: ["M0A21EB1AC", ChipType.M0A21],
-    0x015A2320: ["M0A23OC1AC", ChipType.M0A21],
-    0x015A2321: ["M0A23OC1ACU", ChipType.M0A21],
-    0x015A23A0: ["M0A23EC1AC", ChipType.M0A21],
-    0x015A23A1: ["M0A23EC1ACU", ChipType.M0A21],
-    0x011296F1: ["M029GGC0AE", ChipType.M030G],
-    0x011306E0: ["M030GTD1AE", ChipType.M030G],
-    0x011306E1: ["M030GTC0AE", ChipType.M030G],
-    0x011306E2: ["M030GTC1AE", ChipType.M030G],
-    0x011306F0: ["M030GGD1AE", ChipType.M030G],
-    0x011306F1: ["M030GGC0AE", ChipType.M030G],
-    0x011306F2: ["M030GGC1AE", ChipType.M030G],
-    0x01647100: ["M471LI8AE", ChipType.M471],
-    0x01647101: ["M471LG7AE", ChipType.M471],
-    0x01647130: ["M471VI8AE", ChipType.M471],
-    0x01647131: ["M471VG7AE", ChipType.M471],
-    0x01647140: ["M471KI8AE", ChipType.M471],
-    0x01647141: ["M471KG7AE", ChipType.M471],
-    0x01647170: ["M471QI8AE", ChipType.M471],
-    0x01647171: ["M471QG7AE", ChipType.M471],
-    0x01647190: ["M471RI8AE", ChipType.M471],
-    0x01647191: ["M471RG7AE", ChipType.M471],
-    0x016471F0: ["M471CI8AE", ChipType.M471],
-    0x30012204: ["NUC122LD2DN", ChipType.NUC122DN],
-    0x30012208: ["NUC122LC1DN", ChipType.NUC122DN],
-    0x30012222: ["NUC122SD2DN", ChipType.NUC122DN],
-    0x30012226: ["NUC122SC1DN", ChipType.NUC122DN],
-    0x30012231: ["NUC122ZD2DN", ChipType.NUC122DN],
-    0x30012235: ["NUC122ZC1DN", ChipType.NUC122DN],
-    0x10020000: ["NUC200LE3AE", ChipType.NUC200AE],
-    0x10020004: ["NUC200LD2AE", ChipType.NUC200AE],
-    0x10020007: ["NUC200LC2AE", ChipType.NUC200AE],
-    0x10020018: ["NUC200VE3AE", ChipType.NUC200AE],
-    0x10020027: ["NUC200SE3AE", ChipType.NUC200AE],
-    0x10020031: ["NUC200SD2AE", ChipType.NUC200AE],
-    0x10020034: ["NUC200SC2AE", ChipType.NUC200AE],
-    0x10022004: ["NUC220LD2AE", ChipType.NUC200AE],
-    0x10022007: ["NUC220LC2AE", ChipType.NUC200AE],
-    0x10022018: ["NUC220VE3AE", ChipType.NUC200AE],
-    0x10022027: ["NUC220SE3AE", ChipType.NUC200AE],
-    0x10022031: ["NUC220SD2AE", ChipType.NUC200AE],
-    0x10022034: ["NUC220SC2AE", ChipType.NUC200AE],
-    0x10023000: ["NUC230LE3AE", ChipType.NUC200AE],
-    0x10023004: ["NUC230LD2AE", ChipType.NUC200AE],
-    0x10023007: ["NUC230LC2AE", ChipType.NUC200AE],
-    0x10023018: ["NUC230VE3AE", ChipType.NUC200AE],
-    0x10023027: ["NUC230SE3AE", ChipType.NUC200AE],
-    0x10023031: ["NUC230SD2AE", ChipType.NUC200AE],
-    0x10023034: ["NUC230SC2AE", ChipType.NUC200AE],
-    0x10024000: ["NUC240LE3AE", ChipType.NUC200AE],
-    0x10024004: ["NUC240LD2AE", ChipType.NUC200AE],
-    0x10024007: ["NUC240LC2AE", ChipType.NUC200AE],
-    0x10024018: ["NUC240VE3AE", ChipType.NUC200AE],
-    0x10024027: ["NUC240SE3AE", ChipType.NUC200AE],
-    0x10024031: ["NUC240SD2AE", ChipType.NUC200AE],
-    0x10024034: ["NUC240SC2AE", ChipType.NUC200AE],
-    0x40010000: ["NUC100LE3EN", ChipType.NUC200AE],
-    0x40010003: ["NUC100LD3EN", ChipType.NUC200AE],
-    0x40010004: ["NUC100LD2EN", ChipType.NUC200AE],
-    0x40010005: ["NUC100LD1EN", ChipType.NUC200AE],
-    0x40010008: ["NUC100LC1EN", ChipType.NUC200AE],
-    0x40010009: ["NUC100RE3EN", ChipType.NUC200AE],
-    0x40010012: ["NUC100RD3EN", ChipType.NUC200AE],
-    0x40010013: ["NUC100RD2EN", ChipType.NUC200AE],
-    0x40010014: ["NUC100RD1EN", ChipType.NUC200AE],
-    0x40010017: ["NUC100RC1EN", ChipType.NUC200AE],
-    0x40010018: ["NUC100VE3DE", ChipType.NUC200AE],
-    0x40010021: ["NUC100VD3EN", ChipType.NUC200AE],
-    0x40010022: ["NUC100VD2EN", ChipType.NUC200AE],
-    0x40012000: ["NUC120LE3EN", ChipType.NUC200AE],
-    0x40012003: ["NUC120LD3EN", ChipType.NUC200AE],
-    0x40012004: ["NUC120LD2DE", ChipType.NUC200AE],
-    0x40012005: ["NUC120LD1EN", ChipType.NUC200AE],
-    0x40012008: ["NUC120LC1EN", ChipType.NUC200AE],
-    0x40012009: ["NUC120RE3EN", ChipType.NUC200AE],
-    0x40012012: ["NUC120RD3EN", ChipType.NUC200AE],
-    0x40012013: ["NUC120RD2EN", ChipType.NUC200AE],
-    0x40012014: ["NUC120RD1EN", ChipType.NUC200AE],
-    0x40012017: ["NUC120RC1EN", ChipType.NUC200AE],
-    0x40012018: ["NUC120VE3EN", ChipType.NUC200AE],
-    0x40012021: ["NUC120VD3EN", ChipType.NUC200AE],
-    0x40012022: ["NUC120VD2EN", ChipType.NUC200AE],
-    0x40013017: ["NUC230RC1AE", ChipType.NUC200AE],
-    0x40022000: ["NUC220LE3AE", ChipType.NUC200AE],
-    0x00100008: ["N512VD4", ChipType.NANO100BN],
-    0x00100009: ["N512MD4", ChipType.NANO100BN],
-    0x00100010: ["N512SD4", ChipType.NANO100BN],
-    0x00110030: ["Nano100KE3BN", ChipType.NANO100BN],
-    0x00110031: ["Nano100KE2BN", ChipType.NANO100BN],
-    0x00110032: ["Nano100VE3BN", ChipType.NANO100BN],
-    0x00110033: ["Nano100VE2BN", ChipType.NANO100BN],
-    0x00110034: ["Nano100SE3BN", ChipType.NANO100BN],
-    0x00110035: ["Nano100SE2BN", ChipType.NANO100BN],
-    0x00110036: ["Nano100LE3BN", ChipType.NANO100BN],
-    0x00110037: ["Nano100LE2BN", ChipType.NANO100BN],
-    0x00110038: ["Nano100KD3BN", ChipType.NANO100BN],
-    0x00110039: ["Nano100KD2BN", ChipType.NANO100BN],
-    0x0011003A: ["Nano100VD3BN", ChipType.NANO100BN],
-    0x0011003B: ["Nano100VD2BN", ChipType.NANO100BN],
-    0x0011003C: ["Nano100SD3BN", ChipType.NANO100BN],
-    0x0011003D: ["Nano100SD2BN", ChipType.NANO100BN],
-    0x0011003E: ["Nano100LD3BN", ChipType.NANO100BN],
-    0x0011003F: ["Nano100LD2BN", ChipType.NANO100BN],
-    0x00110040: ["Nano100KC2BN", ChipType.NANO100BN],
-    0x00110041: ["Nano100VC2BN", ChipType.NANO100BN],
-    0x00110042: ["Nano100SC2BN", ChipType.NANO100BN],
-    0x00110043: ["Nano100LC2BN", ChipType.NANO100BN],
-    0x00110044: ["Nano100NE3BN", ChipType.NANO100BN],
-    0x00110045: ["Nano100ND3BN", ChipType.NANO100BN],
-    0x00110046: ["Nano100ND2BN", ChipType.NANO100BN],
-    0x00110047: ["Nano100WE3BN", ChipType.NANO100BN],
-    0x00111030: ["Nano110KE3BN", ChipType.NANO100BN],
-    0x00111031: ["Nano110KE2BN", ChipType.NANO100BN],
-    0x00111032: ["Nano110VE3BN", ChipType.NANO100BN],
-    0x00111033: ["Nano110VE2BN", ChipType.NANO100BN],
-    0x00111034: ["Nano110SE3BN", ChipType.NANO100BN],
-    0x00111035: ["Nano110SE2BN", ChipType.NANO100BN],
-    0x00111038: ["Nano110KD3BN", ChipType.NANO100BN],
-    0x00111039: ["Nano110KD2BN", ChipType.NANO100BN],
-    0x0011103A: ["Nano110VD3BN", ChipType.NANO100BN],
-    0x0011103B: ["Nano110VD2BN", ChipType.NANO100BN],
-    0x0011103C: ["Nano110SD3BN", ChipType.NANO100BN],
-    0x0011103D: ["Nano110SD2BN", ChipType.NANO100BN],
-    0x00111040: ["Nano110KC2BN", ChipType.NANO100BN],
-    0x00111041: ["Nano110VC2BN", ChipType.NANO100BN],
-    0x00111042: ["Nano110SC2BN", ChipType.NANO100BN],
-    0x00111043: ["Nano110RC2BN", ChipType.NANO100BN],
-    0x00111044: ["Nano110RD2BN", ChipType.NANO100BN],
-    0x00111045: ["Nano110RD3BN", ChipType.NANO100BN],
-    0x00112030: ["Nano120KE3BN", ChipType.NANO100BN],
-    0x00112031: ["Nano120KE2BN", ChipType.NANO100BN],
-    0x00112032: ["Nano120VE3BN", ChipType.NANO100BN],
-    0x00112033: ["Nano120VE2BN", ChipType.NANO100BN],
-    0x00112034: ["Nano120SE3BN", ChipType.NANO100BN],
-    0x00112035: ["Nano120SE2BN", ChipType.NANO100BN],
-    0x00112036: ["Nano120LE3BN", ChipType.NANO100BN],
-    0x00112037: ["Nano120LE2BN", ChipType.NANO100BN],
-    0x00112038: ["Nano120KD3BN", ChipType.NANO100BN],
-    0x00112039: ["Nano120KD2BN", ChipType.NANO100BN],
-    0x0011203A: ["Nano120VD3BN", ChipType.NANO100BN],
-    0x0011203B: ["Nano120VD2BN", ChipType.NANO100BN],
-    0x0011203C: ["Nano120SD3BN", ChipType.NANO100BN],
-    0x0011203D: ["Nano120SD2BN", ChipType.NANO100BN],
-    0x0011203E: ["Nano120LD3BN", ChipType.NANO100BN],
-    0x0011203F: ["Nano120LD2BN", ChipType.NANO100BN],
-    0x00112040: ["Nano120KC2BN", ChipType.NANO100BN],
-    0x00112041: ["Nano120VC2BN", ChipType.NANO100BN],
-    0x00112042: ["Nano120SC2BN", ChipType.NANO100BN],
-    0x00112043: ["Nano120LC2BN", ChipType.NANO100BN],
-    0x00113030: ["Nano130KE3BN", ChipType.NANO100BN],
-    0x00113031: ["Nano130KE2BN", ChipType.NANO100BN],
-    0x00113032: ["Nano130VE3BN", ChipType.NANO100BN],
-    0x00113033: ["Nano130VE2BN", ChipType.NANO100BN],
-    0x00113034: ["Nano130SE3BN", ChipType.NANO100BN],
-    0x00113035: ["Nano130SE2BN", ChipType.NANO100BN],
-    0x00113038: ["Nano130KD3BN", ChipType.NANO100BN],
-    0x00113039: ["Nano130KD2BN", ChipType.NANO100BN],
-    0x0011303A: ["Nano130VD3BN", ChipType.NANO100BN],
-    0x0011303B: ["Nano130VD2BN", ChipType.NANO100BN],
-    0x0011303C: ["Nano130SD3BN", ChipType.NANO100BN],
-    0x0011303D: ["Nano130SD2BN", ChipType.NANO100BN],
-    0x00113040: ["Nano130KC2BN", ChipType.NANO100BN],
-    0x00113041: ["Nano130VC2BN", ChipType.NANO100BN],
-    0x00113042: ["Nano130SC2BN", ChipType.NANO100BN],
-    0x00295804: ["NUC029TAN", ChipType.M051DN],
-    0x00295824: ["NUC029CIG1", ChipType.M051DN],
-    0x00295A00: ["NUC029LAN", ChipType.M051DN],
-    0x00295A03: ["NUC029ZAN", ChipType.M051DN],
-    0x00295A06: ["NUC029NAN", ChipType.M051DN],
-    0x20005200: ["M052LDN", ChipType.M051DN],
-    0x20005203: ["M052ZDN", ChipType.M051DN],
-    0x20005204: ["M052TDN", ChipType.M051DN],
-    0x20005205: ["M052XDN", ChipType.M051DN],
-    0x20005400: ["M054LDN", ChipType.M051DN],
-    0x20005403: ["M054ZDN", ChipType.M051DN],
-    0x20005404: ["M054TDN", ChipType.M051DN],
-    0x20005405: ["M054XDN", ChipType.M051DN],
-    0x20005800: ["M058LDN", ChipType.M051DN],
-    0x20005803: ["M058ZDN", ChipType.M051DN],
-    0x20005804: ["M058TDN", ChipType.M051DN],
-    0x20005805: ["M058XDN", ChipType.M051DN],
-    0x20005A00: ["M0516LDN", ChipType.M051DN],
-    0x20005A03: ["M0516ZDN", ChipType.M051DN],
-    0x20005A04: ["M0516TDN", ChipType.M051DN],
-    0x20005A05: ["M0516XDN", ChipType.M051DN],
-    0x10010300: ["NUC103SB2BN0", ChipType.NUC123AE],
-    0x10010301: ["NUC103SB2BN1", ChipType.NUC123AE],
-    0x10010302: ["NUC103SB3BN0", ChipType.NUC123AE],
-    0x10010303: ["NUC103SB4BN0", ChipType.NUC123AE],
-    0x10010304: ["NUC103SC2BN0", ChipType.NUC123AE],
-    0x10010305: ["NUC103SC2BN1", ChipType.NUC123AE],
-    0x10010306: ["NUC103SC3BN0", ChipType.NUC123AE],
-    0x10010307: ["NUC103SC4BN0", ChipType.NUC123AE],
-    0x10010308: ["NUC103SC2BN2", ChipType.NUC123AE],
-    0x10010309: ["NUC103SC2BN3", ChipType.NUC123AE],
-    0x10010310: ["NUC103SC3BN2", ChipType.NUC123AE],
-    0x10010311: ["NUC103SC4BN2", ChipType.NUC123AE],
-    0x10010312: ["NUC103SD2BN0", ChipType.NUC123AE],
-    0x10010313: ["NUC103SD2BN1", ChipType.NUC123AE],
-    0x10010314: ["NUC103SD3BN0", ChipType.NUC123AE],
-    0x10010315: ["NUC103SD4BN0", ChipType.NUC123AE],
-    0x10010316: ["NUC103SE2BN0", ChipType.NUC123AE],
-    0x10010317: ["NUC103SE2BN1", ChipType.NUC123AE],
-    0x10010318: ["NUC103SE3BN0", ChipType.NUC123AE],
-    0x10010319: ["NUC103SE4BN0", ChipType.NUC123AE],
-    0x10010320: ["NUC103LB2BN0", ChipType.NUC123AE],
-    0x10010321: ["NUC103LB2BN1", ChipType.NUC123AE],
-    0x10010322: ["NUC103LB3BN0", ChipType.NUC123AE],
-    0x10010323: ["NUC103LB4BN0", ChipType.NUC123AE],
-    0x10010324: ["NUC103LC2BN0", ChipType.NUC123AE],
-    0x10010325: ["NUC103LC2BN1", ChipType.NUC123AE],
-    0x10010326: ["NUC103LC3BN0", ChipType.NUC123AE],
-    0x10010327: ["NUC103LC4BN0", ChipType.NUC123AE],
-    0x10010328: ["NUC103LC2BN2", ChipType.NUC123AE],
-    0x10010329: ["NUC103LC2BN3", ChipType.NUC123AE],
-    0x10010330: ["NUC103LC3BN2", ChipType.NUC123AE],
-    0x10010331: ["NUC103LC4BN2", ChipType.NUC123AE],
-    0x10010332: ["NUC103LD2BN0", ChipType.NUC123AE],
-    0x10010333: ["NUC103LD2BN1", ChipType.NUC123AE],
-    0x10010334: ["NUC103LD3BN0", ChipType.NUC123AE],
-    0x10010335: ["NUC103LD4BN0", ChipType.NUC123AE],
-    0x10010336: ["NUC103LE2BN0", ChipType.NUC123AE],
-    0x10010337: ["NUC103LE2BN1", ChipType.NUC123AE],
-    0x10010338: ["NUC103LE3BN0", ChipType.NUC123AE],
-    0x10010339: ["NUC103LE4BN0", ChipType.NUC123AE],
-    0x10010340: ["NUC103ZB2BN0", ChipType.NUC123AE],
-    0x10010341: ["NUC103ZB2BN1", ChipType.NUC123AE],
-    0x10010342: ["NUC103ZB3BN0", ChipType.NUC123AE],
-    0x10010343: ["NUC103ZB4BN0", ChipType.NUC123AE],
-    0x10010344: ["NUC103ZC2BN0", ChipType.NUC123AE],
-    0x10010345: ["NUC103ZC2BN1", ChipType.NUC123AE],
-    0x10010346: ["NUC103ZC3BN0", ChipType.NUC123AE],
-    0x10010347: ["NUC103ZC4BN0", ChipType.NUC123AE],
-    0x10010348: ["NUC103ZC2BN2", ChipType.NUC123AE],
-    0x10010349: ["NUC103ZC2BN3", ChipType.NUC123AE],
-    0x10010350: ["NUC103ZC3BN2", ChipType.NUC123AE],
-    0x10010351: ["NUC103ZC4BN2", ChipType.NUC123AE],
-    0x10010352: ["NUC103ZD2BN0", ChipType.NUC123AE],
-    0x10010353: ["NUC103ZD2BN1", ChipType.NUC123AE],
-    0x10010354: ["NUC103ZD3BN0", ChipType.NUC123AE],
-    0x10010355: ["NUC103ZD4BN0", ChipType.NUC123AE],
-    0x10010356: ["NUC103ZE2BN0", ChipType.NUC123AE],
-    0x10010357: ["NUC103ZE2BN1", ChipType.NUC123AE],
-    0x10010358: ["NUC103ZE3BN0", ChipType.NUC123AE],
-    0x10010359: ["NUC103ZE4BN0", ChipType.NUC123AE],
-    0x10010500: ["NUC105SB2BN0", ChipType.NUC123AE],
-    0x10010501: ["NUC105SB2BN1", ChipType.NUC123AE],
-    0x10010502: ["NUC105SB3BN0", ChipType.NUC123AE],
-    0x10010503: ["NUC105SB4BN0", ChipType.NUC123AE],
-    0x10010504: ["NUC105SC2BN0", ChipType.NUC123AE],
-    0x10010505: ["NUC105SC2BN1", ChipType.NUC123AE],
-    0x10010506: ["NUC105SC3BN0", ChipType.NUC123AE],
-    0x10010507: ["NUC105SC4BN0", ChipType.NUC123AE],
-    0x10010508: ["NUC105SC2BN2", ChipType.NUC123AE],
-    0x10010509: ["NUC105SC2BN3", ChipType.NUC123AE],
-    0x10010510: ["NUC105SC3BN2", ChipType.NUC123AE],
-    0x10010511: ["NUC105SC4BN2", ChipType.NUC123AE],
-    0x10010512: ["NUC105SD2BN0", ChipType.NUC123AE],
-    0x10010513: ["NUC105SD2BN1", ChipType.NUC123AE],
-    0x10010514: ["NUC105SD3BN0", ChipType.NUC123AE],
-    0x10010515: ["NUC105SD4BN0", ChipType.NUC123AE],
-    0x10010516: ["NUC105SE2BN0", ChipType.NUC123AE],
-    0x10010517: ["NUC105SE2BN1", ChipType.NUC123AE],
-    0x10010518: ["NUC105SE3BN0", ChipType.NUC123AE],
-    0x10010519: ["NUC105SE4BN0", ChipType.NUC123AE],
-    0x10010520: ["NUC105LB2BN0", ChipType.NUC123AE],
-    0x10010521: ["NUC105LB2BN1", ChipType.NUC123AE],
-    0x10010522: ["NUC105LB3BN0", ChipType.NUC123AE],
-    0x10010523: ["NUC105LB4BN0", ChipType.NUC123AE],
-    0x10010524: ["NUC105LC2BN0", ChipType.NUC123AE],
-    0x10010525: ["NUC105LC2BN1", ChipType.NUC123AE],
-    0x10010526: ["NUC105LC3BN0", ChipType.NUC123AE],
-    0x10010527: ["NUC105LC4BN0", ChipType.NUC123AE],
-    0x10010528: ["NUC105LC2BN2", ChipType.NUC123AE],
-    0x10010529: ["NUC105LC2BN3", ChipType.NUC123AE],
-    0x10010530: ["NUC105LC3BN2", ChipType.NUC123AE],
-    0x10010531: ["NUC105LC4BN2", ChipType.NUC123AE],
-    0x10010532: ["NUC105LD2BN0", ChipType.NUC123AE],
-    0x10010533: ["NUC105LD2BN1", ChipType.NUC123AE],
-    0x10010534: ["NUC105LD3BN0", ChipType.NUC123AE],
-    0x10010535: ["NUC105LD4BN0", ChipType.NUC123AE],
-    0x10010536: ["NUC105LE2BN0", ChipType.NUC123AE],
-    0x10010537: ["NUC105LE2BN1", ChipType.NUC123AE],
-    0x10010538: ["NUC105LE3BN0", ChipType.NUC123AE],
-    0x10010539: ["NUC105LE4BN0", ChipType.NUC123AE],
-    0x10010540: ["NUC105ZB2BN0", ChipType.NUC123AE],
-    0x10010541: ["NUC105ZB2BN1", ChipType.NUC123AE],
-    0x10010542: ["NUC105ZB3BN0", ChipType.NUC123AE],
-    0x10010543: ["NUC105ZB4BN0", ChipType.NUC123AE],
-    0x10010544: ["NUC105ZC2BN0", ChipType.NUC123AE],
-    0x10010545: ["NUC105ZC2BN1", ChipType.NUC123AE],
-    0x10010546: ["NUC105ZC3BN0", ChipType.NUC123AE],
-    0x10010547: ["NUC105ZC4BN0", ChipType.NUC123AE],
-    0x10010548: ["NUC105ZC2BN2", ChipType.NUC123AE],
-    0x10010549: ["NUC105ZC2BN3", ChipType.NUC123AE],
-    0x10010550: ["NUC105ZC3BN2", ChipType.NUC123AE],
-    0x10010551: ["NUC105ZC4BN2", ChipType.NUC123AE],
-    0x10010552: ["NUC105ZD2BN0", ChipType.NUC123AE],
-    0x10010553: ["NUC105ZD2BN1", ChipType.NUC123AE],
-    0x10010554: ["NUC105ZD3BN0", ChipType.NUC123AE],
-    0x10010555: ["NUC105ZD4BN0", ChipType.NUC123AE],
-    0x10010556: ["NUC105ZE2BN0", ChipType.NUC123AE],
-    0x10010557: ["NUC105ZE2BN1", ChipType.NUC123AE],
-    0x10010558: ["NUC105ZE3BN0", ChipType.NUC123AE],
-    0x10010559: ["NUC105ZE4BN0", ChipType.NUC123AE],
-    0x10012305: ["NUC123SC2AE1", ChipType.NUC123AE],
-    0x10012315: ["NUC123SD4AE0", ChipType.NUC123AE],
-    0x10012316: ["NUC123SD4SN0", ChipType.NUC123AE],
-    0x10012325: ["NUC123LC2AE1", ChipType.NUC123AE],
-    0x10012335: ["NUC123LD4AE0", ChipType.NUC123AE],
-    0x10012336: ["NUC123LC2AP1", ChipType.NUC123AE],
-    0x10012345: ["NUC123ZC2AE1", ChipType.NUC123AE],
-    0x10012355: ["NUC123ZD4AE0", ChipType.NUC123AE],
-    0x10012356: ["PH-MN1-33", ChipType.NUC123AE],
-    0x00051900: ["M0519LE3AE", ChipType.NM1500AE],
-    0x00051902: ["M0519LD3AE", ChipType.NM1500AE],
-    0x00051920: ["M0519SE3AE", ChipType.NM1500AE],
-    0x00051922: ["M0519SD3AE", ChipType.NM1500AE],
-    0x00051930: ["M0519VE3AE", ChipType.NM1500AE],
-    0x00351006: ["NM1510LC1AE", ChipType.NM1500AE],
-    0x00351008: ["NM1510LB1AE", ChipType.NM1500AE],
-    0x00352003: ["NM1520LD2AE", ChipType.NM1500AE],
-    0x00352005: ["NM1520LC2AE", ChipType.NM1500AE],
-    0x00352023: ["NM1520RD2AE", ChipType.NM1500AE],
-    0x00352025: ["NM1520RC2AE", ChipType.NM1500AE],
-    0x00353000: ["NM1530LE3AE", ChipType.NM1500AE],
-    0x00353030: ["NM1530VE3AE", ChipType.NM1500AE],
-    0x00353032: ["NM1530VD3AE", ChipType.NM1500AE],
-    0x30005200: ["M052LDE", ChipType.M051DE],
-    0x30005203: ["M052ZDE", ChipType.M051DE],
-    0x30005204: ["M052TDE", ChipType.M051DE],
-    0x30005205: ["M052XDE", ChipType.M051DE],
-    0x30005400: ["M054LDE", ChipType.M051DE],
-    0x30005403: ["M054ZDE", ChipType.M051DE],
-    0x30005404: ["M054TDE", ChipType.M051DE],
-    0x30005405: ["M054XDE", ChipType.M051DE],
-    0x30005800: ["M058LDE", ChipType.M051DE],
-    0x30005803: ["M058ZDE", ChipType.M051DE],
-    0x30005804: ["M058TDE", ChipType.M051DE],
-    0x30005805: ["M058XDE", ChipType.M051DE],
-    0x30005807: ["M058MDE", ChipType.M051DE],
-    0x30005810: ["NM1330LC1AE", ChipType.M051DE],
-    0x30005A00: ["M0516LDE", ChipType.M051DE],
-    0x30005A03: ["M0516ZDE", ChipType.M051DE],
-    0x30005A04: ["M0516TDE", ChipType.M051DE],
-    0x30005A05: ["M0516XDE", ChipType.M051DE],
-    0x30005A10: ["NM1330LD2AE", ChipType.M051DE],
-    0x30295804: ["NUC029TAE", ChipType.M051DE],
-    0x00295415: ["NUC029FAE", ChipType.MINI51DE],
-    0x20205100: ["MINI51LDE", ChipType.MINI51DE],
-    0x20205101: ["MINI51QDE", ChipType.MINI51DE],
-    0x20205102: ["MINI51", ChipType.MINI51DE],
-    0x20205103: ["MINI51ZDE", ChipType.MINI51DE],
-    0x20205104: ["MINI51TDE", ChipType.MINI51DE],
-    0x20205105: ["MINI51FDE", ChipType.MINI51DE],
-    0x20205200: ["MINI52LDE", ChipType.MINI51DE],
-    0x20205201: ["MINI52QDE", ChipType.MINI51DE],
-    0x20205202: ["MINI52", ChipType.MINI51DE],
-    0x20205203: ["MINI52ZDE", ChipType.MINI51DE],
-    0x20205204: ["MINI52TDE", ChipType.MINI51DE],
-    0x20205205: ["MINI52FDE", ChipType.MINI51DE],
-    0x20205400: ["MINI54LDE", ChipType.MINI51DE],
-    0x20205401: ["MINI54QDE", ChipType.MINI51DE],
-    0x20205402: ["MINI54", ChipType.MINI51DE],
-    0x20205403: ["MINI54ZDE", ChipType.MINI51DE],
-    0x20205404: ["MINI54TDE", ChipType.MINI51DE],
-    0x20205405: ["MINI54FDE", ChipType.MINI51DE],
-    0x20205406: ["MINI54FHC", ChipType.MINI51DE],
-    0x00B01400: ["NM1120DC1AE", ChipType.NM1120],
-    0x00B01420: ["NM1120FC1AE", ChipType.NM1120],
-    0x00B01421: ["PT1000", ChipType.NM1120],
-    0x00B01440: ["NM1120EC1AE", ChipType.NM1120],
-    0x00B01450: ["NM1120XC1AE", ChipType.NM1120],
-    0x00B01460: ["NM1120TC1AE", ChipType.NM1120],
-    0x00B01470: ["NM1120ZC1AE", ChipType.NM1120],
-    0x00B05720: ["MINI57FDE", ChipType.NM1120],
-    0x00B05740: ["MINI57EDE", ChipType.NM1120],
-    0x00B05750: ["MINI57XDE", ChipType.NM1120],
-    0x00B05760: ["MINI57TDE", ChipType.NM1120],
-    0x00B05761: ["YM0232A-04T", ChipType.NM1120],
-    0x00B057F0: ["MINI57WTDE", ChipType.NM1120],
-    0x00B15000: ["NPT150ZDE", ChipType.NM1120],
-    0x00B81000: ["NM1810FC1AE", ChipType.NM1120],
-    0x00B81010: ["NM1810EC1AE", ChipType.NM1120],
-    0x00B81020: ["NM1810XC1AE", ChipType.NM1120],
-    0x00B81030: ["NM1810XC1BE", ChipType.NM1120],
-    0x00B81040: ["NM18100Y", ChipType.NM1120],
-    0x00B81041: ["NM18101Y", ChipType.NM1120],
-    0x00B81042: ["NM18102ZCAE", ChipType.NM1120],
-    0x00B81043: ["NM18103ZCAE", ChipType.NM1120],
-    0x00B81045: ["NM18105Y", ChipType.NM1120],
-    0x00B81047: ["NM18107Y", ChipType.NM1120],
-    0x00B81050: ["NM1810ZC1BE", ChipType.NM1120],
-    0x00B81060: ["NM1810LC1AE", ChipType.NM1120],
-    0x00B81120: ["NM1811XC1AE", ChipType.NM1120],
-    0x00B81130: ["NM1811ZC1AE", ChipType.NM1120],
-    0x00B81310: ["NM1813FC1AE", ChipType.NM1120],
-    0x00B81320: ["NM1813EC1AE", ChipType.NM1120],
-    0x00B81340: ["NM1813LC1AE", ChipType.NM1120],
-    0x00B81710: ["NM1817UC1AE", ChipType.NM1120],
-    0x00B81720: ["NM1817NT", ChipType.NM1120],
-    0x00000505: ["NUC505", ChipType.NUC505],
-    0x0C012300: ["NM1234D", ChipType.NM1230],
-    0x0C012301: ["NM1233D", ChipType.NM1230],
-    0x0C012302: ["NM1232D", ChipType.NM1230],
-    0x0C01230A: ["NM1220EBK0", ChipType.NM1230],
-    0x0C01230B: ["TF5103", ChipType.NM1230],
-    0x0C012390: ["NM1234Y", ChipType.NM1230],
-    0x0C012391: ["NM1233Y", ChipType.NM1230],
-    0x0C012392: ["NM1232Y", ChipType.NM1230],
-    0x0C051000: ["TF5103D", ChipType.NM1230],
-    0x0C051090: ["TF5103Y", ChipType.NM1230],
-    0x0C051091: ["TF5102Y", ChipType.NM1230],
-    0x0C082390: ["NM18307Y", ChipType.NM1230],
-    0x00F25102: ["M251LG6AE", ChipType.M252_G],
-    0x00F25111: ["M251SG6AE", ChipType.M252_G],
-    0x00F25140: ["M251KG6AE", ChipType.M252_G],
-    0x00F25202: ["M252LG6AE", ChipType.M252_G],
-    0x00F25211: ["M252SG6AE", ChipType.M252_G],
-    0x00F25240: ["M252KG6AE", ChipType.M252_G],
-    0x00F25105: ["M251LE3AE", ChipType.M252_E],
-    0x00F25114: ["M251SE3AE", ChipType.M252_E],
-    0x00F25116: ["NDA102SE3", ChipType.M252_E],
-    0x00F25143: ["M251KE3AE", ChipType.M252_E],
-    0x00F25205: ["M252LE3AE", ChipType.M252_E],
-    0x00F25214: ["M252SE3AE", ChipType.M252_E],
-    0x00F25243: ["M252KE3AE", ChipType.M252_E],
-    0x00F25101: ["M251LD2AE", ChipType.M252_D],
-    0x00F25104: ["M251LC2AE", ChipType.M252_D],
-    0x00F25110: ["M251SD2AE", ChipType.M252_D],
-    0x00F25112: ["NDA102SD2", ChipType.M252_D],
-    0x00F25113: ["M251SC2AE", ChipType.M252_D],
-    0x00F251C2: ["M251ZD2AE", ChipType.M252_D],
-    0x00F251C5: ["NDA102TD2", ChipType.M252_D],
-    0x00F25201: ["M252LD2AE", ChipType.M252_D],
-    0x00F25204: ["M252LC2AE", ChipType.M252_D],
-    0x00F25210: ["M252SD2AE", ChipType.M252_D],
-    0x00F25213: ["M252SC2AE", ChipType.M252_D],
-    0x00F252C2: ["M252ZD2AE", ChipType.M252_D],
-    0x00F25170: ["NDA102UD2", ChipType.M252_C],
-    0x00F251A0: ["M251EC2AE", ChipType.M252_C],
-    0x00F251A4: ["M251EB2AE", ChipType.M252_C],
-    0x00F251B0: ["M251FC2AE", ChipType.M252_C],
-    0x00F251B3: ["M251FB2AE", ChipType.M252_C],
-    0x00F251E0: ["M251ZC2AE", ChipType.M252_C],
-    0x00F251E5: ["M251ZB2AE", ChipType.M252_C],
-    0x00F252A0: ["M252EC2AE", ChipType.M252_C],
-    0x00F252B0: ["M252FC2AE", ChipType.M252_C],
-    0x00F252E0: ["M252ZC2AE", ChipType.M252_C],
-    0x0C112400: ["NM1244D48", ChipType.NM1240],
-    0x0C112401: ["NM1243D48", ChipType.NM1240],
-    0x0C112430: ["N32F030D", ChipType.NM1240],
-    0x0C112431: ["N32F030Y", ChipType.NM1240],
-    0x0C112432: ["N32F030X", ChipType.NM1240],
-    0x0C112490: ["NM1244Y48", ChipType.NM1240],
-    0x0C112491: ["NM1243Y48", ChipType.NM1240],
-    0x0C1124E0: ["NM1244Y", ChipType.NM1240],
-    0x0C1124E1: ["NM1243Y", ChipType.NM1240],
-    0x0C182400: ["NM18440D", ChipType.NM1240],
-    0x0C182490: ["NM18407Y", ChipType.NM1240],
-    0x0C182491: ["NM18407SY", ChipType.NM1240],
-    0x0C182492: ["NM18402Y", ChipType.NM1240],
-    0x00F25410: ["M254SD3AE", ChipType.M258],
-    0x00F25411: ["M254SE3AE", ChipType.M258],
-    0x00F25440: ["M254KD3AE", ChipType.M258],
-    0x00F25441: ["M254KE3AE", ChipType.M258],
-    0x00F25470: ["M254QD3AE", ChipType.M258],
-    0x00F25471: ["M254QE3AE", ChipType.M258],
-    0x00F254A1: ["M254ME3AE", ChipType.M258],
-    0x00F25610: ["M256SD3AE", ChipType.M258],
-    0x00F25611: ["M256SE3AE", ChipType.M258],
-    0x00F25640: ["M256KD3AE", ChipType.M258],
-    0x00F25641: ["M256KE3AE", ChipType.M258],
-    0x00F25670: ["M256QD3AE", ChipType.M258],
-    0x00F25671: ["M256QE3AE", ChipType.M258],
-    0x00F25810: ["M258SD3AE", ChipType.M258],
-    0x00F25811: ["M258SE3AE", ChipType.M258],
-    0x00F25840: ["M258KD3AE", ChipType.M258],
-    0x00F25841: ["M258KE3AE", ChipType.M258],
-    0x00F25870: ["M258QD3AE", ChipType.M258],
-    0x00F25871: ["M258QE3AE", ChipType.M258],
-    0x00D480FF: ["M480TEST", ChipType.M480],
-    0x00D48100: ["M481LIDAE", ChipType.M480],
-    0x00D48101: ["M481LGAAE", ChipType.M480],
-    0x00D48110: ["M481SIDAE", ChipType.M480],
-    0x00D48111: ["M481SGAAE", ChipType.M480],
-    0x00D48140: ["M481KIDAE", ChipType.M480],
-    0x00D48141: ["M481KGAAE", ChipType.M480],
-    0x00D481E0: ["M481ZIDAE", ChipType.M480],
-    0x00D481E1: ["M481ZGAAE", ChipType.M480],
-    0x00D481E2: ["M481ZGDAE", ChipType.M480],
-    0x00D48200: ["M482LIDAE", ChipType.M480],
-    0x00D48201: ["M482LGAAE", ChipType.M480],
-    0x00D48210: ["M482SIDAE", ChipType.M480],
-    0x00D48211: ["M482SGAAE", ChipType.M480],
-    0x00D48212: ["M482SIDAE3O", ChipType.M480],
-    0x00D48230: ["M482VIDAE", ChipType.M480],
-    0x00D48231: ["M482VGAAE", ChipType.M480],
-    0x00D48240: ["M482KIDAE", ChipType.M480],
-    0x00D48241: ["M482KGAAE", ChipType.M480],
-    0x00D48250: ["M482JIDAE", ChipType.M480],
-    0x00D48251: ["M482JGAAE", ChipType.M480],
-    0x00D482E0: ["M482ZIDAE", ChipType.M480],
-    0x00D48300: ["M483LIDAE", ChipType.M480],
-    0x00D48301: ["M483LGAAE", ChipType.M480],
-    0x00D48310: ["M483SIDAE", ChipType.M480],
-    0x00D48311: ["M483SGAAE", ChipType.M480],
-    0x00D48330: ["M483VIDAE", ChipType.M480],
-    0x00D48331: ["M483VGAAE", ChipType.M480],
-    0x00D48340: ["M483KIDAE", ChipType.M480],
-    0x00D48341: ["M483KGAAE", ChipType.M480],
-    0x00D48350: ["M483JIDAE", ChipType.M480],
-    0x00D48351: ["M483JGAAE", ChipType.M480],
-    0x00D48410: ["M484SIDAE", ChipType.M480],
-    0x00D48411: ["M484SGAAE", ChipType.M480],
-    0x00D48412: ["M484SIDAE2U", ChipType.M480],
-    0x00D48413: ["M484SGAAE2U", ChipType.M480],
-    0x00D48440: ["M484KIDAE", ChipType.M480],
-    0x00D48441: ["M484KGAAE", ChipType.M480],
-    0x00D48500: ["M485LIDAE", ChipType.M480],
-    0x00D48510: ["M485SIDAE", ChipType.M480],
-    0x00D48511: ["M485SGAAE", ChipType.M480],
-    0x00D4851F: ["M48SSIDAE", ChipType.M480],
-    0x00D48530: ["M485VIDAE", ChipType.M480],
-    0x00D48531: ["M485VGAAE", ChipType.M480],
-    0x00D48540: ["M485KIDAE", ChipType.M480],
-    0x00D48541: ["M485KGAAE", ChipType.M480],
-    0x00D48550: ["M485JIDAE", ChipType.M480],
-    0x00D48551: ["M485JGAAE", ChipType.M480],
-    0x00D48580: ["M485OIDAE", ChipType.M480],
-    0x00D48581: ["M485OGAAE", ChipType.M480],
-    0x00D48590: ["M485YIDAE", ChipType.M480],
-    0x00D485E0: ["M485ZIDAE", ChipType.M480],
-    0x00D48640: ["M486KIDAE", ChipType.M480],
-    0x00D48650: ["M486JIDAE", ChipType.M480],
-    0x00D48710: ["M487SIDAE", ChipType.M480],
-    0x00D48711: ["M487SGAAE", ChipType.M480],
-    0x00D48740: ["M487KIDAE", ChipType.M480],
-    0x00D48741: ["M487KGAAE", ChipType.M480],
-    0x00D4874E: ["M487KMCAN", ChipType.M480],
-    0x00D4874F: ["M48SKIDAE", ChipType.M480],
-    0x00D48750: ["M487JIDAE", ChipType.M480],
-    0x00D48751: ["M487JGAAE", ChipType.M480],
-    0x00235100: ["M2351KIAAE", ChipType.M2351],
-    0x00235101: ["M2351SIAAE", ChipType.M2351],
-    0x00235102: ["M2351CIAAE", ChipType.M2351],
-    0x00235103: ["M2351ZIAAE", ChipType.M2351],
-    0x00235300: ["M2351SFSIAAP", ChipType.M2351],
-    0x00261000: ["M261ZIAAE", ChipType.M2351],
-    0x00261001: ["M261SIAAE", ChipType.M2351],
-    0x00261002: ["M261KIAAE", ChipType.M2351],
-    0x00262000: ["M262ZIAAE", ChipType.M2351],
-    0x00262001: ["M262SIAAE", ChipType.M2351],
-    0x00262002: ["M262KIAAE", ChipType.M2351],
-    0x00263000: ["M263ZIAAE", ChipType.M2351],
-    0x00263001: ["M263SIAAE", ChipType.M2351],
-    0x00263002: ["M263KIAAE", ChipType.M2351],
-    0x01343302: ["M433LE8AE", ChipType.M480LD],
-    0x01343312: ["M433SE8AE", ChipType.M480LD],
-    0x01347901: ["M479LG8AEE", ChipType.M480LD],
-    0x01347911: ["M479SG8AEE", ChipType.M480LD],
-    0x01347991: ["M479NG8AEE", ChipType.M480LD],
-    0x01348100: ["M481LGCAE", ChipType.M480LD],
-    0x01348101: ["M481LG8AE", ChipType.M480LD],
-    0x01348102: ["M481LE8AE", ChipType.M480LD],
-    0x0134810F: ["M481LGCAEU", ChipType.M480LD],
-    0x01348110: ["M481SGCAE", ChipType.M480LD],
-    0x01348111: ["M481SG8AE", ChipType.M480LD],
-    0x01348112: ["M481SE8AE", ChipType.M480LD],
-    0x01348114: ["M481SGCAE2A", ChipType.M480LD],
-    0x01348115: ["M481SG8AE2A", ChipType.M480LD],
-    0x013481E0: ["M481ZGCAE", ChipType.M480LD],
-    0x013481E1: ["M481ZG8AE", ChipType.M480LD],
-    0x013481E2: ["M481ZE8AE", ChipType.M480LD],
-    0x01348200: ["M482LGCAE", ChipType.M480LD],
-    0x01348201: ["M482LG8AE", ChipType.M480LD],
-    0x01348202: ["M482LE8AE", ChipType.M480LD],
-    0x01348210: ["M482SGCAE", ChipType.M480LD],
-    0x01348211: ["M482SG8AE", ChipType.M480LD],
-    0x01348212: ["M482SE8AE", ChipType.M480LD],
-    0x01348240: ["M482KGCAE", ChipType.M480LD],
-    0x01348241: ["M482KG8AE", ChipType.M480LD],
-    0x013482E0: ["M482ZGCAE", ChipType.M480LD],
-    0x013482E1: ["M482ZG8AE", ChipType.M480LD],
-    0x013482E2: ["M482ZE8AE", ChipType.M480LD],
-    0x01348310: ["M483SGCAE", ChipType.M480LD],
-    0x01348311: ["M483SG8AE", ChipType.M480LD],
-    0x01348312: ["M483SE8AE", ChipType.M480LD],
-    0x01348314: ["M483SGCAE2A", ChipType.M480LD],
-    0x01348315: ["M483SG8AE2A", ChipType.M480LD],
-    0x01348340: ["M483KGCAE", ChipType.M480LD],
-    0x01348341: ["M483KG8AE", ChipType.M480LD],
-    0x01348344: ["M483KGCAE2A", ChipType.M480LD],
-    0x01348345: ["M483KG8AE2A", ChipType.M480LD],
-    0xA1735400: ["M2354LJFAE", ChipType.M2354],
-    0xA173540C: ["M2354LJFCE", ChipType.M2354],
-    0xA1735410: ["M2354SJFAE", ChipType.M2354],
-    0xA1735440: ["M2354KJFAE", ChipType.M2354],
-    0xA173544F: ["M2354ALPHA", ChipType.M2354],
-    0x00235500: ["M2354ES", ChipType.M2354ES],
-    0x00F25000: ["M253LD3AE", ChipType.M253],
-    0x00F25001: ["M253LE3AE", ChipType.M253],
-    0x00F25002: ["M253LD3BE", ChipType.M253],
-    0x00F25003: ["M253LE3BE", ChipType.M253],
-    0x00F250E0: ["M253ZE3AE", ChipType.M253],
-    0x00F250E1: ["M253ZE3BE", ChipType.M253],
-    0x011316E0: ["M031GTD2AE", ChipType.M031GPON],
-    0x011316E1: ["M031GTC1AE", ChipType.M031GPON],
-    0x011316E2: ["M031GTC2AE", ChipType.M031GPON],
-    0x011316F0: ["M031GGD2AE", ChipType.M031GPON],
-    0x011316F1: ["M031GGC1AE", ChipType.M031GPON],
-    0x011316F2: ["M031GGC2AE", ChipType.M031GPON],
-    0x01191690: ["M091YD2AE", ChipType.M031GPON],
-    0x01191692: ["M091YC2AE", ChipType.M031GPON],
-    0x011916E0: ["M091TD2AE", ChipType.M031GPON],
-    0x011916E2: ["M091TC2AE", ChipType.M031GPON],
-    0x01812600: ["NUC1262LE4AE", ChipType.NUC1262],
-    0x01812610: ["NUC1262SE4AE", ChipType.NUC1262],
-    0x01812690: ["NUC1262NE4AE", ChipType.NUC1262],
-    0x01812691: ["NUC1262YE4AE", ChipType.NUC1262],
-    0x00945000: ["M451MLD3AE", ChipType.M451LD],
-    0x00945001: ["M451MLC3AE", ChipType.M451LD],
-    0x00945002: ["MP3202A", ChipType.M451LD],
-    0x00945010: ["M451MSD3AE", ChipType.M451LD],
-    0x00945011: ["M451MSC3AE", ChipType.M451LD],
-    0x00945020: ["M451MRD3AE", ChipType.M451LD],
-    0x00945021: ["M451MRC3AE", ChipType.M451LD],
-    0x00945100: ["M451LD3AE", ChipType.M451LD],
-    0x00945101: ["M451LC3AE", ChipType.M451LD],
-    0x00945110: ["M451SD3AE", ChipType.M451LD],
-    0x00945111: ["M451SC3AE", ChipType.M451LD],
-    0x00945120: ["M451RD3AE", ChipType.M451LD],
-    0x00945121: ["M451RC3AE", ChipType.M451LD],
-    0x00945130: ["M451VD3AE", ChipType.M451LD],
-    0x00945131: ["M451VC3AE", ChipType.M451LD],
-    0x009451F0: ["M451YD3AE", ChipType.M451LD],
-    0x009451F1: ["M451YC3AE", ChipType.M451LD],
-    0x00945200: ["M452LD3AE", ChipType.M451LD],
-    0x00945201: ["M452LC3AE", ChipType.M451LD],
-    0x00945210: ["M452SD3AE", ChipType.M451LD],
-    0x00945211: ["M452SC3AE", ChipType.M451LD],
-    0x00945220: ["M452RD3AE", ChipType.M451LD],
-    0x00945221: ["M452RC3AE", ChipType.M451LD],
-    0x00945230: ["M452VD3AE", ChipType.M451LD],
-    0x00945231: ["M452VC3AE", ChipType.M451LD],
-    0x009452F0: ["M452YD3AE", ChipType.M451LD],
-    0x009452F1: ["M452YC3AE", ChipType.M451LD],
-    0x00945300: ["M453LD3AE", ChipType.M451LD],
-    0x00945301: ["M453LC3AE", ChipType.M451LD],
-    0x00945310: ["M453SD3AE", ChipType.M451LD],
-    0x00945311: ["M453SC3AE", ChipType.M451LD],
-    0x00945320: ["M453RD3AE", ChipType.M451LD],
-    0x00945321: ["M453RC3AE", ChipType.M451LD],
-    0x00945330: ["M453VD3AE", ChipType.M451LD],
-    0x00945331: ["M453VC3AE", ChipType.M451LD],
-    0x009453F0: ["M453YD3AE", ChipType.M451LD],
-    0x009453F1: ["M453YC3AE", ChipType.M451LD],
-    0x01B46310: ["M463SJHAE", ChipType.M460HD],
-    0x01B46311: ["M463SIHAE", ChipType.M460HD],
-    0x01B46340: ["M463KJHAE", ChipType.M460HD],
-    0x01B46341: ["M463KIHAE", ChipType.M460HD],
-    0x01B46410: ["M464SJHAE", ChipType.M460HD],
-    0x01B46411: ["M464SIHAE", ChipType.M460HD],
-    0x01B46440: ["M464KJHAE", ChipType.M460HD],
-    0x01B46441: ["M464KIHAE", ChipType.M460HD],
-    0x01B46710: ["M467SJHAE", ChipType.M460HD],
-    0x01B46711: ["M467SIHAE", ChipType.M460HD],
-    0x01B46712: ["M467S2JHAE", ChipType.M460HD],
-    0x01B46730: ["M467VJHAE", ChipType.M460HD],
-    0x01B46731: ["M467VIHAE", ChipType.M460HD],
-    0x01B46740: ["M467KJHAE", ChipType.M460HD],
-    0x01B46741: ["M467KIHAE", ChipType.M460HD],
-    0x01B46742: ["M467K2JHAE", ChipType.M460HD],
-    0x01B46750: ["M467JJHAE", ChipType.M460HD],
-    0x01B46751: ["M467JIHAE", ChipType.M460HD],
-    0x01B46752: ["M467J2JHAE", ChipType.M460HD],
-    0x01B46760: ["M467HJHAE", ChipType.M460HD],
-    0x01B46761: ["M467HIHAE", ChipType.M460HD],
-    0x01B46762: ["M467H2JHAE", ChipType.M460HD],
-    0x01B46B10: ["M463H3SJHAN", ChipType.M460HD],
-    0x01B46B11: ["M463H3SIHAN", ChipType.M460HD],
-    0x01B46B12: ["M463SJHAN", ChipType.M460HD],
-    0x01B46B40: ["M463H3KJHAN", ChipType.M460HD],
-    0x01B46B41: ["M463H3KIHAN", ChipType.M460HD],
-    0x01B46B42: ["M463KJHAN", ChipType.M460HD],
-    0x01B46B50: ["M467H3JJHAN", ChipType.M460HD],
-    0x01B46B61: ["M467H3HJHAN", ChipType.M460HD],
-    0x01B46F10: ["M467H3SJHAE", ChipType.M460HD],
-    0x01B46F11: ["M467SJHAN", ChipType.M460HD],
-    0x01B46F40: ["M467H3KJHAE", ChipType.M460HD],
-    0x01B46F41: ["M467KJHAN", ChipType.M460HD],
-    0x01B46F50: ["M467H3JJHAN", ChipType.M460HD],
-    0x01B46F51: ["M467H3JJHAE", ChipType.M460HD],
-    0x01B46F52: ["M467JJHAN", ChipType.M460HD],
-    0x01B46F60: ["M467H3HJHAN", ChipType.M460HD],
-    0x01B46F61: ["M467HJHAN", ChipType.M460HD],
-    0x01A25411: ["M254SD2AE", ChipType.M256D],
-    0x01A254A1: ["M254MD2AE", ChipType.M256D],
-    0x01A25611: ["M256SD2AE", ChipType.M256D],
-    0x01A256A1: ["M256MD2AE", ChipType.M256D],
-    0x01925411: ["M254SG6AE", ChipType.M258G],
-    0x01925441: ["M254KG6AE", ChipType.M258G],
-    0x01925611: ["M256SG6AE", ChipType.M258G],
-    0x01925641: ["M256KG6AE", ChipType.M258G],
-    0x01925671: ["M256QG6AE", ChipType.M258G],
-    0x01925811: ["M258SG6AE", ChipType.M258G],
-    0x01925841: ["M258KG6AE", ChipType.M258G],
-    0x01925871: ["M258QG6AE", ChipType.M258G],
-    0x01C46000: ["M460LGCAE", ChipType.M460LD],
-    0x01C46010: ["M460SGCAE", ChipType.M460LD],
-    0x01C46040: ["M460KGCAE", ChipType.M460LD],
-    0x01C46080: ["M460AGCAE", ChipType.M460LD],
-    0x01C46090: ["M460YGCAE", ChipType.M460LD],
-    0x01C46300: ["M463LGCAE", ChipType.M460LD],
-    0x01C4630E: ["M463L2GCAC", ChipType.M460LD],
-    0x01C46310: ["M463SGCAE", ChipType.M460LD],
-    0x01C4631E: ["M463S2GCAC", ChipType.M460LD],
-    0x01C46330: ["M463VGCAE", ChipType.M460LD],
-    0x01C46340: ["M463KGCAE", ChipType.M460LD],
-    0x01C4634E: ["M463K2GCAC", ChipType.M460LD],
-    0x01C46380: ["M463AGCAE", ChipType.M460LD],
-    0x01C46390: ["M463YGCAE", ChipType.M460LD],
-    0x01C46400: ["M464LGCAE", ChipType.M460LD],
-    0x01C46410: ["M464SGCAE", ChipType.M460LD],
-    0x01C46440: ["M464KGCAE", ChipType.M460LD],
-    0x01C46480: ["M464AGCAE", ChipType.M460LD],
-    0x01C46490: ["M464YGCAE", ChipType.M460LD],
-    0x01C46A00: ["M46ALGCAE", ChipType.M460LD],
-    0x01C46A10: ["M46ASGCAE", ChipType.M460LD],
-    0x01C46A40: ["M46AKGCAE", ChipType.M460LD],
-    0x01C46A80: ["M46AAGCAE", ChipType.M460LD],
-    0x01C46A90: ["M46AYGCAE", ChipType.M460LD],
-    0x01D12600: ["NUC1263LD4AE", ChipType.NUC1263],
-    0x01D12610: ["NUC1263SD4AE", ChipType.NUC1263],
-    0x01D12690: ["NUC1263ND4AE", ChipType.NUC1263],
-    0x01D126E0: ["NUC1263ZD4AE", ChipType.NUC1263],
-    0x21D12600: ["NUC1263LD4CE", ChipType.NUC1263],
-    0x21D12610: ["NUC1263SD4CE", ChipType.NUC1263],
-    0x21D12690: ["NUC1263ND4CE", ChipType.NUC1263],
-    0x21D126E0: ["NUC1263ZD4CE", ChipType.NUC1263],
-    0x01F31000: ["M2L31LIDAE", ChipType.M2L31],
-    0x01F31001: ["M2L31LGDAE", ChipType.M2L31],
-    0x01F31002: ["M2L31LG4AE", ChipType.M2L31],
-    0x01F31003: ["M2L31LE4AE", ChipType.M2L31],
-    0x01F31004: ["M2L31LD4AE", ChipType.M2L31],
-    0x01F31010: ["M2L31SIDAE", ChipType.M2L31],
-    0x01F31011: ["M2L31SGDAE", ChipType.M2L31],
-    0x01F31012: ["M2L31SG4AE", ChipType.M2L31],
-    0x01F31013: ["M2L31SE4AE", ChipType.M2L31],
-    0x01F31040: ["M2L31KIDAE", ChipType.M2L31],
-    0x01F31041: ["M2L31KGDAE", ChipType.M2L31],
-    0x01F31090: ["M2L31YIDAE", ChipType.M2L31],
-    0x01F31091: ["M2L31YGDAE", ChipType.M2L31],
-    0x01F31092: ["M2L31YG4AE", ChipType.M2L31],
-    0x01F31093: ["M2L31YE4AE", ChipType.M2L31],
-    0x01F31094: ["M2L31YD4AE", ChipType.M2L31],
-    0x01F310A0: ["M2L31CIDAE", ChipType.M2L31],
-    0x01F310A1: ["M2L31CGDAE", ChipType.M2L31],
-    0x01F310B4: ["M2L31XD4AE", ChipType.M2L31],
-    0x01F310C3: ["M2L31ZE4AE", ChipType.M2L31],
-    0x01F310C4: ["M2L31ZD4AE", ChipType.M2L31],
-    0x00551000: ["M55M1ES", ChipType.M55M1],
-    0x01F03C80: ["M2003XC1AE", ChipType.M2003],
-    0x01F03C9F: ["M2P481QC1AE", ChipType.M2003],
-    0x01F03CB0: ["M2003FC1AE", ChipType.M2003],
-    0x01F03CFF: ["KN44490A", ChipType.M2003],
-# 8051
-    0x00002140: ["N76E884", ChipType.N76E885],
-    0x00002150: ["N76E885", ChipType.N76E885],
-    0x00002F50: ["N76E616", ChipType.N76E616],
-    0x00003640: ["N76E002", ChipType.N76E003],
-    0x00003650: ["N76E003", ChipType.N76E003],
-    0x00004832: ["ML51_32K_GENERIC", ChipType.ML51_32K],
-    0x00004932: ["ML51_32K_MISSINGNO (Please report the chip name if you encounter this in the wild)", ChipType.ML51_32K],
-    0x00004944: ["ML51_64K_MISSINGNO (Please report the chip name if you encounter this in the wild)", ChipType.ML51_32K],
-    0x00104832: ["ML51LC0XX", ChipType.ML51_32K],
-    0x01104821: ["ML51PB9AE", ChipType.ML51_32K],
-    0x01104832: ["ML51PC0AE", ChipType.ML51_32K],
-    0x02104832: ["ML51EC0AE", ChipType.ML51_32K],
-    0x03104832: ["ML51UC0AE", ChipType.ML51_32K],
-    0x0B104832: ["ML51FC0AE", ChipType.ML51_32K],
-    0x0C104821: ["ML51TB9AE", ChipType.ML51_32K],
-    0x0C104832: ["ML51TC0AE", ChipType.ML51_32K],
-    0x00004711: ["ML51_8K_MISSINGNO  (Please report the chip name if you encounter this in the wild)", ChipType.ML51_16K],
-    0x00004721: ["ML51_16K_GENERIC", ChipType.ML51_16K],
-    0x00004821: ["ML51_16K_GENERIC_2", ChipType.ML51_16K],
-    0x00104721: ["ML51LB9XX", ChipType.ML51_16K],
-    0x02104721: ["ML51EB9AE", ChipType.ML51_16K],
-    0x03104721: ["ML51UB9AE", ChipType.ML51_16K],
-    0x04104711: ["ML51OA9AE", ChipType.ML51_16K],
-    0x04104721: ["ML51OB9AE", ChipType.ML51_16K],
-    0x06104711: ["ML51BA9AE", ChipType.ML51_16K],
-    0x06104721: ["ML51BB9AE", ChipType.ML51_16K],
-    0x09104711: ["ML51DA9AE", ChipType.ML51_16K],
-    0x09104721: ["ML51DB9AE", ChipType.ML51_16K],
-    0x0B104711: ["ML51FA9AE", ChipType.ML51_16K],
-    0x0B104721: ["ML51FB9AE", ChipType.ML51_16K],
-    0x0D104711: ["ML51XA9AE", ChipType.ML51_16K],
-    0x0D104721: ["ML51XB9AE", ChipType.ML51_16K],
-    0x00004B20: ["MS51_16K_MISSINGNO_512B (Please report the chip name if you encounter this in the wild)", ChipType.MS51_16K],
-    0x00004B21: ["MS51_16K_GENERIC_1K", ChipType.MS51_16K],
-    0x04004B21: ["MS51OB9AE", ChipType.MS51_16K],
-    0x05004B21: ["MS51XB9AE", ChipType.MS51_16K],
-    0x09004B21: ["MS51XB9CE", ChipType.MS51_16K],
-    0x0B004B21: ["MS51FB9AE", ChipType.MS51_16K],
-    0x0E004B21: ["MS51XB9BE", ChipType.MS51_16K],
-    0x1D004B21: ["NM18002Y", ChipType.MS51_16K],
-    0x00004B10: ["MS51_8K_GENERIC_512B", ChipType.MS51_8K],
-    0x00004B11: ["MS51_8K_GENERIC_1K", ChipType.MS51_8K],
-    0x00005211: ["MS5108KXX", ChipType.MS51_8K],
-    0x06005211: ["MS51BA9AE", ChipType.MS51_8K],
-    0x0A005211: ["MS51DA9AE", ChipType.MS51_8K],
-    0x0F005211: ["MS51IA9AE", ChipType.MS51_8K],
-    0x00005322: ["MS51_16K_GENERIC", ChipType.MS51_32K],
-    0x00005332: ["MS51_32K_GENERIC", ChipType.MS51_32K],
-    0x01005332: ["MS51PC0AE", ChipType.MS51_32K],
-    0x02005322: ["MS51EB0AE", ChipType.MS51_32K],
-    0x02005332: ["MS51EC0AE", ChipType.MS51_32K],
-    0x05005332: ["MS51XC0AE", ChipType.MS51_32K],
-    0x0B005332: ["MS51FC0AE", ChipType.MS51_32K],
-    0x0C005332: ["MS51TC0AE", ChipType.MS51_32K],
-    0x0E005332: ["MS51XC0BE", ChipType.MS51_32K],
-    0x00005734: ["ML56_32K_GENERIC", ChipType.ML56],
-    0x00005744: ["ML56_64K_GENERIC", ChipType.ML56],
-    0x00105734: ["ML51LC1AE", ChipType.ML56],
-    0x00105744: ["ML51LD1AE", ChipType.ML56],
-    0x00115734: ["ML54LC1AE", ChipType.ML56],
-    0x00115744: ["ML54LD1AE", ChipType.ML56],
-    0x00125734: ["ML56LC1AE", ChipType.ML56],
-    0x00125744: ["ML56LD1AE", ChipType.ML56],
-    0x07115744: ["ML54MD1AE", ChipType.ML56],
-    0x07125744: ["ML56MD1AE", ChipType.ML56],
-    0x08105744: ["ML51SD1AE", ChipType.ML56],
-    0x08115744: ["ML54SD1AE", ChipType.ML56],
-    0x08125744: ["ML56SD1AE", ChipType.ML56],
-    0x0C105734: ["ML51TC1AE", ChipType.ML56],
-    0x0C105744: ["ML51TD1AE", ChipType.ML56],
-    0x0C115734: ["ML54TC1AE", ChipType.ML56],
-    0x0C125734: ["ML56TC1AE", ChipType.ML56],
-    0x00006321: ["MUG51_GENERIC", ChipType.MUG51],
-    0x0C106321: ["MUG51TB9AE", ChipType.MUG51],
-    0xFFFF6321: ["MUG51W", ChipType.MUG51],
-    0x00006721: ["MG51_16K_GENERIC", ChipType.MG51],
-    0x00006731: ["MG51_32K_GENERIC", ChipType.MG51],
-    0x00006750: ["N76S003_GENERIC", ChipType.MG51],
-    0x05006721: ["MG51XB9AE", ChipType.MG51],
-    0x05006731: ["MG51XC9AE", ChipType.MG51],
-    0x05006750: ["N76S003AQ20", ChipType.MG51],
-    0x0B006721: ["MG51FB9AE", ChipType.MG51],
-    0x0B006731: ["MG51FC9AE", ChipType.MG51],
-    0x0B006750: ["N76S003AT20", ChipType.MG51],
-    0x0E006721: ["MG51XB9BE", ChipType.MG51],
-    0x0E006731: ["MG51XC9BE", ChipType.MG51],
-    0x0E006750: ["N76S003BQ20", ChipType.MG51],
-    # Unknown what these are
-    0x00007234: ["MG51_64K_MISSING_NO (Please report the chip name if you encounter this in the wild)", ChipType.MG51],
-    0x00007244: ["MG51_32K_MISSING_NO (Please report the chip name if you encounter this in the wild)", ChipType.MG51],
+def _build_part_num_ids() -> dict:
+    return {
+        0xFFFFFFFF: ["UNKNOWN", ChipType.UNKNOWN],
+        0x00010000: ["NUC100LE3AN", ChipType.NUC100AN],
+        0x00010001: ["NUC100LE2AN", ChipType.NUC100AN],
+        0x00010002: ["NUC100LE1AN", ChipType.NUC100AN],
+        0x00010003: ["NUC100LD3AN", ChipType.NUC100AN],
+        0x00010004: ["NUC100LD2AN", ChipType.NUC100AN],
+        0x00010005: ["NUC100LD1AN", ChipType.NUC100AN],
+        0x00010006: ["NUC100LC3AN", ChipType.NUC100AN],
+        0x00010007: ["NUC100LC2AN", ChipType.NUC100AN],
+        0x00010008: ["NUC100LC1AN", ChipType.NUC100AN],
+        0x00010009: ["NUC100RE3AN", ChipType.NUC100AN],
+        0x00010010: ["NUC100RE2AN", ChipType.NUC100AN],
+        0x00010011: ["NUC100RE1AN", ChipType.NUC100AN],
+        0x00010012: ["NUC100RD3AN", ChipType.NUC100AN],
+        0x00010013: ["NUC100RD2AN", ChipType.NUC100AN],
+        0x00010014: ["NUC100RD1AN", ChipType.NUC100AN],
+        0x00010015: ["NUC100RC3AN", ChipType.NUC100AN],
+        0x00010016: ["NUC100RC2AN", ChipType.NUC100AN],
+        0x00010017: ["NUC100RC1AN", ChipType.NUC100AN],
+        0x00010019: ["NUC100VE2AN", ChipType.NUC100AN],
+        0x00010020: ["NUC100VE1AN", ChipType.NUC100AN],
+        0x00010021: ["NUC100VD3AN", ChipType.NUC100AN],
+        0x00010022: ["NUC100VD2AN", ChipType.NUC100AN],
+        0x00010023: ["NUC100VD1AN", ChipType.NUC100AN],
+        0x00010024: ["NUC100VC3AN", ChipType.NUC100AN],
+        0x00010025: ["NUC100VC2AN", ChipType.NUC100AN],
+        0x00010026: ["NUC100VC1AN", ChipType.NUC100AN],
+        0x00010031: ["NUC100SD2AN", ChipType.NUC100AN],
+        0x00010100: ["NUC101LE3AN", ChipType.NUC100AN],
+        0x00010101: ["NUC101LE2AN", ChipType.NUC100AN],
+        0x00010102: ["NUC101LE1AN", ChipType.NUC100AN],
+        0x00010103: ["NUC101LD3AN", ChipType.NUC100AN],
+        0x00010104: ["NUC101LD2AN", ChipType.NUC100AN],
+        0x00010105: ["NUC101LD1AN", ChipType.NUC100AN],
+        0x00010106: ["NUC101LC3AN", ChipType.NUC100AN],
+        0x00010107: ["NUC101LC2AN", ChipType.NUC100AN],
+        0x00010108: ["NUC101LC1AN", ChipType.NUC100AN],
+        0x00010109: ["NUC101RE3AN", ChipType.NUC100AN],
+        0x00010110: ["NUC101RE2AN", ChipType.NUC100AN],
+        0x00010111: ["NUC101RE1AN", ChipType.NUC100AN],
+        0x00010112: ["NUC101RD3AN", ChipType.NUC100AN],
+        0x00010113: ["NUC101RD2AN", ChipType.NUC100AN],
+        0x00010114: ["NUC101RD1AN", ChipType.NUC100AN],
+        0x00010115: ["NUC101RC3AN", ChipType.NUC100AN],
+        0x00010116: ["NUC101RC2AN", ChipType.NUC100AN],
+        0x00010117: ["NUC101RC1AN", ChipType.NUC100AN],
+        0x00010118: ["NUC101VE3AN", ChipType.NUC100AN],
+        0x00010119: ["NUC101VE2AN", ChipType.NUC100AN],
+        0x00010120: ["NUC101VE1AN", ChipType.NUC100AN],
+        0x00010121: ["NUC101VD3AN", ChipType.NUC100AN],
+        0x00010122: ["NUC101VD2AN", ChipType.NUC100AN],
+        0x00010123: ["NUC101VD1AN", ChipType.NUC100AN],
+        0x00010124: ["NUC101VC3AN", ChipType.NUC100AN],
+        0x00010125: ["NUC101VC2AN", ChipType.NUC100AN],
+        0x00010126: ["NUC101VC1AN", ChipType.NUC100AN],
+        0x00010200: ["NUC102LE3AN", ChipType.NUC100AN],
+        0x00010201: ["NUC102LE2AN", ChipType.NUC100AN],
+        0x00010202: ["NUC102LE1AN", ChipType.NUC100AN],
+        0x00010203: ["NUC102LD3AN", ChipType.NUC100AN],
+        0x00010204: ["NUC102LD2AN", ChipType.NUC100AN],
+        0x00010205: ["NUC102LD1AN", ChipType.NUC100AN],
+        0x00010206: ["NUC102LC3AN", ChipType.NUC100AN],
+        0x00010207: ["NUC102LC2AN", ChipType.NUC100AN],
+        0x00010208: ["NUC102LC1AN", ChipType.NUC100AN],
+        0x00010209: ["NUC102RE3AN", ChipType.NUC100AN],
+        0x00010210: ["NUC102RE2AN", ChipType.NUC100AN],
+        0x00010211: ["NUC102RE1AN", ChipType.NUC100AN],
+        0x00010212: ["NUC102RD3AN", ChipType.NUC100AN],
+        0x00010213: ["NUC102RD2AN", ChipType.NUC100AN],
+        0x00010214: ["NUC102RD1AN", ChipType.NUC100AN],
+        0x00010215: ["NUC102RC3AN", ChipType.NUC100AN],
+        0x00010216: ["NUC102RC2AN", ChipType.NUC100AN],
+        0x00010217: ["NUC102RC1AN", ChipType.NUC100AN],
+        0x00010218: ["NUC102SE3AN", ChipType.NUC100AN],
+        0x00010219: ["NUC102SE2AN", ChipType.NUC100AN],
+        0x00010220: ["NUC102SE1AN", ChipType.NUC100AN],
+        0x00010221: ["NUC102SD3AN", ChipType.NUC100AN],
+        0x00010222: ["NUC102SD2AN", ChipType.NUC100AN],
+        0x00010223: ["NUC102SD1AN", ChipType.NUC100AN],
+        0x00010224: ["NUC102SC3AN", ChipType.NUC100AN],
+        0x00010225: ["NUC102SC2AN", ChipType.NUC100AN],
+        0x00010226: ["NUC102SC1AN", ChipType.NUC100AN],
+        0x00010227: ["NUC102ZE3AN", ChipType.NUC100AN],
+        0x00010228: ["NUC102ZE2AN", ChipType.NUC100AN],
+        0x00010229: ["NUC102ZE1AN", ChipType.NUC100AN],
+        0x00010230: ["NUC102ZD3AN", ChipType.NUC100AN],
+        0x00010231: ["NUC102ZD2AN", ChipType.NUC100AN],
+        0x00010232: ["NUC102ZD1AN", ChipType.NUC100AN],
+        0x00010233: ["NUC102ZC3AN", ChipType.NUC100AN],
+        0x00010234: ["NUC102ZC2AN", ChipType.NUC100AN],
+        0x00010235: ["NUC102ZC1AN", ChipType.NUC100AN],
+        0x00010236: ["NUC102ZB3AN", ChipType.NUC100AN],
+        0x00010237: ["NUC102ZB2AN", ChipType.NUC100AN],
+        0x00010238: ["NUC102ZB1AN", ChipType.NUC100AN],
+        0x00010239: ["NUC102ZA3AN", ChipType.NUC100AN],
+        0x00010240: ["NUC102ZA2AN", ChipType.NUC100AN],
+        0x00010241: ["NUC102ZA1AN", ChipType.NUC100AN],
+        0x00010242: ["NUC102LB3AN", ChipType.NUC100AN],
+        0x00010243: ["NUC102LB2AN", ChipType.NUC100AN],
+        0x00010244: ["NUC102LB1AN", ChipType.NUC100AN],
+        0x00010245: ["NUC102LA3AN", ChipType.NUC100AN],
+        0x00010246: ["NUC102LA2AN", ChipType.NUC100AN],
+        0x00010247: ["NUC102LA1AN", ChipType.NUC100AN],
+        0x00010248: ["NUC102RB3AN", ChipType.NUC100AN],
+        0x00010249: ["NUC102RB2AN", ChipType.NUC100AN],
+        0x00010250: ["NUC102RB1AN", ChipType.NUC100AN],
+        0x00010251: ["NUC102RA3AN", ChipType.NUC100AN],
+        0x00010252: ["NUC102RA2AN", ChipType.NUC100AN],
+        0x00010253: ["NUC102RA1AN", ChipType.NUC100AN],
+        0x00010254: ["NUC102SB3AN", ChipType.NUC100AN],
+        0x00010255: ["NUC102SB2AN", ChipType.NUC100AN],
+        0x00010256: ["NUC102SB1AN", ChipType.NUC100AN],
+        0x00010257: ["NUC102SA3AN", ChipType.NUC100AN],
+        0x00010258: ["NUC102SA2AN", ChipType.NUC100AN],
+        0x00010259: ["NUC102SA1AN", ChipType.NUC100AN],
+        0x00010260: ["NUC102LA0AN", ChipType.NUC100AN],
+        0x00010261: ["NUC102LB0AN", ChipType.NUC100AN],
+        0x00010262: ["NUC102LC0AN", ChipType.NUC100AN],
+        0x00010263: ["NUC102LD0AN", ChipType.NUC100AN],
+        0x00010264: ["NUC102RA0AN", ChipType.NUC100AN],
+        0x00010265: ["NUC102RB0AN", ChipType.NUC100AN],
+        0x00010266: ["NUC102RC0AN", ChipType.NUC100AN],
+        0x00010267: ["NUC102RD0AN", ChipType.NUC100AN],
+        0x00010268: ["NUC102SA0AN", ChipType.NUC100AN],
+        0x00010269: ["NUC102SB0AN", ChipType.NUC100AN],
+        0x00010270: ["NUC102SC0AN", ChipType.NUC100AN],
+        0x00010271: ["NUC102SD0AN", ChipType.NUC100AN],
+        0x00010272: ["NUC102ZA0AN", ChipType.NUC100AN],
+        0x00010273: ["NUC102ZB0AN", ChipType.NUC100AN],
+        0x00010274: ["NUC102ZC0AN", ChipType.NUC100AN],
+        0x00010275: ["NUC102ZD0AN", ChipType.NUC100AN],
+        0x00010276: ["NUC102YD3AN", ChipType.NUC100AN],
+        0x00010277: ["NUC102YD2AN", ChipType.NUC100AN],
+        0x00010278: ["NUC102YD1AN", ChipType.NUC100AN],
+        0x00010279: ["NUC102YD0AN", ChipType.NUC100AN],
+        0x00010280: ["NUC102YC3AN", ChipType.NUC100AN],
+        0x00010281: ["NUC102YC2AN", ChipType.NUC100AN],
+        0x00010282: ["NUC102YC1AN", ChipType.NUC100AN],
+        0x00010283: ["NUC102YC0AN", ChipType.NUC100AN],
+        0x00010284: ["NUC102YB3AN", ChipType.NUC100AN],
+        0x00010285: ["NUC102YB2AN", ChipType.NUC100AN],
+        0x00010286: ["NUC102YB1AN", ChipType.NUC100AN],
+        0x00010287: ["NUC102YB0AN", ChipType.NUC100AN],
+        0x00010288: ["NUC102YA3AN", ChipType.NUC100AN],
+        0x00010289: ["NUC102YA2AN", ChipType.NUC100AN],
+        0x00010290: ["NUC102YA1AN", ChipType.NUC100AN],
+        0x00010291: ["NUC102YA0AN", ChipType.NUC100AN],
+        0x00012001: ["NUC120LE2AN", ChipType.NUC100AN],
+        0x00012002: ["NUC120LE1AN", ChipType.NUC100AN],
+        0x00012003: ["NUC120LD3AN", ChipType.NUC100AN],
+        0x00012004: ["NUC120LD2AN", ChipType.NUC100AN],
+        0x00012005: ["NUC120LD1AN", ChipType.NUC100AN],
+        0x00012006: ["NUC120LC3AN", ChipType.NUC100AN],
+        0x00012007: ["NUC120LC2AN", ChipType.NUC100AN],
+        0x00012008: ["NUC120LC1AN", ChipType.NUC100AN],
+        0x00012009: ["NUC120RE3AN", ChipType.NUC100AN],
+        0x00012010: ["NUC120RE2AN", ChipType.NUC100AN],
+        0x00012011: ["NUC120RE1AN", ChipType.NUC100AN],
+        0x00012012: ["NUC120RD3AN", ChipType.NUC100AN],
+        0x00012013: ["NUC120RD2AN", ChipType.NUC100AN],
+        0x00012014: ["NUC120RD1AN", ChipType.NUC100AN],
+        0x00012015: ["NUC120RC3AN", ChipType.NUC100AN],
+        0x00012016: ["NUC120RC2AN", ChipType.NUC100AN],
+        0x00012017: ["NUC120RC1AN", ChipType.NUC100AN],
+        0x00012018: ["NUC120VE3AN", ChipType.NUC100AN],
+        0x00012019: ["NUC120VE2AN", ChipType.NUC100AN],
+        0x00012020: ["NUC120VE1AN", ChipType.NUC100AN],
+        0x00012021: ["NUC120VD3AN", ChipType.NUC100AN],
+        0x00012022: ["NUC120VD2AN", ChipType.NUC100AN],
+        0x00012023: ["NUC120VD1AN", ChipType.NUC100AN],
+        0x00012024: ["NUC120VC3AN", ChipType.NUC100AN],
+        0x00012025: ["NUC120VC2AN", ChipType.NUC100AN],
+        0x00012026: ["NUC120VC1AN", ChipType.NUC100AN],
+        0x00013001: ["NUC130LE2AN", ChipType.NUC100AN],
+        0x00013002: ["NUC130LE1AN", ChipType.NUC100AN],
+        0x00013003: ["NUC130LD3AN", ChipType.NUC100AN],
+        0x00013004: ["NUC130LD2AN", ChipType.NUC100AN],
+        0x00013005: ["NUC130LD1AN", ChipType.NUC100AN],
+        0x00013006: ["NUC130LC3AN", ChipType.NUC100AN],
+        0x00013007: ["NUC130LC2AN", ChipType.NUC100AN],
+        0x00013008: ["NUC130LC1AN", ChipType.NUC100AN],
+        0x00013009: ["NUC130RE3AN", ChipType.NUC100AN],
+        0x00013010: ["NUC130RE2AN", ChipType.NUC100AN],
+        0x00013011: ["NUC130RE1AN", ChipType.NUC100AN],
+        0x00013012: ["NUC130RD3AN", ChipType.NUC100AN],
+        0x00013013: ["NUC130RD2AN", ChipType.NUC100AN],
+        0x00013014: ["NUC130RD1AN", ChipType.NUC100AN],
+        0x00013015: ["NUC130RC3AN", ChipType.NUC100AN],
+        0x00013016: ["NUC130RC2AN", ChipType.NUC100AN],
+        0x00013017: ["NUC130RC1AN", ChipType.NUC100AN],
+        0x00013018: ["NUC130VE3AN", ChipType.NUC100AN],
+        0x00013019: ["NUC130VE2AN", ChipType.NUC100AN],
+        0x00013020: ["NUC130VE1AN", ChipType.NUC100AN],
+        0x00013021: ["NUC130VD3AN", ChipType.NUC100AN],
+        0x00013022: ["NUC130VD2AN", ChipType.NUC100AN],
+        0x00013023: ["NUC130VD1AN", ChipType.NUC100AN],
+        0x00013024: ["NUC130VC3AN", ChipType.NUC100AN],
+        0x00013025: ["NUC130VC2AN", ChipType.NUC100AN],
+        0x00013026: ["NUC130VC1AN", ChipType.NUC100AN],
+        0x00014000: ["NUC140LE3AN", ChipType.NUC100AN],
+        0x00014001: ["NUC140LE2AN", ChipType.NUC100AN],
+        0x00014002: ["NUC140LE1AN", ChipType.NUC100AN],
+        0x00014003: ["NUC140LD3AN", ChipType.NUC100AN],
+        0x00014004: ["NUC140LD2AN", ChipType.NUC100AN],
+        0x00014005: ["NUC140LD1AN", ChipType.NUC100AN],
+        0x00014006: ["NUC140LC3AN", ChipType.NUC100AN],
+        0x00014007: ["NUC140LC2AN", ChipType.NUC100AN],
+        0x00014008: ["NUC140LC1AN", ChipType.NUC100AN],
+        0x00014009: ["NUC140RE3AN", ChipType.NUC100AN],
+        0x00014010: ["NUC140RE2AN", ChipType.NUC100AN],
+        0x00014011: ["NUC140RE1AN", ChipType.NUC100AN],
+        0x00014012: ["NUC140RD3AN", ChipType.NUC100AN],
+        0x00014013: ["NUC140RD2AN", ChipType.NUC100AN],
+        0x00014014: ["NUC140RD1AN", ChipType.NUC100AN],
+        0x00014015: ["NUC140RC3AN", ChipType.NUC100AN],
+        0x00014016: ["NUC140RC2AN", ChipType.NUC100AN],
+        0x00014017: ["NUC140RC1AN", ChipType.NUC100AN],
+        0x00014018: ["NUC140VE3AN", ChipType.NUC100AN],
+        0x00014019: ["NUC140VE2AN", ChipType.NUC100AN],
+        0x00014020: ["NUC140VE1AN", ChipType.NUC100AN],
+        0x00014021: ["NUC140VD3AN", ChipType.NUC100AN],
+        0x00014022: ["NUC140VD2AN", ChipType.NUC100AN],
+        0x00014023: ["NUC140VD1AN", ChipType.NUC100AN],
+        0x00014024: ["NUC140VC3AN", ChipType.NUC100AN],
+        0x00014025: ["NUC140VC2AN", ChipType.NUC100AN],
+        0x00014026: ["NUC140VC1AN", ChipType.NUC100AN],
+        0x00100018: ["NUC100VE3AN", ChipType.NUC100AN],
+        0x00120000: ["NUC120LE3AN", ChipType.NUC100AN],
+        0x00130000: ["NUC130LE3AN", ChipType.NUC100AN],
+        0x10010004: ["NUC100LD2BN", ChipType.NUC100BN],
+        0x10010005: ["NUC100LD1BN", ChipType.NUC100BN],
+        0x10010007: ["NUC100LC2BN", ChipType.NUC100BN],
+        0x10010008: ["NUC100LC1BN", ChipType.NUC100BN],
+        0x10010013: ["NUC100RD2BN", ChipType.NUC100BN],
+        0x10010014: ["NUC100RD1BN", ChipType.NUC100BN],
+        0x10010016: ["NUC100RC2BN", ChipType.NUC100BN],
+        0x10010017: ["NUC100RC1BN", ChipType.NUC100BN],
+        0x10010027: ["NUC100LD0BN", ChipType.NUC100BN],
+        0x10010028: ["NUC100LC0BN", ChipType.NUC100BN],
+        0x10010029: ["NUC100LB2BN", ChipType.NUC100BN],
+        0x10010030: ["NUC100LB1BN", ChipType.NUC100BN],
+        0x10010031: ["NUC100LB0BN", ChipType.NUC100BN],
+        0x10010032: ["NUC100LA2BN", ChipType.NUC100BN],
+        0x10010033: ["NUC100LA1BN", ChipType.NUC100BN],
+        0x10010034: ["NUC100LA0BN", ChipType.NUC100BN],
+        0x10010035: ["NUC100RD0BN", ChipType.NUC100BN],
+        0x10010036: ["NUC100RC0BN", ChipType.NUC100BN],
+        0x10010037: ["NUC100RB2BN", ChipType.NUC100BN],
+        0x10010038: ["NUC100RB1BN", ChipType.NUC100BN],
+        0x10010039: ["NUC100RB0BN", ChipType.NUC100BN],
+        0x10010040: ["NUC100RA2BN", ChipType.NUC100BN],
+        0x10010041: ["NUC100RA1BN", ChipType.NUC100BN],
+        0x10010042: ["NUC100RA0BN", ChipType.NUC100BN],
+        0x10010104: ["NUC101LD2BN", ChipType.NUC100BN],
+        0x10010105: ["NUC101LD1BN", ChipType.NUC100BN],
+        0x10010107: ["NUC101LC2BN", ChipType.NUC100BN],
+        0x10010108: ["NUC101LC1BN", ChipType.NUC100BN],
+        0x10010113: ["NUC101RD2BN", ChipType.NUC100BN],
+        0x10010114: ["NUC101RD1BN", ChipType.NUC100BN],
+        0x10010116: ["NUC101RC2BN", ChipType.NUC100BN],
+        0x10010117: ["NUC101RC1BN", ChipType.NUC100BN],
+        0x10010127: ["NUC101LD0BN", ChipType.NUC100BN],
+        0x10010128: ["NUC101LC0BN", ChipType.NUC100BN],
+        0x10010129: ["NUC101LB2BN", ChipType.NUC100BN],
+        0x10010130: ["NUC101LB1BN", ChipType.NUC100BN],
+        0x10010131: ["NUC101LB0BN", ChipType.NUC100BN],
+        0x10010132: ["NUC101LA2BN", ChipType.NUC100BN],
+        0x10010133: ["NUC101LA1BN", ChipType.NUC100BN],
+        0x10010134: ["NUC101LA0BN", ChipType.NUC100BN],
+        0x10010135: ["NUC101RD0BN", ChipType.NUC100BN],
+        0x10010136: ["NUC101RC0BN", ChipType.NUC100BN],
+        0x10010137: ["NUC101RB2BN", ChipType.NUC100BN],
+        0x10010138: ["NUC101RB1BN", ChipType.NUC100BN],
+        0x10010139: ["NUC101RB0BN", ChipType.NUC100BN],
+        0x10010140: ["NUC101RA2BN", ChipType.NUC100BN],
+        0x10010141: ["NUC101RA1BN", ChipType.NUC100BN],
+        0x10010142: ["NUC101RA0BN", ChipType.NUC100BN],
+        0x10010143: ["NUC101YD2BN", ChipType.NUC100BN],
+        0x10010144: ["NUC101YD1BN", ChipType.NUC100BN],
+        0x10010145: ["NUC101YD0BN", ChipType.NUC100BN],
+        0x10010146: ["NUC101YC2BN", ChipType.NUC100BN],
+        0x10010147: ["NUC101YC1BN", ChipType.NUC100BN],
+        0x10010148: ["NUC101YC0BN", ChipType.NUC100BN],
+        0x10010149: ["NUC101YB2BN", ChipType.NUC100BN],
+        0x10010150: ["NUC101YB1BN", ChipType.NUC100BN],
+        0x10010151: ["NUC101YB0BN", ChipType.NUC100BN],
+        0x10010152: ["NUC101YA2BN", ChipType.NUC100BN],
+        0x10010153: ["NUC101YA1BN", ChipType.NUC100BN],
+        0x10010154: ["NUC101YA0BN", ChipType.NUC100BN],
+        0x10012004: ["NUC120LD2BN", ChipType.NUC100BN],
+        0x10012005: ["NUC120LD1BN", ChipType.NUC100BN],
+        0x10012007: ["NUC120LC2BN", ChipType.NUC100BN],
+        0x10012008: ["NUC120LC1BN", ChipType.NUC100BN],
+        0x10012013: ["NUC120RD2BN", ChipType.NUC100BN],
+        0x10012014: ["NUC120RD1BN", ChipType.NUC100BN],
+        0x10012016: ["NUC120RC2BN", ChipType.NUC100BN],
+        0x10012017: ["NUC120RC1BN", ChipType.NUC100BN],
+        0x10012027: ["NUC120LD0BN", ChipType.NUC100BN],
+        0x10012028: ["NUC120LC0BN", ChipType.NUC100BN],
+        0x10012029: ["NUC120LB2BN", ChipType.NUC100BN],
+        0x10012030: ["NUC120LB1BN", ChipType.NUC100BN],
+        0x10012031: ["NUC120LB0BN", ChipType.NUC100BN],
+        0x10012032: ["NUC120LA2BN", ChipType.NUC100BN],
+        0x10012033: ["NUC120LA1BN", ChipType.NUC100BN],
+        0x10012034: ["NUC120LA0BN", ChipType.NUC100BN],
+        0x10012035: ["NUC120RD0BN", ChipType.NUC100BN],
+        0x10012036: ["NUC120RC0BN", ChipType.NUC100BN],
+        0x10012037: ["NUC120RB2BN", ChipType.NUC100BN],
+        0x10012038: ["NUC120RB1BN", ChipType.NUC100BN],
+        0x10012039: ["NUC120RB0BN", ChipType.NUC100BN],
+        0x10012040: ["NUC120RA2BN", ChipType.NUC100BN],
+        0x10012041: ["NUC120RA1BN", ChipType.NUC100BN],
+        0x10012042: ["NUC120RA0BN", ChipType.NUC100BN],
+        0x10013004: ["NUC130LD2BN", ChipType.NUC100BN],
+        0x10013005: ["NUC130LD1BN", ChipType.NUC100BN],
+        0x10013007: ["NUC130LC2BN", ChipType.NUC100BN],
+        0x10013008: ["NUC130LC1BN", ChipType.NUC100BN],
+        0x10013013: ["NUC130RD2BN", ChipType.NUC100BN],
+        0x10013014: ["NUC130RD1BN", ChipType.NUC100BN],
+        0x10013016: ["NUC130RC2BN", ChipType.NUC100BN],
+        0x10013017: ["NUC130RC1BN", ChipType.NUC100BN],
+        0x10013027: ["NUC130LD0BN", ChipType.NUC100BN],
+        0x10013028: ["NUC130LC0BN", ChipType.NUC100BN],
+        0x10013029: ["NUC130LB2BN", ChipType.NUC100BN],
+        0x10013030: ["NUC130LB1BN", ChipType.NUC100BN],
+        0x10013031: ["NUC130LB0BN", ChipType.NUC100BN],
+        0x10013032: ["NUC130LA2BN", ChipType.NUC100BN],
+        0x10013033: ["NUC130LA1BN", ChipType.NUC100BN],
+        0x10013034: ["NUC130LA0BN", ChipType.NUC100BN],
+        0x10013035: ["NUC130RD0BN", ChipType.NUC100BN],
+        0x10013036: ["NUC130RC0BN", ChipType.NUC100BN],
+        0x10013037: ["NUC130RB2BN", ChipType.NUC100BN],
+        0x10013038: ["NUC130RB1BN", ChipType.NUC100BN],
+        0x10013039: ["NUC130RB0BN", ChipType.NUC100BN],
+        0x10013040: ["NUC130RA2BN", ChipType.NUC100BN],
+        0x10013041: ["NUC130RA1BN", ChipType.NUC100BN],
+        0x10013042: ["NUC130RA0BN", ChipType.NUC100BN],
+        0x10014004: ["NUC140LD2BN", ChipType.NUC100BN],
+        0x10014005: ["NUC140LD1BN", ChipType.NUC100BN],
+        0x10014007: ["NUC140LC2BN", ChipType.NUC100BN],
+        0x10014008: ["NUC140LC1BN", ChipType.NUC100BN],
+        0x10014013: ["NUC140RD2BN", ChipType.NUC100BN],
+        0x10014014: ["NUC140RD1BN", ChipType.NUC100BN],
+        0x10014016: ["NUC140RC2BN", ChipType.NUC100BN],
+        0x10014017: ["NUC140RC1BN", ChipType.NUC100BN],
+        0x10014027: ["NUC140LD0BN", ChipType.NUC100BN],
+        0x10014028: ["NUC140LC0BN", ChipType.NUC100BN],
+        0x10014029: ["NUC140LB2BN", ChipType.NUC100BN],
+        0x10014030: ["NUC140LB1BN", ChipType.NUC100BN],
+        0x10014031: ["NUC140LB0BN", ChipType.NUC100BN],
+        0x10014032: ["NUC140LA2BN", ChipType.NUC100BN],
+        0x10014033: ["NUC140LA1BN", ChipType.NUC100BN],
+        0x10014034: ["NUC140LA0BN", ChipType.NUC100BN],
+        0x10014035: ["NUC140RD0BN", ChipType.NUC100BN],
+        0x10014036: ["NUC140RC0BN", ChipType.NUC100BN],
+        0x10014037: ["NUC140RB2BN", ChipType.NUC100BN],
+        0x10014038: ["NUC140RB1BN", ChipType.NUC100BN],
+        0x10014039: ["NUC140RB0BN", ChipType.NUC100BN],
+        0x10014040: ["NUC140RA2BN", ChipType.NUC100BN],
+        0x10014041: ["NUC140RA1BN", ChipType.NUC100BN],
+        0x10014042: ["NUC140RA0BN", ChipType.NUC100BN],
+        0x00005100: ["M051LAN", ChipType.M051AN],
+        0x00005101: ["M051PAN", ChipType.M051AN],
+        0x00005102: ["M051YAN", ChipType.M051AN],
+        0x00005103: ["M051ZAN", ChipType.M051AN],
+        0x00005200: ["M052LAN", ChipType.M051AN],
+        0x00005201: ["M052PAN", ChipType.M051AN],
+        0x00005202: ["M052YAN", ChipType.M051AN],
+        0x00005203: ["M052ZAN", ChipType.M051AN],
+        0x00005400: ["M054LAN", ChipType.M051AN],
+        0x00005401: ["M054PAN", ChipType.M051AN],
+        0x00005402: ["M054YAN", ChipType.M051AN],
+        0x00005403: ["M054ZAN", ChipType.M051AN],
+        0x00005800: ["M058LAN", ChipType.M051AN],
+        0x00005801: ["M058PAN", ChipType.M051AN],
+        0x00005802: ["M058YAN", ChipType.M051AN],
+        0x00005803: ["M058ZAN", ChipType.M051AN],
+        0x00005A00: ["M0516LAN", ChipType.M051AN],
+        0x00005A01: ["M0516PAN", ChipType.M051AN],
+        0x00005A02: ["M0516YAN", ChipType.M051AN],
+        0x00005A03: ["M0516ZAN", ChipType.M051AN],
+        0x20010000: ["NUC100LE3CN", ChipType.NUC100CN],
+        0x20010001: ["NUC100LE2CN", ChipType.NUC100CN],
+        0x20010002: ["NUC100LE1CN", ChipType.NUC100CN],
+        0x20010003: ["NUC100LD3CN", ChipType.NUC100CN],
+        0x20010004: ["NUC100LD2CN", ChipType.NUC100CN],
+        0x20010005: ["NUC100LD1CN", ChipType.NUC100CN],
+        0x20010006: ["NUC100LC3CN", ChipType.NUC100CN],
+        0x20010007: ["NUC100LC2CN", ChipType.NUC100CN],
+        0x20010008: ["NUC100LC1CN", ChipType.NUC100CN],
+        0x20010009: ["NUC100RE3CN", ChipType.NUC100CN],
+        0x20010010: ["NUC100RE2CN", ChipType.NUC100CN],
+        0x20010011: ["NUC100RE1CN", ChipType.NUC100CN],
+        0x20010012: ["NUC100RD3CN", ChipType.NUC100CN],
+        0x20010013: ["NUC100RD2CN", ChipType.NUC100CN],
+        0x20010014: ["NUC100RD1CN", ChipType.NUC100CN],
+        0x20010015: ["NUC100RC3CN", ChipType.NUC100CN],
+        0x20010016: ["NUC100RC2CN", ChipType.NUC100CN],
+        0x20010017: ["NUC100RC1CN", ChipType.NUC100CN],
+        0x20010018: ["NUC100VE3CN", ChipType.NUC100CN],
+        0x20010019: ["NUC100VE2CN", ChipType.NUC100CN],
+        0x20010020: ["NUC100VE1CN", ChipType.NUC100CN],
+        0x20010021: ["NUC100VD3CN", ChipType.NUC100CN],
+        0x20010022: ["NUC100VD2CN", ChipType.NUC100CN],
+        0x20010023: ["NUC100VD1CN", ChipType.NUC100CN],
+        0x20010024: ["NUC100VC3CN", ChipType.NUC100CN],
+        0x20010025: ["NUC100VC2CN", ChipType.NUC100CN],
+        0x20010026: ["NUC100VC1CN", ChipType.NUC100CN],
+        0x20010100: ["NUC101LE3CN", ChipType.NUC100CN],
+        0x20010101: ["NUC101LE2CN", ChipType.NUC100CN],
+        0x20010102: ["NUC101LE1CN", ChipType.NUC100CN],
+        0x20010103: ["NUC101LD3CN", ChipType.NUC100CN],
+        0x20010104: ["NUC101LD2CN", ChipType.NUC100CN],
+        0x20010105: ["NUC101LD1CN", ChipType.NUC100CN],
+        0x20010106: ["NUC101LC3CN", ChipType.NUC100CN],
+        0x20010107: ["NUC101LC2CN", ChipType.NUC100CN],
+        0x20010108: ["NUC101LC1CN", ChipType.NUC100CN],
+        0x20010109: ["NUC101RE3CN", ChipType.NUC100CN],
+        0x20010110: ["NUC101RE2CN", ChipType.NUC100CN],
+        0x20010111: ["NUC101RE1CN", ChipType.NUC100CN],
+        0x20010112: ["NUC101RD3CN", ChipType.NUC100CN],
+        0x20010113: ["NUC101RD2CN", ChipType.NUC100CN],
+        0x20010114: ["NUC101RD1CN", ChipType.NUC100CN],
+        0x20010115: ["NUC101RC3CN", ChipType.NUC100CN],
+        0x20010116: ["NUC101RC2CN", ChipType.NUC100CN],
+        0x20010117: ["NUC101RC1CN", ChipType.NUC100CN],
+        0x20010118: ["NUC101VE3CN", ChipType.NUC100CN],
+        0x20010119: ["NUC101VE2CN", ChipType.NUC100CN],
+        0x20010120: ["NUC101VE1CN", ChipType.NUC100CN],
+        0x20010121: ["NUC101VD3CN", ChipType.NUC100CN],
+        0x20010122: ["NUC101VD2CN", ChipType.NUC100CN],
+        0x20010123: ["NUC101VD1CN", ChipType.NUC100CN],
+        0x20010124: ["NUC101VC3CN", ChipType.NUC100CN],
+        0x20010125: ["NUC101VC2CN", ChipType.NUC100CN],
+        0x20010126: ["NUC101VC1CN", ChipType.NUC100CN],
+        0x20012000: ["NUC120LE3CN", ChipType.NUC100CN],
+        0x20012001: ["NUC120LE2CN", ChipType.NUC100CN],
+        0x20012002: ["NUC120LE1CN", ChipType.NUC100CN],
+        0x20012003: ["NUC120LD3CN", ChipType.NUC100CN],
+        0x20012004: ["NUC120LD2CN", ChipType.NUC100CN],
+        0x20012005: ["NUC120LD1CN", ChipType.NUC100CN],
+        0x20012006: ["NUC120LC3CN", ChipType.NUC100CN],
+        0x20012007: ["NUC120LC2CN", ChipType.NUC100CN],
+        0x20012008: ["NUC120LC1CN", ChipType.NUC100CN],
+        0x20012009: ["NUC120RE3CN", ChipType.NUC100CN],
+        0x20012010: ["NUC120RE2CN", ChipType.NUC100CN],
+        0x20012011: ["NUC120RE1CN", ChipType.NUC100CN],
+        0x20012012: ["NUC120RD3CN", ChipType.NUC100CN],
+        0x20012013: ["NUC120RD2CN", ChipType.NUC100CN],
+        0x20012014: ["NUC120RD1CN", ChipType.NUC100CN],
+        0x20012015: ["NUC120RC3CN", ChipType.NUC100CN],
+        0x20012016: ["NUC120RC2CN", ChipType.NUC100CN],
+        0x20012017: ["NUC120RC1CN", ChipType.NUC100CN],
+        0x20012018: ["NUC120VE3CN", ChipType.NUC100CN],
+        0x20012019: ["NUC120VE2CN", ChipType.NUC100CN],
+        0x20012020: ["NUC120VE1CN", ChipType.NUC100CN],
+        0x20012021: ["NUC120VD3CN", ChipType.NUC100CN],
+        0x20012022: ["NUC120VD2CN", ChipType.NUC100CN],
+        0x20012023: ["NUC120VD1CN", ChipType.NUC100CN],
+        0x20012024: ["NUC120VC3CN", ChipType.NUC100CN],
+        0x20012025: ["NUC120VC2CN", ChipType.NUC100CN],
+        0x20012026: ["NUC120VC1CN", ChipType.NUC100CN],
+        0x20013000: ["NUC130LE3CN", ChipType.NUC100CN],
+        0x20013001: ["NUC130LE2CN", ChipType.NUC100CN],
+        0x20013002: ["NUC130LE1CN", ChipType.NUC100CN],
+        0x20013003: ["NUC130LD3CN", ChipType.NUC100CN],
+        0x20013004: ["NUC130LD2CN", ChipType.NUC100CN],
+        0x20013005: ["NUC130LD1CN", ChipType.NUC100CN],
+        0x20013006: ["NUC130LC3CN", ChipType.NUC100CN],
+        0x20013007: ["NUC130LC2CN", ChipType.NUC100CN],
+        0x20013008: ["NUC130LC1CN", ChipType.NUC100CN],
+        0x20013009: ["NUC130RE3CN", ChipType.NUC100CN],
+        0x20013010: ["NUC130RE2CN", ChipType.NUC100CN],
+        0x20013011: ["NUC130RE1CN", ChipType.NUC100CN],
+        0x20013012: ["NUC130RD3CN", ChipType.NUC100CN],
+        0x20013013: ["NUC130RD2CN", ChipType.NUC100CN],
+        0x20013014: ["NUC130RD1CN", ChipType.NUC100CN],
+        0x20013015: ["NUC130RC3CN", ChipType.NUC100CN],
+        0x20013016: ["NUC130RC2CN", ChipType.NUC100CN],
+        0x20013017: ["NUC130RC1CN", ChipType.NUC100CN],
+        0x20013018: ["NUC130VE3CN", ChipType.NUC100CN],
+        0x20013019: ["NUC130VE2CN", ChipType.NUC100CN],
+        0x20013020: ["NUC130VE1CN", ChipType.NUC100CN],
+        0x20013021: ["NUC130VD3CN", ChipType.NUC100CN],
+        0x20013022: ["NUC130VD2CN", ChipType.NUC100CN],
+        0x20013023: ["NUC130VD1CN", ChipType.NUC100CN],
+        0x20013024: ["NUC130VC3CN", ChipType.NUC100CN],
+        0x20013025: ["NUC130VC2CN", ChipType.NUC100CN],
+        0x20013026: ["NUC130VC1CN", ChipType.NUC100CN],
+        0x20014000: ["NUC140LE3CN", ChipType.NUC100CN],
+        0x20014001: ["NUC140LE2CN", ChipType.NUC100CN],
+        0x20014002: ["NUC140LE1CN", ChipType.NUC100CN],
+        0x20014003: ["NUC140LD3CN", ChipType.NUC100CN],
+        0x20014004: ["NUC140LD2CN", ChipType.NUC100CN],
+        0x20014005: ["NUC140LD1CN", ChipType.NUC100CN],
+        0x20014006: ["NUC140LC3CN", ChipType.NUC100CN],
+        0x20014007: ["NUC140LC2CN", ChipType.NUC100CN],
+        0x20014008: ["NUC140LC1CN", ChipType.NUC100CN],
+        0x20014009: ["NUC140RE3CN", ChipType.NUC100CN],
+        0x20014010: ["NUC140RE2CN", ChipType.NUC100CN],
+        0x20014011: ["NUC140RE1CN", ChipType.NUC100CN],
+        0x20014012: ["NUC140RD3CN", ChipType.NUC100CN],
+        0x20014013: ["NUC140RD2CN", ChipType.NUC100CN],
+        0x20014014: ["NUC140RD1CN", ChipType.NUC100CN],
+        0x20014015: ["NUC140RC3CN", ChipType.NUC100CN],
+        0x20014016: ["NUC140RC2CN", ChipType.NUC100CN],
+        0x20014017: ["NUC140RC1CN", ChipType.NUC100CN],
+        0x20014018: ["NUC140VE3CN", ChipType.NUC100CN],
+        0x20014019: ["NUC140VE2CN", ChipType.NUC100CN],
+        0x20014020: ["NUC140VE1CN", ChipType.NUC100CN],
+        0x20014021: ["NUC140VD3CN", ChipType.NUC100CN],
+        0x20014022: ["NUC140VD2CN", ChipType.NUC100CN],
+        0x20014023: ["NUC140VD1CN", ChipType.NUC100CN],
+        0x20014024: ["NUC140VC3CN", ChipType.NUC100CN],
+        0x20014025: ["NUC140VC2CN", ChipType.NUC100CN],
+        0x20014026: ["NUC140VC1CN", ChipType.NUC100CN],
+        0x00012200: ["NUC122LE3AN", ChipType.NUC122AN],
+        0x00012201: ["NUC122LE2AN", ChipType.NUC122AN],
+        0x00012202: ["NUC122LE1AN", ChipType.NUC122AN],
+        0x00012203: ["NUC122LD3AN", ChipType.NUC122AN],
+        0x00012204: ["NUC122LD2AN", ChipType.NUC122AN],
+        0x00012205: ["NUC122LD1AN", ChipType.NUC122AN],
+        0x00012206: ["NUC122LC3AN", ChipType.NUC122AN],
+        0x00012207: ["NUC122LC2AN", ChipType.NUC122AN],
+        0x00012208: ["NUC122LC1AN", ChipType.NUC122AN],
+        0x00012209: ["NUC122RE3AN", ChipType.NUC122AN],
+        0x00012210: ["NUC122RE2AN", ChipType.NUC122AN],
+        0x00012211: ["NUC122RE1AN", ChipType.NUC122AN],
+        0x00012212: ["NUC122RD3AN", ChipType.NUC122AN],
+        0x00012213: ["NUC122RD2AN", ChipType.NUC122AN],
+        0x00012214: ["NUC122RD1AN", ChipType.NUC122AN],
+        0x00012215: ["NUC122RC3AN", ChipType.NUC122AN],
+        0x00012216: ["NUC122RC2AN", ChipType.NUC122AN],
+        0x00012217: ["NUC122RC1AN", ChipType.NUC122AN],
+        0x00012218: ["NUC122SE3AN", ChipType.NUC122AN],
+        0x00012219: ["NUC122SE2AN", ChipType.NUC122AN],
+        0x00012220: ["NUC122SE1AN", ChipType.NUC122AN],
+        0x00012221: ["NUC122SD3AN", ChipType.NUC122AN],
+        0x00012222: ["NUC122SD2AN", ChipType.NUC122AN],
+        0x00012223: ["NUC122SD1AN", ChipType.NUC122AN],
+        0x00012224: ["NUC122SC3AN", ChipType.NUC122AN],
+        0x00012225: ["NUC122SC2AN", ChipType.NUC122AN],
+        0x00012226: ["NUC122SC1AN", ChipType.NUC122AN],
+        0x00012227: ["NUC122ZE3AN", ChipType.NUC122AN],
+        0x00012228: ["NUC122ZE2AN", ChipType.NUC122AN],
+        0x00012229: ["NUC122ZE1AN", ChipType.NUC122AN],
+        0x00012230: ["NUC122ZD3AN", ChipType.NUC122AN],
+        0x00012231: ["NUC122ZD2AN", ChipType.NUC122AN],
+        0x00012232: ["NUC122ZD1AN", ChipType.NUC122AN],
+        0x00012233: ["NUC122ZC3AN", ChipType.NUC122AN],
+        0x00012234: ["NUC122ZC2AN", ChipType.NUC122AN],
+        0x00012235: ["NUC122ZC1AN", ChipType.NUC122AN],
+        0x00012236: ["NUC122ZB3AN", ChipType.NUC122AN],
+        0x00012237: ["NUC122ZB2AN", ChipType.NUC122AN],
+        0x00012238: ["NUC122ZB1AN", ChipType.NUC122AN],
+        0x00012239: ["NUC122ZA3AN", ChipType.NUC122AN],
+        0x00012240: ["NUC122ZA2AN", ChipType.NUC122AN],
+        0x00012241: ["NUC122ZA1AN", ChipType.NUC122AN],
+        0x00012242: ["NUC122LB3AN", ChipType.NUC122AN],
+        0x00012243: ["NUC122LB2AN", ChipType.NUC122AN],
+        0x00012244: ["NUC122LB1AN", ChipType.NUC122AN],
+        0x00012245: ["NUC122LA3AN", ChipType.NUC122AN],
+        0x00012246: ["NUC122LA2AN", ChipType.NUC122AN],
+        0x00012247: ["NUC122LA1AN", ChipType.NUC122AN],
+        0x00012248: ["NUC122RB3AN", ChipType.NUC122AN],
+        0x00012249: ["NUC122RB2AN", ChipType.NUC122AN],
+        0x00012250: ["NUC122RB1AN", ChipType.NUC122AN],
+        0x00012251: ["NUC122RA3AN", ChipType.NUC122AN],
+        0x00012252: ["NUC122RA2AN", ChipType.NUC122AN],
+        0x00012253: ["NUC122RA1AN", ChipType.NUC122AN],
+        0x00012254: ["NUC122SB3AN", ChipType.NUC122AN],
+        0x00012255: ["NUC122SB2AN", ChipType.NUC122AN],
+        0x00012256: ["NUC122SB1AN", ChipType.NUC122AN],
+        0x00012257: ["NUC122SA3AN", ChipType.NUC122AN],
+        0x00012258: ["NUC122SA2AN", ChipType.NUC122AN],
+        0x00012259: ["NUC122SA1AN", ChipType.NUC122AN],
+        0x00012260: ["NUC122LA0AN", ChipType.NUC122AN],
+        0x00012261: ["NUC122LB0AN", ChipType.NUC122AN],
+        0x00012262: ["NUC122LC0AN", ChipType.NUC122AN],
+        0x00012263: ["NUC122LD0AN", ChipType.NUC122AN],
+        0x00012264: ["NUC122RA0AN", ChipType.NUC122AN],
+        0x00012265: ["NUC122RB0AN", ChipType.NUC122AN],
+        0x00012266: ["NUC122RC0AN", ChipType.NUC122AN],
+        0x00012267: ["NUC122RD0AN", ChipType.NUC122AN],
+        0x00012268: ["NUC122SA0AN", ChipType.NUC122AN],
+        0x00012269: ["NUC122SB0AN", ChipType.NUC122AN],
+        0x00012270: ["NUC122SC0AN", ChipType.NUC122AN],
+        0x00012271: ["NUC122SD0AN", ChipType.NUC122AN],
+        0x00012272: ["NUC122ZA0AN", ChipType.NUC122AN],
+        0x00012273: ["NUC122ZB0AN", ChipType.NUC122AN],
+        0x00012274: ["NUC122ZC0AN", ChipType.NUC122AN],
+        0x00012275: ["NUC122ZD0AN", ChipType.NUC122AN],
+        0x00012276: ["NUC122YD3AN", ChipType.NUC122AN],
+        0x00012277: ["NUC122YD2AN", ChipType.NUC122AN],
+        0x00012278: ["NUC122YD1AN", ChipType.NUC122AN],
+        0x00012279: ["NUC122YD0AN", ChipType.NUC122AN],
+        0x00012280: ["NUC122YC3AN", ChipType.NUC122AN],
+        0x00012281: ["NUC122YC2AN", ChipType.NUC122AN],
+        0x00012282: ["NUC122YC1AN", ChipType.NUC122AN],
+        0x00012283: ["NUC122YC0AN", ChipType.NUC122AN],
+        0x00012284: ["NUC122YB3AN", ChipType.NUC122AN],
+        0x00012285: ["NUC122YB2AN", ChipType.NUC122AN],
+        0x00012286: ["NUC122YB1AN", ChipType.NUC122AN],
+        0x00012287: ["NUC122YB0AN", ChipType.NUC122AN],
+        0x00012288: ["NUC122YA3AN", ChipType.NUC122AN],
+        0x00012289: ["NUC122YA2AN", ChipType.NUC122AN],
+        0x00012290: ["NUC122YA1AN", ChipType.NUC122AN],
+        0x00012291: ["NUC122YA0AN", ChipType.NUC122AN],
+        0x10012222: ["NUC122SD2BN", ChipType.NUC122AN],
+        0x00020000: ["NUC200LE3AN", ChipType.NUC100DN],
+        0x00020001: ["NUC200LE2AN", ChipType.NUC100DN],
+        0x00020002: ["NUC200LE1AN", ChipType.NUC100DN],
+        0x00020003: ["NUC200LD3AN", ChipType.NUC100DN],
+        0x00020004: ["NUC200LD2AN", ChipType.NUC100DN],
+        0x00020005: ["NUC200LD1AN", ChipType.NUC100DN],
+        0x00020006: ["NUC200LC3AN", ChipType.NUC100DN],
+        0x00020007: ["NUC200LC2AN", ChipType.NUC100DN],
+        0x00020008: ["NUC200LC1AN", ChipType.NUC100DN],
+        0x00020009: ["NUC200RE3AN", ChipType.NUC100DN],
+        0x00020010: ["NUC200RE2AN", ChipType.NUC100DN],
+        0x00020011: ["NUC200RE1AN", ChipType.NUC100DN],
+        0x00020012: ["NUC200RD3AN", ChipType.NUC100DN],
+        0x00020013: ["NUC200RD2AN", ChipType.NUC100DN],
+        0x00020014: ["NUC200RD1AN", ChipType.NUC100DN],
+        0x00020015: ["NUC200RC3AN", ChipType.NUC100DN],
+        0x00020016: ["NUC200RC2AN", ChipType.NUC100DN],
+        0x00020017: ["NUC200RC1AN", ChipType.NUC100DN],
+        0x00020018: ["NUC200VE3AN", ChipType.NUC100DN],
+        0x00020019: ["NUC200VE2AN", ChipType.NUC100DN],
+        0x00020020: ["NUC200VE1AN", ChipType.NUC100DN],
+        0x00020021: ["NUC200VD3AN", ChipType.NUC100DN],
+        0x00020022: ["NUC200VD2AN", ChipType.NUC100DN],
+        0x00020023: ["NUC200VD1AN", ChipType.NUC100DN],
+        0x00020024: ["NUC200VC3AN", ChipType.NUC100DN],
+        0x00020025: ["NUC200VC2AN", ChipType.NUC100DN],
+        0x00020026: ["NUC200VC1AN", ChipType.NUC100DN],
+        0x00020027: ["NUC200SE3AN", ChipType.NUC100DN],
+        0x00020028: ["NUC200SE2AN", ChipType.NUC100DN],
+        0x00020029: ["NUC200SE1AN", ChipType.NUC100DN],
+        0x00020030: ["NUC200SD3AN", ChipType.NUC100DN],
+        0x00020031: ["NUC200SD2AN", ChipType.NUC100DN],
+        0x00020032: ["NUC200SD1AN", ChipType.NUC100DN],
+        0x00020033: ["NUC200SC3AN", ChipType.NUC100DN],
+        0x00020034: ["NUC200SC2AN", ChipType.NUC100DN],
+        0x00020035: ["NUC200SC1AN", ChipType.NUC100DN],
+        0x00022000: ["NUC220LE3AN", ChipType.NUC100DN],
+        0x00022001: ["NUC220LE2AN", ChipType.NUC100DN],
+        0x00022002: ["NUC220LE1AN", ChipType.NUC100DN],
+        0x00022003: ["NUC220LD3AN", ChipType.NUC100DN],
+        0x00022004: ["NUC220LD2AN", ChipType.NUC100DN],
+        0x00022005: ["NUC220LD1AN", ChipType.NUC100DN],
+        0x00022006: ["NUC220LC3AN", ChipType.NUC100DN],
+        0x00022007: ["NUC220LC2AN", ChipType.NUC100DN],
+        0x00022008: ["NUC220LC1AN", ChipType.NUC100DN],
+        0x00022009: ["NUC220RE3AN", ChipType.NUC100DN],
+        0x00022010: ["NUC220RE2AN", ChipType.NUC100DN],
+        0x00022011: ["NUC220RE1AN", ChipType.NUC100DN],
+        0x00022012: ["NUC220RD3AN", ChipType.NUC100DN],
+        0x00022013: ["NUC220RD2AN", ChipType.NUC100DN],
+        0x00022014: ["NUC220RD1AN", ChipType.NUC100DN],
+        0x00022015: ["NUC220RC3AN", ChipType.NUC100DN],
+        0x00022016: ["NUC220RC2AN", ChipType.NUC100DN],
+        0x00022017: ["NUC220RC1AN", ChipType.NUC100DN],
+        0x00022018: ["NUC220VE3AN", ChipType.NUC100DN],
+        0x00022019: ["NUC220VE2AN", ChipType.NUC100DN],
+        0x00022020: ["NUC220VE1AN", ChipType.NUC100DN],
+        0x00022021: ["NUC220VD3AN", ChipType.NUC100DN],
+        0x00022022: ["NUC220VD2AN", ChipType.NUC100DN],
+        0x00022023: ["NUC220VD1AN", ChipType.NUC100DN],
+        0x00022024: ["NUC220VC3AN", ChipType.NUC100DN],
+        0x00022025: ["NUC220VC2AN", ChipType.NUC100DN],
+        0x00022026: ["NUC220VC1AN", ChipType.NUC100DN],
+        0x00022027: ["NUC220SE3AN", ChipType.NUC100DN],
+        0x00022028: ["NUC220SE2AN", ChipType.NUC100DN],
+        0x00022029: ["NUC220SE1AN", ChipType.NUC100DN],
+        0x00022030: ["NUC220SD3AN", ChipType.NUC100DN],
+        0x00022031: ["NUC220SD2AN", ChipType.NUC100DN],
+        0x00022032: ["NUC220SD1AN", ChipType.NUC100DN],
+        0x00022033: ["NUC220SC3AN", ChipType.NUC100DN],
+        0x00022034: ["NUC220SC2AN", ChipType.NUC100DN],
+        0x00022035: ["NUC220SC1AN", ChipType.NUC100DN],
+        0x30010000: ["NUC100LE3DN", ChipType.NUC100DN],
+        0x30010001: ["NUC100LE2DN", ChipType.NUC100DN],
+        0x30010002: ["NUC100LE1DN", ChipType.NUC100DN],
+        0x30010003: ["NUC100LD3DN", ChipType.NUC100DN],
+        0x30010004: ["NUC100LD2DN", ChipType.NUC100DN],
+        0x30010005: ["NUC100LD1DN", ChipType.NUC100DN],
+        0x30010006: ["NUC100LC3DN", ChipType.NUC100DN],
+        0x30010007: ["NUC100LC2DN", ChipType.NUC100DN],
+        0x30010008: ["NUC100LC1DN", ChipType.NUC100DN],
+        0x30010009: ["NUC100RE3DN", ChipType.NUC100DN],
+        0x30010010: ["NUC100RE2DN", ChipType.NUC100DN],
+        0x30010011: ["NUC100RE1DN", ChipType.NUC100DN],
+        0x30010012: ["NUC100RD3DN", ChipType.NUC100DN],
+        0x30010013: ["NUC100RD2DN", ChipType.NUC100DN],
+        0x30010014: ["NUC100RD1DN", ChipType.NUC100DN],
+        0x30010015: ["NUC100RC3DN", ChipType.NUC100DN],
+        0x30010016: ["NUC100RC2DN", ChipType.NUC100DN],
+        0x30010017: ["NUC100RC1DN", ChipType.NUC100DN],
+        0x30010018: ["NUC100VE3DN", ChipType.NUC100DN],
+        0x30010019: ["NUC100VE2DN", ChipType.NUC100DN],
+        0x30010020: ["NUC100VE1DN", ChipType.NUC100DN],
+        0x30010021: ["NUC100VD3DN", ChipType.NUC100DN],
+        0x30010022: ["NUC100VD2DN", ChipType.NUC100DN],
+        0x30010023: ["NUC100VD1DN", ChipType.NUC100DN],
+        0x30010024: ["NUC100VC3DN", ChipType.NUC100DN],
+        0x30010025: ["NUC100VC2DN", ChipType.NUC100DN],
+        0x30010026: ["NUC100VC1DN", ChipType.NUC100DN],
+        0x30010027: ["NUC100SE3DN", ChipType.NUC100DN],
+        0x30010028: ["NUC100SE2DN", ChipType.NUC100DN],
+        0x30010029: ["NUC100SE1DN", ChipType.NUC100DN],
+        0x30010030: ["NUC100SD3DN", ChipType.NUC100DN],
+        0x30010031: ["NUC100SD2DN", ChipType.NUC100DN],
+        0x30010032: ["NUC100SD1DN", ChipType.NUC100DN],
+        0x30010033: ["NUC100SC3DN", ChipType.NUC100DN],
+        0x30010034: ["NUC100SC2DN", ChipType.NUC100DN],
+        0x30010035: ["NUC100SC1DN", ChipType.NUC100DN],
+        0x30012000: ["NUC120LE3DN", ChipType.NUC100DN],
+        0x30012001: ["NUC120LE2DN", ChipType.NUC100DN],
+        0x30012002: ["NUC120LE1DN", ChipType.NUC100DN],
+        0x30012003: ["NUC120LD3DN", ChipType.NUC100DN],
+        0x30012004: ["NUC120LD2DN", ChipType.NUC100DN],
+        0x30012005: ["NUC120LD1DN", ChipType.NUC100DN],
+        0x30012006: ["NUC120LC3DN", ChipType.NUC100DN],
+        0x30012007: ["NUC120LC2DN", ChipType.NUC100DN],
+        0x30012008: ["NUC120LC1DN", ChipType.NUC100DN],
+        0x30012018: ["NUC120VE3DN", ChipType.NUC100DN],
+        0x30012019: ["NUC120VE2DN", ChipType.NUC100DN],
+        0x30012020: ["NUC120VE1DN", ChipType.NUC100DN],
+        0x30012021: ["NUC120VD3DN", ChipType.NUC100DN],
+        0x30012022: ["NUC120VD2DN", ChipType.NUC100DN],
+        0x30012023: ["NUC120VD1DN", ChipType.NUC100DN],
+        0x30012024: ["NUC120VC3DN", ChipType.NUC100DN],
+        0x30012025: ["NUC120VC2DN", ChipType.NUC100DN],
+        0x30012026: ["NUC120VC1DN", ChipType.NUC100DN],
+        0x30012027: ["NUC120RE3DN", ChipType.NUC100DN],
+        0x30012028: ["NUC120RE2DN", ChipType.NUC100DN],
+        0x30012029: ["NUC120RE1DN", ChipType.NUC100DN],
+        0x30012030: ["NUC120RD3DN", ChipType.NUC100DN],
+        0x30012031: ["NUC120RD2DN", ChipType.NUC100DN],
+        0x30012032: ["NUC120RD1DN", ChipType.NUC100DN],
+        0x30012033: ["NUC120RC3DN", ChipType.NUC100DN],
+        0x30012034: ["NUC120RC2DN", ChipType.NUC100DN],
+        0x30012035: ["NUC120RC1DN", ChipType.NUC100DN],
+        0x30013000: ["NUC130LE3DN", ChipType.NUC100DN],
+        0x30013001: ["NUC130LE2DN", ChipType.NUC100DN],
+        0x30013002: ["NUC130LE1DN", ChipType.NUC100DN],
+        0x30013003: ["NUC130LD3DN", ChipType.NUC100DN],
+        0x30013004: ["NUC130LD2DN", ChipType.NUC100DN],
+        0x30013005: ["NUC130LD1DN", ChipType.NUC100DN],
+        0x30013006: ["NUC130LC3DN", ChipType.NUC100DN],
+        0x30013007: ["NUC130LC2DN", ChipType.NUC100DN],
+        0x30013008: ["NUC130LC1DN", ChipType.NUC100DN],
+        0x30013018: ["NUC130VE3DN", ChipType.NUC100DN],
+        0x30013019: ["NUC130VE2DN", ChipType.NUC100DN],
+        0x30013020: ["NUC130VE1DN", ChipType.NUC100DN],
+        0x30013021: ["NUC130VD3DN", ChipType.NUC100DN],
+        0x30013022: ["NUC130VD2DN", ChipType.NUC100DN],
+        0x30013023: ["NUC130VD1DN", ChipType.NUC100DN],
+        0x30013024: ["NUC130VC3DN", ChipType.NUC100DN],
+        0x30013025: ["NUC130VC2DN", ChipType.NUC100DN],
+        0x30013026: ["NUC130VC1DN", ChipType.NUC100DN],
+        0x30013027: ["NUC130RE3DN", ChipType.NUC100DN],
+        0x30013028: ["NUC130RE2DN", ChipType.NUC100DN],
+        0x30013029: ["NUC130RE1DN", ChipType.NUC100DN],
+        0x30013030: ["NUC130RD3DN", ChipType.NUC100DN],
+        0x30013031: ["NUC130RD2DN", ChipType.NUC100DN],
+        0x30013032: ["NUC130RD1DN", ChipType.NUC100DN],
+        0x30013033: ["NUC130RC3DN", ChipType.NUC100DN],
+        0x30013034: ["NUC130RC2DN", ChipType.NUC100DN],
+        0x30013035: ["NUC130RC1DN", ChipType.NUC100DN],
+        0x30014000: ["NUC140LE3DN", ChipType.NUC100DN],
+        0x30014001: ["NUC140LE2DN", ChipType.NUC100DN],
+        0x30014002: ["NUC140LE1DN", ChipType.NUC100DN],
+        0x30014003: ["NUC140LD3DN", ChipType.NUC100DN],
+        0x30014004: ["NUC140LD2DN", ChipType.NUC100DN],
+        0x30014005: ["NUC140LD1DN", ChipType.NUC100DN],
+        0x30014006: ["NUC140LC3DN", ChipType.NUC100DN],
+        0x30014007: ["NUC140LC2DN", ChipType.NUC100DN],
+        0x30014008: ["NUC140LC1DN", ChipType.NUC100DN],
+        0x30014018: ["NUC140VE3DN", ChipType.NUC100DN],
+        0x30014019: ["NUC140VE2DN", ChipType.NUC100DN],
+        0x30014020: ["NUC140VE1DN", ChipType.NUC100DN],
+        0x30014021: ["NUC140VD3DN", ChipType.NUC100DN],
+        0x30014022: ["NUC140VD2DN", ChipType.NUC100DN],
+        0x30014023: ["NUC140VD1DN", ChipType.NUC100DN],
+        0x30014024: ["NUC140VC3DN", ChipType.NUC100DN],
+        0x30014025: ["NUC140VC2DN", ChipType.NUC100DN],
+        0x30014026: ["NUC140VC1DN", ChipType.NUC100DN],
+        0x30014027: ["NUC140RE3DN", ChipType.NUC100DN],
+        0x30014028: ["NUC140RE2DN", ChipType.NUC100DN],
+        0x30014029: ["NUC140RE1DN", ChipType.NUC100DN],
+        0x30014030: ["NUC140RD3DN", ChipType.NUC100DN],
+        0x30014031: ["NUC140RD2DN", ChipType.NUC100DN],
+        0x30014032: ["NUC140RD1DN", ChipType.NUC100DN],
+        0x30014033: ["NUC140RC3DN", ChipType.NUC100DN],
+        0x30014034: ["NUC140RC2DN", ChipType.NUC100DN],
+        0x30014035: ["NUC140RC1DN", ChipType.NUC100DN],
+        0x00100000: ["N512DC4", ChipType.NANO100AN],
+        0x00100001: ["N512LC4", ChipType.NANO100AN],
+        0x00100002: ["NANO100AN_MISSINGNO0", ChipType.NANO100AN],
+        0x00100003: ["N512MC4", ChipType.NANO100AN],
+        0x00100004: ["NANO100AN_MISSINGNO1", ChipType.NANO100AN],
+        0x00100005: ["N512SC4", ChipType.NANO100AN],
+        0x00100006: ["NANO100AN_MISSINGNO2", ChipType.NANO100AN],
+        0x00100007: ["NANO100AN_MISSINGNO3", ChipType.NANO100AN],
+        0x00110000: ["Nano100VF3AN", ChipType.NANO100AN],
+        0x00110001: ["Nano100VF2AN", ChipType.NANO100AN],
+        0x00110002: ["Nano100SF3AN", ChipType.NANO100AN],
+        0x00110003: ["Nano100SF2AN", ChipType.NANO100AN],
+        0x00110004: ["Nano100LF3AN", ChipType.NANO100AN],
+        0x00110005: ["Nano100LF2AN", ChipType.NANO100AN],
+        0x00110006: ["Nano100VE3AN", ChipType.NANO100AN],
+        0x00110007: ["Nano100VE2AN", ChipType.NANO100AN],
+        0x00110008: ["Nano100SE3AN", ChipType.NANO100AN],
+        0x00110009: ["Nano100SE2AN", ChipType.NANO100AN],
+        0x00110010: ["Nano100LE3AN", ChipType.NANO100AN],
+        0x00110011: ["Nano100LE2AN", ChipType.NANO100AN],
+        0x00110012: ["Nano100VD3AN", ChipType.NANO100AN],
+        0x00110013: ["Nano100VD2AN", ChipType.NANO100AN],
+        0x00110014: ["Nano100VD1AN", ChipType.NANO100AN],
+        0x00110015: ["Nano100SD3AN", ChipType.NANO100AN],
+        0x00110016: ["Nano100SD2AN", ChipType.NANO100AN],
+        0x00110017: ["Nano100SD1AN", ChipType.NANO100AN],
+        0x00110018: ["Nano100LD3AN", ChipType.NANO100AN],
+        0x00110019: ["Nano100LD2AN", ChipType.NANO100AN],
+        0x00110020: ["Nano100LD1AN", ChipType.NANO100AN],
+        0x00110021: ["Nano100VC2AN", ChipType.NANO100AN],
+        0x00110022: ["Nano100VC1AN", ChipType.NANO100AN],
+        0x00110023: ["Nano100SC2AN", ChipType.NANO100AN],
+        0x00110024: ["Nano100SC1AN", ChipType.NANO100AN],
+        0x00110025: ["Nano100LC2AN", ChipType.NANO100AN],
+        0x00110026: ["Nano100LC1AN", ChipType.NANO100AN],
+        0x00110027: ["Nano100ZD3AN", ChipType.NANO100AN],
+        0x00110028: ["Nano100ZD2AN", ChipType.NANO100AN],
+        0x00110029: ["Nano100ZC2AN", ChipType.NANO100AN],
+        0x00111000: ["Nano110VF3AN", ChipType.NANO100AN],
+        0x00111001: ["Nano110VF2AN", ChipType.NANO100AN],
+        0x00111002: ["Nano110SF3AN", ChipType.NANO100AN],
+        0x00111003: ["Nano110SF2AN", ChipType.NANO100AN],
+        0x00111006: ["Nano110VE3AN", ChipType.NANO100AN],
+        0x00111007: ["Nano110VE2AN", ChipType.NANO100AN],
+        0x00111008: ["Nano110SE3AN", ChipType.NANO100AN],
+        0x00111009: ["Nano110SE2AN", ChipType.NANO100AN],
+        0x00111012: ["Nano110VD3AN", ChipType.NANO100AN],
+        0x00111013: ["Nano110VD2AN", ChipType.NANO100AN],
+        0x00111014: ["Nano110VD1AN", ChipType.NANO100AN],
+        0x00111015: ["Nano110SD3AN", ChipType.NANO100AN],
+        0x00111016: ["Nano110SD2AN", ChipType.NANO100AN],
+        0x00111017: ["Nano110SD1AN", ChipType.NANO100AN],
+        0x00111021: ["Nano110VC2AN", ChipType.NANO100AN],
+        0x00111022: ["Nano110VC1AN", ChipType.NANO100AN],
+        0x00111023: ["Nano110SC2AN", ChipType.NANO100AN],
+        0x00111024: ["Nano110SC1AN", ChipType.NANO100AN],
+        0x00112000: ["Nano120VF3AN", ChipType.NANO100AN],
+        0x00112001: ["Nano120VF2AN", ChipType.NANO100AN],
+        0x00112002: ["Nano120SF3AN", ChipType.NANO100AN],
+        0x00112003: ["Nano120SF2AN", ChipType.NANO100AN],
+        0x00112004: ["Nano120LF3AN", ChipType.NANO100AN],
+        0x00112005: ["Nano120LF2AN", ChipType.NANO100AN],
+        0x00112006: ["Nano120VE3AN", ChipType.NANO100AN],
+        0x00112007: ["Nano120VE2AN", ChipType.NANO100AN],
+        0x00112008: ["Nano120SE3AN", ChipType.NANO100AN],
+        0x00112009: ["Nano120SE2AN", ChipType.NANO100AN],
+        0x00112010: ["Nano120LE3AN", ChipType.NANO100AN],
+        0x00112011: ["Nano120LE2AN", ChipType.NANO100AN],
+        0x00112012: ["Nano120VD3AN", ChipType.NANO100AN],
+        0x00112013: ["Nano120VD2AN", ChipType.NANO100AN],
+        0x00112014: ["Nano120VD1AN", ChipType.NANO100AN],
+        0x00112015: ["Nano120SD3AN", ChipType.NANO100AN],
+        0x00112016: ["Nano120SD2AN", ChipType.NANO100AN],
+        0x00112017: ["Nano120SD1AN", ChipType.NANO100AN],
+        0x00112018: ["Nano120LD3AN", ChipType.NANO100AN],
+        0x00112019: ["Nano120LD2AN", ChipType.NANO100AN],
+        0x00112020: ["Nano120LD1AN", ChipType.NANO100AN],
+        0x00112021: ["Nano120VC2AN", ChipType.NANO100AN],
+        0x00112022: ["Nano120VC1AN", ChipType.NANO100AN],
+        0x00112023: ["Nano120SC2AN", ChipType.NANO100AN],
+        0x00112024: ["Nano120SC1AN", ChipType.NANO100AN],
+        0x00112025: ["Nano120LC2AN", ChipType.NANO100AN],
+        0x00112026: ["Nano120LC1AN", ChipType.NANO100AN],
+        0x00112027: ["Nano120ZD3AN", ChipType.NANO100AN],
+        0x00112028: ["Nano120ZD2AN", ChipType.NANO100AN],
+        0x00112029: ["Nano120ZC2AN", ChipType.NANO100AN],
+        0x00113000: ["Nano130VF3AN", ChipType.NANO100AN],
+        0x00113001: ["Nano130VF2AN", ChipType.NANO100AN],
+        0x00113002: ["Nano130SF3AN", ChipType.NANO100AN],
+        0x00113003: ["Nano130SF2AN", ChipType.NANO100AN],
+        0x00113006: ["Nano130VE3AN", ChipType.NANO100AN],
+        0x00113007: ["Nano130VE2AN", ChipType.NANO100AN],
+        0x00113008: ["Nano130SE3AN", ChipType.NANO100AN],
+        0x00113009: ["Nano130SE2AN", ChipType.NANO100AN],
+        0x00113012: ["Nano130VD3AN", ChipType.NANO100AN],
+        0x00113013: ["Nano130VD2AN", ChipType.NANO100AN],
+        0x00113014: ["Nano130VD1AN", ChipType.NANO100AN],
+        0x00113015: ["Nano130SD3AN", ChipType.NANO100AN],
+        0x00113016: ["Nano130SD2AN", ChipType.NANO100AN],
+        0x00113017: ["Nano130SD1AN", ChipType.NANO100AN],
+        0x00113021: ["Nano130VC2AN", ChipType.NANO100AN],
+        0x00113022: ["Nano130VC1AN", ChipType.NANO100AN],
+        0x00113023: ["Nano130SC2AN", ChipType.NANO100AN],
+        0x00113024: ["Nano130SC1AN", ChipType.NANO100AN],
+        0x10005100: ["M051LBN", ChipType.M051BN],
+        0x10005101: ["M051PBN", ChipType.M051BN],
+        0x10005102: ["M051YBN", ChipType.M051BN],
+        0x10005103: ["M051ZBN", ChipType.M051BN],
+        0x10005200: ["M052LBN", ChipType.M051BN],
+        0x10005201: ["M052PBN", ChipType.M051BN],
+        0x10005202: ["M052YBN", ChipType.M051BN],
+        0x10005203: ["M052ZBN", ChipType.M051BN],
+        0x10005204: ["M052TBN", ChipType.M051BN],
+        0x10005205: ["M052XBN", ChipType.M051BN],
+        0x10005400: ["M054LBN", ChipType.M051BN],
+        0x10005401: ["M054PBN", ChipType.M051BN],
+        0x10005402: ["M054YBN", ChipType.M051BN],
+        0x10005403: ["M054ZBN", ChipType.M051BN],
+        0x10005404: ["M054TBN", ChipType.M051BN],
+        0x10005405: ["M054XBN", ChipType.M051BN],
+        0x10005406: ["M051BN_MISSINGNO0", ChipType.M051BN],
+        0x10005800: ["M058LBN", ChipType.M051BN],
+        0x10005801: ["M058PBN", ChipType.M051BN],
+        0x10005802: ["M058YBN", ChipType.M051BN],
+        0x10005803: ["M058ZBN", ChipType.M051BN],
+        0x10005804: ["M058TBN", ChipType.M051BN],
+        0x10005805: ["M058XBN", ChipType.M051BN],
+        0x10005A00: ["M0516LBN", ChipType.M051BN],
+        0x10005A01: ["M0516PBN", ChipType.M051BN],
+        0x10005A02: ["M0516YBN", ChipType.M051BN],
+        0x10005A03: ["M0516ZBN", ChipType.M051BN],
+        0x10005A04: ["M0516TBN", ChipType.M051BN],
+        0x10005A05: ["M0516XBN", ChipType.M051BN],
+        0x00205100: ["MINI51LAN", ChipType.MINI51AN],
+        0x00205101: ["MINI51QAN", ChipType.MINI51AN],
+        0x00205102: ["MINI51", ChipType.MINI51AN],
+        0x00205103: ["MINI51ZAN", ChipType.MINI51AN],
+        0x00205104: ["MINI51TAN", ChipType.MINI51AN],
+        0x00205200: ["MINI52LAN", ChipType.MINI51AN],
+        0x00205201: ["MINI52QAN", ChipType.MINI51AN],
+        0x00205202: ["MINI52", ChipType.MINI51AN],
+        0x00205203: ["MINI52ZAN", ChipType.MINI51AN],
+        0x00205204: ["MINI52TAN", ChipType.MINI51AN],
+        0x00205400: ["MINI54LAN", ChipType.MINI51AN],
+        0x00205401: ["MINI54QAN", ChipType.MINI51AN],
+        0x00205402: ["MINI54", ChipType.MINI51AN],
+        0x00205403: ["MINI54ZAN", ChipType.MINI51AN],
+        0x00205404: ["MINI54TAN", ChipType.MINI51AN],
+        0x00010300: ["NUC103SB2AN0", ChipType.NUC123AN],
+        0x00010301: ["NUC103SB2AN1", ChipType.NUC123AN],
+        0x00010302: ["NUC103SB3AN0", ChipType.NUC123AN],
+        0x00010303: ["NUC103SB4AN0", ChipType.NUC123AN],
+        0x00010304: ["NUC103SC2AN0", ChipType.NUC123AN],
+        0x00010305: ["NUC103SC2AN1", ChipType.NUC123AN],
+        0x00010306: ["NUC103SC3AN0", ChipType.NUC123AN],
+        0x00010307: ["NUC103SC4AN0", ChipType.NUC123AN],
+        0x00010308: ["NUC103SC2AN2", ChipType.NUC123AN],
+        0x00010309: ["NUC103SC2AN3", ChipType.NUC123AN],
+        0x00010310: ["NUC103SC3AN2", ChipType.NUC123AN],
+        0x00010311: ["NUC103SC4AN2", ChipType.NUC123AN],
+        0x00010312: ["NUC103SD2AN0", ChipType.NUC123AN],
+        0x00010313: ["NUC103SD2AN1", ChipType.NUC123AN],
+        0x00010314: ["NUC103SD3AN0", ChipType.NUC123AN],
+        0x00010315: ["NUC103SD4AN0", ChipType.NUC123AN],
+        0x00010316: ["NUC103SE2AN0", ChipType.NUC123AN],
+        0x00010317: ["NUC103SE2AN1", ChipType.NUC123AN],
+        0x00010318: ["NUC103SE3AN0", ChipType.NUC123AN],
+        0x00010319: ["NUC103SE4AN0", ChipType.NUC123AN],
+        0x00010320: ["NUC103LB2AN0", ChipType.NUC123AN],
+        0x00010321: ["NUC103LB2AN1", ChipType.NUC123AN],
+        0x00010322: ["NUC103LB3AN0", ChipType.NUC123AN],
+        0x00010323: ["NUC103LB4AN0", ChipType.NUC123AN],
+        0x00010324: ["NUC103LC2AN0", ChipType.NUC123AN],
+        0x00010325: ["NUC103LC2AN1", ChipType.NUC123AN],
+        0x00010326: ["NUC103LC3AN0", ChipType.NUC123AN],
+        0x00010327: ["NUC103LC4AN0", ChipType.NUC123AN],
+        0x00010328: ["NUC103LC2AN2", ChipType.NUC123AN],
+        0x00010329: ["NUC103LC2AN3", ChipType.NUC123AN],
+        0x00010330: ["NUC103LC3AN2", ChipType.NUC123AN],
+        0x00010331: ["NUC103LC4AN2", ChipType.NUC123AN],
+        0x00010332: ["NUC103LD2AN0", ChipType.NUC123AN],
+        0x00010333: ["NUC103LD2AN1", ChipType.NUC123AN],
+        0x00010334: ["NUC103LD3AN0", ChipType.NUC123AN],
+        0x00010335: ["NUC103LD4AN0", ChipType.NUC123AN],
+        0x00010336: ["NUC103LE2AN0", ChipType.NUC123AN],
+        0x00010337: ["NUC103LE2AN1", ChipType.NUC123AN],
+        0x00010338: ["NUC103LE3AN0", ChipType.NUC123AN],
+        0x00010339: ["NUC103LE4AN0", ChipType.NUC123AN],
+        0x00010340: ["NUC103ZB2AN0", ChipType.NUC123AN],
+        0x00010341: ["NUC103ZB2AN1", ChipType.NUC123AN],
+        0x00010342: ["NUC103ZB3AN0", ChipType.NUC123AN],
+        0x00010343: ["NUC103ZB4AN0", ChipType.NUC123AN],
+        0x00010344: ["NUC103ZC2AN0", ChipType.NUC123AN],
+        0x00010345: ["NUC103ZC2AN1", ChipType.NUC123AN],
+        0x00010346: ["NUC103ZC3AN0", ChipType.NUC123AN],
+        0x00010347: ["NUC103ZC4AN0", ChipType.NUC123AN],
+        0x00010348: ["NUC103ZC2AN2", ChipType.NUC123AN],
+        0x00010349: ["NUC103ZC2AN3", ChipType.NUC123AN],
+        0x00010350: ["NUC103ZC3AN2", ChipType.NUC123AN],
+        0x00010351: ["NUC103ZC4AN2", ChipType.NUC123AN],
+        0x00010352: ["NUC103ZD2AN0", ChipType.NUC123AN],
+        0x00010353: ["NUC103ZD2AN1", ChipType.NUC123AN],
+        0x00010354: ["NUC103ZD3AN0", ChipType.NUC123AN],
+        0x00010355: ["NUC103ZD4AN0", ChipType.NUC123AN],
+        0x00010356: ["NUC103ZE2AN0", ChipType.NUC123AN],
+        0x00010357: ["NUC103ZE2AN1", ChipType.NUC123AN],
+        0x00010358: ["NUC103ZE3AN0", ChipType.NUC123AN],
+        0x00010359: ["NUC103ZE4AN0", ChipType.NUC123AN],
+        0x00010500: ["NUC105SB2AN0", ChipType.NUC123AN],
+        0x00010501: ["NUC105SB2AN1", ChipType.NUC123AN],
+        0x00010502: ["NUC105SB3AN0", ChipType.NUC123AN],
+        0x00010503: ["NUC105SB4AN0", ChipType.NUC123AN],
+        0x00010504: ["NUC105SC2AN0", ChipType.NUC123AN],
+        0x00010505: ["NUC105SC2AN1", ChipType.NUC123AN],
+        0x00010506: ["NUC105SC3AN0", ChipType.NUC123AN],
+        0x00010507: ["NUC105SC4AN0", ChipType.NUC123AN],
+        0x00010508: ["NUC105SC2AN2", ChipType.NUC123AN],
+        0x00010509: ["NUC105SC2AN3", ChipType.NUC123AN],
+        0x00010510: ["NUC105SC3AN2", ChipType.NUC123AN],
+        0x00010511: ["NUC105SC4AN2", ChipType.NUC123AN],
+        0x00010512: ["NUC105SD2AN0", ChipType.NUC123AN],
+        0x00010513: ["NUC105SD2AN1", ChipType.NUC123AN],
+        0x00010514: ["NUC105SD3AN0", ChipType.NUC123AN],
+        0x00010515: ["NUC105SD4AN0", ChipType.NUC123AN],
+        0x00010516: ["NUC105SE2AN0", ChipType.NUC123AN],
+        0x00010517: ["NUC105SE2AN1", ChipType.NUC123AN],
+        0x00010518: ["NUC105SE3AN0", ChipType.NUC123AN],
+        0x00010519: ["NUC105SE4AN0", ChipType.NUC123AN],
+        0x00010520: ["NUC105LB2AN0", ChipType.NUC123AN],
+        0x00010521: ["NUC105LB2AN1", ChipType.NUC123AN],
+        0x00010522: ["NUC105LB3AN0", ChipType.NUC123AN],
+        0x00010523: ["NUC105LB4AN0", ChipType.NUC123AN],
+        0x00010524: ["NUC105LC2AN0", ChipType.NUC123AN],
+        0x00010525: ["NUC105LC2AN1", ChipType.NUC123AN],
+        0x00010526: ["NUC105LC3AN0", ChipType.NUC123AN],
+        0x00010527: ["NUC105LC4AN0", ChipType.NUC123AN],
+        0x00010528: ["NUC105LC2AN2", ChipType.NUC123AN],
+        0x00010529: ["NUC105LC2AN3", ChipType.NUC123AN],
+        0x00010530: ["NUC105LC3AN2", ChipType.NUC123AN],
+        0x00010531: ["NUC105LC4AN2", ChipType.NUC123AN],
+        0x00010532: ["NUC105LD2AN0", ChipType.NUC123AN],
+        0x00010533: ["NUC105LD2AN1", ChipType.NUC123AN],
+        0x00010534: ["NUC105LD3AN0", ChipType.NUC123AN],
+        0x00010535: ["NUC105LD4AN0", ChipType.NUC123AN],
+        0x00010536: ["NUC105LE2AN0", ChipType.NUC123AN],
+        0x00010537: ["NUC105LE2AN1", ChipType.NUC123AN],
+        0x00010538: ["NUC105LE3AN0", ChipType.NUC123AN],
+        0x00010539: ["NUC105LE4AN0", ChipType.NUC123AN],
+        0x00010540: ["NUC105ZB2AN0", ChipType.NUC123AN],
+        0x00010541: ["NUC105ZB2AN1", ChipType.NUC123AN],
+        0x00010542: ["NUC105ZB3AN0", ChipType.NUC123AN],
+        0x00010543: ["NUC105ZB4AN0", ChipType.NUC123AN],
+        0x00010544: ["NUC105ZC2AN0", ChipType.NUC123AN],
+        0x00010545: ["NUC105ZC2AN1", ChipType.NUC123AN],
+        0x00010546: ["NUC105ZC3AN0", ChipType.NUC123AN],
+        0x00010547: ["NUC105ZC4AN0", ChipType.NUC123AN],
+        0x00010548: ["NUC105ZC2AN2", ChipType.NUC123AN],
+        0x00010549: ["NUC105ZC2AN3", ChipType.NUC123AN],
+        0x00010550: ["NUC105ZC3AN2", ChipType.NUC123AN],
+        0x00010551: ["NUC105ZC4AN2", ChipType.NUC123AN],
+        0x00010552: ["NUC105ZD2AN0", ChipType.NUC123AN],
+        0x00010553: ["NUC105ZD2AN1", ChipType.NUC123AN],
+        0x00010554: ["NUC105ZD3AN0", ChipType.NUC123AN],
+        0x00010555: ["NUC105ZD4AN0", ChipType.NUC123AN],
+        0x00010556: ["NUC105ZE2AN0", ChipType.NUC123AN],
+        0x00010557: ["NUC105ZE2AN1", ChipType.NUC123AN],
+        0x00010558: ["NUC105ZE3AN0", ChipType.NUC123AN],
+        0x00010559: ["NUC105ZE4AN0", ChipType.NUC123AN],
+        0x00012300: ["NUC123SB2AN0", ChipType.NUC123AN],
+        0x00012301: ["NUC123SB2AN1", ChipType.NUC123AN],
+        0x00012302: ["NUC123SB3AN0", ChipType.NUC123AN],
+        0x00012303: ["NUC123SB4AN0", ChipType.NUC123AN],
+        0x00012304: ["NUC123SC2AN0", ChipType.NUC123AN],
+        0x00012305: ["NUC123SC2AN1", ChipType.NUC123AN],
+        0x00012306: ["NUC123SC3AN0", ChipType.NUC123AN],
+        0x00012307: ["NUC123SC4AN0", ChipType.NUC123AN],
+        0x00012308: ["NUC123SC2AN2", ChipType.NUC123AN],
+        0x00012309: ["NUC123SC2AN3", ChipType.NUC123AN],
+        0x00012310: ["NUC123SC3AN2", ChipType.NUC123AN],
+        0x00012311: ["NUC123SC4AN2", ChipType.NUC123AN],
+        0x00012312: ["NUC123SD2AN0", ChipType.NUC123AN],
+        0x00012313: ["NUC123SD2AN1", ChipType.NUC123AN],
+        0x00012314: ["NUC123SD3AN0", ChipType.NUC123AN],
+        0x00012315: ["NUC123SD4AN0", ChipType.NUC123AN],
+        0x00012316: ["NUC123SE2AN0", ChipType.NUC123AN],
+        0x00012317: ["NUC123SE2AN1", ChipType.NUC123AN],
+        0x00012318: ["NUC123SE3AN0", ChipType.NUC123AN],
+        0x00012319: ["NUC123SE4AN0", ChipType.NUC123AN],
+        0x00012320: ["NUC123LB2AN0", ChipType.NUC123AN],
+        0x00012321: ["NUC123LB2AN1", ChipType.NUC123AN],
+        0x00012322: ["NUC123LB3AN0", ChipType.NUC123AN],
+        0x00012323: ["NUC123LB4AN0", ChipType.NUC123AN],
+        0x00012324: ["NUC123LC2AN0", ChipType.NUC123AN],
+        0x00012325: ["NUC123LC2AN1", ChipType.NUC123AN],
+        0x00012326: ["NUC123LC3AN0", ChipType.NUC123AN],
+        0x00012327: ["NUC123LC4AN0", ChipType.NUC123AN],
+        0x00012328: ["NUC123LC2AN2", ChipType.NUC123AN],
+        0x00012329: ["NUC123LC2AN3", ChipType.NUC123AN],
+        0x00012330: ["NUC123LC3AN2", ChipType.NUC123AN],
+        0x00012331: ["NUC123LC4AN2", ChipType.NUC123AN],
+        0x00012332: ["NUC123LD2AN0", ChipType.NUC123AN],
+        0x00012333: ["NUC123LD2AN1", ChipType.NUC123AN],
+        0x00012334: ["NUC123LD3AN0", ChipType.NUC123AN],
+        0x00012335: ["NUC123LD4AN0", ChipType.NUC123AN],
+        0x00012336: ["NUC123LE2AN0", ChipType.NUC123AN],
+        0x00012337: ["NUC123LE2AN1", ChipType.NUC123AN],
+        0x00012338: ["NUC123LE3AN0", ChipType.NUC123AN],
+        0x00012339: ["NUC123LE4AN0", ChipType.NUC123AN],
+        0x00012340: ["NUC123ZB2AN0", ChipType.NUC123AN],
+        0x00012341: ["NUC123ZB2AN1", ChipType.NUC123AN],
+        0x00012342: ["NUC123ZB3AN0", ChipType.NUC123AN],
+        0x00012343: ["NUC123ZB4AN0", ChipType.NUC123AN],
+        0x00012344: ["NUC123ZC2AN0", ChipType.NUC123AN],
+        0x00012345: ["NUC123ZC2AN1", ChipType.NUC123AN],
+        0x00012346: ["NUC123ZC3AN0", ChipType.NUC123AN],
+        0x00012347: ["NUC123ZC4AN0", ChipType.NUC123AN],
+        0x00012348: ["NUC123ZC2AN2", ChipType.NUC123AN],
+        0x00012349: ["NUC123ZC2AN3", ChipType.NUC123AN],
+        0x00012350: ["NUC123ZC3AN2", ChipType.NUC123AN],
+        0x00012351: ["NUC123ZC4AN2", ChipType.NUC123AN],
+        0x00012352: ["NUC123ZD2AN0", ChipType.NUC123AN],
+        0x00012353: ["NUC123ZD2AN1", ChipType.NUC123AN],
+        0x00012354: ["NUC123ZD3AN0", ChipType.NUC123AN],
+        0x00012355: ["NUC123ZD4AN0", ChipType.NUC123AN],
+        0x00012356: ["NUC123ZE2AN0", ChipType.NUC123AN],
+        0x00012357: ["NUC123ZE2AN1", ChipType.NUC123AN],
+        0x00012358: ["NUC123ZE3AN0", ChipType.NUC123AN],
+        0x00012359: ["NUC123ZE4AN0", ChipType.NUC123AN],
+        0x00012361: ["PA2828Q", ChipType.NUC123AN],
+        0x00040001: ["NUC400JI8AE", ChipType.NUC400AE],
+        0x00040002: ["NUC400JH8AE", ChipType.NUC400AE],
+        0x00040003: ["NUC400JG8AE", ChipType.NUC400AE],
+        0x00040004: ["NUC400KI8AE", ChipType.NUC400AE],
+        0x00040005: ["NUC400KH8AE", ChipType.NUC400AE],
+        0x00040006: ["NUC400KG8AE", ChipType.NUC400AE],
+        0x00040007: ["NUC400VI8AE", ChipType.NUC400AE],
+        0x00040008: ["NUC400VH8AE", ChipType.NUC400AE],
+        0x00040009: ["NUC400VG8AE", ChipType.NUC400AE],
+        0x00040010: ["NUC400RI8AE", ChipType.NUC400AE],
+        0x00040011: ["NUC400RH8AE", ChipType.NUC400AE],
+        0x00040012: ["NUC400RG8AE", ChipType.NUC400AE],
+        0x00041001: ["NUC410JI8AE", ChipType.NUC400AE],
+        0x00041002: ["NUC410JH8AE", ChipType.NUC400AE],
+        0x00041003: ["NUC410JG8AE", ChipType.NUC400AE],
+        0x00041004: ["NUC410KI8AE", ChipType.NUC400AE],
+        0x00041005: ["NUC410KH8AE", ChipType.NUC400AE],
+        0x00041006: ["NUC410KG8AE", ChipType.NUC400AE],
+        0x00041007: ["NUC410VI8AE", ChipType.NUC400AE],
+        0x00041008: ["NUC410VH8AE", ChipType.NUC400AE],
+        0x00041009: ["NUC410VG8AE", ChipType.NUC400AE],
+        0x00041010: ["NUC410RI8AE", ChipType.NUC400AE],
+        0x00041011: ["NUC410RH8AE", ChipType.NUC400AE],
+        0x00041012: ["NUC410RG8AE", ChipType.NUC400AE],
+        0x00042201: ["NUC422JI8AE", ChipType.NUC400AE],
+        0x00042202: ["NUC422JH8AE", ChipType.NUC400AE],
+        0x00042203: ["NUC422JG8AE", ChipType.NUC400AE],
+        0x00042204: ["NUC422KI8AE", ChipType.NUC400AE],
+        0x00042205: ["NUC422KH8AE", ChipType.NUC400AE],
+        0x00042206: ["NUC422KG8AE", ChipType.NUC400AE],
+        0x00042207: ["NUC422VI8AE", ChipType.NUC400AE],
+        0x00042208: ["NUC422VH8AE", ChipType.NUC400AE],
+        0x00042209: ["NUC422VG8AE", ChipType.NUC400AE],
+        0x00042210: ["NUC422RI8AE", ChipType.NUC400AE],
+        0x00042211: ["NUC422RH8AE", ChipType.NUC400AE],
+        0x00042212: ["NUC422RG8AE", ChipType.NUC400AE],
+        0x00043001: ["NUC430JI8AE", ChipType.NUC400AE],
+        0x00043002: ["NUC430JH8AE", ChipType.NUC400AE],
+        0x00043003: ["NUC430JG8AE", ChipType.NUC400AE],
+        0x00043004: ["NUC430KI8AE", ChipType.NUC400AE],
+        0x00043005: ["NUC430KH8AE", ChipType.NUC400AE],
+        0x00043006: ["NUC430KG8AE", ChipType.NUC400AE],
+        0x00043007: ["NUC430VI8AE", ChipType.NUC400AE],
+        0x00043008: ["NUC430VH8AE", ChipType.NUC400AE],
+        0x00043009: ["NUC430VG8AE", ChipType.NUC400AE],
+        0x00043010: ["NUC430RI8AE", ChipType.NUC400AE],
+        0x00043011: ["NUC430RH8AE", ChipType.NUC400AE],
+        0x00043012: ["NUC430RG8AE", ChipType.NUC400AE],
+        0x00044201: ["NUC442JI8AE", ChipType.NUC400AE],
+        0x00044202: ["NUC442JH8AE", ChipType.NUC400AE],
+        0x00044203: ["NUC442JG8AE", ChipType.NUC400AE],
+        0x00044204: ["NUC442KI8AE", ChipType.NUC400AE],
+        0x00044205: ["NUC442KH8AE", ChipType.NUC400AE],
+        0x00044206: ["NUC442KG8AE", ChipType.NUC400AE],
+        0x00044207: ["NUC442VI8AE", ChipType.NUC400AE],
+        0x00044208: ["NUC442VH8AE", ChipType.NUC400AE],
+        0x00044209: ["NUC442VG8AE", ChipType.NUC400AE],
+        0x00044210: ["NUC442RI8AE", ChipType.NUC400AE],
+        0x00044211: ["NUC442RH8AE", ChipType.NUC400AE],
+        0x00044212: ["NUC442RG8AE", ChipType.NUC400AE],
+        0x00045201: ["NUC452JI8AE", ChipType.NUC400AE],
+        0x00045202: ["NUC452JH8AE", ChipType.NUC400AE],
+        0x00045203: ["NUC452JG8AE", ChipType.NUC400AE],
+        0x00045204: ["NUC452KI8AE", ChipType.NUC400AE],
+        0x00045205: ["NUC452KH8AE", ChipType.NUC400AE],
+        0x00045206: ["NUC452KG8AE", ChipType.NUC400AE],
+        0x00045207: ["NUC452VI8AE", ChipType.NUC400AE],
+        0x00045208: ["NUC452VH8AE", ChipType.NUC400AE],
+        0x00045209: ["NUC452VG8AE", ChipType.NUC400AE],
+        0x00046001: ["NUC460JI8AE", ChipType.NUC400AE],
+        0x00046002: ["NUC460JH8AE", ChipType.NUC400AE],
+        0x00046003: ["NUC460JG8AE", ChipType.NUC400AE],
+        0x00046004: ["NUC460KI8AE", ChipType.NUC400AE],
+        0x00046005: ["NUC460KH8AE", ChipType.NUC400AE],
+        0x00046006: ["NUC460KG8AE", ChipType.NUC400AE],
+        0x00046007: ["NUC460VI8AE", ChipType.NUC400AE],
+        0x00046008: ["NUC460VH8AE", ChipType.NUC400AE],
+        0x00046009: ["NUC460VG8AE", ChipType.NUC400AE],
+        0x00046010: ["NUC460RI8AE", ChipType.NUC400AE],
+        0x00046011: ["NUC460RH8AE", ChipType.NUC400AE],
+        0x00046012: ["NUC460RG8AE", ChipType.NUC400AE],
+        0x00047201: ["NUC472HI8AE", ChipType.NUC400AE],
+        0x00047202: ["NUC472HH8AE", ChipType.NUC400AE],
+        0x00047203: ["NUC472HG8AE", ChipType.NUC400AE],
+        0x00047204: ["NUC472JI8AE", ChipType.NUC400AE],
+        0x00047205: ["NUC472JH8AE", ChipType.NUC400AE],
+        0x00047206: ["NUC472JG8AE", ChipType.NUC400AE],
+        0x00047207: ["NUC472KI8AE", ChipType.NUC400AE],
+        0x00047208: ["NUC472KH8AE", ChipType.NUC400AE],
+        0x00047209: ["NUC472KG8AE", ChipType.NUC400AE],
+        0x00047210: ["NUC472VI8AE", ChipType.NUC400AE],
+        0x00047211: ["NUC472VH8AE", ChipType.NUC400AE],
+        0x00047212: ["NUC472VG8AE", ChipType.NUC400AE],
+        0x00005410: ["M054SLAN", ChipType.M058SAN],
+        0x00005413: ["M054SZAN", ChipType.M058SAN],
+        0x00005414: ["M054STAN", ChipType.M058SAN],
+        0x00005416: ["M054SSAN", ChipType.M058SAN],
+        0x00005810: ["M058SLAN", ChipType.M058SAN],
+        0x00005813: ["M058SZAN", ChipType.M058SAN],
+        0x00005814: ["M058STAN", ChipType.M058SAN],
+        0x00005816: ["M058SSAN", ChipType.M058SAN],
+        0x00005818: ["M058SFAN", ChipType.M058SAN],
+        0x00005910: ["M059SLAN", ChipType.M058SAN],
+        0x00005913: ["M059SZAN", ChipType.M058SAN],
+        0x00005914: ["M059STAN", ChipType.M058SAN],
+        0x00005916: ["M059SSAN", ChipType.M058SAN],
+        0x00110201: ["Nano102ZB0AN", ChipType.NANO102AN],
+        0x00110202: ["Nano102ZB1AN", ChipType.NANO102AN],
+        0x00110203: ["Nano102ZC1AN", ChipType.NANO102AN],
+        0x00110204: ["Nano102ZC2AN", ChipType.NANO102AN],
+        0x00110205: ["Nano102LB0AN", ChipType.NANO102AN],
+        0x00110206: ["Nano102LB1AN", ChipType.NANO102AN],
+        0x00110207: ["Nano102LC1AN", ChipType.NANO102AN],
+        0x00110208: ["Nano102LC2AN", ChipType.NANO102AN],
+        0x00110209: ["Nano102SB0AN", ChipType.NANO102AN],
+        0x00110210: ["Nano102SB1AN", ChipType.NANO102AN],
+        0x00110211: ["Nano102SC1AN", ChipType.NANO102AN],
+        0x00110212: ["Nano102SC2AN", ChipType.NANO102AN],
+        0x00111201: ["Nano112LB0AN", ChipType.NANO102AN],
+        0x00111202: ["Nano112LB1AN", ChipType.NANO102AN],
+        0x00111203: ["Nano112LC1AN", ChipType.NANO102AN],
+        0x00111204: ["Nano112LC2AN", ChipType.NANO102AN],
+        0x00111205: ["Nano112SB0AN", ChipType.NANO102AN],
+        0x00111206: ["Nano112SB1AN", ChipType.NANO102AN],
+        0x00111207: ["Nano112SC1AN", ChipType.NANO102AN],
+        0x00111208: ["Nano112SC2AN", ChipType.NANO102AN],
+        0x00111209: ["Nano112RB0AN", ChipType.NANO102AN],
+        0x00111210: ["Nano112RB1AN", ChipType.NANO102AN],
+        0x00111211: ["Nano112RC1AN", ChipType.NANO102AN],
+        0x00111212: ["Nano112RC2AN", ChipType.NANO102AN],
+        0x00111213: ["Nano112VB0AN", ChipType.NANO102AN],
+        0x00111214: ["Nano112VB1AN", ChipType.NANO102AN],
+        0x00111215: ["Nano112VC1AN", ChipType.NANO102AN],
+        0x00111216: ["Nano112VC2AN", ChipType.NANO102AN],
+        0x00505500: ["MINI55LDE", ChipType.MINI55],
+        0x00505503: ["MINI55ZDE", ChipType.MINI55],
+        0x00505504: ["MINI55TDE", ChipType.MINI55],
+        0x00505600: ["NVS06AL", ChipType.MINI55],
+        0x00605200: ["NM1200LAAE", ChipType.MINI55],
+        0x00605204: ["NM1200TAAE", ChipType.MINI55],
+        0x00605207: ["NM1100XAAE", ChipType.MINI55],
+        0x00605208: ["NM1100FAAE", ChipType.MINI55],
+        0x00605400: ["NM1200LBAE", ChipType.MINI55],
+        0x00605403: ["NM1200ZBAE", ChipType.MINI55],
+        0x00605404: ["NM1200TBAE", ChipType.MINI55],
+        0x00605407: ["NM1100XBAE", ChipType.MINI55],
+        0x00605408: ["NM1100FBAE", ChipType.MINI55],
+        0x0060540A: ["NM1100DBAE", ChipType.MINI55],
+        0x00605411: ["T32S200", ChipType.MINI55],
+        0x00682010: ["NM18200S", ChipType.MINI55],
+        0x00682011: ["NM18201S", ChipType.MINI55],
+        0x00682012: ["NM18202S", ChipType.MINI55],
+        0x00682020: ["NM1820ZB0AE", ChipType.MINI55],
+        0x00682030: ["NM18200D", ChipType.MINI55],
+        0x00682031: ["NM18201D", ChipType.MINI55],
+        0x00682040: ["NM18200Y", ChipType.MINI55],
+        0x00682041: ["NM18201Y", ChipType.MINI55],
+        0x00682042: ["NM18202Y", ChipType.MINI55],
+        0x00682100: ["NM1821FB0AE", ChipType.MINI55],
+        0x00682320: ["NM1823EB0AE", ChipType.MINI55],
+        0x00682330: ["NM1823ZB0AE", ChipType.MINI55],
+        0x00682340: ["NM1823LB0AE", ChipType.MINI55],
+        0x00682410: ["NM1824FB0AE", ChipType.MINI55],
+        0x00682710: ["NM1827UB0AE", ChipType.MINI55],
+        0x00682720: ["NM1827MB0AE", ChipType.MINI55],
+        0x00682721: ["NM1827UW", ChipType.MINI55],
+        0x00845000: ["M451MLG6AE", ChipType.M451HD],
+        0x00845001: ["M451MLE6AE", ChipType.M451HD],
+        0x00845020: ["M451MRG6AE", ChipType.M451HD],
+        0x00845021: ["M451MRE6AE", ChipType.M451HD],
+        0x00845100: ["M451LG6AE", ChipType.M451HD],
+        0x00845101: ["M451LE6AE", ChipType.M451HD],
+        0x00845120: ["M451RG6AE", ChipType.M451HD],
+        0x00845121: ["M451RE6AE", ChipType.M451HD],
+        0x00845130: ["M451VG6AE", ChipType.M451HD],
+        0x00845131: ["M451VE6AE", ChipType.M451HD],
+        0x00845200: ["M452LG6AE", ChipType.M451HD],
+        0x00845201: ["M452LE6AE", ChipType.M451HD],
+        0x00845210: ["M452SG6AE", ChipType.M451HD],
+        0x00845211: ["M452SE6AE", ChipType.M451HD],
+        0x00845220: ["M452RG6AE", ChipType.M451HD],
+        0x00845221: ["M452RE6AE", ChipType.M451HD],
+        0x00845230: ["M452VG6AE", ChipType.M451HD],
+        0x00845231: ["M452VE6AE", ChipType.M451HD],
+        0x00845300: ["M453LG6AE", ChipType.M451HD],
+        0x00845301: ["M453LE6AE", ChipType.M451HD],
+        0x00845320: ["M453RG6AE", ChipType.M451HD],
+        0x00845321: ["M453RE6AE", ChipType.M451HD],
+        0x00845330: ["M453VG6AE", ChipType.M451HD],
+        0x00845331: ["M453VE6AE", ChipType.M451HD],
+        0x00845400: ["M4TKLG6AE", ChipType.M451HD],
+        0x00845401: ["M4TKLE6AE", ChipType.M451HD],
+        0x00845420: ["M4TKRG6AE", ChipType.M451HD],
+        0x00845421: ["M4TKRE6AE", ChipType.M451HD],
+        0x00845430: ["M4TKVG6AE", ChipType.M451HD],
+        0x00845431: ["M4TKVE6AE", ChipType.M451HD],
+        0x00845700: ["M4LEDLG6AE", ChipType.M451HD],
+        0x00845701: ["M4LEDLE6AE", ChipType.M451HD],
+        0x00845720: ["M4LEDRG6AE", ChipType.M451HD],
+        0x00845721: ["M4LEDRE6AE", ChipType.M451HD],
+        0x00032003: ["NM1320LC2AE", ChipType.M0518],
+        0x00034003: ["NM1340D", ChipType.M0518],
+        0x00295A30: ["NUC029LDE", ChipType.M0518],
+        0x00295A31: ["NUC029SDE", ChipType.M0518],
+        0x00295A37: ["NUC029MDE", ChipType.M0518],
+        0x10013100: ["NUC131LD2AE", ChipType.M0518],
+        0x10013103: ["NUC131LC2AE", ChipType.M0518],
+        0x10013110: ["NUC131SD2AE", ChipType.M0518],
+        0x10013113: ["NUC131SC2AE", ChipType.M0518],
+        0x10013120: ["NUC131RD2AE", ChipType.M0518],
+        0x10013123: ["NUC131RC2AE", ChipType.M0518],
+        0x100131B0: ["NUC131FAE", ChipType.M0518],
+        0x10051800: ["M0518LD2AE", ChipType.M0518],
+        0x10051803: ["M0518LC2AE", ChipType.M0518],
+        0x10051810: ["M0518SD2AE", ChipType.M0518],
+        0x10051813: ["M0518SC2AE", ChipType.M0518],
+        0x100A8610: ["M0A86SD2AE", ChipType.M0518],
+        0xF0013100: ["NUC131LD2AEU", ChipType.M0518],
+        0xF0013103: ["NUC131LC2AEU", ChipType.M0518],
+        0xF0013110: ["NUC131SD2AEU", ChipType.M0518],
+        0xF0013113: ["NUC131SC2AEU", ChipType.M0518],
+        0x00A05800: ["MINI58LDE", ChipType.MINI58],
+        0x00A05801: ["MINI58QDE", ChipType.MINI58],
+        0x00A05803: ["MINI58ZDE", ChipType.MINI58],
+        0x00A05804: ["MINI58TDE", ChipType.MINI58],
+        0x00A05805: ["MINI58FDE", ChipType.MINI58],
+        0x00A05806: ["MINI58FHC", ChipType.MINI58],
+        0x00295C52: ["NUC029KGE", ChipType.M0564],
+        0x00C05204: ["NUC126LG4AE", ChipType.M0564],
+        0x00C05205: ["NUC126LE4AE", ChipType.M0564],
+        0x00C05206: ["NUC126NE4AE", ChipType.M0564],
+        0x00C05212: ["NUC126SG4AE", ChipType.M0564],
+        0x00C05213: ["NUC126SE4AE", ChipType.M0564],
+        0x00C05230: ["NUC126KG4AE", ChipType.M0564],
+        0x00C05231: ["NUC126VG4AE", ChipType.M0564],
+        0x00C56404: ["M0564LG4AE", ChipType.M0564],
+        0x00C56405: ["M0564LE4AE", ChipType.M0564],
+        0x00C56412: ["M0564SG4AE", ChipType.M0564],
+        0x00C56413: ["M0564SE4AE", ChipType.M0564],
+        0x00C56431: ["M0564VG4AE", ChipType.M0564],
+        0x00C56440: ["M0564KG4AE", ChipType.M0564],
+        0x01607130: ["M071VG4AE", ChipType.M0564],
+        0x01607170: ["M071QG4AE", ChipType.M0564],
+        0x01607171: ["M071QE4AE", ChipType.M0564],
+        0x00110301: ["Nano103SD3AE", ChipType.NANO103],
+        0x00110302: ["Nano103SD2AE", ChipType.NANO103],
+        0x00110303: ["Nano103SD1AE", ChipType.NANO103],
+        0x00110304: ["Nano103LD3AE", ChipType.NANO103],
+        0x00110305: ["Nano103LD2AE", ChipType.NANO103],
+        0x00110306: ["Nano103LD1AE", ChipType.NANO103],
+        0x00110307: ["Nano103ZD3AE", ChipType.NANO103],
+        0x00110308: ["Nano103ZD2AE", ChipType.NANO103],
+        0x00110309: ["Nano103ZD1AE", ChipType.NANO103],
+        0x00110310: ["Nano103SC2AE", ChipType.NANO103],
+        0x00110311: ["Nano103SC1AE", ChipType.NANO103],
+        0x00110312: ["Nano103LC2AE", ChipType.NANO103],
+        0x00110313: ["Nano103LC1AE", ChipType.NANO103],
+        0x00110314: ["Nano103ZC2AE", ChipType.NANO103],
+        0x00110315: ["Nano103ZC1AE", ChipType.NANO103],
+        0x00110316: ["Nano103SC3AE", ChipType.NANO103],
+        0x00110317: ["Nano103LC3AE", ChipType.NANO103],
+        0x00110318: ["Nano103ZC3AE", ChipType.NANO103],
+        0x00110320: ["YM0232A03S", ChipType.NANO103],
+        0x00012105: ["NUC121SC2AE", ChipType.NUC121],
+        0x00012125: ["NUC121LC2AE", ChipType.NUC121],
+        0x00012145: ["NUC121ZC2AE", ChipType.NUC121],
+        0x00012160: ["NUC121Y25CN", ChipType.NUC121],
+        0x00012180: ["NUC121WC2AE", ChipType.NUC121],
+        0x00012505: ["NUC125SC2AE", ChipType.NUC121],
+        0x00012525: ["NUC125LC2AE", ChipType.NUC121],
+        0x00012545: ["NUC125ZC2AE", ChipType.NUC121],
+        0x00295B40: ["NUC029LEE", ChipType.NUC2201],
+        0x00295B41: ["NUC029SEE", ChipType.NUC2201],
+        0x01607112: ["M071SE3AE", ChipType.NUC2201],
+        0x01607113: ["M071SD3AE", ChipType.NUC2201],
+        0x01607192: ["M071R1E3AE", ChipType.NUC2201],
+        0x01607193: ["M071R1D3AE", ChipType.NUC2201],
+        0x20024000: ["NUC2201LE3AE", ChipType.NUC2201],
+        0x20024027: ["NUC2201SE3AE", ChipType.NUC2201],
+        0x00E45200: ["M4521LE6AE", ChipType.M4521],
+        0x00E45201: ["M4521LD6AE", ChipType.M4521],
+        0x00E45210: ["M4521SE6AE", ChipType.M4521],
+        0x00E45211: ["M4521SD6AE", ChipType.M4521],
+        0x00E45220: ["M4521RE6AE", ChipType.M4521],
+        0x00E45221: ["M4521RD6AE", ChipType.M4521],
+        0x01647112: ["M471SE6AE", ChipType.M4521],
+        0x01647113: ["M471SD6AE", ChipType.M4521],
+        0x01647192: ["M471R1E6AE", ChipType.M4521],
+        0x01647193: ["M471R1D6AE", ChipType.M4521],
+        0x016471A3: ["M471MD6AE", ChipType.M4521],
+        0x01131CA0: ["M031EC1AE", ChipType.M031_32K],
+        0x01131CB0: ["M031FC1AE", ChipType.M031_32K],
+        0x01131CE0: ["M031TC1AE", ChipType.M031_32K],
+        0x01131E00: ["M031LE3AE", ChipType.M031_128K],
+        0x01131E10: ["M031SE3AE", ChipType.M031_128K],
+        0x01131E90: ["M031BTYE3AN", ChipType.M031_128K],
+        0x01131EE0: ["M031TE3AE", ChipType.M031_128K],
+        0x01132E00: ["M032LE3AE", ChipType.M031_128K],
+        0x01132E10: ["M032SE3AE", ChipType.M031_128K],
+        0x01131D00: ["M031LD2AE", ChipType.M031_64K],
+        0x01131D01: ["M031LC2AE", ChipType.M031_64K],
+        0x01131D10: ["M031SD2AE", ChipType.M031_64K],
+        0x01131D11: ["M031SC2AE", ChipType.M031_64K],
+        0x01131D90: ["M031BTYD2AN", ChipType.M031_64K],
+        0x01131DE0: ["M031TD2AE", ChipType.M031_64K],
+        0x01131BA0: ["M031EB0AE", ChipType.M031_16K],
+        0x01131BB0: ["M031FB0AE", ChipType.M031_16K],
+        0x01131BE0: ["M031TB0AE", ChipType.M031_16K],
+        0x00295C50: ["NUC029LGE", ChipType.NUC1261],
+        0x00295C51: ["NUC029SGE", ChipType.NUC1261],
+        0x01205204: ["NUC1261LG4AE", ChipType.NUC1261],
+        0x01205205: ["NUC1261LE4AE", ChipType.NUC1261],
+        0x01205206: ["NUC1261NE4AE", ChipType.NUC1261],
+        0x01205212: ["NUC1261SG4AE", ChipType.NUC1261],
+        0x01205213: ["NUC1261SE4AE", ChipType.NUC1261],
+        0x01256404: ["M05641LG4AE", ChipType.NUC1261],
+        0x01256405: ["M05641LE4AE", ChipType.NUC1261],
+        0x01256412: ["M05641SG4AE", ChipType.NUC1261],
+        0x01256413: ["M05641SE4AE", ChipType.NUC1261],
+        0x01131100: ["M031LIAAE", ChipType.M031_512K],
+        0x01131110: ["M031SIAAE", ChipType.M031_512K],
+        0x01131140: ["M031KIAAE", ChipType.M031_512K],
+        0x01132100: ["M032LIAAE", ChipType.M031_512K],
+        0x01132110: ["M032SIAAE", ChipType.M031_512K],
+        0x01132140: ["M032KIAAE", ChipType.M031_512K],
+        0x01131600: ["M031LG8AE", ChipType.M031_256K],
+        0x01131601: ["M031LG6AE", ChipType.M031_256K],
+        0x01131610: ["M031SG8AE", ChipType.M031_256K],
+        0x01131611: ["M031SG6AE", ChipType.M031_256K],
+        0x01131640: ["M031KG8AE", ChipType.M031_256K],
+        0x01131641: ["M031KG6AE", ChipType.M031_256K],
+        0x01132600: ["M032LG8AE", ChipType.M031_256K],
+        0x01132601: ["M032LG6AE", ChipType.M031_256K],
+        0x01132610: ["M032SG8AE", ChipType.M031_256K],
+        0x01132611: ["M032SG6AE", ChipType.M031_256K],
+        0x01132640: ["M032KG8AE", ChipType.M031_256K],
+        0x01132641: ["M032KG6AE", ChipType.M031_256K],
+        0x016071A4: ["M071MD2AE", ChipType.NUC1311],
+        0x016071A5: ["M071MC2AE", ChipType.NUC1311],
+        0x11413100: ["NUC1311LD2AE", ChipType.NUC1311],
+        0x11413101: ["NUC1311LC2AE", ChipType.NUC1311],
+        0x11413103: ["M0515LDE", ChipType.NUC1311],
+        0x01130D00: ["M030LD2AE", ChipType.M032D],
+        0x01130DB0: ["M030FD2AE", ChipType.M032D],
+        0x01130DE0: ["M030TD2AE", ChipType.M032D],
+        0x01132CA0: ["M032EC1AE", ChipType.M032D],
+        0x01132CB0: ["M032FC1AE", ChipType.M032D],
+        0x01132CE0: ["M032TC1AE", ChipType.M032D],
+        0x01132D00: ["M032LD2AE", ChipType.M032D],
+        0x01132D01: ["M032LC2AE", ChipType.M032D],
+        0x01132DE0: ["M032TD2AE", ChipType.M032D],
+        0x01132DE1: ["M032TC2AE", ChipType.M032D],
+        0x015A2120: ["M0A21OC1AC", ChipType.M0A21],
+        0x015A2121: ["M0A21OB1AC", ChipType.M0A21],
+        0x015A21A0: ["M0A21EC1AC", ChipType.M0A21],
+        0x015A21A1: ["M0A21EB1AC", ChipType.M0A21],
+        0x015A2320: ["M0A23OC1AC", ChipType.M0A21],
+        0x015A2321: ["M0A23OC1ACU", ChipType.M0A21],
+        0x015A23A0: ["M0A23EC1AC", ChipType.M0A21],
+        0x015A23A1: ["M0A23EC1ACU", ChipType.M0A21],
+        0x011296F1: ["M029GGC0AE", ChipType.M030G],
+        0x011306E0: ["M030GTD1AE", ChipType.M030G],
+        0x011306E1: ["M030GTC0AE", ChipType.M030G],
+        0x011306E2: ["M030GTC1AE", ChipType.M030G],
+        0x011306F0: ["M030GGD1AE", ChipType.M030G],
+        0x011306F1: ["M030GGC0AE", ChipType.M030G],
+        0x011306F2: ["M030GGC1AE", ChipType.M030G],
+        0x01647100: ["M471LI8AE", ChipType.M471],
+        0x01647101: ["M471LG7AE", ChipType.M471],
+        0x01647130: ["M471VI8AE", ChipType.M471],
+        0x01647131: ["M471VG7AE", ChipType.M471],
+        0x01647140: ["M471KI8AE", ChipType.M471],
+        0x01647141: ["M471KG7AE", ChipType.M471],
+        0x01647170: ["M471QI8AE", ChipType.M471],
+        0x01647171: ["M471QG7AE", ChipType.M471],
+        0x01647190: ["M471RI8AE", ChipType.M471],
+        0x01647191: ["M471RG7AE", ChipType.M471],
+        0x016471F0: ["M471CI8AE", ChipType.M471],
+        0x30012204: ["NUC122LD2DN", ChipType.NUC122DN],
+        0x30012208: ["NUC122LC1DN", ChipType.NUC122DN],
+        0x30012222: ["NUC122SD2DN", ChipType.NUC122DN],
+        0x30012226: ["NUC122SC1DN", ChipType.NUC122DN],
+        0x30012231: ["NUC122ZD2DN", ChipType.NUC122DN],
+        0x30012235: ["NUC122ZC1DN", ChipType.NUC122DN],
+        0x10020000: ["NUC200LE3AE", ChipType.NUC200AE],
+        0x10020004: ["NUC200LD2AE", ChipType.NUC200AE],
+        0x10020007: ["NUC200LC2AE", ChipType.NUC200AE],
+        0x10020018: ["NUC200VE3AE", ChipType.NUC200AE],
+        0x10020027: ["NUC200SE3AE", ChipType.NUC200AE],
+        0x10020031: ["NUC200SD2AE", ChipType.NUC200AE],
+        0x10020034: ["NUC200SC2AE", ChipType.NUC200AE],
+        0x10022004: ["NUC220LD2AE", ChipType.NUC200AE],
+        0x10022007: ["NUC220LC2AE", ChipType.NUC200AE],
+        0x10022018: ["NUC220VE3AE", ChipType.NUC200AE],
+        0x10022027: ["NUC220SE3AE", ChipType.NUC200AE],
+        0x10022031: ["NUC220SD2AE", ChipType.NUC200AE],
+        0x10022034: ["NUC220SC2AE", ChipType.NUC200AE],
+        0x10023000: ["NUC230LE3AE", ChipType.NUC200AE],
+        0x10023004: ["NUC230LD2AE", ChipType.NUC200AE],
+        0x10023007: ["NUC230LC2AE", ChipType.NUC200AE],
+        0x10023018: ["NUC230VE3AE", ChipType.NUC200AE],
+        0x10023027: ["NUC230SE3AE", ChipType.NUC200AE],
+        0x10023031: ["NUC230SD2AE", ChipType.NUC200AE],
+        0x10023034: ["NUC230SC2AE", ChipType.NUC200AE],
+        0x10024000: ["NUC240LE3AE", ChipType.NUC200AE],
+        0x10024004: ["NUC240LD2AE", ChipType.NUC200AE],
+        0x10024007: ["NUC240LC2AE", ChipType.NUC200AE],
+        0x10024018: ["NUC240VE3AE", ChipType.NUC200AE],
+        0x10024027: ["NUC240SE3AE", ChipType.NUC200AE],
+        0x10024031: ["NUC240SD2AE", ChipType.NUC200AE],
+        0x10024034: ["NUC240SC2AE", ChipType.NUC200AE],
+        0x40010000: ["NUC100LE3EN", ChipType.NUC200AE],
+        0x40010003: ["NUC100LD3EN", ChipType.NUC200AE],
+        0x40010004: ["NUC100LD2EN", ChipType.NUC200AE],
+        0x40010005: ["NUC100LD1EN", ChipType.NUC200AE],
+        0x40010008: ["NUC100LC1EN", ChipType.NUC200AE],
+        0x40010009: ["NUC100RE3EN", ChipType.NUC200AE],
+        0x40010012: ["NUC100RD3EN", ChipType.NUC200AE],
+        0x40010013: ["NUC100RD2EN", ChipType.NUC200AE],
+        0x40010014: ["NUC100RD1EN", ChipType.NUC200AE],
+        0x40010017: ["NUC100RC1EN", ChipType.NUC200AE],
+        0x40010018: ["NUC100VE3DE", ChipType.NUC200AE],
+        0x40010021: ["NUC100VD3EN", ChipType.NUC200AE],
+        0x40010022: ["NUC100VD2EN", ChipType.NUC200AE],
+        0x40012000: ["NUC120LE3EN", ChipType.NUC200AE],
+        0x40012003: ["NUC120LD3EN", ChipType.NUC200AE],
+        0x40012004: ["NUC120LD2DE", ChipType.NUC200AE],
+        0x40012005: ["NUC120LD1EN", ChipType.NUC200AE],
+        0x40012008: ["NUC120LC1EN", ChipType.NUC200AE],
+        0x40012009: ["NUC120RE3EN", ChipType.NUC200AE],
+        0x40012012: ["NUC120RD3EN", ChipType.NUC200AE],
+        0x40012013: ["NUC120RD2EN", ChipType.NUC200AE],
+        0x40012014: ["NUC120RD1EN", ChipType.NUC200AE],
+        0x40012017: ["NUC120RC1EN", ChipType.NUC200AE],
+        0x40012018: ["NUC120VE3EN", ChipType.NUC200AE],
+        0x40012021: ["NUC120VD3EN", ChipType.NUC200AE],
+        0x40012022: ["NUC120VD2EN", ChipType.NUC200AE],
+        0x40013017: ["NUC230RC1AE", ChipType.NUC200AE],
+        0x40022000: ["NUC220LE3AE", ChipType.NUC200AE],
+        0x00100008: ["N512VD4", ChipType.NANO100BN],
+        0x00100009: ["N512MD4", ChipType.NANO100BN],
+        0x00100010: ["N512SD4", ChipType.NANO100BN],
+        0x00110030: ["Nano100KE3BN", ChipType.NANO100BN],
+        0x00110031: ["Nano100KE2BN", ChipType.NANO100BN],
+        0x00110032: ["Nano100VE3BN", ChipType.NANO100BN],
+        0x00110033: ["Nano100VE2BN", ChipType.NANO100BN],
+        0x00110034: ["Nano100SE3BN", ChipType.NANO100BN],
+        0x00110035: ["Nano100SE2BN", ChipType.NANO100BN],
+        0x00110036: ["Nano100LE3BN", ChipType.NANO100BN],
+        0x00110037: ["Nano100LE2BN", ChipType.NANO100BN],
+        0x00110038: ["Nano100KD3BN", ChipType.NANO100BN],
+        0x00110039: ["Nano100KD2BN", ChipType.NANO100BN],
+        0x0011003A: ["Nano100VD3BN", ChipType.NANO100BN],
+        0x0011003B: ["Nano100VD2BN", ChipType.NANO100BN],
+        0x0011003C: ["Nano100SD3BN", ChipType.NANO100BN],
+        0x0011003D: ["Nano100SD2BN", ChipType.NANO100BN],
+        0x0011003E: ["Nano100LD3BN", ChipType.NANO100BN],
+        0x0011003F: ["Nano100LD2BN", ChipType.NANO100BN],
+        0x00110040: ["Nano100KC2BN", ChipType.NANO100BN],
+        0x00110041: ["Nano100VC2BN", ChipType.NANO100BN],
+        0x00110042: ["Nano100SC2BN", ChipType.NANO100BN],
+        0x00110043: ["Nano100LC2BN", ChipType.NANO100BN],
+        0x00110044: ["Nano100NE3BN", ChipType.NANO100BN],
+        0x00110045: ["Nano100ND3BN", ChipType.NANO100BN],
+        0x00110046: ["Nano100ND2BN", ChipType.NANO100BN],
+        0x00110047: ["Nano100WE3BN", ChipType.NANO100BN],
+        0x00111030: ["Nano110KE3BN", ChipType.NANO100BN],
+        0x00111031: ["Nano110KE2BN", ChipType.NANO100BN],
+        0x00111032: ["Nano110VE3BN", ChipType.NANO100BN],
+        0x00111033: ["Nano110VE2BN", ChipType.NANO100BN],
+        0x00111034: ["Nano110SE3BN", ChipType.NANO100BN],
+        0x00111035: ["Nano110SE2BN", ChipType.NANO100BN],
+        0x00111038: ["Nano110KD3BN", ChipType.NANO100BN],
+        0x00111039: ["Nano110KD2BN", ChipType.NANO100BN],
+        0x0011103A: ["Nano110VD3BN", ChipType.NANO100BN],
+        0x0011103B: ["Nano110VD2BN", ChipType.NANO100BN],
+        0x0011103C: ["Nano110SD3BN", ChipType.NANO100BN],
+        0x0011103D: ["Nano110SD2BN", ChipType.NANO100BN],
+        0x00111040: ["Nano110KC2BN", ChipType.NANO100BN],
+        0x00111041: ["Nano110VC2BN", ChipType.NANO100BN],
+        0x00111042: ["Nano110SC2BN", ChipType.NANO100BN],
+        0x00111043: ["Nano110RC2BN", ChipType.NANO100BN],
+        0x00111044: ["Nano110RD2BN", ChipType.NANO100BN],
+        0x00111045: ["Nano110RD3BN", ChipType.NANO100BN],
+        0x00112030: ["Nano120KE3BN", ChipType.NANO100BN],
+        0x00112031: ["Nano120KE2BN", ChipType.NANO100BN],
+        0x00112032: ["Nano120VE3BN", ChipType.NANO100BN],
+        0x00112033: ["Nano120VE2BN", ChipType.NANO100BN],
+        0x00112034: ["Nano120SE3BN", ChipType.NANO100BN],
+        0x00112035: ["Nano120SE2BN", ChipType.NANO100BN],
+        0x00112036: ["Nano120LE3BN", ChipType.NANO100BN],
+        0x00112037: ["Nano120LE2BN", ChipType.NANO100BN],
+        0x00112038: ["Nano120KD3BN", ChipType.NANO100BN],
+        0x00112039: ["Nano120KD2BN", ChipType.NANO100BN],
+        0x0011203A: ["Nano120VD3BN", ChipType.NANO100BN],
+        0x0011203B: ["Nano120VD2BN", ChipType.NANO100BN],
+        0x0011203C: ["Nano120SD3BN", ChipType.NANO100BN],
+        0x0011203D: ["Nano120SD2BN", ChipType.NANO100BN],
+        0x0011203E: ["Nano120LD3BN", ChipType.NANO100BN],
+        0x0011203F: ["Nano120LD2BN", ChipType.NANO100BN],
+        0x00112040: ["Nano120KC2BN", ChipType.NANO100BN],
+        0x00112041: ["Nano120VC2BN", ChipType.NANO100BN],
+        0x00112042: ["Nano120SC2BN", ChipType.NANO100BN],
+        0x00112043: ["Nano120LC2BN", ChipType.NANO100BN],
+        0x00113030: ["Nano130KE3BN", ChipType.NANO100BN],
+        0x00113031: ["Nano130KE2BN", ChipType.NANO100BN],
+        0x00113032: ["Nano130VE3BN", ChipType.NANO100BN],
+        0x00113033: ["Nano130VE2BN", ChipType.NANO100BN],
+        0x00113034: ["Nano130SE3BN", ChipType.NANO100BN],
+        0x00113035: ["Nano130SE2BN", ChipType.NANO100BN],
+        0x00113038: ["Nano130KD3BN", ChipType.NANO100BN],
+        0x00113039: ["Nano130KD2BN", ChipType.NANO100BN],
+        0x0011303A: ["Nano130VD3BN", ChipType.NANO100BN],
+        0x0011303B: ["Nano130VD2BN", ChipType.NANO100BN],
+        0x0011303C: ["Nano130SD3BN", ChipType.NANO100BN],
+        0x0011303D: ["Nano130SD2BN", ChipType.NANO100BN],
+        0x00113040: ["Nano130KC2BN", ChipType.NANO100BN],
+        0x00113041: ["Nano130VC2BN", ChipType.NANO100BN],
+        0x00113042: ["Nano130SC2BN", ChipType.NANO100BN],
+        0x00295804: ["NUC029TAN", ChipType.M051DN],
+        0x00295824: ["NUC029CIG1", ChipType.M051DN],
+        0x00295A00: ["NUC029LAN", ChipType.M051DN],
+        0x00295A03: ["NUC029ZAN", ChipType.M051DN],
+        0x00295A06: ["NUC029NAN", ChipType.M051DN],
+        0x20005200: ["M052LDN", ChipType.M051DN],
+        0x20005203: ["M052ZDN", ChipType.M051DN],
+        0x20005204: ["M052TDN", ChipType.M051DN],
+        0x20005205: ["M052XDN", ChipType.M051DN],
+        0x20005400: ["M054LDN", ChipType.M051DN],
+        0x20005403: ["M054ZDN", ChipType.M051DN],
+        0x20005404: ["M054TDN", ChipType.M051DN],
+        0x20005405: ["M054XDN", ChipType.M051DN],
+        0x20005800: ["M058LDN", ChipType.M051DN],
+        0x20005803: ["M058ZDN", ChipType.M051DN],
+        0x20005804: ["M058TDN", ChipType.M051DN],
+        0x20005805: ["M058XDN", ChipType.M051DN],
+        0x20005A00: ["M0516LDN", ChipType.M051DN],
+        0x20005A03: ["M0516ZDN", ChipType.M051DN],
+        0x20005A04: ["M0516TDN", ChipType.M051DN],
+        0x20005A05: ["M0516XDN", ChipType.M051DN],
+        0x10010300: ["NUC103SB2BN0", ChipType.NUC123AE],
+        0x10010301: ["NUC103SB2BN1", ChipType.NUC123AE],
+        0x10010302: ["NUC103SB3BN0", ChipType.NUC123AE],
+        0x10010303: ["NUC103SB4BN0", ChipType.NUC123AE],
+        0x10010304: ["NUC103SC2BN0", ChipType.NUC123AE],
+        0x10010305: ["NUC103SC2BN1", ChipType.NUC123AE],
+        0x10010306: ["NUC103SC3BN0", ChipType.NUC123AE],
+        0x10010307: ["NUC103SC4BN0", ChipType.NUC123AE],
+        0x10010308: ["NUC103SC2BN2", ChipType.NUC123AE],
+        0x10010309: ["NUC103SC2BN3", ChipType.NUC123AE],
+        0x10010310: ["NUC103SC3BN2", ChipType.NUC123AE],
+        0x10010311: ["NUC103SC4BN2", ChipType.NUC123AE],
+        0x10010312: ["NUC103SD2BN0", ChipType.NUC123AE],
+        0x10010313: ["NUC103SD2BN1", ChipType.NUC123AE],
+        0x10010314: ["NUC103SD3BN0", ChipType.NUC123AE],
+        0x10010315: ["NUC103SD4BN0", ChipType.NUC123AE],
+        0x10010316: ["NUC103SE2BN0", ChipType.NUC123AE],
+        0x10010317: ["NUC103SE2BN1", ChipType.NUC123AE],
+        0x10010318: ["NUC103SE3BN0", ChipType.NUC123AE],
+        0x10010319: ["NUC103SE4BN0", ChipType.NUC123AE],
+        0x10010320: ["NUC103LB2BN0", ChipType.NUC123AE],
+        0x10010321: ["NUC103LB2BN1", ChipType.NUC123AE],
+        0x10010322: ["NUC103LB3BN0", ChipType.NUC123AE],
+        0x10010323: ["NUC103LB4BN0", ChipType.NUC123AE],
+        0x10010324: ["NUC103LC2BN0", ChipType.NUC123AE],
+        0x10010325: ["NUC103LC2BN1", ChipType.NUC123AE],
+        0x10010326: ["NUC103LC3BN0", ChipType.NUC123AE],
+        0x10010327: ["NUC103LC4BN0", ChipType.NUC123AE],
+        0x10010328: ["NUC103LC2BN2", ChipType.NUC123AE],
+        0x10010329: ["NUC103LC2BN3", ChipType.NUC123AE],
+        0x10010330: ["NUC103LC3BN2", ChipType.NUC123AE],
+        0x10010331: ["NUC103LC4BN2", ChipType.NUC123AE],
+        0x10010332: ["NUC103LD2BN0", ChipType.NUC123AE],
+        0x10010333: ["NUC103LD2BN1", ChipType.NUC123AE],
+        0x10010334: ["NUC103LD3BN0", ChipType.NUC123AE],
+        0x10010335: ["NUC103LD4BN0", ChipType.NUC123AE],
+        0x10010336: ["NUC103LE2BN0", ChipType.NUC123AE],
+        0x10010337: ["NUC103LE2BN1", ChipType.NUC123AE],
+        0x10010338: ["NUC103LE3BN0", ChipType.NUC123AE],
+        0x10010339: ["NUC103LE4BN0", ChipType.NUC123AE],
+        0x10010340: ["NUC103ZB2BN0", ChipType.NUC123AE],
+        0x10010341: ["NUC103ZB2BN1", ChipType.NUC123AE],
+        0x10010342: ["NUC103ZB3BN0", ChipType.NUC123AE],
+        0x10010343: ["NUC103ZB4BN0", ChipType.NUC123AE],
+        0x10010344: ["NUC103ZC2BN0", ChipType.NUC123AE],
+        0x10010345: ["NUC103ZC2BN1", ChipType.NUC123AE],
+        0x10010346: ["NUC103ZC3BN0", ChipType.NUC123AE],
+        0x10010347: ["NUC103ZC4BN0", ChipType.NUC123AE],
+        0x10010348: ["NUC103ZC2BN2", ChipType.NUC123AE],
+        0x10010349: ["NUC103ZC2BN3", ChipType.NUC123AE],
+        0x10010350: ["NUC103ZC3BN2", ChipType.NUC123AE],
+        0x10010351: ["NUC103ZC4BN2", ChipType.NUC123AE],
+        0x10010352: ["NUC103ZD2BN0", ChipType.NUC123AE],
+        0x10010353: ["NUC103ZD2BN1", ChipType.NUC123AE],
+        0x10010354: ["NUC103ZD3BN0", ChipType.NUC123AE],
+        0x10010355: ["NUC103ZD4BN0", ChipType.NUC123AE],
+        0x10010356: ["NUC103ZE2BN0", ChipType.NUC123AE],
+        0x10010357: ["NUC103ZE2BN1", ChipType.NUC123AE],
+        0x10010358: ["NUC103ZE3BN0", ChipType.NUC123AE],
+        0x10010359: ["NUC103ZE4BN0", ChipType.NUC123AE],
+        0x10010500: ["NUC105SB2BN0", ChipType.NUC123AE],
+        0x10010501: ["NUC105SB2BN1", ChipType.NUC123AE],
+        0x10010502: ["NUC105SB3BN0", ChipType.NUC123AE],
+        0x10010503: ["NUC105SB4BN0", ChipType.NUC123AE],
+        0x10010504: ["NUC105SC2BN0", ChipType.NUC123AE],
+        0x10010505: ["NUC105SC2BN1", ChipType.NUC123AE],
+        0x10010506: ["NUC105SC3BN0", ChipType.NUC123AE],
+        0x10010507: ["NUC105SC4BN0", ChipType.NUC123AE],
+        0x10010508: ["NUC105SC2BN2", ChipType.NUC123AE],
+        0x10010509: ["NUC105SC2BN3", ChipType.NUC123AE],
+        0x10010510: ["NUC105SC3BN2", ChipType.NUC123AE],
+        0x10010511: ["NUC105SC4BN2", ChipType.NUC123AE],
+        0x10010512: ["NUC105SD2BN0", ChipType.NUC123AE],
+        0x10010513: ["NUC105SD2BN1", ChipType.NUC123AE],
+        0x10010514: ["NUC105SD3BN0", ChipType.NUC123AE],
+        0x10010515: ["NUC105SD4BN0", ChipType.NUC123AE],
+        0x10010516: ["NUC105SE2BN0", ChipType.NUC123AE],
+        0x10010517: ["NUC105SE2BN1", ChipType.NUC123AE],
+        0x10010518: ["NUC105SE3BN0", ChipType.NUC123AE],
+        0x10010519: ["NUC105SE4BN0", ChipType.NUC123AE],
+        0x10010520: ["NUC105LB2BN0", ChipType.NUC123AE],
+        0x10010521: ["NUC105LB2BN1", ChipType.NUC123AE],
+        0x10010522: ["NUC105LB3BN0", ChipType.NUC123AE],
+        0x10010523: ["NUC105LB4BN0", ChipType.NUC123AE],
+        0x10010524: ["NUC105LC2BN0", ChipType.NUC123AE],
+        0x10010525: ["NUC105LC2BN1", ChipType.NUC123AE],
+        0x10010526: ["NUC105LC3BN0", ChipType.NUC123AE],
+        0x10010527: ["NUC105LC4BN0", ChipType.NUC123AE],
+        0x10010528: ["NUC105LC2BN2", ChipType.NUC123AE],
+        0x10010529: ["NUC105LC2BN3", ChipType.NUC123AE],
+        0x10010530: ["NUC105LC3BN2", ChipType.NUC123AE],
+        0x10010531: ["NUC105LC4BN2", ChipType.NUC123AE],
+        0x10010532: ["NUC105LD2BN0", ChipType.NUC123AE],
+        0x10010533: ["NUC105LD2BN1", ChipType.NUC123AE],
+        0x10010534: ["NUC105LD3BN0", ChipType.NUC123AE],
+        0x10010535: ["NUC105LD4BN0", ChipType.NUC123AE],
+        0x10010536: ["NUC105LE2BN0", ChipType.NUC123AE],
+        0x10010537: ["NUC105LE2BN1", ChipType.NUC123AE],
+        0x10010538: ["NUC105LE3BN0", ChipType.NUC123AE],
+        0x10010539: ["NUC105LE4BN0", ChipType.NUC123AE],
+        0x10010540: ["NUC105ZB2BN0", ChipType.NUC123AE],
+        0x10010541: ["NUC105ZB2BN1", ChipType.NUC123AE],
+        0x10010542: ["NUC105ZB3BN0", ChipType.NUC123AE],
+        0x10010543: ["NUC105ZB4BN0", ChipType.NUC123AE],
+        0x10010544: ["NUC105ZC2BN0", ChipType.NUC123AE],
+        0x10010545: ["NUC105ZC2BN1", ChipType.NUC123AE],
+        0x10010546: ["NUC105ZC3BN0", ChipType.NUC123AE],
+        0x10010547: ["NUC105ZC4BN0", ChipType.NUC123AE],
+        0x10010548: ["NUC105ZC2BN2", ChipType.NUC123AE],
+        0x10010549: ["NUC105ZC2BN3", ChipType.NUC123AE],
+        0x10010550: ["NUC105ZC3BN2", ChipType.NUC123AE],
+        0x10010551: ["NUC105ZC4BN2", ChipType.NUC123AE],
+        0x10010552: ["NUC105ZD2BN0", ChipType.NUC123AE],
+        0x10010553: ["NUC105ZD2BN1", ChipType.NUC123AE],
+        0x10010554: ["NUC105ZD3BN0", ChipType.NUC123AE],
+        0x10010555: ["NUC105ZD4BN0", ChipType.NUC123AE],
+        0x10010556: ["NUC105ZE2BN0", ChipType.NUC123AE],
+        0x10010557: ["NUC105ZE2BN1", ChipType.NUC123AE],
+        0x10010558: ["NUC105ZE3BN0", ChipType.NUC123AE],
+        0x10010559: ["NUC105ZE4BN0", ChipType.NUC123AE],
+        0x10012305: ["NUC123SC2AE1", ChipType.NUC123AE],
+        0x10012315: ["NUC123SD4AE0", ChipType.NUC123AE],
+        0x10012316: ["NUC123SD4SN0", ChipType.NUC123AE],
+        0x10012325: ["NUC123LC2AE1", ChipType.NUC123AE],
+        0x10012335: ["NUC123LD4AE0", ChipType.NUC123AE],
+        0x10012336: ["NUC123LC2AP1", ChipType.NUC123AE],
+        0x10012345: ["NUC123ZC2AE1", ChipType.NUC123AE],
+        0x10012355: ["NUC123ZD4AE0", ChipType.NUC123AE],
+        0x10012356: ["PH-MN1-33", ChipType.NUC123AE],
+        0x00051900: ["M0519LE3AE", ChipType.NM1500AE],
+        0x00051902: ["M0519LD3AE", ChipType.NM1500AE],
+        0x00051920: ["M0519SE3AE", ChipType.NM1500AE],
+        0x00051922: ["M0519SD3AE", ChipType.NM1500AE],
+        0x00051930: ["M0519VE3AE", ChipType.NM1500AE],
+        0x00351006: ["NM1510LC1AE", ChipType.NM1500AE],
+        0x00351008: ["NM1510LB1AE", ChipType.NM1500AE],
+        0x00352003: ["NM1520LD2AE", ChipType.NM1500AE],
+        0x00352005: ["NM1520LC2AE", ChipType.NM1500AE],
+        0x00352023: ["NM1520RD2AE", ChipType.NM1500AE],
+        0x00352025: ["NM1520RC2AE", ChipType.NM1500AE],
+        0x00353000: ["NM1530LE3AE", ChipType.NM1500AE],
+        0x00353030: ["NM1530VE3AE", ChipType.NM1500AE],
+        0x00353032: ["NM1530VD3AE", ChipType.NM1500AE],
+        0x30005200: ["M052LDE", ChipType.M051DE],
+        0x30005203: ["M052ZDE", ChipType.M051DE],
+        0x30005204: ["M052TDE", ChipType.M051DE],
+        0x30005205: ["M052XDE", ChipType.M051DE],
+        0x30005400: ["M054LDE", ChipType.M051DE],
+        0x30005403: ["M054ZDE", ChipType.M051DE],
+        0x30005404: ["M054TDE", ChipType.M051DE],
+        0x30005405: ["M054XDE", ChipType.M051DE],
+        0x30005800: ["M058LDE", ChipType.M051DE],
+        0x30005803: ["M058ZDE", ChipType.M051DE],
+        0x30005804: ["M058TDE", ChipType.M051DE],
+        0x30005805: ["M058XDE", ChipType.M051DE],
+        0x30005807: ["M058MDE", ChipType.M051DE],
+        0x30005810: ["NM1330LC1AE", ChipType.M051DE],
+        0x30005A00: ["M0516LDE", ChipType.M051DE],
+        0x30005A03: ["M0516ZDE", ChipType.M051DE],
+        0x30005A04: ["M0516TDE", ChipType.M051DE],
+        0x30005A05: ["M0516XDE", ChipType.M051DE],
+        0x30005A10: ["NM1330LD2AE", ChipType.M051DE],
+        0x30295804: ["NUC029TAE", ChipType.M051DE],
+        0x00295415: ["NUC029FAE", ChipType.MINI51DE],
+        0x20205100: ["MINI51LDE", ChipType.MINI51DE],
+        0x20205101: ["MINI51QDE", ChipType.MINI51DE],
+        0x20205102: ["MINI51", ChipType.MINI51DE],
+        0x20205103: ["MINI51ZDE", ChipType.MINI51DE],
+        0x20205104: ["MINI51TDE", ChipType.MINI51DE],
+        0x20205105: ["MINI51FDE", ChipType.MINI51DE],
+        0x20205200: ["MINI52LDE", ChipType.MINI51DE],
+        0x20205201: ["MINI52QDE", ChipType.MINI51DE],
+        0x20205202: ["MINI52", ChipType.MINI51DE],
+        0x20205203: ["MINI52ZDE", ChipType.MINI51DE],
+        0x20205204: ["MINI52TDE", ChipType.MINI51DE],
+        0x20205205: ["MINI52FDE", ChipType.MINI51DE],
+        0x20205400: ["MINI54LDE", ChipType.MINI51DE],
+        0x20205401: ["MINI54QDE", ChipType.MINI51DE],
+        0x20205402: ["MINI54", ChipType.MINI51DE],
+        0x20205403: ["MINI54ZDE", ChipType.MINI51DE],
+        0x20205404: ["MINI54TDE", ChipType.MINI51DE],
+        0x20205405: ["MINI54FDE", ChipType.MINI51DE],
+        0x20205406: ["MINI54FHC", ChipType.MINI51DE],
+        0x00B01400: ["NM1120DC1AE", ChipType.NM1120],
+        0x00B01420: ["NM1120FC1AE", ChipType.NM1120],
+        0x00B01421: ["PT1000", ChipType.NM1120],
+        0x00B01440: ["NM1120EC1AE", ChipType.NM1120],
+        0x00B01450: ["NM1120XC1AE", ChipType.NM1120],
+        0x00B01460: ["NM1120TC1AE", ChipType.NM1120],
+        0x00B01470: ["NM1120ZC1AE", ChipType.NM1120],
+        0x00B05720: ["MINI57FDE", ChipType.NM1120],
+        0x00B05740: ["MINI57EDE", ChipType.NM1120],
+        0x00B05750: ["MINI57XDE", ChipType.NM1120],
+        0x00B05760: ["MINI57TDE", ChipType.NM1120],
+        0x00B05761: ["YM0232A-04T", ChipType.NM1120],
+        0x00B057F0: ["MINI57WTDE", ChipType.NM1120],
+        0x00B15000: ["NPT150ZDE", ChipType.NM1120],
+        0x00B81000: ["NM1810FC1AE", ChipType.NM1120],
+        0x00B81010: ["NM1810EC1AE", ChipType.NM1120],
+        0x00B81020: ["NM1810XC1AE", ChipType.NM1120],
+        0x00B81030: ["NM1810XC1BE", ChipType.NM1120],
+        0x00B81040: ["NM18100Y", ChipType.NM1120],
+        0x00B81041: ["NM18101Y", ChipType.NM1120],
+        0x00B81042: ["NM18102ZCAE", ChipType.NM1120],
+        0x00B81043: ["NM18103ZCAE", ChipType.NM1120],
+        0x00B81045: ["NM18105Y", ChipType.NM1120],
+        0x00B81047: ["NM18107Y", ChipType.NM1120],
+        0x00B81050: ["NM1810ZC1BE", ChipType.NM1120],
+        0x00B81060: ["NM1810LC1AE", ChipType.NM1120],
+        0x00B81120: ["NM1811XC1AE", ChipType.NM1120],
+        0x00B81130: ["NM1811ZC1AE", ChipType.NM1120],
+        0x00B81310: ["NM1813FC1AE", ChipType.NM1120],
+        0x00B81320: ["NM1813EC1AE", ChipType.NM1120],
+        0x00B81340: ["NM1813LC1AE", ChipType.NM1120],
+        0x00B81710: ["NM1817UC1AE", ChipType.NM1120],
+        0x00B81720: ["NM1817NT", ChipType.NM1120],
+        0x00000505: ["NUC505", ChipType.NUC505],
+        0x0C012300: ["NM1234D", ChipType.NM1230],
+        0x0C012301: ["NM1233D", ChipType.NM1230],
+        0x0C012302: ["NM1232D", ChipType.NM1230],
+        0x0C01230A: ["NM1220EBK0", ChipType.NM1230],
+        0x0C01230B: ["TF5103", ChipType.NM1230],
+        0x0C012390: ["NM1234Y", ChipType.NM1230],
+        0x0C012391: ["NM1233Y", ChipType.NM1230],
+        0x0C012392: ["NM1232Y", ChipType.NM1230],
+        0x0C051000: ["TF5103D", ChipType.NM1230],
+        0x0C051090: ["TF5103Y", ChipType.NM1230],
+        0x0C051091: ["TF5102Y", ChipType.NM1230],
+        0x0C082390: ["NM18307Y", ChipType.NM1230],
+        0x00F25102: ["M251LG6AE", ChipType.M252_G],
+        0x00F25111: ["M251SG6AE", ChipType.M252_G],
+        0x00F25140: ["M251KG6AE", ChipType.M252_G],
+        0x00F25202: ["M252LG6AE", ChipType.M252_G],
+        0x00F25211: ["M252SG6AE", ChipType.M252_G],
+        0x00F25240: ["M252KG6AE", ChipType.M252_G],
+        0x00F25105: ["M251LE3AE", ChipType.M252_E],
+        0x00F25114: ["M251SE3AE", ChipType.M252_E],
+        0x00F25116: ["NDA102SE3", ChipType.M252_E],
+        0x00F25143: ["M251KE3AE", ChipType.M252_E],
+        0x00F25205: ["M252LE3AE", ChipType.M252_E],
+        0x00F25214: ["M252SE3AE", ChipType.M252_E],
+        0x00F25243: ["M252KE3AE", ChipType.M252_E],
+        0x00F25101: ["M251LD2AE", ChipType.M252_D],
+        0x00F25104: ["M251LC2AE", ChipType.M252_D],
+        0x00F25110: ["M251SD2AE", ChipType.M252_D],
+        0x00F25112: ["NDA102SD2", ChipType.M252_D],
+        0x00F25113: ["M251SC2AE", ChipType.M252_D],
+        0x00F251C2: ["M251ZD2AE", ChipType.M252_D],
+        0x00F251C5: ["NDA102TD2", ChipType.M252_D],
+        0x00F25201: ["M252LD2AE", ChipType.M252_D],
+        0x00F25204: ["M252LC2AE", ChipType.M252_D],
+        0x00F25210: ["M252SD2AE", ChipType.M252_D],
+        0x00F25213: ["M252SC2AE", ChipType.M252_D],
+        0x00F252C2: ["M252ZD2AE", ChipType.M252_D],
+        0x00F25170: ["NDA102UD2", ChipType.M252_C],
+        0x00F251A0: ["M251EC2AE", ChipType.M252_C],
+        0x00F251A4: ["M251EB2AE", ChipType.M252_C],
+        0x00F251B0: ["M251FC2AE", ChipType.M252_C],
+        0x00F251B3: ["M251FB2AE", ChipType.M252_C],
+        0x00F251E0: ["M251ZC2AE", ChipType.M252_C],
+        0x00F251E5: ["M251ZB2AE", ChipType.M252_C],
+        0x00F252A0: ["M252EC2AE", ChipType.M252_C],
+        0x00F252B0: ["M252FC2AE", ChipType.M252_C],
+        0x00F252E0: ["M252ZC2AE", ChipType.M252_C],
+        0x0C112400: ["NM1244D48", ChipType.NM1240],
+        0x0C112401: ["NM1243D48", ChipType.NM1240],
+        0x0C112430: ["N32F030D", ChipType.NM1240],
+        0x0C112431: ["N32F030Y", ChipType.NM1240],
+        0x0C112432: ["N32F030X", ChipType.NM1240],
+        0x0C112490: ["NM1244Y48", ChipType.NM1240],
+        0x0C112491: ["NM1243Y48", ChipType.NM1240],
+        0x0C1124E0: ["NM1244Y", ChipType.NM1240],
+        0x0C1124E1: ["NM1243Y", ChipType.NM1240],
+        0x0C182400: ["NM18440D", ChipType.NM1240],
+        0x0C182490: ["NM18407Y", ChipType.NM1240],
+        0x0C182491: ["NM18407SY", ChipType.NM1240],
+        0x0C182492: ["NM18402Y", ChipType.NM1240],
+        0x00F25410: ["M254SD3AE", ChipType.M258],
+        0x00F25411: ["M254SE3AE", ChipType.M258],
+        0x00F25440: ["M254KD3AE", ChipType.M258],
+        0x00F25441: ["M254KE3AE", ChipType.M258],
+        0x00F25470: ["M254QD3AE", ChipType.M258],
+        0x00F25471: ["M254QE3AE", ChipType.M258],
+        0x00F254A1: ["M254ME3AE", ChipType.M258],
+        0x00F25610: ["M256SD3AE", ChipType.M258],
+        0x00F25611: ["M256SE3AE", ChipType.M258],
+        0x00F25640: ["M256KD3AE", ChipType.M258],
+        0x00F25641: ["M256KE3AE", ChipType.M258],
+        0x00F25670: ["M256QD3AE", ChipType.M258],
+        0x00F25671: ["M256QE3AE", ChipType.M258],
+        0x00F25810: ["M258SD3AE", ChipType.M258],
+        0x00F25811: ["M258SE3AE", ChipType.M258],
+        0x00F25840: ["M258KD3AE", ChipType.M258],
+        0x00F25841: ["M258KE3AE", ChipType.M258],
+        0x00F25870: ["M258QD3AE", ChipType.M258],
+        0x00F25871: ["M258QE3AE", ChipType.M258],
+        0x00D480FF: ["M480TEST", ChipType.M480],
+        0x00D48100: ["M481LIDAE", ChipType.M480],
+        0x00D48101: ["M481LGAAE", ChipType.M480],
+        0x00D48110: ["M481SIDAE", ChipType.M480],
+        0x00D48111: ["M481SGAAE", ChipType.M480],
+        0x00D48140: ["M481KIDAE", ChipType.M480],
+        0x00D48141: ["M481KGAAE", ChipType.M480],
+        0x00D481E0: ["M481ZIDAE", ChipType.M480],
+        0x00D481E1: ["M481ZGAAE", ChipType.M480],
+        0x00D481E2: ["M481ZGDAE", ChipType.M480],
+        0x00D48200: ["M482LIDAE", ChipType.M480],
+        0x00D48201: ["M482LGAAE", ChipType.M480],
+        0x00D48210: ["M482SIDAE", ChipType.M480],
+        0x00D48211: ["M482SGAAE", ChipType.M480],
+        0x00D48212: ["M482SIDAE3O", ChipType.M480],
+        0x00D48230: ["M482VIDAE", ChipType.M480],
+        0x00D48231: ["M482VGAAE", ChipType.M480],
+        0x00D48240: ["M482KIDAE", ChipType.M480],
+        0x00D48241: ["M482KGAAE", ChipType.M480],
+        0x00D48250: ["M482JIDAE", ChipType.M480],
+        0x00D48251: ["M482JGAAE", ChipType.M480],
+        0x00D482E0: ["M482ZIDAE", ChipType.M480],
+        0x00D48300: ["M483LIDAE", ChipType.M480],
+        0x00D48301: ["M483LGAAE", ChipType.M480],
+        0x00D48310: ["M483SIDAE", ChipType.M480],
+        0x00D48311: ["M483SGAAE", ChipType.M480],
+        0x00D48330: ["M483VIDAE", ChipType.M480],
+        0x00D48331: ["M483VGAAE", ChipType.M480],
+        0x00D48340: ["M483KIDAE", ChipType.M480],
+        0x00D48341: ["M483KGAAE", ChipType.M480],
+        0x00D48350: ["M483JIDAE", ChipType.M480],
+        0x00D48351: ["M483JGAAE", ChipType.M480],
+        0x00D48410: ["M484SIDAE", ChipType.M480],
+        0x00D48411: ["M484SGAAE", ChipType.M480],
+        0x00D48412: ["M484SIDAE2U", ChipType.M480],
+        0x00D48413: ["M484SGAAE2U", ChipType.M480],
+        0x00D48440: ["M484KIDAE", ChipType.M480],
+        0x00D48441: ["M484KGAAE", ChipType.M480],
+        0x00D48500: ["M485LIDAE", ChipType.M480],
+        0x00D48510: ["M485SIDAE", ChipType.M480],
+        0x00D48511: ["M485SGAAE", ChipType.M480],
+        0x00D4851F: ["M48SSIDAE", ChipType.M480],
+        0x00D48530: ["M485VIDAE", ChipType.M480],
+        0x00D48531: ["M485VGAAE", ChipType.M480],
+        0x00D48540: ["M485KIDAE", ChipType.M480],
+        0x00D48541: ["M485KGAAE", ChipType.M480],
+        0x00D48550: ["M485JIDAE", ChipType.M480],
+        0x00D48551: ["M485JGAAE", ChipType.M480],
+        0x00D48580: ["M485OIDAE", ChipType.M480],
+        0x00D48581: ["M485OGAAE", ChipType.M480],
+        0x00D48590: ["M485YIDAE", ChipType.M480],
+        0x00D485E0: ["M485ZIDAE", ChipType.M480],
+        0x00D48640: ["M486KIDAE", ChipType.M480],
+        0x00D48650: ["M486JIDAE", ChipType.M480],
+        0x00D48710: ["M487SIDAE", ChipType.M480],
+        0x00D48711: ["M487SGAAE", ChipType.M480],
+        0x00D48740: ["M487KIDAE", ChipType.M480],
+        0x00D48741: ["M487KGAAE", ChipType.M480],
+        0x00D4874E: ["M487KMCAN", ChipType.M480],
+        0x00D4874F: ["M48SKIDAE", ChipType.M480],
+        0x00D48750: ["M487JIDAE", ChipType.M480],
+        0x00D48751: ["M487JGAAE", ChipType.M480],
+        0x00235100: ["M2351KIAAE", ChipType.M2351],
+        0x00235101: ["M2351SIAAE", ChipType.M2351],
+        0x00235102: ["M2351CIAAE", ChipType.M2351],
+        0x00235103: ["M2351ZIAAE", ChipType.M2351],
+        0x00235300: ["M2351SFSIAAP", ChipType.M2351],
+        0x00261000: ["M261ZIAAE", ChipType.M2351],
+        0x00261001: ["M261SIAAE", ChipType.M2351],
+        0x00261002: ["M261KIAAE", ChipType.M2351],
+        0x00262000: ["M262ZIAAE", ChipType.M2351],
+        0x00262001: ["M262SIAAE", ChipType.M2351],
+        0x00262002: ["M262KIAAE", ChipType.M2351],
+        0x00263000: ["M263ZIAAE", ChipType.M2351],
+        0x00263001: ["M263SIAAE", ChipType.M2351],
+        0x00263002: ["M263KIAAE", ChipType.M2351],
+        0x01343302: ["M433LE8AE", ChipType.M480LD],
+        0x01343312: ["M433SE8AE", ChipType.M480LD],
+        0x01347901: ["M479LG8AEE", ChipType.M480LD],
+        0x01347911: ["M479SG8AEE", ChipType.M480LD],
+        0x01347991: ["M479NG8AEE", ChipType.M480LD],
+        0x01348100: ["M481LGCAE", ChipType.M480LD],
+        0x01348101: ["M481LG8AE", ChipType.M480LD],
+        0x01348102: ["M481LE8AE", ChipType.M480LD],
+        0x0134810F: ["M481LGCAEU", ChipType.M480LD],
+        0x01348110: ["M481SGCAE", ChipType.M480LD],
+        0x01348111: ["M481SG8AE", ChipType.M480LD],
+        0x01348112: ["M481SE8AE", ChipType.M480LD],
+        0x01348114: ["M481SGCAE2A", ChipType.M480LD],
+        0x01348115: ["M481SG8AE2A", ChipType.M480LD],
+        0x013481E0: ["M481ZGCAE", ChipType.M480LD],
+        0x013481E1: ["M481ZG8AE", ChipType.M480LD],
+        0x013481E2: ["M481ZE8AE", ChipType.M480LD],
+        0x01348200: ["M482LGCAE", ChipType.M480LD],
+        0x01348201: ["M482LG8AE", ChipType.M480LD],
+        0x01348202: ["M482LE8AE", ChipType.M480LD],
+        0x01348210: ["M482SGCAE", ChipType.M480LD],
+        0x01348211: ["M482SG8AE", ChipType.M480LD],
+        0x01348212: ["M482SE8AE", ChipType.M480LD],
+        0x01348240: ["M482KGCAE", ChipType.M480LD],
+        0x01348241: ["M482KG8AE", ChipType.M480LD],
+        0x013482E0: ["M482ZGCAE", ChipType.M480LD],
+        0x013482E1: ["M482ZG8AE", ChipType.M480LD],
+        0x013482E2: ["M482ZE8AE", ChipType.M480LD],
+        0x01348310: ["M483SGCAE", ChipType.M480LD],
+        0x01348311: ["M483SG8AE", ChipType.M480LD],
+        0x01348312: ["M483SE8AE", ChipType.M480LD],
+        0x01348314: ["M483SGCAE2A", ChipType.M480LD],
+        0x01348315: ["M483SG8AE2A", ChipType.M480LD],
+        0x01348340: ["M483KGCAE", ChipType.M480LD],
+        0x01348341: ["M483KG8AE", ChipType.M480LD],
+        0x01348344: ["M483KGCAE2A", ChipType.M480LD],
+        0x01348345: ["M483KG8AE2A", ChipType.M480LD],
+        0xA1735400: ["M2354LJFAE", ChipType.M2354],
+        0xA173540C: ["M2354LJFCE", ChipType.M2354],
+        0xA1735410: ["M2354SJFAE", ChipType.M2354],
+        0xA1735440: ["M2354KJFAE", ChipType.M2354],
+        0xA173544F: ["M2354ALPHA", ChipType.M2354],
+        0x00235500: ["M2354ES", ChipType.M2354ES],
+        0x00F25000: ["M253LD3AE", ChipType.M253],
+        0x00F25001: ["M253LE3AE", ChipType.M253],
+        0x00F25002: ["M253LD3BE", ChipType.M253],
+        0x00F25003: ["M253LE3BE", ChipType.M253],
+        0x00F250E0: ["M253ZE3AE", ChipType.M253],
+        0x00F250E1: ["M253ZE3BE", ChipType.M253],
+        0x011316E0: ["M031GTD2AE", ChipType.M031GPON],
+        0x011316E1: ["M031GTC1AE", ChipType.M031GPON],
+        0x011316E2: ["M031GTC2AE", ChipType.M031GPON],
+        0x011316F0: ["M031GGD2AE", ChipType.M031GPON],
+        0x011316F1: ["M031GGC1AE", ChipType.M031GPON],
+        0x011316F2: ["M031GGC2AE", ChipType.M031GPON],
+        0x01191690: ["M091YD2AE", ChipType.M031GPON],
+        0x01191692: ["M091YC2AE", ChipType.M031GPON],
+        0x011916E0: ["M091TD2AE", ChipType.M031GPON],
+        0x011916E2: ["M091TC2AE", ChipType.M031GPON],
+        0x01812600: ["NUC1262LE4AE", ChipType.NUC1262],
+        0x01812610: ["NUC1262SE4AE", ChipType.NUC1262],
+        0x01812690: ["NUC1262NE4AE", ChipType.NUC1262],
+        0x01812691: ["NUC1262YE4AE", ChipType.NUC1262],
+        0x00945000: ["M451MLD3AE", ChipType.M451LD],
+        0x00945001: ["M451MLC3AE", ChipType.M451LD],
+        0x00945002: ["MP3202A", ChipType.M451LD],
+        0x00945010: ["M451MSD3AE", ChipType.M451LD],
+        0x00945011: ["M451MSC3AE", ChipType.M451LD],
+        0x00945020: ["M451MRD3AE", ChipType.M451LD],
+        0x00945021: ["M451MRC3AE", ChipType.M451LD],
+        0x00945100: ["M451LD3AE", ChipType.M451LD],
+        0x00945101: ["M451LC3AE", ChipType.M451LD],
+        0x00945110: ["M451SD3AE", ChipType.M451LD],
+        0x00945111: ["M451SC3AE", ChipType.M451LD],
+        0x00945120: ["M451RD3AE", ChipType.M451LD],
+        0x00945121: ["M451RC3AE", ChipType.M451LD],
+        0x00945130: ["M451VD3AE", ChipType.M451LD],
+        0x00945131: ["M451VC3AE", ChipType.M451LD],
+        0x009451F0: ["M451YD3AE", ChipType.M451LD],
+        0x009451F1: ["M451YC3AE", ChipType.M451LD],
+        0x00945200: ["M452LD3AE", ChipType.M451LD],
+        0x00945201: ["M452LC3AE", ChipType.M451LD],
+        0x00945210: ["M452SD3AE", ChipType.M451LD],
+        0x00945211: ["M452SC3AE", ChipType.M451LD],
+        0x00945220: ["M452RD3AE", ChipType.M451LD],
+        0x00945221: ["M452RC3AE", ChipType.M451LD],
+        0x00945230: ["M452VD3AE", ChipType.M451LD],
+        0x00945231: ["M452VC3AE", ChipType.M451LD],
+        0x009452F0: ["M452YD3AE", ChipType.M451LD],
+        0x009452F1: ["M452YC3AE", ChipType.M451LD],
+        0x00945300: ["M453LD3AE", ChipType.M451LD],
+        0x00945301: ["M453LC3AE", ChipType.M451LD],
+        0x00945310: ["M453SD3AE", ChipType.M451LD],
+        0x00945311: ["M453SC3AE", ChipType.M451LD],
+        0x00945320: ["M453RD3AE", ChipType.M451LD],
+        0x00945321: ["M453RC3AE", ChipType.M451LD],
+        0x00945330: ["M453VD3AE", ChipType.M451LD],
+        0x00945331: ["M453VC3AE", ChipType.M451LD],
+        0x009453F0: ["M453YD3AE", ChipType.M451LD],
+        0x009453F1: ["M453YC3AE", ChipType.M451LD],
+        0x01B46310: ["M463SJHAE", ChipType.M460HD],
+        0x01B46311: ["M463SIHAE", ChipType.M460HD],
+        0x01B46340: ["M463KJHAE", ChipType.M460HD],
+        0x01B46341: ["M463KIHAE", ChipType.M460HD],
+        0x01B46410: ["M464SJHAE", ChipType.M460HD],
+        0x01B46411: ["M464SIHAE", ChipType.M460HD],
+        0x01B46440: ["M464KJHAE", ChipType.M460HD],
+        0x01B46441: ["M464KIHAE", ChipType.M460HD],
+        0x01B46710: ["M467SJHAE", ChipType.M460HD],
+        0x01B46711: ["M467SIHAE", ChipType.M460HD],
+        0x01B46712: ["M467S2JHAE", ChipType.M460HD],
+        0x01B46730: ["M467VJHAE", ChipType.M460HD],
+        0x01B46731: ["M467VIHAE", ChipType.M460HD],
+        0x01B46740: ["M467KJHAE", ChipType.M460HD],
+        0x01B46741: ["M467KIHAE", ChipType.M460HD],
+        0x01B46742: ["M467K2JHAE", ChipType.M460HD],
+        0x01B46750: ["M467JJHAE", ChipType.M460HD],
+        0x01B46751: ["M467JIHAE", ChipType.M460HD],
+        0x01B46752: ["M467J2JHAE", ChipType.M460HD],
+        0x01B46760: ["M467HJHAE", ChipType.M460HD],
+        0x01B46761: ["M467HIHAE", ChipType.M460HD],
+        0x01B46762: ["M467H2JHAE", ChipType.M460HD],
+        0x01B46B10: ["M463H3SJHAN", ChipType.M460HD],
+        0x01B46B11: ["M463H3SIHAN", ChipType.M460HD],
+        0x01B46B12: ["M463SJHAN", ChipType.M460HD],
+        0x01B46B40: ["M463H3KJHAN", ChipType.M460HD],
+        0x01B46B41: ["M463H3KIHAN", ChipType.M460HD],
+        0x01B46B42: ["M463KJHAN", ChipType.M460HD],
+        0x01B46B50: ["M467H3JJHAN", ChipType.M460HD],
+        0x01B46B61: ["M467H3HJHAN", ChipType.M460HD],
+        0x01B46F10: ["M467H3SJHAE", ChipType.M460HD],
+        0x01B46F11: ["M467SJHAN", ChipType.M460HD],
+        0x01B46F40: ["M467H3KJHAE", ChipType.M460HD],
+        0x01B46F41: ["M467KJHAN", ChipType.M460HD],
+        0x01B46F50: ["M467H3JJHAN", ChipType.M460HD],
+        0x01B46F51: ["M467H3JJHAE", ChipType.M460HD],
+        0x01B46F52: ["M467JJHAN", ChipType.M460HD],
+        0x01B46F60: ["M467H3HJHAN", ChipType.M460HD],
+        0x01B46F61: ["M467HJHAN", ChipType.M460HD],
+        0x01A25411: ["M254SD2AE", ChipType.M256D],
+        0x01A254A1: ["M254MD2AE", ChipType.M256D],
+        0x01A25611: ["M256SD2AE", ChipType.M256D],
+        0x01A256A1: ["M256MD2AE", ChipType.M256D],
+        0x01925411: ["M254SG6AE", ChipType.M258G],
+        0x01925441: ["M254KG6AE", ChipType.M258G],
+        0x01925611: ["M256SG6AE", ChipType.M258G],
+        0x01925641: ["M256KG6AE", ChipType.M258G],
+        0x01925671: ["M256QG6AE", ChipType.M258G],
+        0x01925811: ["M258SG6AE", ChipType.M258G],
+        0x01925841: ["M258KG6AE", ChipType.M258G],
+        0x01925871: ["M258QG6AE", ChipType.M258G],
+        0x01C46000: ["M460LGCAE", ChipType.M460LD],
+        0x01C46010: ["M460SGCAE", ChipType.M460LD],
+        0x01C46040: ["M460KGCAE", ChipType.M460LD],
+        0x01C46080: ["M460AGCAE", ChipType.M460LD],
+        0x01C46090: ["M460YGCAE", ChipType.M460LD],
+        0x01C46300: ["M463LGCAE", ChipType.M460LD],
+        0x01C4630E: ["M463L2GCAC", ChipType.M460LD],
+        0x01C46310: ["M463SGCAE", ChipType.M460LD],
+        0x01C4631E: ["M463S2GCAC", ChipType.M460LD],
+        0x01C46330: ["M463VGCAE", ChipType.M460LD],
+        0x01C46340: ["M463KGCAE", ChipType.M460LD],
+        0x01C4634E: ["M463K2GCAC", ChipType.M460LD],
+        0x01C46380: ["M463AGCAE", ChipType.M460LD],
+        0x01C46390: ["M463YGCAE", ChipType.M460LD],
+        0x01C46400: ["M464LGCAE", ChipType.M460LD],
+        0x01C46410: ["M464SGCAE", ChipType.M460LD],
+        0x01C46440: ["M464KGCAE", ChipType.M460LD],
+        0x01C46480: ["M464AGCAE", ChipType.M460LD],
+        0x01C46490: ["M464YGCAE", ChipType.M460LD],
+        0x01C46A00: ["M46ALGCAE", ChipType.M460LD],
+        0x01C46A10: ["M46ASGCAE", ChipType.M460LD],
+        0x01C46A40: ["M46AKGCAE", ChipType.M460LD],
+        0x01C46A80: ["M46AAGCAE", ChipType.M460LD],
+        0x01C46A90: ["M46AYGCAE", ChipType.M460LD],
+        0x01D12600: ["NUC1263LD4AE", ChipType.NUC1263],
+        0x01D12610: ["NUC1263SD4AE", ChipType.NUC1263],
+        0x01D12690: ["NUC1263ND4AE", ChipType.NUC1263],
+        0x01D126E0: ["NUC1263ZD4AE", ChipType.NUC1263],
+        0x21D12600: ["NUC1263LD4CE", ChipType.NUC1263],
+        0x21D12610: ["NUC1263SD4CE", ChipType.NUC1263],
+        0x21D12690: ["NUC1263ND4CE", ChipType.NUC1263],
+        0x21D126E0: ["NUC1263ZD4CE", ChipType.NUC1263],
+        0x01F31000: ["M2L31LIDAE", ChipType.M2L31],
+        0x01F31001: ["M2L31LGDAE", ChipType.M2L31],
+        0x01F31002: ["M2L31LG4AE", ChipType.M2L31],
+        0x01F31003: ["M2L31LE4AE", ChipType.M2L31],
+        0x01F31004: ["M2L31LD4AE", ChipType.M2L31],
+        0x01F31010: ["M2L31SIDAE", ChipType.M2L31],
+        0x01F31011: ["M2L31SGDAE", ChipType.M2L31],
+        0x01F31012: ["M2L31SG4AE", ChipType.M2L31],
+        0x01F31013: ["M2L31SE4AE", ChipType.M2L31],
+        0x01F31040: ["M2L31KIDAE", ChipType.M2L31],
+        0x01F31041: ["M2L31KGDAE", ChipType.M2L31],
+        0x01F31090: ["M2L31YIDAE", ChipType.M2L31],
+        0x01F31091: ["M2L31YGDAE", ChipType.M2L31],
+        0x01F31092: ["M2L31YG4AE", ChipType.M2L31],
+        0x01F31093: ["M2L31YE4AE", ChipType.M2L31],
+        0x01F31094: ["M2L31YD4AE", ChipType.M2L31],
+        0x01F310A0: ["M2L31CIDAE", ChipType.M2L31],
+        0x01F310A1: ["M2L31CGDAE", ChipType.M2L31],
+        0x01F310B4: ["M2L31XD4AE", ChipType.M2L31],
+        0x01F310C3: ["M2L31ZE4AE", ChipType.M2L31],
+        0x01F310C4: ["M2L31ZD4AE", ChipType.M2L31],
+        0x00551000: ["M55M1ES", ChipType.M55M1],
+        0x01F03C80: ["M2003XC1AE", ChipType.M2003],
+        0x01F03C9F: ["M2P481QC1AE", ChipType.M2003],
+        0x01F03CB0: ["M2003FC1AE", ChipType.M2003],
+        0x01F03CFF: ["KN44490A", ChipType.M2003],
+    # 8051
+        0x00002140: ["N76E884", ChipType.N76E885],
+        0x00002150: ["N76E885", ChipType.N76E885],
+        0x00002F50: ["N76E616", ChipType.N76E616],
+        0x00003640: ["N76E002", ChipType.N76E003],
+        0x00003650: ["N76E003", ChipType.N76E003],
+        0x00004832: ["ML51_32K_GENERIC", ChipType.ML51_32K],
+        0x00004932: ["ML51_32K_MISSINGNO (Please report the chip name if you encounter this in the wild)", ChipType.ML51_32K],
+        0x00004944: ["ML51_64K_MISSINGNO (Please report the chip name if you encounter this in the wild)", ChipType.ML51_32K],
+        0x00104832: ["ML51LC0XX", ChipType.ML51_32K],
+        0x01104821: ["ML51PB9AE", ChipType.ML51_32K],
+        0x01104832: ["ML51PC0AE", ChipType.ML51_32K],
+        0x02104832: ["ML51EC0AE", ChipType.ML51_32K],
+        0x03104832: ["ML51UC0AE", ChipType.ML51_32K],
+        0x0B104832: ["ML51FC0AE", ChipType.ML51_32K],
+        0x0C104821: ["ML51TB9AE", ChipType.ML51_32K],
+        0x0C104832: ["ML51TC0AE", ChipType.ML51_32K],
+        0x00004711: ["ML51_8K_MISSINGNO  (Please report the chip name if you encounter this in the wild)", ChipType.ML51_16K],
+        0x00004721: ["ML51_16K_GENERIC", ChipType.ML51_16K],
+        0x00004821: ["ML51_16K_GENERIC_2", ChipType.ML51_16K],
+        0x00104721: ["ML51LB9XX", ChipType.ML51_16K],
+        0x02104721: ["ML51EB9AE", ChipType.ML51_16K],
+        0x03104721: ["ML51UB9AE", ChipType.ML51_16K],
+        0x04104711: ["ML51OA9AE", ChipType.ML51_16K],
+        0x04104721: ["ML51OB9AE", ChipType.ML51_16K],
+        0x06104711: ["ML51BA9AE", ChipType.ML51_16K],
+        0x06104721: ["ML51BB9AE", ChipType.ML51_16K],
+        0x09104711: ["ML51DA9AE", ChipType.ML51_16K],
+        0x09104721: ["ML51DB9AE", ChipType.ML51_16K],
+        0x0B104711: ["ML51FA9AE", ChipType.ML51_16K],
+        0x0B104721: ["ML51FB9AE", ChipType.ML51_16K],
+        0x0D104711: ["ML51XA9AE", ChipType.ML51_16K],
+        0x0D104721: ["ML51XB9AE", ChipType.ML51_16K],
+        0x00004B20: ["MS51_16K_MISSINGNO_512B (Please report the chip name if you encounter this in the wild)", ChipType.MS51_16K],
+        0x00004B21: ["MS51_16K_GENERIC_1K", ChipType.MS51_16K],
+        0x04004B21: ["MS51OB9AE", ChipType.MS51_16K],
+        0x05004B21: ["MS51XB9AE", ChipType.MS51_16K],
+        0x09004B21: ["MS51XB9CE", ChipType.MS51_16K],
+        0x0B004B21: ["MS51FB9AE", ChipType.MS51_16K],
+        0x0E004B21: ["MS51XB9BE", ChipType.MS51_16K],
+        0x1D004B21: ["NM18002Y", ChipType.MS51_16K],
+        0x00004B10: ["MS51_8K_GENERIC_512B", ChipType.MS51_8K],
+        0x00004B11: ["MS51_8K_GENERIC_1K", ChipType.MS51_8K],
+        0x00005211: ["MS5108KXX", ChipType.MS51_8K],
+        0x06005211: ["MS51BA9AE", ChipType.MS51_8K],
+        0x0A005211: ["MS51DA9AE", ChipType.MS51_8K],
+        0x0F005211: ["MS51IA9AE", ChipType.MS51_8K],
+        0x00005322: ["MS51_16K_GENERIC", ChipType.MS51_32K],
+        0x00005332: ["MS51_32K_GENERIC", ChipType.MS51_32K],
+        0x01005332: ["MS51PC0AE", ChipType.MS51_32K],
+        0x02005322: ["MS51EB0AE", ChipType.MS51_32K],
+        0x02005332: ["MS51EC0AE", ChipType.MS51_32K],
+        0x05005332: ["MS51XC0AE", ChipType.MS51_32K],
+        0x0B005332: ["MS51FC0AE", ChipType.MS51_32K],
+        0x0C005332: ["MS51TC0AE", ChipType.MS51_32K],
+        0x0E005332: ["MS51XC0BE", ChipType.MS51_32K],
+        0x00005734: ["ML56_32K_GENERIC", ChipType.ML56],
+        0x00005744: ["ML56_64K_GENERIC", ChipType.ML56],
+        0x00105734: ["ML51LC1AE", ChipType.ML56],
+        0x00105744: ["ML51LD1AE", ChipType.ML56],
+        0x00115734: ["ML54LC1AE", ChipType.ML56],
+        0x00115744: ["ML54LD1AE", ChipType.ML56],
+        0x00125734: ["ML56LC1AE", ChipType.ML56],
+        0x00125744: ["ML56LD1AE", ChipType.ML56],
+        0x07115744: ["ML54MD1AE", ChipType.ML56],
+        0x07125744: ["ML56MD1AE", ChipType.ML56],
+        0x08105744: ["ML51SD1AE", ChipType.ML56],
+        0x08115744: ["ML54SD1AE", ChipType.ML56],
+        0x08125744: ["ML56SD1AE", ChipType.ML56],
+        0x0C105734: ["ML51TC1AE", ChipType.ML56],
+        0x0C105744: ["ML51TD1AE", ChipType.ML56],
+        0x0C115734: ["ML54TC1AE", ChipType.ML56],
+        0x0C125734: ["ML56TC1AE", ChipType.ML56],
+        0x00006321: ["MUG51_GENERIC", ChipType.MUG51],
+        0x0C106321: ["MUG51TB9AE", ChipType.MUG51],
+        0xFFFF6321: ["MUG51W", ChipType.MUG51],
+        0x00006721: ["MG51_16K_GENERIC", ChipType.MG51],
+        0x00006731: ["MG51_32K_GENERIC", ChipType.MG51],
+        0x00006750: ["N76S003_GENERIC", ChipType.MG51],
+        0x05006721: ["MG51XB9AE", ChipType.MG51],
+        0x05006731: ["MG51XC9AE", ChipType.MG51],
+        0x05006750: ["N76S003AQ20", ChipType.MG51],
+        0x0B006721: ["MG51FB9AE", ChipType.MG51],
+        0x0B006731: ["MG51FC9AE", ChipType.MG51],
+        0x0B006750: ["N76S003AT20", ChipType.MG51],
+        0x0E006721: ["MG51XB9BE", ChipType.MG51],
+        0x0E006731: ["MG51XC9BE", ChipType.MG51],
+        0x0E006750: ["N76S003BQ20", ChipType.MG51],
+        # Unknown what these are
+        0x00007234: ["MG51_64K_MISSING_NO (Please report the chip name if you encounter this in the wild)", ChipType.MG51],
+        0x00007244: ["MG51_32K_MISSING_NO (Please report the chip name if you encounter this in the wild)", ChipType.MG51],
+    }
+
+
+_part_num_ids: dict = None
+_did_index: dict = None
+
+
+def get_part_num_ids() -> dict:
+    """
+    Returns the PID -> [name, ChipType] table, building it on first use
+    """
+    global _part_num_ids
+    if _part_num_ids is None:
+        _part_num_ids = _build_part_num_ids()
+    return _part_num_ids
+
+
+def _get_did_index() -> dict:
+    # Maps the low 16 bits (DID) to the first PID entry that has them, in table order.
+    global _did_index
+    if _did_index is None:
+        index = {}
+        for key, (_, chip_type) in get_part_num_ids().items():
+            index.setdefault(key & 0xFFFF, (chip_type.name + "_UNKNOWN", chip_type))
+        _did_index = index
+    return _did_index
 
-}
 
+def __getattr__(name):
+    # PartNumIDs used to be a module-level dict; keep it accessible without building it at import time
+    if name == "PartNumIDs":
+        return get_part_num_ids()
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
 
 
 def lookup_name_and_type(pid: int) -> Tuple[str, ChipType]:
-    if pid in PartNumIDs:
-        return PartNumIDs[pid]
-    else:
-        pid = pid & 0xFFFF
-        if pid in PartNumIDs:
-            return PartNumIDs[pid]
-        for key in PartNumIDs:
-            if key & 0xFFFF == pid:
-                _, chip_type = PartNumIDs[key]
-                name = chip_type.name + "_UNKNOWN"
-                return name, chip_type
-    return "UNKNOWN", ChipType.UNKNOWN
\ No newline at end of file
+    part_num_ids = get_part_num_ids()
+    if pid in part_num_ids:
+        return part_num_ids[pid]
+    pid = pid & 0xFFFF
+    if pid in part_num_ids:
+        return part_num_ids[pid]
+    return _get_did_index().get(pid, ("UNKNOWN", ChipType.UNKNOWN))
@@ -0,0 +1,112 @@
+"""
+nuvoprogpy tools
+
+    python -m nuvoprogpy pack -o job.nupkg -d <device> [-w aprom] [-l ldrom] [-c config.json]
+    python -m nuvoprogpy info job.nupkg
+"""
+import getopt
+import sys
+
+from .fileformats import FirmwareFileError
+from .nupkg import NuPackage, NuPackageError, pack_files
+from .PartNumID import get_part_num_ids
+
+
+def eprint(*args, **kwargs):
+    print(*args, file=sys.stderr, **kwargs)
+
+
+def print_usage():
+    print("nuvoprogpy tools\n")
+    print("Usage:")
+    print("\tpack                              build a programming package (.nupkg) for station jobs")
+    print("\t    -o, --output=<filename>       package to write")
+    print("\t    -d, --device=<id|name>        target device: a device ID (0x3650: any chip with that DID; a 32-bit ID")
+    print("\t                                        also matches the PID) or a chip name (N76E003)")
+    print("\t    -w, --write=<filename>        APROM image (.bin, or .hex/.ihx/.srec)")
+    print("\t    -l, --ldrom=<filename>        LDROM image (needs --config)")
+    print("\t    -c, --config=<filename>       config.json to program")
+    print("\tinfo <filename>                   check a package and print its contents")
+
+
+def parse_device(arg: str) -> int:
+    """
+    A device ID from a number or a chip name in PartNumID
+    """
+    try:
+        return int(arg, 0)
+    except ValueError:
+        pass
+    for device_id, (name, _) in get_part_num_ids().items():
+        if name.upper() == arg.upper():
+            return device_id
+    raise ValueError("Unknown device: %s" % arg)
+
+
+def pack_main(argv) -> int:
+    try:
+        opts, _ = getopt.getopt(argv, "ho:d:w:l:c:", ["help", "output=", "device=", "write=", "ldrom=", "config="])
+    except getopt.GetoptError:
+        eprint("Invalid command line arguments. Please refer to the usage documentation.")
+        print_usage()
+        return 2
+    output = device = aprom_file = ldrom_file = config_file = None
+    for opt, arg in opts:
+        if opt in ("-h", "--help"):
+            print_usage()
+            return 0
+        elif opt in ("-o", "--output"):
+            output = arg.strip()
+        elif opt in ("-d", "--device"):
+            device = arg.strip()
+        elif opt in ("-w", "--write"):
+            aprom_file = arg.strip()
+        elif opt in ("-l", "--ldrom"):
+            ldrom_file = arg.strip()
+        elif opt in ("-c", "--config"):
+            config_file = arg.strip()
+    if not output or not device or not (aprom_file or ldrom_file or config_file):
+        eprint("ERROR: pack needs --output, --device and at least one of --write, --ldrom and --config.\n\n")
+        print_usage()
+        return 2
+    try:
+        device_id = parse_device(device)
+        size = pack_files(output, device_id, aprom_file, ldrom_file, config_file)
+        with NuPackage.open(output) as package:
+            print(package.describe())
+    except (NuPackageError, FirmwareFileError, ValueError) as e:
+        eprint("ERROR: %s" % e)
+        return 1
+    except OSError as e:
+        eprint("ERROR: %s: %s" % (e.filename, e.strerror))
+        return 1
+    print("Wrote %s (%d bytes)" % (output, size))
+    return 0
+
+
+def info_main(argv) -> int:
+    if len(argv) != 1:
+        print_usage()
+        return 2
+    try:
+        with NuPackage.open(argv[0]) as package:
+            print(package.describe())
+    except NuPackageError as e:
+        eprint("ERROR: %s" % e)
+        return 1
+    except OSError as e:
+        eprint("ERROR: %s: %s" % (e.filename, e.strerror))
+        return 1
+    return 0
+
+
+def main() -> int:
+    commands = {"pack": pack_main, "info": info_main}
+    if len(sys.argv) < 2 or sys.argv[1] not in commands:
+        print_usage()
+        return 0 if len(sys.argv) > 1 and sys.argv[1] in ("-h", "--help") else 2
+    return commands[sys.argv[1]](sys.argv[2:])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,361 @@
+"""
+Production batch programming
+------
+
+Programs boards continuously from a manifest: wait for a board, program, verify, log, wait for it to be
+removed, repeat. Image files and the config are read once for the whole batch.
+
+Manifest (JSON, paths are relative to the manifest file):
+
+    {
+        "aprom": "app.bin",            (optional)
+        "ldrom": "bootloader.bin",     (optional)
+        "config": "config.json",       (optional)
+        "package": "job.nupkg",        (optional, replaces aprom, ldrom and config; see nupkg.py)
+        "verify": true,                (default true)
+        "count": 0,                    (number of boards to program, 0 = until interrupted)
+        "log": "batch-log.jsonl",      (optional, one JSON object per board)
+        "removal": "auto",             ("auto", "prompt" or "none"; how to wait for the board to be removed)
+        "poll_interval": 0.25,         (seconds between presence checks)
+        "serialize": {                 (optional, per-board patches; see serialize.py for the template format)
+            "templates": [...],
+            "state": "serial-state.json"   (optional, persists the counter between runs)
+        }
+    }
+"""
+import json
+import os
+import sys
+import time
+
+try:
+    from .config import ConfigFlags
+    from .nupkg import NuPackage, NuPackageError
+    from .serialize import Serializer, ImageVariant, program_variant_icp
+except ImportError:
+    from config import ConfigFlags
+    from nupkg import NuPackage, NuPackageError
+    from serialize import Serializer, ImageVariant, program_variant_icp
+
+
+class BatchError(Exception):
+    pass
+
+
+def eprint(*args, **kwargs):
+    print(*args, file=sys.stderr, **kwargs)
+
+
+class BatchManifest:
+    """
+    A loaded batch manifest, with its images read into memory
+    ------
+
+    #### Attributes:
+        aprom_data (bytes), ldrom_data (bytes):
+            The images (empty if not specified); SparseImages mapped from the package if there is one
+        config_json (dict):
+            The parsed config file, or None. Converted to ConfigFlags per device by get_config().
+        package (NuPackage):
+            The opened package, or None
+    """
+    REMOVAL_MODES = ("auto", "prompt", "none")
+
+    def __init__(self, manifest: dict, base_dir: str = "."):
+        self.base_dir = base_dir
+        self.aprom_path = self._path(manifest.get("aprom"))
+        self.ldrom_path = self._path(manifest.get("ldrom"))
+        self.config_path = self._path(manifest.get("config"))
+        self.verify = bool(manifest.get("verify", True))
+        self.count = int(manifest.get("count", 0))
+        self.log_path = self._path(manifest.get("log"))
+        self.removal = manifest.get("removal", "auto")
+        self.poll_interval = float(manifest.get("poll_interval", 0.25))
+        self.serialize = manifest.get("serialize")
+        self.package_path = self._path(manifest.get("package"))
+        if self.removal not in self.REMOVAL_MODES:
+            raise BatchError("Invalid removal mode: %s" % self.removal)
+        if self.package_path and (self.aprom_path or self.ldrom_path or self.config_path):
+            raise BatchError("A package already holds the images and config; remove aprom, ldrom and config")
+        if not (self.aprom_path or self.ldrom_path or self.config_path or self.package_path):
+            raise BatchError("Manifest has nothing to program")
+        self.package = None
+        self.config_json = None
+        if self.package_path:
+            # checked once here, before the first board is connected
+            try:
+                self.package = NuPackage.open(self.package_path)
+            except NuPackageError as e:
+                raise BatchError(str(e))
+            self.aprom_data = self.package.aprom
+            self.ldrom_data = self.package.ldrom
+        else:
+            self.aprom_data = self._read(self.aprom_path)
+            self.ldrom_data = self._read(self.ldrom_path)
+        if self.config_path:
+            with open(self.config_path, "r") as f:
+                self.config_json = json.load(f)
+        self._configs = {}
+
+    @staticmethod
+    def from_file(filename: str) -> "BatchManifest":
+        with open(filename, "r") as f:
+            manifest = json.load(f)
+        return BatchManifest(manifest, os.path.dirname(os.path.abspath(filename)))
+
+    def _path(self, path):
+        if not path:
+            return None
+        return os.path.join(self.base_dir, path)
+
+    @staticmethod
+    def _read(path) -> bytes:
+        if not path:
+            return bytes()
+        with open(path, "rb") as f:
+            return f.read()
+
+    def get_config(self, device_id: int) -> ConfigFlags:
+        """
+        Returns a fresh ConfigFlags for the device (programming may modify it), or None if no config was given
+        """
+        if self.package is not None:
+            return self.package.get_config(device_id)
+        if self.config_json is None:
+            return None
+        if device_id not in self._configs:
+            self._configs[device_id] = ConfigFlags.from_json(self.config_json, device_id).to_bytes()
+        return ConfigFlags.from_bytes(self._configs[device_id], device_id)
+
+    def check_device(self, device_info):
+        """
+        Raises BatchError if the manifest's package isn't for this device
+        """
+        if self.package is not None:
+            try:
+                self.package.check_device(device_info)
+            except NuPackageError as e:
+                raise BatchError(str(e))
+
+    def get_serializer(self) -> Serializer:
+        """
+        Returns a Serializer for the manifest's "serialize" section, or None if there is none
+        """
+        if not self.serialize:
+            return None
+        return Serializer.from_manifest(self.serialize, self.base_dir)
+
+
+class ICPStation:
+    """
+    Batch station using Nuvo51ICP. The PGM interface stays initialized for the whole batch.
+    """
+
+    def __init__(self, nuvo, poll_interval=0.25):
+        self.nuvo = nuvo
+        self.poll_interval = poll_interval
+
+    def open(self):
+        self.nuvo.init_pgm()
+
+    def close(self):
+        self.nuvo.deinit_pgm()
+
+    def _probe(self) -> int:
+        self.nuvo.enter_icp(True, False, False)
+        return self.nuvo.get_device_id()
+
+    def wait_for_board(self):
+        while True:
+            if self._probe() != 0:
+                return
+            self.nuvo.exit_icp()
+            time.sleep(self.poll_interval)
+
+    def wait_for_removal(self):
+        while True:
+            device_id = self._probe()
+            self.nuvo.exit_icp()
+            if device_id == 0:
+                return
+            time.sleep(self.poll_interval)
+
+    def get_uid(self) -> bytes:
+        return self.nuvo.get_uid()
+
+    def program(self, manifest: BatchManifest, aprom_data: bytes, ldrom_data: bytes, variant: ImageVariant = None) -> bool:
+        manifest.check_device(self.nuvo.get_device_info())
+        config = manifest.get_config(self.nuvo.get_device_id())
+        before_config = None
+        if variant is not None:
+            # everything is written before the config, which may lock the chip: the APROM patches are laid over the
+            # shared image (and written and verified with it), the SPROM patches are written right before the config
+            sprom = ImageVariant(variant.counter, [p for p in variant.patches if p[0] == "sprom"], variant.values)
+            if sprom.patches:
+                before_config = lambda: program_variant_icp(self.nuvo, sprom, aprom_data, manifest.verify)
+            aprom_data = variant.overlay(aprom_data)
+        return self.nuvo.program_all(aprom_data, ldrom_data, config=config, verify=manifest.verify,
+                                     ldrom_config_override=config is None, before_config=before_config)
+
+    def finish_board(self):
+        self.nuvo.exit_icp()
+
+
+class ISPStation:
+    """
+    Batch station using NuvoISP. A board is present once it answers CONNECT.
+    """
+
+    def __init__(self, nuvo, poll_interval=0.25):
+        self.nuvo = nuvo
+        self.poll_interval = poll_interval
+
+    def open(self):
+        pass
+
+    def close(self):
+        self.nuvo.close()
+
+    def wait_for_board(self):
+        try:
+            from .nuvoispy.nuvoispy import NoDevice
+        except ImportError:
+            from nuvoispy.nuvoispy import NoDevice
+        while True:
+            try:
+                self.nuvo.init(retry=False)
+                return
+            except (NoDevice, TimeoutError):
+                time.sleep(self.poll_interval)
+
+    def wait_for_removal(self):
+        # The ICP bridge stays connected and reports a device id of 0 once the target is unplugged.
+        # A stock/custom bootloader leaves ISP mode when we disconnect, so the next board to answer CONNECT is new.
+        if self.nuvo.is_icp_bridge:
+            while self.nuvo.get_device_id() != 0:
+                time.sleep(self.poll_interval)
+        self.nuvo.close()
+
+    def get_uid(self) -> bytes:
+        if not self.nuvo.supports_extended_cmds:
+            return None
+        return self.nuvo.get_uid()
+
+    def program(self, manifest: BatchManifest, aprom_data: bytes, ldrom_data: bytes, variant: ImageVariant = None) -> bool:
+        manifest.check_device(self.nuvo.get_device_info())
+        config = manifest.get_config(self.nuvo.get_device_id())
+        if variant is not None:
+            if variant.region_patches("sprom"):
+                raise BatchError("SPROM serialization is only supported with nuvo51icpy")
+            # the ISP update commands rewrite the whole APROM anyway, so the patches go out with the shared image
+            aprom_data = variant.overlay(aprom_data)
+        return self.nuvo.program_all(aprom_data, ldrom_data if ldrom_data else None, config=config,
+                                     verify_flash=manifest.verify)
+
+    def finish_board(self):
+        self.nuvo.close()
+
+
+class BatchRunner:
+    """
+    Runs a batch on a station
+    ------
+
+    #### Args:
+        manifest (BatchManifest):
+            The loaded manifest
+        station (ICPStation | ISPStation):
+            The programmer to use
+        silent (bool):
+            If True, only errors are printed
+    """
+
+    def __init__(self, manifest: BatchManifest, station, silent=False):
+        self.manifest = manifest
+        self.station = station
+        self.silent = silent
+        self.passed = 0
+        self.failed = 0
+        self.serializer = manifest.get_serializer()
+
+    def print_vb(self, *args, **kwargs):
+        if not self.silent:
+            print(*args, **kwargs)
+
+    def prepare_board(self, index: int, uid: bytes):
+        """
+        Returns the (aprom, ldrom, variant) for a board. Every board shares the manifest's images; variant holds
+        the per-board patches (None if the manifest has no "serialize" section).
+        """
+        variant = self.serializer.next_variant(uid) if self.serializer else None
+        return self.manifest.aprom_data, self.manifest.ldrom_data, variant
+
+    def _log(self, record: dict):
+        if not self.manifest.log_path:
+            return
+        with open(self.manifest.log_path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+
+    def _wait_for_removal(self):
+        mode = self.manifest.removal
+        if mode == "auto":
+            self.print_vb("Waiting for board removal...")
+            self.station.wait_for_removal()
+            return
+        self.station.finish_board()
+        if mode == "prompt":
+            input("Remove the board and press Enter...")
+
+    def run_one(self, index: int) -> bool:
+        self.print_vb("\n[%d] Waiting for board..." % index)
+        self.station.wait_for_board()
+        start = time.monotonic()
+        record = {"board": index, "time": time.strftime("%Y-%m-%dT%H:%M:%S")}
+        ok = False
+        try:
+            record["device_id"] = self.station.nuvo.get_device_id()
+            uid = self.station.get_uid()
+            if uid is not None:
+                record["uid"] = uid.hex()
+            aprom_data, ldrom_data, variant = self.prepare_board(index, uid)
+            if variant is not None:
+                record["serialize"] = variant.values
+            ok = self.station.program(self.manifest, aprom_data, ldrom_data, variant)
+            if ok and variant is not None:
+                self.serializer.commit()
+        except Exception as e:
+            record["error"] = str(e)
+            eprint("[%d] Error: %s" % (index, e))
+        record["ok"] = bool(ok)
+        record["duration"] = round(time.monotonic() - start, 3)
+        self._log(record)
+        if ok:
+            self.passed += 1
+            self.print_vb("[%d] PASS (%.2fs)" % (index, record["duration"]))
+        else:
+            self.failed += 1
+            eprint("[%d] FAIL (%.2fs)" % (index, record["duration"]))
+        self._wait_for_removal()
+        return ok
+
+    def run(self) -> bool:
+        """
+        Program boards until `count` boards have been processed (or forever if count is 0)
+
+        #### Returns:
+            bool: True if every board passed
+        """
+        self.station.open()
+        index = 0
+        try:
+            while self.manifest.count == 0 or index < self.manifest.count:
+                self.run_one(index)
+                index += 1
+        except KeyboardInterrupt:
+            eprint("\nBatch stopped by user.")
+        finally:
+            self.station.close()
+            if self.serializer:
+                self.serializer.close()
+        self.print_vb("\nBatch finished: %d passed, %d failed" % (self.passed, self.failed))
+        return self.failed == 0
@@ -1,14 +1,12 @@
-from curses import flash
 import json
 import struct
 import ctypes
+import functools
 from typing import Tuple
 
 try:
-    from .Flash import Flash_8051 as _Flash_8051
     from .PartNumID import lookup_name_and_type, ChipType
 except:
-    from Flash import Flash_8051 as _Flash_8051
     from PartNumID import lookup_name_and_type, ChipType
 
 N76E003_DEVID = 0x3650
@@ -29,6 +27,8 @@ FLASH_SIZE = 18 * 1024
 
 class FlashInfo:
     # stub class
+    __slots__ = ()
+
     def __init__(self):
         raise NotImplementedError("Don't call the constructor! Call `get_flash_info` instead!")
     
@@ -113,127 +113,152 @@ class FlashInfo:
         raise NotImplementedError("Not implemented!")
 
 
+class MemoryLayout:
+    """
+    Flash memory map for a given chip and LDROM size
+    ------
+
+    Built once per (FlashInfo8051, LDROM size) by `FlashInfo8051.get_layout()`; all fields are plain attributes.
+
+    #### Attributes:
+        page_size (int): Flash page size in bytes
+        aprom_addr, aprom_size (int): APROM region
+        ldrom_addr, ldrom_size (int): LDROM region (LDROM is placed directly after APROM)
+        dataflash_addr, dataflash_size (int): Data flash region (size is 0 on chips without data flash)
+        config_addr, config_len (int): Configuration bytes
+        sprom_addr, sprom_len (int): SPROM region (sprom_len is 0 on chips without SPROM)
+        aprom_pages, ldrom_pages (tuple[int]): Start addresses of every page in the APROM/LDROM regions
+    """
+    __slots__ = ("page_size", "aprom_addr", "aprom_size", "ldrom_addr", "ldrom_size", "dataflash_addr", "dataflash_size",
+                 "config_addr", "config_len", "sprom_addr", "sprom_len", "aprom_pages", "ldrom_pages")
+
+    def __init__(self, flash_info: "FlashInfo8051", ldrom_size: int):
+        _set = object.__setattr__
+        dataflash_size = flash_info.max_dataflash_size
+        if dataflash_size > 0:
+            dataflash_size -= ldrom_size
+        aprom_size = flash_info.max_memory_size - dataflash_size - ldrom_size
+        page_size = flash_info.page_size
+        _set(self, "page_size", page_size)
+        _set(self, "aprom_addr", APROM_ADDR)
+        _set(self, "aprom_size", aprom_size)
+        _set(self, "ldrom_addr", aprom_size)
+        _set(self, "ldrom_size", ldrom_size)
+        _set(self, "dataflash_addr", aprom_size)
+        _set(self, "dataflash_size", dataflash_size)
+        _set(self, "config_addr", flash_info.config_addr)
+        _set(self, "config_len", flash_info.config_len)
+        _set(self, "sprom_addr", flash_info.sprom_addr)
+        _set(self, "sprom_len", flash_info.sprom_len)
+        _set(self, "aprom_pages", tuple(range(APROM_ADDR, APROM_ADDR + aprom_size, page_size)))
+        _set(self, "ldrom_pages", tuple(range(aprom_size, aprom_size + ldrom_size, page_size)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("MemoryLayout is immutable")
+
+    def page_range(self, addr: int, length: int) -> range:
+        """
+        Returns the start addresses of the pages touched by [addr, addr + length)
+        """
+        if length <= 0:
+            return range(0)
+        mask = ~(self.page_size - 1)
+        return range(addr & mask, addr + length, self.page_size)
+
+
 class FlashInfo8051(FlashInfo):
+    # Everything is derived from flash_type once at construction; these are plain (read-only) attributes
+    __slots__ = ("max_memory_size", "ram_size", "did", "flash_type", "_LDROM_size", "_chip_type",
+                 "max_dataflash_size", "page_size", "has_sprom", "sprom_addr", "sprom_len",
+                 "program_times", "page_erase_times", "_layouts")
+
+    static_ldrom_size = 0  # the table's LDROM sizes are all 0
+    maximum_ldrom_size = LDROM_MAX_SIZE
+    has_configurable_size_ldrom = True
+    config_addr = CFG_FLASH_ADDR
+    config_len = CFG_FLASH_LEN
+    mass_erase_times: Tuple[int, int] = (65000, 1000)
+
     def __init__(self, memory_size:int, LDROM_size:int, RAM_size:int, DID:int, Flash_type:int):
-        self._memory_size = memory_size
-        self._LDROM_size = LDROM_size
-        self._RAM_size = RAM_size
-        self._DID = DID
-        self._Flash_type = Flash_type
+        _set = object.__setattr__
+        _set(self, "max_memory_size", memory_size)
+        _set(self, "_LDROM_size", LDROM_size)
+        _set(self, "ram_size", RAM_size)
+        _set(self, "did", DID)
+        _set(self, "flash_type", Flash_type)
         _, type = lookup_name_and_type(DID)
-        self._chip_type = type
-
-    @property
-    def max_memory_size(self):
-        return self._memory_size
+        _set(self, "_chip_type", type)
+        _set(self, "max_dataflash_size", 0x2800 if Flash_type & 0x3 != 0 else 0)
+        _set(self, "page_size", 256 if Flash_type & 0xC != 0 else 128)
+        has_sprom = Flash_type >> 24 & 0x1
+        _set(self, "has_sprom", has_sprom)
+        _set(self, "sprom_addr", SPROM_ADDR if has_sprom else SPECIAL_ADDR)
+        _set(self, "sprom_len", SPROM_LEN if has_sprom else 0)
+        _set(self, "program_times", (40, 5) if Flash_type & 0x4 else (25, 5))
+        _set(self, "page_erase_times", (40000, 100) if Flash_type & 0x4 else (6000, 100))
+        _set(self, "_layouts", {})
+
+    def __setattr__(self, name, value):
+        raise AttributeError("FlashInfo8051 is immutable")
+
+    def get_layout(self, ldrom_size: int) -> MemoryLayout:
+        """
+        Returns the (memoized) memory layout for the given LDROM size in bytes
+        """
+        layout = self._layouts.get(ldrom_size)
+        if layout is None:
+            layout = MemoryLayout(self, ldrom_size)
+            self._layouts[ldrom_size] = layout
+        return layout
 
-    @property
-    def static_ldrom_size(self):
-        # return self._LDROM_size
-        # they're all 0
-        return 0
-    
-    @property
-    def maximum_ldrom_size(self):
-        return 4 * 1024
-    
     def get_ldrom_size(self, config):
         return config.get_ldrom_size()
     
     def get_aprom_size(self, config):
-        return self.max_memory_size - self.get_dataflash_size(config) - self.get_ldrom_size(config)
+        return self.get_layout(config.get_ldrom_size()).aprom_size
     
     def get_dataflash_size(self, config):
-        data_flash_size = self.max_dataflash_size
-        if data_flash_size > 0:
-            data_flash_size -= self.get_ldrom_size(config)
-        return data_flash_size
+        return self.get_layout(config.get_ldrom_size()).dataflash_size
     
     def get_dataflash_addr(self, config):
-        return self.get_aprom_size(config)
-    
-    @property
-    def ram_size(self):
-        return self._RAM_size
-    
-    @property
-    def did(self):
-        return self._DID
-    
-    @property
-    def flash_type(self):
-        return self._Flash_type
-
-    @property
-    def max_dataflash_size(self):
-        if self.flash_type & 0x3 != 0:
-            return 0x2800
-        return 0
-    
-    @property
-    def page_size(self):
-        if self.flash_type & 0xC != 0:
-            return 256
-        return 128
-    
-    @property
-    def has_configurable_size_ldrom(self):
-        return True
-
-    @property
-    def config_addr(self):
-        return CFG_FLASH_ADDR
-
-    @property
-    def config_len(self):
-        return CFG_FLASH_LEN
-
-    @property
-    def has_sprom(self):
-        return self.flash_type >> 24 & 0x1
-
-    @property
-    def sprom_addr(self):
-        if self.has_sprom:
-            return SPROM_ADDR
-        return SPECIAL_ADDR
-
-    @property
-    def sprom_len(self):
-        if self.has_sprom:
-            return SPROM_LEN
-        return 0
-
-    @property
-    def program_times(self) -> Tuple[int, int]:
-        if self.flash_type & 0x4:
-            return (40, 5)
-        return (25, 5)
-    
-    @property
-    def page_erase_times(self) -> Tuple[int, int]:
-        if self.flash_type & 0x4:
-            return (40000, 100)
-        return (6000, 100)
-    
-    @property
-    def mass_erase_times(self) -> Tuple[int, int]:
-        return (65000, 1000)
+        return self.get_layout(config.get_ldrom_size()).dataflash_addr
 
 
 def dump_Flash_8051_to_dict():
+    # Flash.py also carries the (large) NuMicro table, so only import it when needed
+    try:
+        from .Flash import Flash_8051 as _Flash_8051
+    except ImportError:
+        from Flash import Flash_8051 as _Flash_8051
     flash_8051_dict = {}
     for flash in _Flash_8051:
         flash_8051_dict[flash[3]] = FlashInfo8051(flash[0], flash[1], flash[2], flash[3], flash[4])
     return flash_8051_dict
 
-Flash_8051: dict[int, FlashInfo8051] = dump_Flash_8051_to_dict()
+_flash_8051: dict = None
+
+def get_flash_8051() -> dict:
+    """
+    Returns the DID -> FlashInfo8051 table, building it on first use
+    """
+    global _flash_8051
+    if _flash_8051 is None:
+        _flash_8051 = dump_Flash_8051_to_dict()
+    return _flash_8051
+
+def __getattr__(name):
+    # Flash_8051 used to be built at import time; keep it accessible as a module attribute
+    if name == "Flash_8051":
+        return get_flash_8051()
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
 
 
 # supported_types = [ChipType.N76E003, ChipType.MS51_16K, ChipType.MS51_32K, ChipType.MG51]
 
+@functools.lru_cache(maxsize=None)
 def get_flash_info(device_id: int) -> FlashInfo:
     did = device_id & 0xFFFF
+    Flash_8051 = get_flash_8051()
     if did in Flash_8051:
         # have to do this because one of the 8051 chips shares a DID with a NuMicro chip
         _, type = lookup_name_and_type(device_id)
@@ -243,109 +268,74 @@ def get_flash_info(device_id: int) -> FlashInfo:
     return FlashInfo8051(0, 0, 0, did, 0)
 
 class DeviceInfo:
-    def __init__(self, device_id=0xFFFF, pid=0x0000):
-        self._did = device_id
-        self._pid = 0
-        self.pid = pid
-
-    def _refresh_flash_info(self):
-        self.flash_info: FlashInfo = get_flash_info(self.device_id)
-        name, chip_type = lookup_name_and_type(self.device_id)
-        self._name = name
-        self._chip_type = chip_type
-
-    @property
-    def did(self):
-        return self._did
-    
-    @did.setter
-    def did(self, did):
-        self._did = did
-        self._refresh_flash_info()
-
-    @property
-    def pid(self):
-        return self._pid
+    """
+    Immutable description of a connected device
+    ------
+
+    Instances are interned per (device_id, pid), so constructing one for a device that has been seen before
+    costs a dict lookup. The chip name/type and flash info are resolved once, and the values that programming
+    code reads repeatedly (page size, config address, flash size, ...) are stored as plain attributes.
+    """
+    __slots__ = ("did", "pid", "device_id", "flash_info", "chip_name", "chip_type", "is_unsupported",
+                 "ldrom_max_size", "flash_size", "max_nvm_size", "config_addr", "config_len", "page_size",
+                 "has_configurable_size_ldrom", "sprom_addr", "sprom_len", "program_times", "page_erase_times",
+                 "mass_erase_times")
+
+    aprom_addr = APROM_ADDR  # it's always 0
+
+    _interned: dict = {}
+    _INTERN_MAX = 256
+
+    def __new__(cls, device_id=0xFFFF, pid=0x0000):
+        key = (cls, device_id, pid)
+        self = cls._interned.get(key)
+        if self is None:
+            self = object.__new__(cls)
+            self._setup(device_id, pid)
+            if len(cls._interned) >= cls._INTERN_MAX:
+                # junk IDs from a bad connection shouldn't grow this forever
+                cls._interned.clear()
+            cls._interned[key] = self
+        return self
 
-    @pid.setter
-    def pid(self, pid):
-        if pid == self.did and pid != 0xffff:
+    def _setup(self, did, pid):
+        _set = object.__setattr__
+        if pid == did and pid != 0xffff:
             pid = 0
-        self._pid = pid
-        self._refresh_flash_info() 
-    
-    @property
-    def device_id(self):
-        if self.did & 0xFFFF == self.did:
-            return self.did | (self.pid << 16)
-        else:
-            return self.did
-    
-    @property
-    def aprom_addr(self): # it's always 0
-        return 0
-
-    @property
-    def ldrom_max_size(self):
-        return self.flash_info.maximum_ldrom_size
-
-    @property
-    def flash_size(self):
-        return self.flash_info.max_memory_size
-        
-    @property
-    def max_nvm_size(self):
-        return self.flash_info.max_dataflash_size
-    
-    @property
-    def config_addr(self):
-        return self.flash_info.config_addr
-    
-    @property
-    def config_len(self):
-        return self.flash_info.config_len
-
-    @property
-    def is_unsupported(self):
-        if self._chip_type.is_8051:
-            return False
-        return True
-    
-    @property
-    def chip_name(self):
-        return self._name
-    
-    @property
-    def chip_type(self):
-        return self._chip_type
-    
-    @property
-    def page_size(self):
-        return self.flash_info.page_size
-    
-    @property
-    def has_configurable_size_ldrom(self):
-        return self.flash_info.has_configurable_size_ldrom
-    
-    @property
-    def sprom_addr(self):
-        return self.flash_info.sprom_addr
-
-    @property
-    def sprom_len(self):
-        return self.flash_info.sprom_len
-
-    @property
-    def program_times(self) -> Tuple[int, int]:
-        return self.flash_info.program_times
-    
-    @property
-    def page_erase_times(self) -> Tuple[int, int]:
-        return self.flash_info.page_erase_times
-    
-    @property
-    def mass_erase_times(self) -> Tuple[int, int]:
-        return self.flash_info.mass_erase_times
+        device_id = did | (pid << 16) if did & 0xFFFF == did else did
+        flash_info: FlashInfo = get_flash_info(device_id)
+        name, chip_type = lookup_name_and_type(device_id)
+        _set(self, "did", did)
+        _set(self, "pid", pid)
+        _set(self, "device_id", device_id)
+        _set(self, "flash_info", flash_info)
+        _set(self, "chip_name", name)
+        _set(self, "chip_type", chip_type)
+        _set(self, "is_unsupported", not chip_type.is_8051)
+        _set(self, "ldrom_max_size", flash_info.maximum_ldrom_size)
+        _set(self, "flash_size", flash_info.max_memory_size)
+        _set(self, "max_nvm_size", flash_info.max_dataflash_size)
+        _set(self, "config_addr", flash_info.config_addr)
+        _set(self, "config_len", flash_info.config_len)
+        _set(self, "page_size", flash_info.page_size)
+        _set(self, "has_configurable_size_ldrom", flash_info.has_configurable_size_ldrom)
+        _set(self, "sprom_addr", flash_info.sprom_addr)
+        _set(self, "sprom_len", flash_info.sprom_len)
+        _set(self, "program_times", flash_info.program_times)
+        _set(self, "page_erase_times", flash_info.page_erase_times)
+        _set(self, "mass_erase_times", flash_info.mass_erase_times)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("DeviceInfo is immutable, create a new one instead")
+
+    def __reduce__(self):
+        return (DeviceInfo, (self.did, self.pid))
+
+    def get_layout(self, config) -> MemoryLayout:
+        """
+        Returns the memory layout for this device with the LDROM size set in `config`
+        """
+        return self.flash_info.get_layout(config.get_ldrom_size())
 
     def get_aprom_size(self, config):
         return self.flash_info.get_aprom_size(config)
@@ -0,0 +1,336 @@
+"""
+Firmware file formats
+------
+
+Streaming encoders for flash dumps: raw binary, Intel HEX and Motorola S-record. An encoder is fed the dump chunk by
+chunk (as iter_flash() yields it) and writes records as soon as they are complete, so the image never has to be held
+in memory. The HEX and S-record encoders leave out records that are entirely 0xFF (erased flash); a loader fills
+those gaps with 0xFF again.
+
+The loaders go the other way: Intel HEX (including the .ihx files sdcc writes) and S-record files are parsed line by
+line into a sparse segment map, a sorted list of (address, data) runs, so that only the pages the file actually
+populates need to be programmed.
+"""
+import os
+from typing import Dict, Iterable, List, Tuple
+
+FORMATS = ("bin", "hex", "srec")
+# bytes of data per Intel HEX / S-record record
+RECORD_SIZE = 16
+
+_EXTENSIONS = {
+    ".bin": "bin",
+    ".hex": "hex",
+    ".ihx": "hex",
+    ".srec": "srec",
+    ".s19": "srec",
+    ".s28": "srec",
+    ".mot": "srec",
+}
+
+
+def format_from_filename(filename: str, default="bin") -> str:
+    """
+    Guess the file format from the file extension (e.g. ".hex" or ".ihx" -> "hex", ".s19" -> "srec")
+    """
+    return _EXTENSIONS.get(os.path.splitext(filename)[1].lower(), default)
+
+
+class Encoder:
+    """
+    Base class for the streaming encoders
+    ------
+
+    #### Args:
+        f (file):
+            Binary file object to write to
+        addr (int):
+            Flash address of the first byte that will be written
+    """
+
+    def __init__(self, f, addr: int = 0):
+        self.f = f
+        self.addr = addr
+
+    def write(self, chunk):
+        """
+        Encode the next chunk of the dump, which starts where the previous one ended
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """
+        Write out anything still buffered and the end-of-file record, if the format has one
+        """
+        pass
+
+
+class RawEncoder(Encoder):
+    """
+    Plain binary: every byte, including erased ones
+    """
+
+    def write(self, chunk):
+        self.f.write(chunk)
+        self.addr += len(chunk)
+
+
+class _RecordEncoder(Encoder):
+    # collects the stream into RECORD_SIZE-aligned records and drops the erased ones
+
+    def __init__(self, f, addr: int = 0):
+        super().__init__(f, addr)
+        self._pending = bytearray()
+        self._pending_addr = addr
+
+    def write(self, chunk):
+        self._pending += chunk
+        self.addr += len(chunk)
+        start = 0
+        # the first record may be short, so that the rest are aligned to RECORD_SIZE
+        while True:
+            record_addr = self._pending_addr + start
+            end = start + RECORD_SIZE - record_addr % RECORD_SIZE
+            if end > len(self._pending):
+                break
+            self._emit(record_addr, self._pending[start:end])
+            start = end
+        del self._pending[:start]
+        self._pending_addr += start
+
+    def _emit(self, addr, data):
+        if data.count(0xFF) != len(data):
+            self.f.write(self._record(addr, bytes(data)))
+
+    def _record(self, addr, data) -> bytes:
+        raise NotImplementedError
+
+    def close(self):
+        if self._pending:
+            self._emit(self._pending_addr, self._pending)
+            self._pending_addr += len(self._pending)
+            self._pending = bytearray()
+
+
+def _ihex_line(rectype, addr, data) -> bytes:
+    body = bytes([len(data), (addr >> 8) & 0xFF, addr & 0xFF, rectype]) + data
+    return (":%s%02X\n" % (body.hex().upper(), -sum(body) & 0xFF)).encode()
+
+
+class IntelHexEncoder(_RecordEncoder):
+    """
+    Intel HEX, with extended linear address records for data above 64 KB (e.g. the config bytes at 0x30000)
+    """
+
+    def __init__(self, f, addr: int = 0):
+        super().__init__(f, addr)
+        self._upper = 0
+
+    def _record(self, addr, data) -> bytes:
+        line = b""
+        if addr >> 16 != self._upper:
+            self._upper = addr >> 16
+            line = _ihex_line(0x04, 0, bytes([self._upper >> 8, self._upper & 0xFF]))
+        return line + _ihex_line(0x00, addr & 0xFFFF, data)
+
+    def close(self):
+        super().close()
+        self.f.write(_ihex_line(0x01, 0, b""))
+
+
+def _srec_line(rectype, addr, addr_len, data) -> bytes:
+    body = bytes([addr_len + len(data) + 1]) + addr.to_bytes(addr_len, "big") + data
+    return ("S%d%s%02X\n" % (rectype, body.hex().upper(), ~sum(body) & 0xFF)).encode()
+
+
+class SRecordEncoder(_RecordEncoder):
+    """
+    Motorola S-record: S1 records below 64 KB, S2 (24-bit address) records above, and a matching S9/S8 terminator
+    """
+
+    def __init__(self, f, addr: int = 0):
+        super().__init__(f, addr)
+        self._wide = False
+        f.write(_srec_line(0, 0, 2, b"nuvoprog"))
+
+    def _record(self, addr, data) -> bytes:
+        if addr + len(data) > 0x10000:
+            self._wide = True
+            return _srec_line(2, addr, 3, data)
+        return _srec_line(1, addr, 2, data)
+
+    def close(self):
+        super().close()
+        self.f.write(_srec_line(8, 0, 3, b"") if self._wide else _srec_line(9, 0, 2, b""))
+
+
+ENCODERS = {
+    "bin": RawEncoder,
+    "hex": IntelHexEncoder,
+    "srec": SRecordEncoder,
+}
+
+
+def get_encoder(fmt: str, f, addr: int = 0) -> Encoder:
+    """
+    #### Args:
+        fmt (str):
+            One of FORMATS
+        f (file):
+            Binary file object to write to
+        addr (int):
+            Flash address of the first byte
+
+    #### Returns:
+        Encoder
+    """
+    if fmt not in ENCODERS:
+        raise ValueError("Unknown file format: %s (expected one of %s)" % (fmt, ", ".join(FORMATS)))
+    return ENCODERS[fmt](f, addr)
+
+
+class FirmwareFileError(ValueError):
+    """
+    A HEX or S-record file is malformed
+    """
+    pass
+
+
+def _record_lines(lines, start):
+    for lineno, line in enumerate(lines, 1):
+        if isinstance(line, bytes):
+            line = line.decode("ascii", "replace")
+        line = line.strip()
+        if not line:
+            continue
+        if line[0] != start:
+            raise FirmwareFileError("line %d: not a %s record" % (lineno, "Intel HEX" if start == ":" else "S-record"))
+        try:
+            yield lineno, line, bytes.fromhex(line[1 if start == ":" else 2:])
+        except ValueError:
+            raise FirmwareFileError("line %d: invalid hex digits" % lineno)
+
+
+def iter_ihex(lines: Iterable) -> Iterable[Tuple[int, bytes]]:
+    """
+    Parse Intel HEX lines (str or bytes), yielding the (address, data) of each data record
+    """
+    base = 0
+    for lineno, _, rec in _record_lines(lines, ":"):
+        if len(rec) < 5 or len(rec) != rec[0] + 5:
+            raise FirmwareFileError("line %d: bad record length" % lineno)
+        if sum(rec) & 0xFF:
+            raise FirmwareFileError("line %d: checksum mismatch" % lineno)
+        rectype, data = rec[3], rec[4:-1]
+        if rectype == 0x00:
+            yield base + ((rec[1] << 8) | rec[2]), data
+        elif rectype == 0x01:
+            return
+        elif rectype == 0x02:
+            base = int.from_bytes(data, "big") << 4
+        elif rectype == 0x04:
+            base = int.from_bytes(data, "big") << 16
+        # 0x03 and 0x05 are start addresses, which don't describe flash contents
+
+
+_SREC_ADDR_LEN = {"1": 2, "2": 3, "3": 4}
+
+
+def iter_srec(lines: Iterable) -> Iterable[Tuple[int, bytes]]:
+    """
+    Parse Motorola S-record lines (str or bytes), yielding the (address, data) of each S1/S2/S3 record
+    """
+    for lineno, line, rec in _record_lines(lines, "S"):
+        if len(rec) < 1 or rec[0] != len(rec) - 1:
+            raise FirmwareFileError("line %d: bad record length" % lineno)
+        if sum(rec) & 0xFF != 0xFF:
+            raise FirmwareFileError("line %d: checksum mismatch" % lineno)
+        addr_len = _SREC_ADDR_LEN.get(line[1])
+        if addr_len is not None:
+            yield int.from_bytes(rec[1:1 + addr_len], "big"), rec[1 + addr_len:-1]
+        elif line[1] in "789":
+            return
+
+
+PARSERS = {
+    "hex": iter_ihex,
+    "srec": iter_srec,
+}
+
+
+def read_segments(lines: Iterable, fmt: str = "hex") -> List[Tuple[int, bytes]]:
+    """
+    Parse a HEX or S-record file into a segment map
+    ------
+
+    Consecutive records are joined as they are parsed, so only the data itself is held in memory.
+
+    #### Args:
+        lines (Iterable[str | bytes]):
+            The file, line by line (e.g. an open file object)
+        fmt (str):
+            "hex" or "srec"
+
+    #### Returns:
+        list[tuple[int, bytes]]:
+            Sorted, non-overlapping (address, data) segments; adjacent segments are merged
+
+    #### Raises:
+        FirmwareFileError
+            If a record is malformed or two records overlap
+    """
+    if fmt not in PARSERS:
+        raise ValueError("Not a HEX or S-record format: %s" % fmt)
+    segments = []
+    for addr, data in PARSERS[fmt](lines):
+        if not data:
+            continue
+        if segments and segments[-1][0] + len(segments[-1][1]) == addr:
+            segments[-1][1] += data
+        else:
+            segments.append([addr, bytearray(data)])
+    segments.sort(key=lambda segment: segment[0])
+    merged = []
+    for addr, data in segments:
+        if merged:
+            end = merged[-1][0] + len(merged[-1][1])
+            if addr < end:
+                raise FirmwareFileError("overlapping data at 0x%04X" % addr)
+            if addr == end:
+                merged[-1][1] += data
+                continue
+        merged.append([addr, data])
+    return [(addr, bytes(data)) for addr, data in merged]
+
+
+def load_segments(filename: str, fmt: str = None) -> List[Tuple[int, bytes]]:
+    """
+    Read a HEX or S-record file into a segment map (see read_segments()); the format is guessed from the extension
+    if not given
+    """
+    fmt = fmt or format_from_filename(filename, "hex")
+    with open(filename, "rb") as f:
+        try:
+            return read_segments(f, fmt)
+        except FirmwareFileError as e:
+            raise FirmwareFileError("%s: %s" % (filename, e))
+
+
+def segment_pages(segments: List[Tuple[int, bytes]], page_size: int, fill: int = 0xFF) -> Dict[int, bytes]:
+    """
+    Full contents of every page that a segment map populates, with the rest of each page filled with `fill`
+
+    #### Returns:
+        dict[int, bytes]:
+            Page address -> page contents
+    """
+    pages = {}
+    for addr, data in segments:
+        end = addr + len(data)
+        for page in range(addr - addr % page_size, end, page_size):
+            image = pages.get(page)
+            if image is None:
+                image = pages[page] = bytearray([fill]) * page_size
+            start, stop = max(page, addr), min(page + page_size, end)
+            image[start - page:stop - page] = data[start - addr:stop - addr]
+    return {page: bytes(image) for page, image in pages.items()}
@@ -0,0 +1,238 @@
+"""
+Sparse flash images
+------
+
+A SparseImage is a flash image made of populated segments plus a fill byte (0xFF, i.e. erased flash) everywhere
+else, up to a virtual size. Padding an image to its region size only changes that size, so the 0xFF bytes are
+never materialized. Segments hold references to the caller's data instead of copies. Both programmers accept a
+SparseImage wherever they take image bytes, and the ICP writes only the populated segments, since erased flash
+already reads as 0xFF.
+"""
+import bisect
+import hashlib
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+try:
+    from .fileformats import segment_pages
+except ImportError:
+    from fileformats import segment_pages
+
+# bytes of fill produced at once when hashing or comparing gaps
+FILL_CHUNK_SIZE = 4096
+
+
+class SparseImage:
+    """
+    An interval map of (address, data) segments with a fill byte for the gaps
+    ------
+
+    Slicing (`image[a:b]`) returns bytes for just that range. `len(image)` is the virtual size. Two images (or an
+    image and a bytes object) are equal if their contents are, however they are split into segments.
+
+    #### Args:
+        size (int):
+            Virtual size; grows to cover every segment added
+        fill (int):
+            Value of the bytes no segment covers
+
+    #### Attributes:
+        segments (list[tuple[int, bytes]]):
+            Sorted, non-overlapping (address, data) segments; don't modify it directly, use add()
+    """
+    __slots__ = ("segments", "size", "fill", "_starts")
+
+    def __init__(self, size: int = 0, fill: int = 0xFF):
+        self.segments: List[Tuple[int, bytes]] = []
+        self._starts: List[int] = []
+        self.size = size
+        self.fill = fill
+
+    @classmethod
+    def from_segments(cls, segments: Iterable[Tuple[int, bytes]], size: int = 0, fill: int = 0xFF) -> "SparseImage":
+        """
+        An image from (address, data) segments, e.g. from fileformats.load_segments()
+        """
+        image = cls(size, fill)
+        for addr, data in segments:
+            image.add(addr, data)
+        return image
+
+    @classmethod
+    def wrap(cls, data, fill: int = 0xFF) -> "SparseImage":
+        """
+        `data` itself if it is already a SparseImage, otherwise an image with `data` (not a copy) at address 0
+        """
+        if isinstance(data, SparseImage):
+            return data
+        image = cls(0, fill)
+        if data:
+            image.add(0, data)
+        return image
+
+    def add(self, addr: int, data):
+        """
+        Add a segment; it may touch its neighbours but not overlap them (ValueError)
+        """
+        if not len(data):
+            return
+        data = memoryview(data).cast("B")
+        end = addr + len(data)
+        i = bisect.bisect_left(self._starts, addr)
+        if (i < len(self.segments) and self.segments[i][0] < end) or \
+                (i > 0 and self.segments[i - 1][0] + len(self.segments[i - 1][1]) > addr):
+            raise ValueError("Segment 0x%04X-0x%04X overlaps the image" % (addr, end - 1))
+        self.segments.insert(i, (addr, data))
+        self._starts.insert(i, addr)
+        self.size = max(self.size, end)
+
+    def _copy(self, size) -> "SparseImage":
+        image = SparseImage(size, self.fill)
+        image.segments = list(self.segments)
+        image._starts = list(self._starts)
+        return image
+
+    def padded(self, size: int) -> "SparseImage":
+        """
+        The same image with a virtual size of at least `size`; nothing is copied or filled in
+        """
+        if size <= self.size:
+            return self
+        return self._copy(size)
+
+    def truncated(self, size: int) -> "SparseImage":
+        """
+        The first `size` bytes of the image; segments are cut with memoryviews, not copied
+        """
+        if size >= self.size:
+            return self
+        image = SparseImage(size, self.fill)
+        for addr, data in self.segments:
+            if addr >= size:
+                break
+            image.segments.append((addr, data[:size - addr]))
+            image._starts.append(addr)
+        return image
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __add__(self, other) -> "SparseImage":
+        """
+        Concatenate: `other` (bytes or a SparseImage) is placed right after this image's virtual end
+        """
+        other = SparseImage.wrap(other, self.fill)
+        image = self._copy(self.size)
+        for addr, data in other.segments:
+            image.add(self.size + addr, data)
+        image.size = self.size + other.size
+        return image
+
+    def __radd__(self, other) -> "SparseImage":
+        return SparseImage.wrap(other, self.fill) + self
+
+    def pieces(self, start: int = 0, stop: int = None) -> Iterator[Tuple[int, int, memoryview]]:
+        """
+        Yields (address, length, data) covering [start, stop) in order; data is None for the gaps
+        """
+        stop = self.size if stop is None else min(stop, self.size)
+        pos = start
+        i = max(0, bisect.bisect_right(self._starts, start) - 1)
+        for addr, data in self.segments[i:]:
+            if addr >= stop:
+                break
+            end = addr + len(data)
+            if end <= pos:
+                continue
+            if addr > pos:
+                yield pos, addr - pos, None
+                pos = addr
+            piece_end = min(end, stop)
+            yield pos, piece_end - pos, data[pos - addr:piece_end - addr]
+            pos = piece_end
+        if pos < stop:
+            yield pos, stop - pos, None
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            if key < 0:
+                key += self.size
+            for _, _, data in self.pieces(key, key + 1):
+                return self.fill if data is None else data[0]
+            raise IndexError("SparseImage index out of range")
+        start, stop, step = key.indices(self.size)
+        if step != 1:
+            raise ValueError("SparseImage slices must be contiguous")
+        out = bytearray()
+        for _, length, data in self.pieces(start, stop):
+            out += data if data is not None else bytes([self.fill]) * length
+        return bytes(out)
+
+    def tobytes(self) -> bytes:
+        """
+        The whole image, fill included, as bytes
+        """
+        return self[:]
+
+    def __bytes__(self) -> bytes:
+        return self.tobytes()
+
+    @property
+    def populated(self) -> int:
+        """
+        Number of bytes covered by segments
+        """
+        return sum(len(data) for _, data in self.segments)
+
+    def pages(self, page_size: int) -> Dict[int, bytes]:
+        """
+        Full contents of every page that a segment touches, with the rest of each page filled
+
+        #### Returns:
+            dict[int, bytes]:
+                Page address -> page contents
+        """
+        return segment_pages(self.segments, page_size, self.fill)
+
+    def sha256(self):
+        """
+        hashlib SHA-256 of the contents, fill included (the same digest as for the equivalent bytes)
+        """
+        digest = hashlib.sha256()
+        fill = bytes([self.fill]) * FILL_CHUNK_SIZE
+        for _, length, data in self.pieces():
+            if data is not None:
+                digest.update(data)
+                continue
+            for _ in range(length // FILL_CHUNK_SIZE):
+                digest.update(fill)
+            digest.update(fill[:length % FILL_CHUNK_SIZE])
+        return digest
+
+    def hexdigest(self) -> str:
+        return self.sha256().hexdigest()
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, SparseImage):
+            try:
+                other = SparseImage.wrap(memoryview(other))
+            except TypeError:
+                return NotImplemented
+        if self.size != other.size:
+            return False
+        for addr, length, data in self.pieces():
+            if data is None:
+                # a gap matches wherever the other image holds nothing but the fill byte
+                for _, n, other_data in other.pieces(addr, addr + length):
+                    if other_data is None:
+                        if other.fill != self.fill:
+                            return False
+                    elif other_data.tobytes().count(self.fill) != n:
+                        return False
+            elif other[addr:addr + length] != data:
+                return False
+        return True
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "SparseImage(size=0x%X, %d segments, %d bytes populated)" % (self.size, len(self.segments), self.populated)
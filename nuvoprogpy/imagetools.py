@@ -0,0 +1,285 @@
+"""
+Image analytics
+------
+
+Checksums, per-page sums and CRCs, blank-page maps and page diffs for flash images. With numpy installed, inputs of
+NUMPY_MIN_SIZE bytes or more are processed in vectorized form; smaller inputs (e.g. single ISP packets), and every
+input without numpy, use builtins and bytes methods that run in C rather than a per-byte Python loop. numpy is only
+imported the first time a large image is processed.
+
+Run `python -m nuvoprogpy.imagetools` to compare the two backends on a 64 KB image.
+"""
+import time
+import zlib
+from typing import Dict, List, Tuple
+
+try:
+    from .image import SparseImage
+except ImportError:
+    from image import SparseImage
+
+# below this size the numpy call overhead outweighs the vectorization
+NUMPY_MIN_SIZE = 4096
+# bytes compared at once when looking for mismatches without numpy; equal chunks are skipped without a Python loop
+DIFF_CHUNK_SIZE = 64
+
+_numpy = None
+
+
+def _np():
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+    return _numpy or None
+
+
+def _use_numpy(data) -> bool:
+    return len(data) >= NUMPY_MIN_SIZE and _np() is not None
+
+
+def _pages_array(data, page_size, fill):
+    np = _np()
+    arr = np.frombuffer(data, dtype=np.uint8)
+    if len(arr) % page_size:
+        arr = np.concatenate((arr, np.full(-len(arr) % page_size, fill, dtype=np.uint8)))
+    return arr.reshape(-1, page_size)
+
+
+def _page_slices(data, page_size, fill):
+    data = bytes(data)
+    for start in range(0, len(data), page_size):
+        page = data[start:start + page_size]
+        yield page + bytes([fill]) * (page_size - len(page))
+
+
+# checksums
+
+def _checksum16_numpy(data) -> int:
+    np = _np()
+    return int(np.frombuffer(data, dtype=np.uint8).sum(dtype=np.uint64)) & 0xFFFF
+
+
+def _checksum16_python(data) -> int:
+    return sum(memoryview(data).cast("B")) & 0xFFFF
+
+
+def checksum16(data) -> int:
+    """
+    The ISP checksum: the sum of all bytes, truncated to 16 bits
+    """
+    if _use_numpy(data):
+        return _checksum16_numpy(data)
+    return _checksum16_python(data)
+
+
+def _page_sums_numpy(data, page_size, fill) -> List[int]:
+    np = _np()
+    return (_pages_array(data, page_size, fill).sum(axis=1, dtype=np.uint32) & 0xFFFF).tolist()
+
+
+def _page_sums_python(data, page_size, fill) -> List[int]:
+    return [sum(page) & 0xFFFF for page in _page_slices(data, page_size, fill)]
+
+
+def page_sums(data, page_size: int, fill: int = 0xFF) -> List[int]:
+    """
+    16-bit byte sum of each page; a partial last page is padded with `fill`
+    """
+    if _use_numpy(data):
+        return _page_sums_numpy(data, page_size, fill)
+    return _page_sums_python(data, page_size, fill)
+
+
+def page_crcs(data, page_size: int, fill: int = 0xFF) -> List[int]:
+    """
+    CRC-32 of each page; a partial last page is padded with `fill`
+
+    zlib already runs in C, so there is no numpy variant.
+    """
+    return [zlib.crc32(page) for page in _page_slices(data, page_size, fill)]
+
+
+# blank pages
+
+def _blank_pages_numpy(data, page_size, fill) -> List[bool]:
+    return (_pages_array(data, page_size, fill) == fill).all(axis=1).tolist()
+
+
+def _blank_pages_python(data, page_size, fill) -> List[bool]:
+    return [page.count(fill) == page_size for page in _page_slices(data, page_size, fill)]
+
+
+def blank_pages(data, page_size: int, fill: int = 0xFF) -> List[bool]:
+    """
+    Bitmap of the pages that hold nothing but `fill`, one entry per page
+    """
+    if isinstance(data, SparseImage):
+        # pages without a segment are blank by definition; only the ones with data need checking
+        bitmap = [True] * ((len(data) + page_size - 1) // page_size)
+        for page, contents in data.pages(page_size).items():
+            if page // page_size < len(bitmap):
+                bitmap[page // page_size] = contents.count(fill) == page_size
+        return bitmap
+    if _use_numpy(data):
+        return _blank_pages_numpy(data, page_size, fill)
+    return _blank_pages_python(data, page_size, fill)
+
+
+def is_blank(data, fill: int = 0xFF) -> bool:
+    """
+    True if `data` holds nothing but `fill`
+    """
+    if _use_numpy(data):
+        np = _np()
+        return bool((np.frombuffer(data, dtype=np.uint8) == fill).all())
+    return bytes(data).count(fill) == len(data)
+
+
+def drop_blank_pages(data, page_size: int) -> SparseImage:
+    """
+    `data` as a SparseImage without the whole pages that hold only its fill byte (0xFF)
+    ------
+
+    Erased flash already reads as 0xFF, so after an erase those pages don't need to be written. The remaining
+    segments are views into `data`, not copies.
+    """
+    image = SparseImage.wrap(data)
+    out = SparseImage(len(image), image.fill)
+    for addr, segment in image.segments:
+        # only whole pages are dropped; a partial page at the start is kept as it is
+        head = min(-addr % page_size, len(segment))
+        if head:
+            out.add(addr, segment[:head])
+        body = segment[head:]
+        run = None
+        # consecutive pages with data stay a single segment, so they are still written in one go
+        for i, blank in enumerate(blank_pages(body, page_size, image.fill) + [True]):
+            if not blank and run is None:
+                run = i * page_size
+            elif blank and run is not None:
+                out.add(addr + head + run, body[run:i * page_size])
+                run = None
+    return out
+
+
+# diffs
+
+def _diff_ranges_numpy(expected, actual) -> List[Tuple[int, int]]:
+    np = _np()
+    diff = np.frombuffer(expected, dtype=np.uint8) != np.frombuffer(actual, dtype=np.uint8)
+    # a range starts where diff goes from False to True and ends where it goes back
+    edges = np.flatnonzero(np.diff(np.concatenate(([False], diff, [False])).astype(np.int8)))
+    return list(zip(edges[0::2].tolist(), edges[1::2].tolist()))
+
+
+def _diff_ranges_python(expected, actual) -> List[Tuple[int, int]]:
+    ranges = []
+    start = None
+    length = len(expected)
+    for chunk in range(0, length, DIFF_CHUNK_SIZE):
+        end = min(chunk + DIFF_CHUNK_SIZE, length)
+        if expected[chunk:end] == actual[chunk:end]:
+            if start is not None:
+                ranges.append((start, chunk))
+                start = None
+            continue
+        for i in range(chunk, end):
+            if expected[i] != actual[i]:
+                if start is None:
+                    start = i
+            elif start is not None:
+                ranges.append((start, i))
+                start = None
+    if start is not None:
+        ranges.append((start, length))
+    return ranges
+
+
+def diff_ranges(expected, actual) -> List[Tuple[int, int]]:
+    """
+    (start, end) offsets, end exclusive, of the ranges where two equal-length images differ
+    """
+    if _use_numpy(expected):
+        return _diff_ranges_numpy(expected, actual)
+    return _diff_ranges_python(expected, actual)
+
+
+def _page_diff_numpy(expected, actual, page_size) -> List[int]:
+    np = _np()
+    diff = np.frombuffer(expected, dtype=np.uint8) != np.frombuffer(actual, dtype=np.uint8)
+    if len(diff) % page_size:
+        diff = np.concatenate((diff, np.zeros(-len(diff) % page_size, dtype=bool)))
+    return (np.flatnonzero(diff.reshape(-1, page_size).any(axis=1)) * page_size).tolist()
+
+
+def _page_diff_python(expected, actual, page_size) -> List[int]:
+    expected, actual = bytes(expected), bytes(actual)
+    return [start for start in range(0, len(expected), page_size)
+            if expected[start:start + page_size] != actual[start:start + page_size]]
+
+
+def page_diff(expected, actual, page_size: int) -> List[int]:
+    """
+    Offsets of the pages where two images differ; if one is longer, the pages past the end of the other differ
+    """
+    expected, actual = memoryview(expected).cast("B"), memoryview(actual).cast("B")
+    common = min(len(expected), len(actual))
+    full = common - common % page_size
+    a, b = expected[:full], actual[:full]
+    pages = _page_diff_numpy(a, b, page_size) if _use_numpy(a) else _page_diff_python(a, b, page_size)
+    if len(expected) != len(actual) or expected[full:] != actual[full:]:
+        pages += range(full, max(len(expected), len(actual)), page_size)
+    return pages
+
+
+def benchmark(size: int = 0x10000, page_size: int = 128, repeat: int = 20) -> Dict[str, Tuple[float, float]]:
+    """
+    Time the pure Python and numpy backends on a `size`-byte image that is half blank
+
+    #### Returns:
+        dict[str, tuple[float, float]]:
+            Operation -> (Python seconds, numpy seconds) per call; numpy is None if it isn't installed
+    """
+    import random
+    rng = random.Random(0)
+    image = bytearray(b"\xff" * size)
+    image[:size // 2] = bytes(rng.randrange(256) for _ in range(size // 2))
+    image = bytes(image)
+    other = bytearray(image)
+    for i in range(0, size, size // 16):
+        other[i] ^= 1
+    other = bytes(other)
+    cases = {
+        "checksum16": (_checksum16_python, _checksum16_numpy, (image,)),
+        "page_sums": (_page_sums_python, _page_sums_numpy, (image, page_size, 0xFF)),
+        "blank_pages": (_blank_pages_python, _blank_pages_numpy, (image, page_size, 0xFF)),
+        "page_diff": (_page_diff_python, _page_diff_numpy, (image, other, page_size)),
+        "diff_ranges": (_diff_ranges_python, _diff_ranges_numpy, (image, other)),
+    }
+    results = {}
+    for name, (python_fn, numpy_fn, args) in cases.items():
+        timings = []
+        for fn in (python_fn, numpy_fn if _np() is not None else None):
+            if fn is None:
+                timings.append(None)
+                continue
+            fn(*args)
+            start = time.perf_counter()
+            for _ in range(repeat):
+                fn(*args)
+            timings.append((time.perf_counter() - start) / repeat)
+        results[name] = tuple(timings)
+    return results
+
+
+if __name__ == "__main__":
+    for name, (python_s, numpy_s) in benchmark().items():
+        if numpy_s is None:
+            print("%-12s python %8.3f ms   numpy not installed" % (name, python_s * 1e3))
+        else:
+            print("%-12s python %8.3f ms   numpy %8.3f ms   %6.1fx" % (name, python_s * 1e3, numpy_s * 1e3,
+                                                                     python_s / numpy_s))
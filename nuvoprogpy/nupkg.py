@@ -0,0 +1,308 @@
+"""
+Programming packages (.nupkg)
+------
+
+A .nupkg file bundles everything a programming job needs: the APROM and LDROM images, the config bytes, the
+device the job is for, the padded region sizes and a CRC-32 per page. It is laid out so it can be memory-mapped and
+used as it is: NuPackage.open() checks the header and the SHA-256 of the rest of the file, and the images it returns
+are SparseImages whose segments are views into the mapping, so programming streams straight from the page cache.
+
+Layout (all integers little-endian):
+
+    header   (64 bytes)      magic, version, header size, device ID and mask, page size, entry count,
+                             index offset, SHA-256 of everything after the header
+    index    (20 bytes/entry) tag, flash offset (within the region), file offset, length, region size
+    sections                 each aligned to SECTION_ALIGN bytes
+
+Section tags:
+
+    APRM / LDRM    image data; a region may have several entries (e.g. from a sparse HEX file)
+    APHS / LDHS    CRC-32 of every page of the padded region, as uint32s
+    CONF           the config bytes
+
+Build one with `python -m nuvoprogpy pack` (see nuvoprogpy/__main__.py) or build_package().
+"""
+import hashlib
+import mmap
+import struct
+from typing import Dict, List, Tuple
+
+try:
+    from .config import ConfigFlags, DeviceInfo
+    from .fileformats import format_from_filename, load_segments
+    from .image import SparseImage
+    from .imagetools import page_crcs
+except ImportError:
+    from config import ConfigFlags, DeviceInfo
+    from fileformats import format_from_filename, load_segments
+    from image import SparseImage
+    from imagetools import page_crcs
+
+PACKAGE_EXTENSION = ".nupkg"
+MAGIC = b"NUPKG\r\n\x1a"
+VERSION = 1
+SECTION_ALIGN = 64
+
+_HEADER = struct.Struct("<8sHHIIIII32s")
+_ENTRY = struct.Struct("<4sIIII")
+
+_IMAGE_TAGS = {"aprom": b"APRM", "ldrom": b"LDRM"}
+_HASH_TAGS = {"aprom": b"APHS", "ldrom": b"LDHS"}
+_CONFIG_TAG = b"CONF"
+
+
+class NuPackageError(ValueError):
+    pass
+
+
+def is_package_file(filename: str) -> bool:
+    return bool(filename) and filename.lower().endswith(PACKAGE_EXTENSION)
+
+
+def _align(n: int) -> int:
+    return n + (-n % SECTION_ALIGN)
+
+
+def build_package(device_id: int, aprom=bytes(), ldrom=bytes(), config: ConfigFlags = None,
+                  device_mask: int = None) -> bytes:
+    """
+    Build a package
+    ------
+
+    #### Args:
+        device_id (int):
+            The device the package is for (see DeviceInfo.device_id); decides the layout and the config format
+        aprom (bytes or SparseImage), ldrom (bytes or SparseImage):
+            The images (empty to leave the region alone)
+        config (ConfigFlags):
+            Config to program; required with an LDROM image, since it sets the LDROM size
+        device_mask (int):
+            Bits of the device ID a chip has to match (default: 0xFFFF for a 16-bit ID, all 32 bits otherwise)
+
+    #### Returns:
+        bytes: the package
+
+    #### Raises:
+        NuPackageError: if an image doesn't fit its region, or an LDROM image is given without a config
+    """
+    if device_mask is None:
+        device_mask = 0xFFFF if device_id <= 0xFFFF else 0xFFFFFFFF
+    device_info = DeviceInfo(device_id & 0xFFFF, device_id >> 16)
+    if device_info.is_unsupported:
+        raise NuPackageError("Unsupported device ID: 0x%04X" % device_id)
+    if len(ldrom) > 0 and config is None:
+        raise NuPackageError("An LDROM image needs a config, which sets the LDROM size")
+    layout_config = config or ConfigFlags.from_bytes(bytes([0xFF] * device_info.config_len), device_info.device_id)
+    layout = device_info.get_layout(layout_config)
+    page_size = device_info.page_size
+
+    sections: List[Tuple[bytes, int, object, int]] = []
+    for region, data, size in (("aprom", aprom, layout.aprom_size), ("ldrom", ldrom, layout.ldrom_size)):
+        if len(data) == 0:
+            continue
+        if len(data) > size:
+            raise NuPackageError("%s image is %d bytes, but the region is only %d bytes" % (region.upper(), len(data), size))
+        image = SparseImage.wrap(data)
+        for addr, segment in image.segments:
+            sections.append((_IMAGE_TAGS[region], addr, segment, size))
+        crcs = page_crcs(image.padded(size).tobytes(), page_size)
+        sections.append((_HASH_TAGS[region], 0, struct.pack("<%dI" % len(crcs), *crcs), size))
+    if config is not None:
+        sections.append((_CONFIG_TAG, 0, config.to_bytes(), len(config.to_bytes())))
+
+    offset = _align(_HEADER.size + _ENTRY.size * len(sections))
+    index = bytearray()
+    for tag, addr, data, size in sections:
+        index += _ENTRY.pack(tag, addr, offset, len(data), size)
+        offset = _align(offset + len(data))
+    body = bytearray(index)
+    body += bytes(_align(_HEADER.size + len(body)) - _HEADER.size - len(body))
+    for _, _, data, _ in sections:
+        body += data
+        body += bytes(_align(len(data)) - len(data))
+    header = _HEADER.pack(MAGIC, VERSION, _HEADER.size, device_id, device_mask, page_size, len(sections),
+                          _HEADER.size, hashlib.sha256(body).digest())
+    return header + bytes(body)
+
+
+def pack_files(filename: str, device_id: int, aprom_file: str = None, ldrom_file: str = None,
+               config_file: str = None, device_mask: int = None) -> int:
+    """
+    Build a package from image files (raw binary, or HEX/S-record by extension) and a config.json, and write it
+    to `filename`
+
+    #### Returns:
+        int: the size of the package in bytes
+
+    #### Raises:
+        NuPackageError, FirmwareFileError, OSError
+    """
+    images = []
+    for image_file in (aprom_file, ldrom_file):
+        if not image_file:
+            images.append(bytes())
+        elif format_from_filename(image_file) != "bin":
+            images.append(SparseImage.from_segments(load_segments(image_file)))
+        else:
+            with open(image_file, "rb") as f:
+                images.append(f.read())
+    config = None
+    if config_file:
+        config = ConfigFlags.from_json_file(config_file, device_id)
+        if config is None:
+            raise NuPackageError("Could not read config file %s" % config_file)
+    package = build_package(device_id, images[0], images[1], config, device_mask)
+    with open(filename, "wb") as f:
+        f.write(package)
+    return len(package)
+
+
+class NuPackage:
+    """
+    A loaded package
+    ------
+
+    Use NuPackage.open() for a file; the constructor takes any buffer (bytes, mmap). Nothing is copied: the images
+    are views into the buffer, so keep the package open while they are in use.
+
+    #### Attributes:
+        device_id (int), device_mask (int):
+            A chip matches if its device ID, masked, equals device_id, masked
+        page_size (int):
+            Page size the page hashes were computed with
+        aprom (SparseImage), ldrom (SparseImage):
+            The images, padded to their region size (empty if the package doesn't write the region)
+        config_bytes (bytes):
+            The config to program, or None
+    """
+
+    def __init__(self, buffer, name: str = "<package>"):
+        self.name = name
+        self._mmap = buffer if isinstance(buffer, mmap.mmap) else None
+        self._view = memoryview(buffer).cast("B")
+        if len(self._view) < _HEADER.size:
+            raise NuPackageError("%s: too short to be a package" % name)
+        magic, version, header_size, self.device_id, self.device_mask, self.page_size, count, index_offset, \
+            self._digest = _HEADER.unpack_from(self._view)
+        if magic != MAGIC:
+            raise NuPackageError("%s: not a package" % name)
+        if version != VERSION:
+            raise NuPackageError("%s: unsupported package version %d" % (name, version))
+        if index_offset + count * _ENTRY.size > len(self._view):
+            raise NuPackageError("%s: truncated index" % name)
+        self._header_size = header_size
+        self.entries: List[Tuple[bytes, int, int, int, int]] = [
+            _ENTRY.unpack_from(self._view, index_offset + i * _ENTRY.size) for i in range(count)]
+        regions: Dict[bytes, SparseImage] = {}
+        self._hashes: Dict[bytes, memoryview] = {}
+        self.config_bytes = None
+        for tag, addr, offset, length, size in self.entries:
+            if offset + length > len(self._view):
+                raise NuPackageError("%s: section %s runs past the end of the file" % (name, tag.decode(errors="replace")))
+            data = self._view[offset:offset + length]
+            if tag in _IMAGE_TAGS.values():
+                regions.setdefault(tag, SparseImage(size)).add(addr, data)
+            elif tag in _HASH_TAGS.values():
+                self._hashes[tag] = data
+            elif tag == _CONFIG_TAG:
+                self.config_bytes = bytes(data)
+        self.aprom = regions.get(_IMAGE_TAGS["aprom"], SparseImage())
+        self.ldrom = regions.get(_IMAGE_TAGS["ldrom"], SparseImage())
+
+    @classmethod
+    def open(cls, filename: str, verify=True) -> "NuPackage":
+        """
+        Map a package file; with `verify`, its integrity is checked right away (see verify())
+
+        #### Raises:
+            NuPackageError, OSError
+        """
+        with open(filename, "rb") as f:
+            try:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # an empty file can't be mapped
+                raise NuPackageError("%s: too short to be a package" % filename)
+        package = cls(buffer, filename)
+        if verify:
+            package.verify()
+        return package
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        return DeviceInfo(self.device_id & 0xFFFF, self.device_id >> 16)
+
+    def page_crcs(self, region: str) -> List[int]:
+        """
+        The stored CRC-32 of every page of the padded "aprom" or "ldrom" region
+        """
+        data = self._hashes.get(_HASH_TAGS[region])
+        if data is None:
+            return []
+        return list(struct.unpack("<%dI" % (len(data) // 4), data))
+
+    def verify(self):
+        """
+        Check the SHA-256 of the package; if it doesn't match, the page hashes tell which pages are damaged
+
+        #### Raises:
+            NuPackageError: if the package is corrupt
+        """
+        if hashlib.sha256(self._view[self._header_size:]).digest() == self._digest:
+            return
+        bad = []
+        for region, image in (("aprom", self.aprom), ("ldrom", self.ldrom)):
+            stored = self.page_crcs(region)
+            if stored:
+                actual = page_crcs(image.tobytes(), self.page_size)
+                bad += ["%s page %d" % (region.upper(), i) for i, (a, b) in enumerate(zip(stored, actual)) if a != b]
+        raise NuPackageError("%s: checksum mismatch, package is corrupt%s" % (
+            self.name, " (" + ", ".join(bad) + ")" if bad else ""))
+
+    def matches(self, device_info: DeviceInfo) -> bool:
+        return device_info.device_id & self.device_mask == self.device_id & self.device_mask
+
+    def check_device(self, device_info: DeviceInfo):
+        """
+        #### Raises:
+            NuPackageError: if the package isn't for this device
+        """
+        if not self.matches(device_info):
+            raise NuPackageError("%s is for device 0x%08X (%s), but the chip is 0x%08X (%s)" % (
+                self.name, self.device_id, self.device_info.chip_name, device_info.device_id, device_info.chip_name))
+
+    def get_config(self, device_id: int = None) -> ConfigFlags:
+        """
+        A fresh ConfigFlags for the package's config (programming may modify it), or None if it has none
+        """
+        if self.config_bytes is None:
+            return None
+        return ConfigFlags.from_bytes(self.config_bytes, self.device_id if device_id is None else device_id)
+
+    def describe(self) -> str:
+        lines = ["%s: device 0x%08X (%s), mask 0x%08X" % (self.name, self.device_id, self.device_info.chip_name,
+                                                         self.device_mask)]
+        for region, image in (("APROM", self.aprom), ("LDROM", self.ldrom)):
+            if len(image):
+                lines.append("  %s: %d bytes in %d segment(s), padded to %d bytes" % (
+                    region, image.populated, len(image.segments), len(image)))
+        if self.config_bytes is not None:
+            lines.append("  Config: %s" % self.config_bytes.hex())
+        return "\n".join(lines)
+
+    def close(self):
+        self.aprom = self.ldrom = SparseImage()
+        self._hashes = {}
+        self._view.release()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # an image is still in use elsewhere; the mapping goes away with it
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,331 @@
+"""
+nuvo51icpy station daemon
+
+Keeps libnuvo51icp loaded and the PGM (GPIO) interface initialized between boards, and takes jobs over a
+Unix socket. Each job only pays for chip-level ICP entry and exit.
+
+Protocol: newline-delimited JSON. The client sends one request object per line:
+
+    {"cmd": "status"}
+    {"cmd": "program", "aprom": <payload>, "ldrom": <payload>, "config": <config>, "verify": true}
+    {"cmd": "program", "package": "/path/to/job.nupkg", "verify": true}
+    {"cmd": "dump", "path": "/path/to/out.bin"}          (or no path to get the image back as base64)
+    {"cmd": "mass_erase"}
+    {"cmd": "ping"}
+    {"cmd": "shutdown"}
+
+A <payload> is either a file path string, {"path": "..."} or {"data": "<base64>"}. An "aprom" path to a HEX or
+S-record file (without an "ldrom") only programs the pages the file populates.
+A "package" (see nupkg.py) replaces "aprom", "ldrom" and "config"; it is opened and checked before the ICP is
+entered, and programmed only if it was built for the connected chip.
+A <config> is a config.json path string, {"path": "..."}, {"json": {...}} or {"bytes": [5 ints]}.
+Requests may also carry "retry" (bool, default true) to control ICP entry retries.
+
+Images, configs and packages are kept in a PreparedImageCache (see prepcache.py) between jobs, so a repeated job
+only stat()s its files. "ping" returns the cache statistics.
+
+The daemon answers with any number of {"event": "log", ...} and {"event": "progress", ...} lines, followed by
+exactly one {"event": "result", "ok": bool, ...} line.
+"""
+import base64
+import json
+import os
+import socket
+import socketserver
+import tempfile
+import threading
+
+try:
+    from .nuvo51icpy import Nuvo51ICP, NoDeviceException, UnsupportedDeviceException, PGMInitException
+    from ..config import ConfigFlags
+    from ..progress import ProgressReporter
+    from ..fileformats import FirmwareFileError, format_from_filename
+    from ..nupkg import NuPackageError
+    from ..prepcache import PreparedImageCache
+except ImportError:
+    from nuvo51icpy import Nuvo51ICP, NoDeviceException, UnsupportedDeviceException, PGMInitException
+    from config import ConfigFlags
+    from progress import ProgressReporter
+    from fileformats import FirmwareFileError, format_from_filename
+    from nupkg import NuPackageError
+    from prepcache import PreparedImageCache
+
+DEFAULT_SOCKET_PATH = os.path.join(tempfile.gettempdir(), "nuvo51icpy.sock")
+
+
+class DaemonError(Exception):
+    pass
+
+
+def _payload_source(spec):
+    """
+    A payload as a path or the decoded bytes, for PreparedImageCache.load(); None if there is none
+    """
+    if spec is None:
+        return None
+    if isinstance(spec, str):
+        return spec
+    if "data" in spec:
+        return base64.b64decode(spec["data"])
+    if "path" in spec:
+        return spec["path"]
+    raise DaemonError("Invalid payload: expected a path or base64 data")
+
+
+def _load_config(spec, device_id, cache: PreparedImageCache) -> bytes:
+    if spec is None:
+        return None
+    if isinstance(spec, str):
+        spec = {"path": spec}
+    if "bytes" in spec:
+        return ConfigFlags.from_bytes(bytes(spec["bytes"]), device_id).to_bytes()
+    if "json" in spec:
+        return ConfigFlags.from_json(spec["json"], device_id).to_bytes()
+    if "path" in spec:
+        config_bytes = cache.load_config(spec["path"], device_id)
+        if config_bytes is None:
+            raise DaemonError("Could not read config file %s" % spec["path"])
+        return config_bytes
+    raise DaemonError("Invalid config: expected a path, json or bytes")
+
+
+class _JobHandler(socketserver.StreamRequestHandler):
+    server: "ICPDaemon"
+
+    def _send(self, obj):
+        try:
+            self.wfile.write((json.dumps(obj) + "\n").encode())
+            self.wfile.flush()
+        except OSError:
+            # the client went away; finish the job anyway rather than leaving a board half-programmed
+            pass
+
+    def handle(self):
+        for line in self.rfile:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                request = json.loads(line)
+            except ValueError:
+                self._send({"event": "result", "ok": False, "error": "Invalid JSON request"})
+                continue
+            self._send(self.server.run_job(request, self._send))
+            if request.get("cmd") == "shutdown":
+                return
+
+
+class ICPDaemon(socketserver.UnixStreamServer):
+    """
+    Long-running ICP job server
+    ------
+
+    #### Keyword args:
+        socket_path: str:
+            Path of the Unix socket to listen on
+        library: ["pigpio"|"gpiod"|ICPLibInterface] (="gpiod"):
+            Passed through to Nuvo51ICP
+        silent: bool (=False):
+            If True, job logs are only sent to clients and not printed by the daemon
+        cache: PreparedImageCache (=PreparedImageCache()):
+            Cache for the images, configs and packages of jobs
+        realtime: int (=None):
+            Passed through to Nuvo51ICP; jobs run on the thread that serves them, which is the one that created the
+            daemon
+    """
+
+    def __init__(self, socket_path=DEFAULT_SOCKET_PATH, library="gpiod", silent=False, cache=None, realtime=None):
+        self.socket_path = socket_path
+        self.silent = silent
+        self.cache = cache or PreparedImageCache()
+        self._job_lock = threading.Lock()
+        self._emit = None
+        self.nuvo = Nuvo51ICP(silent=False, library=library, logfunc=self._log, realtime=realtime)
+        # claim the socket first, so a second daemon fails before it touches the pins the first one is driving
+        self._remove_stale_socket()
+        super().__init__(socket_path, _JobHandler)
+        try:
+            self.nuvo.init_pgm()
+        except BaseException:
+            self.server_close()
+            raise
+
+    def _remove_stale_socket(self):
+        if not os.path.exists(self.socket_path):
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.socket_path)
+        except OSError:
+            os.unlink(self.socket_path)
+            return
+        finally:
+            probe.close()
+        raise DaemonError("Another daemon is already listening on %s" % self.socket_path)
+
+    def _log(self, *args, **kwargs):
+        text = " ".join(str(arg) for arg in args)
+        if not self.silent:
+            print(text)
+        if self._emit:
+            self._emit({"event": "log", "text": text})
+
+    def server_close(self):
+        super().server_close()
+        self.nuvo.deinit_pgm()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    def run_job(self, request: dict, emit) -> dict:
+        """
+        Run a single job, serialized against all other clients
+
+        #### Returns:
+            dict: the result object sent back to the client
+        """
+        cmd = request.get("cmd")
+        with self._job_lock:
+            self._emit = emit
+            self.nuvo.progress = ProgressReporter(lambda event: emit(dict(event.to_dict(), event="progress")))
+            try:
+                if cmd == "ping":
+                    result = {"cache": self.cache.stats()}
+                elif cmd == "shutdown":
+                    threading.Thread(target=self.shutdown, daemon=True).start()
+                    result = {}
+                elif cmd in ("status", "program", "dump", "mass_erase"):
+                    result = self._run_chip_job(cmd, request)
+                else:
+                    raise DaemonError("Unknown command: %s" % cmd)
+                return dict(result, event="result", ok=result.get("ok", True))
+            except (DaemonError, NuPackageError, FirmwareFileError, NoDeviceException, UnsupportedDeviceException, PGMInitException, OSError) as e:
+                return {"event": "result", "ok": False, "error": str(e)}
+            except Exception as e:
+                return {"event": "result", "ok": False, "error": "%s: %s" % (type(e).__name__, e)}
+            finally:
+                self._emit = None
+
+    def _run_chip_job(self, cmd, request) -> dict:
+        nuvo = self.nuvo
+        package = None
+        if cmd == "program" and request.get("package"):
+            # a corrupt package fails the job without touching the chip
+            package = self.cache.open_package(request["package"])
+        nuvo.enter_icp(True, cmd != "mass_erase", request.get("retry", True))
+        try:
+            if cmd == "status":
+                return self._status()
+            elif cmd == "mass_erase":
+                return {"ok": nuvo.mass_erase()}
+            elif cmd == "dump":
+                return self._dump(request)
+            elif package is not None:
+                return {"ok": nuvo.program_package(package, request.get("verify", True))}
+            return self._program(request)
+        finally:
+            nuvo.exit_icp()
+
+    def _status(self) -> dict:
+        devinfo = self.nuvo.get_device_info()
+        config = self.nuvo.read_config()
+        return {
+            "device_id": devinfo.device_id,
+            "chip_name": devinfo.chip_name,
+            "cid": self.nuvo.get_cid(),
+            "config": list(config.to_bytes()),
+            "locked": self.nuvo.is_locked(),
+        }
+
+    def _dump(self, request) -> dict:
+        nuvo = self.nuvo
+        if nuvo._needs_unlock():
+            raise DaemonError("Chip is locked, cannot read flash")
+        config = nuvo.read_config()
+        path = request.get("path")
+        if path:
+            nuvo.dump_flash_to_file(path, request.get("format", "bin"))
+            config.to_json_file(path.rsplit(".", 1)[0] + "-config.json")
+            return {"path": path, "config": list(config.to_bytes())}
+        return {"data": base64.b64encode(nuvo.dump_flash()).decode(), "config": list(config.to_bytes())}
+
+    def _program(self, request) -> dict:
+        nuvo = self.nuvo
+        device_info = nuvo.get_device_info()
+        aprom = _payload_source(request.get("aprom"))
+        ldrom = _payload_source(request.get("ldrom"))
+        config_bytes = _load_config(request.get("config"), device_info.device_id, self.cache)
+        config = None if config_bytes is None else ConfigFlags.from_bytes(config_bytes, device_info.device_id)
+        verify = request.get("verify", True)
+        if isinstance(aprom, str) and format_from_filename(aprom) != "bin" and ldrom is None:
+            _, image = self.cache.load(aprom)
+            return {"ok": nuvo.program_segments(image, config, verify)}
+        if not aprom and not ldrom and config is None:
+            raise DaemonError("No data to program")
+        # same default as the CLI: only override the LDROM config when no config was given
+        ldrom_override = request.get("ldrom_override", config is None)
+        # an overridden LDROM size moves the region boundary, so the images can only be padded up front without one
+        pad_config_bytes = None
+        if not (ldrom and ldrom_override):
+            if config_bytes is not None:
+                pad_config_bytes = config_bytes
+            elif not nuvo._needs_unlock():
+                pad_config_bytes = nuvo.read_config().to_bytes()
+        prepared = self.cache.prepare(device_info, aprom, ldrom, config_bytes, pad_config_bytes)
+        ok = nuvo.program_all(prepared.aprom, prepared.ldrom, config=prepared.get_config(), verify=verify,
+                              ldrom_config_override=ldrom_override)
+        return {"ok": ok, "digests": prepared.digests, "checksums": prepared.checksums}
+
+
+class ICPDaemonClient:
+    """
+    Client for ICPDaemon
+    ------
+
+    #### Keyword args:
+        socket_path: str:
+            Path of the daemon's Unix socket
+    """
+
+    def __init__(self, socket_path=DEFAULT_SOCKET_PATH):
+        self.socket_path = socket_path
+
+    def request(self, cmd: str, on_event=None, **params) -> dict:
+        """
+        Send a job to the daemon and wait for its result
+
+        #### Args:
+            cmd (str):
+                The command ("status", "program", "dump", "mass_erase", "ping", "shutdown")
+            on_event (Callable[[dict], None]):
+                Called with every "log" and "progress" event while the job runs
+            **params:
+                Request parameters (see the module docstring)
+
+        #### Returns:
+            dict: the result object
+        """
+        request = dict(params, cmd=cmd)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(self.socket_path)
+            sock.sendall((json.dumps(request) + "\n").encode())
+            with sock.makefile("rb") as f:
+                for line in f:
+                    event = json.loads(line)
+                    if event.get("event") == "result":
+                        return event
+                    if on_event:
+                        on_event(event)
+        raise DaemonError("Daemon closed the connection without a result")
+
+
+def serve(socket_path=DEFAULT_SOCKET_PATH, library="gpiod", silent=False, realtime=None):
+    """
+    Run the daemon until interrupted or a "shutdown" job is received
+    """
+    with ICPDaemon(socket_path, library, silent, realtime=realtime) as server:
+        if not silent:
+            print("nuvo51icpy daemon listening on %s" % socket_path)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
@@ -112,6 +112,15 @@ class LibICP:
         self.lib.N51ICP_set_mass_erase_time.argtypes = [ctypes.c_uint32, ctypes.c_uint32]
         self.lib.N51ICP_set_mass_erase_time.restype = None
 
+        self.lib.N51ICP_set_realtime.argtypes = [ctypes.c_uint8, ctypes.c_int]
+        self.lib.N51ICP_set_realtime.restype = ctypes.c_int
+
+        self.lib.N51ICP_get_max_jitter.argtypes = []
+        self.lib.N51ICP_get_max_jitter.restype = ctypes.c_uint32
+
+        self.lib.N51ICP_reset_jitter.argtypes = []
+        self.lib.N51ICP_reset_jitter.restype = None
+
         # Wrapper functions
 
     def send_entry_bits(self) -> bool:
@@ -200,15 +209,25 @@ class LibICP:
         return True
 
     def set_program_time(self, delay_us: int, hold_us: int) -> bool:
-        self.lib.N51ICP_set_program_time(ctypes.c_uint32(time_us), ctypes.c_uint32(hold_us))
+        self.lib.N51ICP_set_program_time(ctypes.c_uint32(delay_us), ctypes.c_uint32(hold_us))
         return True
 
     def set_page_erase_time(self, delay_us: int, hold_us: int) -> bool:
-        self.lib.N51ICP_set_page_erase_time(ctypes.c_uint32(time_us), ctypes.c_uint32(hold_us))
+        self.lib.N51ICP_set_page_erase_time(ctypes.c_uint32(delay_us), ctypes.c_uint32(hold_us))
         return True
     
     def set_mass_erase_time(self, delay_us: int, hold_us: int) -> bool:
-        self.lib.N51ICP_set_mass_erase_time(ctypes.c_uint32(time_us), ctypes.c_uint32(hold_us))
+        self.lib.N51ICP_set_mass_erase_time(ctypes.c_uint32(delay_us), ctypes.c_uint32(hold_us))
+        return True
+
+    def set_realtime(self, enable: bool, cpu: int = -1) -> bool:
+        return self.lib.N51ICP_set_realtime(ctypes.c_uint8(1 if enable else 0), ctypes.c_int(cpu)) == 0
+
+    def get_max_jitter(self) -> int:
+        return int(self.lib.N51ICP_get_max_jitter())
+
+    def reset_jitter(self) -> bool:
+        self.lib.N51ICP_reset_jitter()
         return True
     
 
@@ -61,4 +61,13 @@ class ICPLibInterface:
         raise NotImplementedError("Not implemented!")
     
     def set_entry_time(self, delay_us: int, hold_us: int) -> bool:
-        raise NotImplementedError("Not implemented!")
\ No newline at end of file
+        raise NotImplementedError("Not implemented!")
+
+    def set_realtime(self, enable: bool, cpu: int = -1) -> bool:
+        raise NotImplementedError("Not implemented!")
+
+    def get_max_jitter(self) -> int:
+        raise NotImplementedError("Not implemented!")
+
+    def reset_jitter(self) -> bool:
+        raise NotImplementedError("Not implemented!")
@@ -5,7 +5,7 @@ import time
 import getopt
 import sys
 import os
-from typing import Union
+from typing import List, Tuple, Union
 
 # detect if we are on a raspberry pi
 def is_raspberry_pi():
@@ -21,26 +21,51 @@ def is_raspberry_pi():
 try:
     from ..config import DeviceInfo, ConfigFlags
     from ..config import *
-    if platform.system() == "Linux" and is_raspberry_pi():
-        from .lib.libnuvo51icp import LibICP
-    else:
-        LibICP = None
     from .libicp_iface import ICPLibInterface
+    from ..progress import ProgressReporter
+    from ..plan import PlanOp, ProgrammingPlan, ICPTransport, build_icp_plan, build_page_plan, erased_config
+    from ..pipeline import ImageLoader, dump_to_file
+    from ..fileformats import FORMATS, FirmwareFileError
+    from ..image import SparseImage
+    from ..nupkg import NuPackage, NuPackageError, is_package_file
+    from ..verify import VerifyResult, compare, repair
 except Exception as e:
     # Hack to allow running nuvo51icpy.py directly from the command line
     if __name__ == "__main__":
         # check if config.py exists in the parent directory
         if not os.path.isfile(os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "config.py")):
             raise e
-    if platform.system() == "Linux" and is_raspberry_pi():
-        from lib.libnuvo51icp import LibICP
-    else:
-        LibICP = None
     sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
     from config import DeviceInfo, ConfigFlags
     from config import *
     from libicp_iface import ICPLibInterface
-
+    from progress import ProgressReporter
+    from plan import PlanOp, ProgrammingPlan, ICPTransport, build_icp_plan, build_page_plan, erased_config
+    from pipeline import ImageLoader, dump_to_file
+    from fileformats import FORMATS, FirmwareFileError
+    from image import SparseImage
+    from nupkg import NuPackage, NuPackageError, is_package_file
+    from verify import VerifyResult, compare, repair
+
+
+def load_libicp():
+    """
+    Import the ctypes bindings for libnuvo51icp
+    ------
+
+    This is deferred until a Nuvo51ICP is constructed so that the CLI can parse its arguments (and print usage)
+    without probing the board model or loading the shared library.
+
+    #### Returns:
+        The LibICP class, or None if not running on a Raspberry Pi
+    """
+    if platform.system() != "Linux" or not is_raspberry_pi():
+        return None
+    try:
+        from .lib.libnuvo51icp import LibICP
+    except ImportError:
+        from lib.libnuvo51icp import LibICP
+    return LibICP
 
 
 def eprint(*args, **kwargs):
@@ -79,12 +104,22 @@ Returns:
 class Nuvo51ICP:
     can_write_locked_without_mass_erase = False
     can_mass_erase = True
+    # transfer size used for reads/writes when progress reporting is enabled
+    PROGRESS_CHUNK_SIZE = 1024
+    # passes of repair_pages() after a failed verify in program_all(); 0 to fail straight away
+    repair_retries = 2
+    # ranges less than this many bytes apart are fetched with one read in read_ranges(); setting up an ICP read
+    # (plus the ctypes call) costs about as much as clocking in this many bytes
+    READ_MERGE_GAP = 16
+    # in real-time mode, a page whose slowest byte took this many microseconds longer than its fastest one is read
+    # back after it is written (and repaired if it doesn't match)
+    jitter_budget_us = 50
 
     @property
     def can_write_ldrom(self):
         return True
 
-    def __init__(self, silent=False, library: Union[ICPLibInterface, str] = "gpiod", _enter_no_init=None, _deinit_reset_high=False, logfunc=None):
+    def __init__(self, silent=False, library: Union[ICPLibInterface, str] = "gpiod", _enter_no_init=None, _deinit_reset_high=False, logfunc=None, progress=None, realtime: int = None):
         """
         Nuvo51ICP constructor
         ------
@@ -98,10 +133,18 @@ class Nuvo51ICP:
                 If True, do not initialize the ICP module when entering a with statement
             _deinit_reset_high: _type_ (=True):
                 If True, set the reset pin high when deinitializing the ICP module and do not release the pin
+            progress: [str|Callable|ProgressRenderer] (=None):
+                Progress renderer ("tty", "json", "none") or a callback taking a ProgressEvent.
+                Defaults to "tty", or "none" if silent.
+            realtime: int (=None):
+                If set, run the ICP in real-time mode (Linux: locked memory, SCHED_FIFO) pinned to this CPU, or
+                unpinned if -1; pages written while the timing jitter is over `jitter_budget_us` are re-verified.
+                The mode applies to the thread that initializes the ICP, so program from that thread.
         """
         if library is None:
             library = "gpiod"
         if isinstance(library, str):
+            LibICP = load_libicp()
             if LibICP is None:
                 raise Exception("LibICP not available on this platform!")
             self.icp = LibICP(library)
@@ -110,10 +153,16 @@ class Nuvo51ICP:
         self._enter_no_init = _enter_no_init
         self.deinit_reset_high = _deinit_reset_high
         self.initialized = False
+        self.pgm_initialized = False
         self.silent = silent
         self.pad_data = True
         self.print_func = print if logfunc is None else logfunc
         self.print_err_func = eprint if logfunc is None else logfunc
+        self.progress = ProgressReporter(progress, silent)
+        self.realtime = realtime
+        # pages re-verified because of timing jitter
+        self.jitter_reverified = 0
+        self._checking_jitter = False
 
     def __enter__(self):
         """
@@ -134,7 +183,7 @@ class Nuvo51ICP:
         """
         Print a message if print progress is enabled
         """
-        if not self.silent:
+        if not self.silent and not self.progress.log(" ".join(str(arg) for arg in args)):
             self.print_func(*args, **kwargs)
 
     def print_err(self, *args, **kwargs):
@@ -205,12 +254,40 @@ class Nuvo51ICP:
         self.print_err("Retry failed!")
         return False
 
-    def init(self, do_reset_seq=True, check_device=True, retry=True):
+    def init_pgm(self):
         """
-        Initialize the ICP interface
+        Initialize the PGM (GPIO pin interface) without touching the chip
         ------
 
-        Must be called before any other ICP functions
+        This only needs to be done once per process; use enter_icp()/exit_icp() to switch between boards.
+
+        #### Raises:
+            PGMInitException
+                If the PGM (GPIO pin interface) module fails to initialize
+        """
+        if not self.pgm_initialized:
+            if not self.icp.init():
+                raise PGMInitException("ERROR: Could not initialize ICP.")
+            self.pgm_initialized = True
+            if self.realtime is not None and not self.icp.set_realtime(True, self.realtime):
+                self.print_err("WARNING: Could not fully enter real-time mode (needs root, or CAP_SYS_NICE and "
+                               "CAP_IPC_LOCK); jitter is still checked.")
+
+    def deinit_pgm(self):
+        """
+        Leave ICP mode (if needed) and release the PGM (GPIO pin interface)
+        """
+        self.exit_icp()
+        if self.pgm_initialized:
+            self.pgm_initialized = False
+            if self.realtime is not None:
+                self.icp.set_realtime(False)
+            self.icp.deinit(self.deinit_reset_high)
+
+    def enter_icp(self, do_reset_seq=True, check_device=True, retry=True):
+        """
+        Put the chip into ICP mode, initializing the PGM first if needed
+        ------
 
         #### Keyword args:
             do_reset_seq: bool (=True):
@@ -230,17 +307,15 @@ class Nuvo51ICP:
             **UnsupportedDeviceException**
                 If the detected device is not supported
         """
-        self.initialized = self.icp.init()
+        self.init_pgm()
         self.icp.entry(do_reset_seq)
-        if not self.initialized:
-            raise PGMInitException("ERROR: Could not initialize ICP.")
+        self.initialized = True
         if check_device:
             dev_info = self.get_device_info()
             cid = self.icp.read_cid()
             if dev_info.did == 0:
                 if not retry or not self.retry():
-                    self.icp.exit()
-                    self.icp.deinit(self.deinit_reset_high)
+                    self.exit_icp()
                     raise NoDeviceException(
                         "ERROR: No device detected, please check your connections!")
                 dev_info = self.get_device_info()
@@ -249,20 +324,57 @@ class Nuvo51ICP:
                 self.print_err("WARNING: Read Device ID of 0xFFFF and cid of 0xFF, device may be locked!")
                 self.print_err("Proceeding anyway...")
             elif dev_info.is_unsupported:
-                self.close()
+                self.exit_icp()
                 raise UnsupportedDeviceException(
                     "ERROR: Unsupported device detected: %08X (%s)!" % (dev_info.device_id, dev_info.chip_name))
 
+    def exit_icp(self):
+        """
+        Take the chip out of ICP mode, leaving the PGM initialized
+        """
+        if self.initialized:
+            self.initialized = False
+            self.icp.exit()
+
+    def init(self, do_reset_seq=True, check_device=True, retry=True):
+        """
+        Initialize the ICP interface
+        ------
+
+        Must be called before any other ICP functions
+
+        #### Keyword args:
+            do_reset_seq: bool (=True):
+                Whether to perform the reset sequence before entering ICP mode
+
+            check_device: bool (=True):
+                Whether to check that a device is connected/supported before continuing
+
+            retry: bool (=True):
+                Whether to retry if no device is found
+
+        #### Raises:
+            PGMInitException
+                If the PGM (GPIO pin interface) module fails to initialize
+            **NoDeviceException**
+                If no device is detected
+            **UnsupportedDeviceException**
+                If the detected device is not supported
+        """
+        self.init_pgm()
+        try:
+            self.enter_icp(do_reset_seq, check_device, retry)
+        except (NoDeviceException, UnsupportedDeviceException):
+            self.deinit_pgm()
+            raise
+
     def close(self):
         """
         Deinitialize the ICP interface
         ------
 
         """
-        if self.initialized:
-            self.initialized = False
-            self.icp.exit()
-            self.icp.deinit(self.deinit_reset_high)
+        self.deinit_pgm()
 
     def reinit(self, do_reset_seq=True, check_device=True):
         """
@@ -350,13 +462,137 @@ class Nuvo51ICP:
         self._fail_if_not_init()
         return self.icp.page_erase(addr)
 
-    def read_flash(self, addr, len) -> bytes:
+    def read_flash(self, addr, len, _phase="Reading flash") -> bytes:
         self._fail_if_not_init()
-        return self.icp.read_flash(addr, len)
+        if not self.progress.enabled or len <= self.PROGRESS_CHUNK_SIZE:
+            return self.icp.read_flash(addr, len)
+        if not self.progress.split_transfers:
+            self.progress.update(_phase, 0, len)
+            data = self.icp.read_flash(addr, len)
+            self.progress.update(_phase, len, len)
+            return data
+        data = bytearray()
+        for offset in range(0, len, self.PROGRESS_CHUNK_SIZE):
+            self.progress.update(_phase, offset, len)
+            data += self.icp.read_flash(addr + offset, min(self.PROGRESS_CHUNK_SIZE, len - offset))
+        self.progress.update(_phase, len, len)
+        return bytes(data)
+
+    def read_ranges(self, ranges: List[Tuple[int, int]], max_gap=None) -> List[memoryview]:
+        """
+        Read several (addr, length) ranges with as few ICP reads as possible
+        ------
+
+        The ranges are sorted, and ranges that overlap or are less than `max_gap` bytes apart are read with a single
+        N51ICP_read_flash() call, relying on the chip's address auto-increment. The results are views into one
+        buffer, so nothing is copied per range.
+
+        #### Args:
+            ranges (list[tuple[int, int]]):
+                (address, length) pairs, in any order
+            max_gap (int) (=READ_MERGE_GAP):
+                Largest gap between two ranges that is read through rather than skipped
+
+        #### Returns:
+            list[memoryview]:
+                The data of each range, in the order of `ranges`
+        """
+        self._fail_if_not_init()
+        if max_gap is None:
+            max_gap = self.READ_MERGE_GAP
+        # empty ranges don't need a read at all
+        order = sorted((i for i in range(len(ranges)) if ranges[i][1] > 0), key=lambda i: ranges[i][0])
+        # (start, end, [indices of the ranges it covers])
+        reads = []
+        for i in order:
+            addr, length = ranges[i]
+            if reads and addr <= reads[-1][1] + max_gap:
+                reads[-1][1] = max(reads[-1][1], addr + length)
+                reads[-1][2].append(i)
+            else:
+                reads.append([addr, addr + length, [i]])
+        buf = bytearray(sum(end - start for start, end, _ in reads))
+        view = memoryview(buf)
+        results = [view[0:0]] * len(ranges)
+        offset = 0
+        for start, end, members in reads:
+            view[offset:offset + end - start] = self.icp.read_flash(start, end - start)
+            for i in members:
+                addr, length = ranges[i]
+                results[i] = view[offset + addr - start:offset + addr - start + length]
+            offset += end - start
+        return results
+
+    def iter_flash(self, addr, length, chunk_size=PROGRESS_CHUNK_SIZE, _phase="Reading flash"):
+        """
+        Read flash in chunks, yielding each one as soon as it has been read (see pipeline.dump_to_file())
 
-    def write_flash(self, addr, data) -> bool:
+        #### Yields:
+            bytes:
+                Up to `chunk_size` bytes, in address order
+        """
+        self._fail_if_not_init()
+        for offset in range(0, length, chunk_size):
+            self.progress.update(_phase, offset, length)
+            yield self.icp.read_flash(addr + offset, min(chunk_size, length - offset))
+        self.progress.update(_phase, length, length)
+
+    def write_flash(self, addr, data, _phase="Writing flash") -> bool:
         self._fail_if_not_init()
-        return self.icp.write_flash(addr, data)
+        if isinstance(data, SparseImage):
+            if data.fill != 0xFF:
+                data = data.tobytes()
+            else:
+                # programming 0xFF leaves a flash byte as it is, so only the populated segments are written
+                return all(self.write_flash(addr + offset, segment, _phase) for offset, segment in data.segments)
+        if not self.progress.enabled or len(data) <= self.PROGRESS_CHUNK_SIZE:
+            return self._write_checked(addr, data)
+        total = len(data)
+        if not self.progress.split_transfers:
+            self.progress.update(_phase, 0, total)
+            result = self._write_checked(addr, data)
+            self.progress.update(_phase, total, total)
+            return result
+        for offset in range(0, total, self.PROGRESS_CHUNK_SIZE):
+            self.progress.update(_phase, offset, total)
+            if not self._write_checked(addr + offset, data[offset:offset + self.PROGRESS_CHUNK_SIZE]):
+                return False
+        self.progress.update(_phase, total, total)
+        return True
+
+    def _write_checked(self, addr, data) -> bool:
+        """
+        Write `data`; in real-time mode, one page at a time, reading back each page whose write went over the jitter budget
+        """
+        if self.realtime is None or self._checking_jitter:
+            return self.icp.write_flash(addr, data)
+        page_size = self.get_device_info().page_size
+        offset = 0
+        while offset < len(data):
+            end = min(len(data), offset + page_size - (addr + offset) % page_size)
+            self.icp.reset_jitter()
+            if not self.icp.write_flash(addr + offset, data[offset:end]):
+                return False
+            jitter = self.icp.get_max_jitter()
+            if jitter > self.jitter_budget_us and not self._reverify_page(addr + offset, data[offset:end], jitter):
+                return False
+            offset = end
+        return True
+
+    def _reverify_page(self, addr, data, jitter) -> bool:
+        self.jitter_reverified += 1
+        self.print_vb("Timing jitter of %dus while writing 0x%04X; verifying the page" % (jitter, addr))
+        # the repair writes go through write_flash() too; they don't need checking again
+        self._checking_jitter = True
+        try:
+            result = self.verify_flash(data, addr, False)
+            if not result:
+                result = self.repair_pages(data, addr, result)
+        finally:
+            self._checking_jitter = False
+        if not result:
+            self.print_err("ERROR: Page at 0x%04X could not be written (timing jitter of %dus)." % (addr, jitter))
+        return bool(result)
     
     def erase_sprom(self, addr) -> bool:
         self._fail_if_not_init()
@@ -383,7 +619,37 @@ class Nuvo51ICP:
             return False
         addr = device_info.sprom_addr + addr
         return self.write_flash(addr, data)
-    
+
+    def program_pages(self, pages: dict, verify=True) -> bool:
+        """
+        Erase and rewrite individual pages, leaving the rest of the flash untouched
+
+        #### Args:
+            pages (dict[int, bytes]):
+                Page address -> full page contents
+            verify (bool) (=True):
+                If True, each page is read back after writing
+
+        #### Returns:
+            bool:
+                True if all pages were written (and verified)
+        """
+        self._fail_if_not_init()
+        page_size = self.get_device_info().page_size
+        for addr in sorted(pages):
+            data = pages[addr]
+            if addr % page_size != 0 or len(data) > page_size:
+                self.print_err("ERROR: 0x%04X is not a page write." % addr)
+                return False
+            self.page_erase(addr)
+            if not self.write_flash(addr, data):
+                self.print_err("ERROR: Page write at 0x%04X failed." % addr)
+                return False
+            if verify and self.read_flash(addr, len(data)) != data:
+                self.print_err("ERROR: Page verify at 0x%04X failed." % addr)
+                return False
+        return True
+
     def is_locked(self):
         self._fail_if_not_init()
         return (self.get_cid() == 0xFF or self.read_config().is_locked())
@@ -393,60 +659,79 @@ class Nuvo51ICP:
         device_info = self.get_device_info()
         return self.read_flash(device_info.aprom_addr, device_info.flash_size)
 
-    def dump_flash_to_file(self, read_file:str) -> bool:
+    def dump_flash_to_file(self, read_file:str, fmt="bin") -> bool:
+        """
+        Dump the APROM to `read_file` (and the LDROM, if any, to `<name>-ldrom.bin`)
+
+        With the "hex" or "srec" format, the whole flash goes into `read_file` at its real addresses instead, and
+        erased records are left out. Each chunk is encoded and hashed on a worker thread while the next one is read
+        from the chip.
+        """
         self._fail_if_not_init()
-        try:
-            f = open(read_file, "wb")
-        except OSError as e:
-            self.print_err("Dump to %s failed: %s" % (read_file, e))
-            raise e
         self.print_vb("Reading flash...")
-        ext = read_file.split(".")[-1]
         config = self.read_config()
         device_info = self.get_device_info()
         ldrom_size = device_info.get_ldrom_size(config)
-        if ldrom_size > 0:
-            ldrom_addr = device_info.get_ldrom_addr(config)
-            ldrom_file = read_file.rsplit(".", 1)[0] + "-ldrom.bin"
-            lf = open(ldrom_file, "wb")
-            lf.write(self.read_flash(ldrom_addr, ldrom_size))
-            lf.close()
-        f.write(self.read_flash(device_info.aprom_addr, device_info.get_aprom_size(config)))
-        f.close()
+        if fmt != "bin":
+            dumps = [(read_file, device_info.aprom_addr, device_info.flash_size)]
+        else:
+            dumps = [(read_file, device_info.aprom_addr, device_info.get_aprom_size(config))]
+            if ldrom_size > 0:
+                dumps.insert(0, (read_file.rsplit(".", 1)[0] + "-ldrom.bin", device_info.get_ldrom_addr(config), ldrom_size))
+        for filename, addr, size in dumps:
+            try:
+                digest = dump_to_file(self.iter_flash(addr, size), filename, fmt=fmt, addr=addr)
+            except OSError as e:
+                self.print_err("Dump to %s failed: %s" % (filename, e))
+                raise e
+            self.print_vb("%s: %d bytes, SHA-256 %s" % (filename, size, digest))
         self.print_vb("Done.")
         return True
 
 
-    def verify_flash(self, data: bytes, start_address: int, report_unmatched_bytes=True) -> bool:
+    def verify_flash(self, data: bytes, start_address: int, report_unmatched_bytes=True) -> VerifyResult:
         """
         #### Args:
-            data (bytes): 
-                bytes to verify
+            data (bytes or SparseImage):
+                bytes to verify; the gaps of a SparseImage must read back as its fill byte
             start_address (int):
                 The start address to verify the data at
             report_unmatched_bytes (bool) (=False)):
-                If True, the number of unmatched bytes will be printed to stderr
+                If True, the mismatched bytes and pages will be printed to stderr
 
         #### Returns:
-            bool:
-                True if the data matches the flash, False otherwise
+            VerifyResult:
+                Truthy if the data matches the flash; otherwise it holds the mismatched ranges and pages
         """
         self._fail_if_not_init()
-        read_data = self.read_flash(start_address, len(data))
-        if read_data == None:
-            return False
-        if len(read_data) != len(data):
-            return False
-        result = True
-        byte_errors = 0
-        for i in range(len(data)):
-            if read_data[i] != data[i]:
-                if not report_unmatched_bytes:
-                    return False
-                result = False
-                byte_errors += 1
-        if not result:
-            self.print_err("Verification failed. %d byte errors." % byte_errors)
+        read_data = self.read_flash(start_address, len(data), "Verifying")
+        result = compare(data, read_data or bytes(), start_address, self.get_device_info().page_size)
+        if not result and report_unmatched_bytes:
+            self.print_err(result.describe())
+        return result
+
+    def repair_pages(self, data: bytes, start_address: int, result: VerifyResult, retries=None) -> VerifyResult:
+        """
+        Erase and rewrite only the pages that a failed verify_flash() found, then verify those pages again
+
+        #### Args:
+            data (bytes), start_address (int):
+                What was verified
+            result (VerifyResult):
+                The failed verify_flash() result
+            retries (int) (=self.repair_retries):
+                Maximum number of repair passes
+
+        #### Returns:
+            VerifyResult:
+                The result of the last verify; truthy if the repair succeeded
+        """
+        self._fail_if_not_init()
+        result = repair(result, data, start_address, self.get_device_info().page_size, self.icp.read_flash,
+                        lambda pages: self.program_pages(pages, verify=False),
+                        self.repair_retries if retries is None else retries, self.print_vb)
+        if result:
+            self.print_vb("Repair succeeded.")
         return result
 
     def check_rom_size(self, aprom_size, ldrom_size) -> bool:
@@ -464,10 +749,11 @@ class Nuvo51ICP:
         return True
 
     @staticmethod
-    def pad_rom(data: bytes, max_length: int) -> bytes:
-        if max_length - len(data) < 0:
-            return data
-        return data + bytes([0xFF] * (max_length - len(data)))
+    def pad_rom(data: bytes, max_length: int) -> SparseImage:
+        """
+        `data` padded to `max_length` with 0xFF; the padding is virtual, so nothing is copied
+        """
+        return SparseImage.wrap(data).padded(max_length)
 
     def erase_aprom_area(self, config: ConfigFlags) -> bool:
         self._fail_if_not_init()
@@ -475,8 +761,7 @@ class Nuvo51ICP:
             self.print_err("ERROR: No config provided.")
             return False
         dev_info = self.get_device_info()
-        aprom_size = dev_info.get_aprom_size(config)
-        for i in range(dev_info.aprom_addr,dev_info.aprom_addr + aprom_size, dev_info.page_size):
+        for i in dev_info.get_layout(config).aprom_pages:
             self.page_erase(i)
         return True
 
@@ -490,8 +775,7 @@ class Nuvo51ICP:
         if not ldrom_size:
             self.print_err("ERROR: LDROM size is 0 in config.")
             return False
-        ldrom_addr = dev_info.get_ldrom_addr(config)
-        for i in range(ldrom_addr, ldrom_addr + ldrom_size, dev_info.page_size):
+        for i in dev_info.get_layout(config).ldrom_pages:
             self.page_erase(i)
         return True
 
@@ -624,7 +908,7 @@ class Nuvo51ICP:
         if self.pad_data:
             aprom_data = self.pad_rom(aprom_data, device_info.get_aprom_size(config))
         self.print_vb("Programming APROM...")
-        if not self.write_flash(device_info.aprom_addr, aprom_data):
+        if not self.write_flash(device_info.aprom_addr, aprom_data, "Programming APROM"):
             self.print_err("Programming APROM Failed!")
             return False
         self.print_vb("APROM programmed.")
@@ -678,7 +962,7 @@ class Nuvo51ICP:
                     return False
             else:
                 self.erase_ldrom_area(config)
-        self.write_flash(start_addr, ldrom_data)
+        self.write_flash(start_addr, ldrom_data, "Programming LDROM")
         if verify:
             if not self.verify_flash(ldrom_data, start_addr):
                 self.print_vb("LDROM verification failed.")
@@ -696,123 +980,234 @@ class Nuvo51ICP:
             passed = self._aprom_config_precheck(aprom_data, config)
         return passed
 
-    def _try_mass_erase(self, _erase: bool):
-        if _erase:
-            if not self.mass_erase():
-                return False
-        else:
-            self.print_err("ERROR: Device is locked, cannot program.")
-            return False
-        self.print_vb("Flash erased.")
-        return True
+    def compile_plan(self, aprom_data, ldrom_data=bytes(), config: ConfigFlags = None, verify=True, ldrom_config_override=False, _erase=True) -> ProgrammingPlan:
+        """
+        Work out everything program_all() would do, without touching the flash
+
+        A full reflash uses a mass erase instead of page erases when that is faster, unless the SPROM holds data
+        (a mass erase would lose it).
 
-    def program_all(self, aprom_data, ldrom_data=bytes(), config: ConfigFlags = None, verify=True, ldrom_config_override=False, _erase=True) -> bool:
+        #### Returns:
+            ProgrammingPlan:
+                The plan, or None if the images or config can't be programmed
+        """
         self._fail_if_not_init()
         if not self.check_rom_size(len(aprom_data), len(ldrom_data)):
+            return None
+        device_info = self.get_device_info()
+        locked = self._needs_unlock()
+        if locked:
+            if not _erase:
+                self.print_err("ERROR: Device is locked, cannot program.")
+                return None
+            # the config reads back as all 0xFF after the mass erase
+            current_config = erased_config(device_info)
+        else:
+            current_config = self.read_config()
+        if not config:
+            # config will be set to the current values if it's not provided, so set override to True if we're
+            # starting from an erased chip
+            config = ConfigFlags.from_bytes(current_config.to_bytes(), device_info.device_id)
+            ldrom_config_override = ldrom_config_override or locked
+        if not self._run_prechecks(aprom_data, ldrom_data, config, ldrom_config_override):
+            return None
+        allow_mass_erase = _erase and self.can_mass_erase and len(aprom_data) > 0 and not self._sprom_in_use()
+        return build_icp_plan(device_info, current_config, config, aprom_data, ldrom_data, locked, verify, self.pad_data,
+                              allow_mass_erase=allow_mass_erase)
+
+    def _sprom_in_use(self) -> bool:
+        device_info = self.get_device_info()
+        if device_info.sprom_len == 0:
             return False
-        # if we don't have a config and the device isn't locked, get the current config
-        if not config and not self._needs_unlock():
-            config = self.read_config()
-        if config:
-            if not self._run_prechecks(aprom_data, ldrom_data, config, ldrom_config_override):
-                return False
+        return self.read_sprom(0, device_info.sprom_len).count(0xFF) != device_info.sprom_len
 
-        did_mass_erase = False
-        if self._needs_unlock():
-            if not self._try_mass_erase(_erase):
+    def _run_plan_op(self, op: PlanOp) -> bool:
+        if op.kind == PlanOp.MASS_ERASE:
+            if not self.mass_erase():
                 return False
-            # don't need to erase anything if we did a mass erase
-            _erase = False
-            did_mass_erase = True
-        if not config:
-            config = self.read_config()
-            # config will be set to the default values if it's not provided, so set override to True
-            ldrom_config_override = True
-            if not self._run_prechecks(aprom_data, ldrom_data, config, ldrom_config_override):
+            self.print_vb("Flash erased.")
+        elif op.kind == PlanOp.PAGE_ERASE:
+            for page in op.pages:
+                self.page_erase(page)
+        elif op.kind == PlanOp.WRITE:
+            self.print_vb("Programming {} ({} KB)...".format(op.region, len(op.data) // 1024))
+            if not self.write_flash(op.addr, op.data, "Programming " + op.region):
+                self.print_err("Programming %s Failed!" % op.region)
                 return False
-        device_info = self.get_device_info()
-        ldrom_addr = device_info.get_ldrom_addr(config)
-        if len(aprom_data) > 0:
-            if self.pad_data:
-                aprom_data = self.pad_rom(aprom_data, device_info.get_aprom_size(config))
-            if _erase:
-                self.erase_aprom_area(config)
-            self.print_vb("Programming APROM ({} KB)...".format(len(aprom_data) // 1024))
-            self.write_flash(device_info.aprom_addr, aprom_data)
-        if len(ldrom_data) > 0:
-            if self.pad_data:
-                ldrom_data = self.pad_rom(ldrom_data, device_info.get_ldrom_size(config))
-            if _erase:
-                self.erase_ldrom_area(config)
-            self.print_vb("Programming LDROM ({} KB)...".format(len(ldrom_data) // 1024))
-            self.write_flash(ldrom_addr, ldrom_data)
-        if str(config) != str(self.read_config()):
-            self.program_config(config, (not did_mass_erase))
-
-        if verify:
-            if len(aprom_data) > 0 or len(ldrom_data) > 0:
-                if len(aprom_data) > 0 and not (self.verify_flash(aprom_data, device_info.aprom_addr)):
-                    self.print_vb("APROM Verification failed.")
-                    return False
-                if len(ldrom_data) > 0 and not (self.verify_flash(ldrom_data, ldrom_addr)):
-                    self.print_vb("LDROM Verification failed.")
-                    return False
-                self.print_vb("ROM data verified.")
-            # check that the config was really written
-            # self.reenter_icp()
+        elif op.kind == PlanOp.CONFIG:
+            return self.program_config(op.config, op.erase)
+        elif op.region == "CONFIG":
             new_config = self.read_config()
-            if str(new_config) != str(config):
+            if str(new_config) != str(op.config):
                 self.print_err("Config verification failed.")
                 if not self.silent:
                     self.print_vb("Expected:")
-                    config.print_config()
+                    op.config.print_config()
                     self.print_vb("Got:")
                     new_config.print_config()
                 return False
             self.print_vb("Config verified.")
-            self.print_vb("Verification succeeded.")
+        else:
+            result = self.verify_flash(op.data, op.addr)
+            if not result:
+                result = self.repair_pages(op.data, op.addr, result)
+            if not result:
+                self.print_vb("%s Verification failed." % op.region)
+                return False
+            self.print_vb("%s data verified." % op.region)
+        return True
 
+    def program_all(self, aprom_data, ldrom_data=bytes(), config: ConfigFlags = None, verify=True, ldrom_config_override=False, _erase=True, before_config=None) -> bool:
+        plan = self.compile_plan(aprom_data, ldrom_data, config, verify, ldrom_config_override, _erase)
+        if plan is None:
+            return False
+        self.print_vb("Erase strategy: " + plan.erase_strategy)
+        if not plan.run(self, before_config):
+            return False
+        if verify:
+            self.print_vb("Verification succeeded.")
             self.print_vb("\nResulting Device info:")
             devinfo = self.get_device_info()
             self.print_vb(devinfo)
             self.print_vb()
             if not self.silent:
-                config.print_config()
+                plan.config.print_config()
+        self.print_vb("Finished programming!\n")
+        return True
+
+    def compile_segment_plan(self, segments, config: ConfigFlags = None, verify=True) -> ProgrammingPlan:
+        """
+        Work out what program_segments() would do, without touching the flash
+
+        #### Returns:
+            ProgrammingPlan:
+                The plan, or None if the image can't be programmed page by page
+        """
+        self._fail_if_not_init()
+        if self._needs_unlock():
+            self.print_err("ERROR: Device is locked; program a full image with program_all() instead.")
+            return None
+        device_info = self.get_device_info()
+        current_config = self.read_config()
+        config = config or current_config
+        image = segments if isinstance(segments, SparseImage) else SparseImage.from_segments(segments)
+        pages = image.pages(device_info.page_size)
+        try:
+            return build_page_plan(device_info, device_info.get_layout(config), pages, config, current_config, verify,
+                                   ICPTransport())
+        except ValueError as e:
+            self.print_err("ERROR: %s" % e)
+            return None
+
+    def program_segments(self, segments, config: ConfigFlags = None, verify=True) -> bool:
+        """
+        Program a segment map (e.g. from a HEX file), erasing and writing only the pages it populates
+        ------
+
+        The rest of each populated page is filled with 0xFF; every other page keeps its contents.
+
+        #### Args:
+            segments (SparseImage or list[tuple[int, bytes]]):
+                The image, or (address, data) segments as returned by fileformats.load_segments()
+            config (ConfigFlags):
+                Config to write, if different from the chip's (default: leave the config alone)
+            verify (bool):
+                Read back the written pages
+
+        #### Returns:
+            bool:
+                True if the pages were written (and verified)
+        """
+        plan = self.compile_segment_plan(segments, config, verify)
+        if plan is None:
+            return False
+        self.print_vb("Erase strategy: " + plan.erase_strategy)
+        if not plan.run(self):
+            return False
         self.print_vb("Finished programming!\n")
         return True
 
-    def program_all_files(self, write_file:str="", ldrom_file:str="", config_file: str = "", ldrom_override=True) -> bool:
+    def program_package(self, package: NuPackage, verify=True, dry_run=False) -> bool:
+        """
+        Program a .nupkg package (see nupkg.py) with program_all(), once it has been checked against the chip
+        ------
+
+        The package's integrity is checked when it is opened; this checks that it was built for the connected
+        device before anything is erased.
+
+        #### Returns:
+            bool:
+                True if the package was programmed (or, with `dry_run`, its plan printed)
+        """
+        self._fail_if_not_init()
+        device_info = self.get_device_info()
+        try:
+            package.check_device(device_info)
+        except NuPackageError as e:
+            self.print_err("ERROR: %s" % e)
+            return False
+        config = package.get_config(device_info.device_id)
+        if dry_run:
+            plan = self.compile_plan(package.aprom, package.ldrom, config, verify, ldrom_config_override=config is None)
+            if plan is None:
+                return False
+            print(plan.describe())
+            return True
+        return self.program_all(package.aprom, package.ldrom, config=config, verify=verify,
+                                ldrom_config_override=config is None)
+
+    def program_all_files(self, write_file:str="", ldrom_file:str="", config_file: str = "", ldrom_override=True, dry_run=False) -> bool:
         self._fail_if_not_init()
-        wf = None
-        lf = None
         if not write_file and not ldrom_file and not config_file:
             self.print_err("ERROR: No data to program.")
             return False
-        if write_file != "":
-            try:
-                wf = open(write_file, "rb")
-            except OSError as e:
-                self.print_err("Could not open %s for reading." % write_file)
-                raise e
-        if ldrom_file != "":
-            try:
-                lf = open(ldrom_file, "rb")
-            except OSError as e:
-                self.print_err("Could not open %s for reading." % ldrom_file)
-                raise e
+        # the files are read on a worker thread while the device ID is read
+        loader = ImageLoader(write_file, ldrom_file, config_file)
+        device_id = self.get_device_id() if config_file else None
+        try:
+            images = loader.result()
+        except OSError as e:
+            self.print_err("Could not open %s for reading." % e.filename)
+            raise e
+        except FirmwareFileError as e:
+            self.print_err("ERROR: %s" % e)
+            return False
+        except ValueError:
+            self.print_err("ERROR: Could not read config file.")
+            return False
         config = None
         if config_file != "":
-            config = ConfigFlags.from_json_file(config_file, self.get_device_id())
+            try:
+                config = ConfigFlags.from_json(images.config_json, device_id)
+            except Exception:
+                config = None
             if not config:
                 self.print_err("ERROR: Could not read config file.")
                 return False
-
-        aprom_data = bytes()
-        ldrom_data = bytes()
-        if wf:
-            aprom_data = wf.read()
-        if lf:
-            ldrom_data = lf.read()
+        for filename, digest in images.digests.items():
+            self.print_vb("%s: SHA-256 %s" % (filename, digest))
+
+        if images.aprom_segments is not None and not ldrom_file:
+            # only the pages the file populates are programmed
+            if dry_run:
+                plan = self.compile_segment_plan(images.aprom_segments, config)
+                if plan is None:
+                    return False
+                print(plan.describe())
+                return True
+            return self.program_segments(images.aprom_segments, config)
+        if images.aprom_segments is not None:
+            images.aprom = SparseImage.from_segments(images.aprom_segments)
+        if images.ldrom_segments is not None:
+            images.ldrom = SparseImage.from_segments(images.ldrom_segments)
+        aprom_data = images.aprom or bytes()
+        ldrom_data = images.ldrom or bytes()
+        if dry_run:
+            plan = self.compile_plan(aprom_data, ldrom_data, config=config, ldrom_config_override=ldrom_override)
+            if plan is None:
+                return False
+            print(plan.describe())
+            return True
         return self.program_all(aprom_data, ldrom_data, config=config, ldrom_config_override=ldrom_override)
 
 
@@ -825,14 +1220,28 @@ def print_usage():
     print("\t-u, --status:                     print the connected device info and configuration and exit")
     print("* Read Commands:")
     print("\t-r, --read=<filename>             read entire flash to file")
+    print("\t    --format=<bin|hex|srec>       file format for --read (default: bin); hex and srec hold the whole flash")
+    print("\t                                        and leave out erased records")
     print("* Write Commands (can be used in combination or seperately):")
-    print("\t-w, --write=<filename>            write file to APROM")
+    print("\t-w, --write=<filename>            write file to APROM; a .hex/.ihx/.srec file is written at its own")
+    print("\t                                        addresses, erasing only the pages it populates;")
+    print("\t                                        a .nupkg package (see 'python -m nuvoprogpy pack') programs the whole job")
     print("\t-l, --ldrom=<filename>            write file to LDROM")
     print("\t-e, --mass-erase                  mass erase the chip")
     print("\t-c, --config <filename>           write configuration bytes with the settings in the specified config.json file")
     print("\t                                        * look at 'config-example.json' for the format")
     print("Options:")
     print("\t-s, --silent                      silence all output except for errors")
+    print("\t    --progress=<tty|json|none>    progress output format (default: tty)")
+    print("\t    --dry-run                     print the programming plan and estimated duration without writing")
+    print("\t    --realtime=<cpu|any>          run the ICP in real-time mode (SCHED_FIFO, locked memory) pinned to <cpu>")
+    print("\t                                        (ideally one isolated with isolcpus=); pages written while the")
+    print("\t                                        timing jitter is too high are verified and repaired")
+    print("Station daemon:")
+    print("\t    --daemon                      keep the ICP interface initialized and serve jobs on a unix socket")
+    print("\t    --socket=<path>               socket for --daemon; with other commands, run them through the daemon")
+    print("Production:")
+    print("\t    --batch=<manifest.json>       program boards continuously as they are inserted (see nuvoprogpy/batch.py)")
     print("Pinout:\n")
     print("                           40-pin header J8")
     print(" connect 3.3V of MCU ->    3V3  (1) (2)  5V")
@@ -852,10 +1261,68 @@ def exit_with_code(message, num, usage=True):
         print_usage()
     return num
 
+def run_daemon_client(socket_path, status_cmd, read_file, write_file, ldrom_file, config_file, mass_erase_cmd, silent, progress, fmt="bin") -> int:
+    """
+    Run the requested commands on a running `--daemon` instead of driving the GPIO from this process
+    """
+    try:
+        from .daemon import ICPDaemonClient
+        from ..progress import ProgressEvent, get_renderer
+    except ImportError:
+        from daemon import ICPDaemonClient
+        from progress import ProgressEvent, get_renderer
+    client = ICPDaemonClient(socket_path)
+    renderer = get_renderer(progress, silent)
+
+    def on_event(event):
+        if event["event"] == "log":
+            if not silent:
+                print(event["text"])
+        elif event["event"] == "progress":
+            pev = ProgressEvent(event["phase"], event["done"], event["total"], event["elapsed"])
+            if pev.finished:
+                renderer.finish(pev)
+            else:
+                renderer.render(pev)
+
+    jobs = []
+    if status_cmd:
+        jobs.append(("status", {}))
+    elif read_file:
+        jobs.append(("dump", {"path": os.path.abspath(read_file), "format": fmt}))
+    else:
+        if mass_erase_cmd:
+            jobs.append(("mass_erase", {}))
+        if write_file or ldrom_file or config_file:
+            job = {}
+            if is_package_file(write_file):
+                job["package"] = os.path.abspath(write_file)
+            elif write_file:
+                job["aprom"] = os.path.abspath(write_file)
+            if ldrom_file:
+                job["ldrom"] = os.path.abspath(ldrom_file)
+            if config_file:
+                job["config"] = os.path.abspath(config_file)
+            jobs.append(("program", job))
+    try:
+        for cmd, params in jobs:
+            result = client.request(cmd, on_event, **params)
+            if not result["ok"]:
+                return exit_with_code(result.get("error", "%s failed!!" % cmd), 1, False)
+            if cmd == "status":
+                print("Device ID: 0x{:08X} ({})".format(result["device_id"], result["chip_name"]))
+                ConfigFlags.from_bytes(bytes(result["config"]), result["device_id"]).print_config()
+    except OSError as e:
+        return exit_with_code("ERROR: Could not talk to daemon on %s: %s" % (socket_path, e), 2, False)
+    return 0
+
+
 def main() -> int:
     argv = sys.argv[1:]
     try:
-        opts, _ = getopt.getopt(argv, "hur:w:l:seb:c:")
+        opts, _ = getopt.getopt(argv, "hur:w:l:seb:c:", [
+                                "help", "status", "read=", "write=", "ldrom=", "silent", "mass-erase", "config=", "progress=",
+                                "daemon", "socket=", "batch=", "dry-run", "format=", "realtime="])
     except getopt.GetoptError:
         return exit_with_code("Invalid command line arguments. Please refer to the usage documentation.", 2)
 
@@ -868,6 +1335,13 @@ def main() -> int:
     ldrom_file = ""
     config_file = ""
     silent = False
+    progress = None
+    daemon_cmd = False
+    socket_path = None
+    batch_file = None
+    dry_run = False
+    fmt = "bin"
+    realtime = None
     main_cmds = 0
     if len(opts) == 0:
         print_usage()
@@ -894,9 +1368,52 @@ def main() -> int:
             config_file = arg
         elif opt == "-s" or opt == "--silent":
             silent = True
+        elif opt == "--progress":
+            progress = arg.strip()
+            if progress not in ("tty", "json", "none"):
+                return exit_with_code("ERROR: Invalid progress format: %s\n\n" % progress, 2)
+        elif opt == "--format":
+            fmt = arg.strip()
+            if fmt not in FORMATS:
+                return exit_with_code("ERROR: Invalid file format: %s\n\n" % fmt, 2)
+        elif opt == "--daemon":
+            daemon_cmd = True
+        elif opt == "--socket":
+            socket_path = arg.strip()
+        elif opt == "--batch":
+            batch_file = arg.strip()
+        elif opt == "--dry-run":
+            dry_run = True
+        elif opt == "--realtime":
+            arg = arg.strip()
+            if arg == "any":
+                realtime = -1
+            elif arg.isdigit():
+                realtime = int(arg)
+            else:
+                return exit_with_code("ERROR: Invalid CPU for --realtime: %s\n\n" % arg, 2)
         else:
             print_usage()
             return 2
+    if daemon_cmd:
+        if main_cmds or write_file or ldrom_file or mass_erase_cmd or config_file:
+            return exit_with_code("ERROR: --daemon cannot be combined with other commands.\n\n", 2)
+        try:
+            from .daemon import serve, DEFAULT_SOCKET_PATH
+        except ImportError:
+            from daemon import serve, DEFAULT_SOCKET_PATH
+        serve(socket_path or DEFAULT_SOCKET_PATH, silent=silent, realtime=realtime)
+        return 0
+    if batch_file:
+        if main_cmds or write_file or ldrom_file or mass_erase_cmd or config_file:
+            return exit_with_code("ERROR: --batch cannot be combined with other commands.\n\n", 2)
+        try:
+            from ..batch import BatchManifest, BatchRunner, ICPStation
+        except ImportError:
+            from batch import BatchManifest, BatchRunner, ICPStation
+        manifest = BatchManifest.from_file(batch_file)
+        station = ICPStation(Nuvo51ICP(silent=silent, progress=progress, realtime=realtime), manifest.poll_interval)
+        return 0 if BatchRunner(manifest, station, silent).run() else 1
     is_writing = False
     if aprom_cmd or ldrom_file or mass_erase_cmd or config_file:
         is_writing = True
@@ -918,55 +1435,81 @@ def main() -> int:
                 elif not os.access(filename, os.R_OK):
                     return exit_with_code("ERROR: %s is not readable.\n\n" % filename, 2)
 
-    with Nuvo51ICP(silent=silent) as nuvo:
-        devinfo = nuvo.get_device_info()
-        did_mass_erase = False
-        if devinfo.is_unsupported:
-            if is_writing and nuvo._needs_unlock():
-                print("Device not found, chip may be locked, Do you want to attempt a mass erase? (y/N)")
-                if input() == "y" or input() == "Y":
-                    if not nuvo.mass_erase():
-                        return exit_with_code("Mass erase failed! Exiting...", 2, False)
-                    did_mass_erase = True
-                    devinfo = nuvo.get_device_info()
-                    eprint(devinfo)
-                else:
-                    return exit_with_code("Device not found! Exiting...", 2, False)
-                if devinfo.is_unsupported:
-                    return exit_with_code("ERROR: Unsupported device ID: 0x%04X (mass erase failed!)\n\n" % devinfo.device_id, 2, False)
-            else:
-                if devinfo.device_id == 0:
-                    return exit_with_code("ERROR: Device not found, please check your connections.\n\n", 2, False)
-                return exit_with_code("ERROR: Unsupported device ID: 0x%04X (chip may be locked)\n\n" % devinfo.device_id, 2, False)
-        if not did_mass_erase and mass_erase_cmd:
-            if not nuvo.mass_erase():
-                return exit_with_code("Mass erase failed! Exiting...", 2, False)
+    if is_package_file(write_file) and (ldrom_file or config_file):
+        return exit_with_code("ERROR: a package already holds the LDROM and config; -l and -c cannot be used with it.\n\n", 2)
+    if dry_run and (mass_erase_cmd or not (write_file or ldrom_file or config_file)):
+        return exit_with_code("ERROR: --dry-run only applies to --write, --ldrom and --config.\n\n", 2)
+    if socket_path:
+        if dry_run:
+            return exit_with_code("ERROR: --dry-run cannot be used with --socket.\n\n", 2)
+        if realtime is not None:
+            return exit_with_code("ERROR: --realtime cannot be used with --socket.\n\n", 2)
+        return run_daemon_client(socket_path, status_cmd, read_file, write_file, ldrom_file, config_file,
+                                 mass_erase_cmd, silent, progress, fmt)
+
+    package = None
+    if is_package_file(write_file):
+        # integrity problems show up before the ICP is even entered
+        try:
+            package = NuPackage.open(write_file)
+        except NuPackageError as e:
+            return exit_with_code("ERROR: %s\n\n" % e, 2, False)
+    try:
+        with Nuvo51ICP(silent=silent, progress=progress, realtime=realtime) as nuvo:
             devinfo = nuvo.get_device_info()
-            eprint(devinfo)
-            print("Mass erase successful.")
-        # process commands
-        if status_cmd:
-            print(devinfo)
-            cfg = nuvo.read_config()
-            if not cfg:
-                return exit_with_code("Config read failed!!", 1, False)
-            cfg.print_config()
+            did_mass_erase = False
+            if devinfo.is_unsupported:
+                if is_writing and nuvo._needs_unlock():
+                    print("Device not found, chip may be locked, Do you want to attempt a mass erase? (y/N)")
+                    if input() == "y" or input() == "Y":
+                        if not nuvo.mass_erase():
+                            return exit_with_code("Mass erase failed! Exiting...", 2, False)
+                        did_mass_erase = True
+                        devinfo = nuvo.get_device_info()
+                        eprint(devinfo)
+                    else:
+                        return exit_with_code("Device not found! Exiting...", 2, False)
+                    if devinfo.is_unsupported:
+                        return exit_with_code("ERROR: Unsupported device ID: 0x%04X (mass erase failed!)\n\n" % devinfo.device_id, 2, False)
+                else:
+                    if devinfo.device_id == 0:
+                        return exit_with_code("ERROR: Device not found, please check your connections.\n\n", 2, False)
+                    return exit_with_code("ERROR: Unsupported device ID: 0x%04X (chip may be locked)\n\n" % devinfo.device_id, 2, False)
+            if not did_mass_erase and mass_erase_cmd:
+                if not nuvo.mass_erase():
+                    return exit_with_code("Mass erase failed! Exiting...", 2, False)
+                devinfo = nuvo.get_device_info()
+                eprint(devinfo)
+                print("Mass erase successful.")
+            # process commands
+            if status_cmd:
+                print(devinfo)
+                cfg = nuvo.read_config()
+                if not cfg:
+                    return exit_with_code("Config read failed!!", 1, False)
+                cfg.print_config()
+                return 0
+            elif read_cmd:
+                print(devinfo)
+                cfg = nuvo.read_config()
+                cfg.print_config()
+                print()
+                if nuvo._needs_unlock():
+                    return exit_with_code("Error: Chip is locked, cannot read flash", 1, False)
+                nuvo.dump_flash_to_file(read_file, fmt)
+                # remove extension from read_file
+                config_file = read_file.rsplit(".", 1)[0] + "-config.json"
+                cfg.to_json_file(config_file)
+            elif package is not None:
+                if not nuvo.program_package(package, dry_run=dry_run):
+                    return exit_with_code("Programming failed!!", 1, False)
+            elif ldrom_file or write_file or config_file:
+                if not nuvo.program_all_files(write_file, ldrom_file, config_file, not(config_file != ""), dry_run):
+                    return exit_with_code("Programming failed!!", 1, False)
             return 0
-        elif read_cmd:
-            print(devinfo)
-            cfg = nuvo.read_config()
-            cfg.print_config()
-            print()
-            if nuvo._needs_unlock():
-                return exit_with_code("Error: Chip is locked, cannot read flash", 1, False)
-            nuvo.dump_flash_to_file(read_file)
-            # remove extension from read_file
-            config_file = read_file.rsplit(".", 1)[0] + "-config.json"
-            cfg.to_json_file(config_file)
-        elif ldrom_file or write_file or config_file:
-            if not nuvo.program_all_files(write_file, ldrom_file, config_file, not(config_file != "")):
-                return exit_with_code("Programming failed!!", 1, False)
-        return 0
+    finally:
+        if package is not None:
+            package.close()
 
 
 try:
@@ -32,15 +32,25 @@ import getopt
 import os
 import platform
 import sys
-import serial
 import time
 import math
 
-from zmq import device
+# pyserial is imported on first use (see _load_serial), so that "--help" and library users
+# that never open a port don't pay for it
+serial = None
 
 try:
     from ..nuvoprog import NuvoProg
     from ..config import ConfigFlags, DeviceInfo
+    from ..progress import ProgressReporter
+    from ..plan import PlanOp, ProgrammingPlan, ISPTransport, build_isp_plan, build_isp_region_plan, build_page_plan
+    from .rle import pages_spanned, rle_packets
+    from ..pipeline import ImageLoader, dump_to_file
+    from ..fileformats import FORMATS, FirmwareFileError, format_from_filename, load_segments
+    from ..image import SparseImage
+    from ..imagetools import checksum16
+    from ..nupkg import NuPackage, NuPackageError, is_package_file
+    from ..verify import VerifyResult, compare, repair
 except Exception as e:
     # Hack to allow running nuvoicpy.py directly from the command line
     if __name__ == "__main__":
@@ -51,6 +61,15 @@ except Exception as e:
         os.path.dirname(os.path.realpath(__file__)), ".."))
     from config import *
     from nuvoprog import NuvoProg
+    from progress import ProgressReporter
+    from plan import PlanOp, ProgrammingPlan, ISPTransport, build_isp_plan, build_isp_region_plan, build_page_plan
+    from rle import pages_spanned, rle_packets
+    from pipeline import ImageLoader, dump_to_file
+    from fileformats import FORMATS, FirmwareFileError, format_from_filename, load_segments
+    from image import SparseImage
+    from imagetools import checksum16
+    from nupkg import NuPackage, NuPackageError, is_package_file
+    from verify import VerifyResult, compare, repair
 
 # Standard commands
 CMD_UPDATE_APROM      =  0xa0
@@ -77,6 +96,18 @@ CMD_GET_UCID          =  0xb4 # non-official
 CMD_GET_BANDGAP       =  0xb5 # non-official
 CMD_ISP_PAGE_ERASE    =  0xD5 # non-official
 CMD_GET_PID           =  0xeb # non-official
+CMD_STREAM_READ       =  0xa7 # non-official
+CMD_UPDATE_RLE        =  0xa8 # non-official, see rle.py
+CMD_GET_CAPS          =  0xb6 # non-official
+
+# Capability flags returned by CMD_GET_CAPS (see isp_common.h)
+CAP_LAZY_ERASE        =  0x01 # CMD_UPDATE_APROM erases each page just before writing it, skipping blank pages
+CAP_STREAM_READ       =  0x02 # CMD_STREAM_READ is supported
+CAP_RLE_UPDATE        =  0x04 # CMD_UPDATE_RLE is supported
+CAP_PIPELINED         =  0x08 # update packets are acknowledged before they are written, and reads are prefetched
+
+# CMD_UPDATE_RLE flags (byte 2 of the first packet's address field)
+RLE_FLAG_MASS_ERASE   =  0x01 # mass erase first, like CMD_UPDATE_WHOLE_ROM (ICP bridge only)
 
 # Arduino ISP-to-ICP bridge only
 CMD_UPDATE_WHOLE_ROM  =  0xE1 # non-official
@@ -121,6 +152,9 @@ DUMP_PKT_CHECKSUM_START = PKT_HEADER_END
 DUMP_PKT_CHECKSUM_SIZE = 0  # disabled for now
 DUMP_DATA_START = (DUMP_PKT_CHECKSUM_START + DUMP_PKT_CHECKSUM_SIZE)
 DUMP_DATA_SIZE = (PACKSIZE - DUMP_DATA_START)
+# CMD_STREAM_READ: data packets the device sends per flow-control ACK; the host's serial buffer must hold a window
+STREAM_WINDOW_START = 16
+STREAM_WINDOW = 16
 
 DEFAULT_SER_BAUD = 115200
 DEFAULT_SER_TIMEOUT = 0.1  # 100ms
@@ -128,6 +162,7 @@ RESET_TIMEOUT = 0.5 # 500ms
 FORMAT2_TIMEOUT = 0.2 # 200ms
 ERASE_TIMEOUT = 8.5 # 8500 ms
 PAGE_ERASE_TIMEOUT = 0.2 # 200ms
+LAZY_ERASE_TIMEOUT = FORMAT2_TIMEOUT + 2 * PAGE_ERASE_TIMEOUT # a plain update packet can start writing to two pages
 READ_ROM_TIMEOUT = 2 # 2000ms
 
 DEFAULT_UNIX_PORT = "/dev/ttyACM0"
@@ -220,17 +255,21 @@ def cmd_to_str(cmd):
         return "CMD_FORMAT2_CONTINUATION"
     elif cmd == CMD_GET_PID:
         return "CMD_GET_PID"
+    elif cmd == CMD_GET_CAPS:
+        return "CMD_GET_CAPS"
+    elif cmd == CMD_STREAM_READ:
+        return "CMD_STREAM_READ"
+    elif cmd == CMD_UPDATE_RLE:
+        return "CMD_UPDATE_RLE"
     else:
         return "{:02x}".format(cmd)
 
-def progress_bar(text, value, endvalue, bar_length=54):
-    percent = float(value) / endvalue
-    arrow = '-' * int(round(percent * bar_length)-1) + '>'
-    spaces = ' ' * (bar_length - len(arrow))
-
-    print("\r{0}: [{1}] {2}%".format(text, arrow +
-          spaces, int(round(percent * 100))), end='\r')
-    
+def _load_serial():
+    global serial
+    if serial is None:
+        import serial as _serial
+        serial = _serial
+    return serial
 
 def pack_u16(val):
     return bytes([val & 0xff, (val >> 8) & 0xff])
@@ -242,10 +281,7 @@ def unpack_u32(data):
     return (data[0] & 0xff) + ((data[1] & 0xff) << 8) + ((data[2] & 0xff) << 16) + ((data[3] & 0xff) << 24)
 
 def calc_checksum(data):
-    txsum = 0
-    for i in range(len(data)):
-        txsum += data[i]
-    return txsum & 0xffff
+    return checksum16(data)
 
 class ISPPacket:
     seq_num = 0
@@ -293,7 +329,10 @@ class ACKPacket(ISPPacket):
 
     
 class NuvoISP(NuvoProg):
-    def __init__(self, serial_rate=DEFAULT_SER_BAUD, serial_timeout=DEFAULT_SER_TIMEOUT, serial_port=(DEFAULT_WIN_PORT if platform.system() == "Windows" else DEFAULT_UNIX_PORT), silent=False):
+    # passes of repair_pages() after a failed verify in program_all(); 0 to fail straight away
+    repair_retries = 2
+
+    def __init__(self, serial_rate=DEFAULT_SER_BAUD, serial_timeout=DEFAULT_SER_TIMEOUT, serial_port=(DEFAULT_WIN_PORT if platform.system() == "Windows" else DEFAULT_UNIX_PORT), silent=False, progress=None):
         """
         NuvoISP constructor
         ------
@@ -303,15 +342,18 @@ class NuvoISP(NuvoProg):
             serial_timeout (float): Serial timeout in seconds
             serial_port (str): Serial port to use (default = "COM1" on Windows, "/dev/ttyACM0" on *nix)
             silent (bool): If True, suppresses all output
+            progress (str | Callable | ProgressRenderer): Progress renderer ("tty", "json", "none") or a callback taking a ProgressEvent (default = "tty", or "none" if silent)
 
         """
         self.ser = None
         self.silent = silent
+        self.progress = ProgressReporter(progress, silent)
         self.serial_rate = serial_rate
         self.serial_timeout = serial_timeout
         self.serial_port = serial_port
         self.seq_num = 0
         self.fw_ver = 0
+        self.caps = 0
         self._connected = False
 
     def __enter__(self):
@@ -402,6 +444,7 @@ class NuvoISP(NuvoProg):
 
     def reopen_serial(self):
         SERIAL_CLOSE_WAIT = 0.5
+        _load_serial()
         if not self.ser:
             self.ser = serial.Serial(self.serial_port, self.serial_rate, timeout=self.serial_timeout)
         else:
@@ -420,20 +463,19 @@ class NuvoISP(NuvoProg):
     def is_icp_bridge(self):
         return self.fw_ver == ICP_BRIDGE_FW_VER
 
+    def has_cap(self, cap) -> bool:
+        return (self.caps & cap) != 0
+
     def print_vb(self, *args, **kwargs):
         """
         Print a message if print progress is enabled
         """
-        if not self.silent:
+        if not self.silent and not self.progress.log(" ".join(str(arg) for arg in args)):
             print(*args, **kwargs)
 
     @staticmethod
     def verify_chksum(tx, rx):
-        txsum = 0
-        for i in range(len(tx)):
-            txsum += tx[i]
-
-        txsum &= 0xffff
+        txsum = checksum16(tx)
         rxsum = (rx[1] << 8) + rx[0]
 
         return (rxsum == txsum)
@@ -533,6 +575,7 @@ class NuvoISP(NuvoProg):
             raise Exception("Failed to sync sequence number")
         self.fw_ver = self.get_fwver()
         self._connected = True
+        self.caps = self.get_caps() if self.supports_extended_cmds else 0
 
     def _send_cmd(self, tx: ISPPacket, max_timeout=None):
         tx.seq_num = self.seq_num
@@ -650,6 +693,15 @@ class NuvoISP(NuvoProg):
         _, rx_pkt = self.send_cmd(self._cmd_packet(CMD_GET_CID))
         return rx_pkt.data[0]
 
+    def get_caps(self) -> int:
+        """
+        Returns the CAP_* flags of the ISP firmware (0 if it predates CMD_GET_CAPS)
+        """
+        self._fail_if_not_init()
+        self._fail_if_not_extended()
+        success, rx_pkt = self.send_cmd(self._cmd_packet(CMD_GET_CAPS), fail_on_checksum_error=False)
+        return rx_pkt.data[0] if success else 0
+
     def get_uid(self):
         self._fail_if_not_init()
         self._fail_if_not_extended()
@@ -709,21 +761,39 @@ class NuvoISP(NuvoProg):
         self._fail_if_not_extended()
         self.send_cmd(self._cmd_packet(CMD_ISP_PAGE_ERASE, bytes([addr & 0xff, (addr >> 8) & 0xff])), max(PAGE_ERASE_TIMEOUT, self.serial_timeout))
 
+    def _update_timeout(self, first_packet, pages=2):
+        # with lazy erase, the device erases each page the packet touches (`pages`) before it answers
+        lazy_timeout = max(LAZY_ERASE_TIMEOUT, FORMAT2_TIMEOUT + pages * PAGE_ERASE_TIMEOUT)
+        if first_packet and (not self.has_cap(CAP_LAZY_ERASE) or self.is_icp_bridge):
+            # flash must erase in 8.5s (the bridge also mass erases a locked chip here)
+            return max(ERASE_TIMEOUT, lazy_timeout if self.has_cap(CAP_LAZY_ERASE) else 0, self.serial_timeout)
+        if self.has_cap(CAP_LAZY_ERASE):
+            # the device erases each page as its data arrives instead of the whole range up front
+            return max(lazy_timeout, self.serial_timeout)
+        return max(FORMAT2_TIMEOUT, self.serial_timeout)
+
     def update_flash(self, addr, data, size, update_dataflash=False):
         self._fail_if_not_init()
+        if self.has_cap(CAP_RLE_UPDATE):
+            if isinstance(data, SparseImage):
+                # the encoder needs contiguous bytes; the 0xFF runs still cost next to nothing on the wire
+                data = data[:size]
+            packets = list(rle_packets(memoryview(data)[:size]))
+            # fall back to the plain update if compressing doesn't save any packets
+            if len(packets) < 1 + math.ceil(max(0, size - 48) / 56):
+                return self._update_flash_rle(addr, data, size, packets, update_dataflash)
         flen = size
         ipos = 0
         addr_pckd = pack_u32(addr)
         flen_pckd = pack_u32(flen)
         txsum = 0
-        while (ipos <= flen):
+        while (ipos < flen):
             cmd_name = CMD_FORMAT2_CONTINUATION
             update_size = 56
-            timeout = max(FORMAT2_TIMEOUT, self.serial_timeout)
+            timeout = self._update_timeout(ipos == 0)
             if (ipos == 0):
                 cmd_name = CMD_UPDATE_APROM
                 update_size = 48
-                timeout = max(ERASE_TIMEOUT, self.serial_timeout) # flash must erase in 8.5s
                 if update_dataflash:
                     self._fail_if_not_icp_bridge()
                     cmd_name = CMD_UPDATE_WHOLE_ROM
@@ -737,9 +807,7 @@ class NuvoISP(NuvoProg):
                 sdata = bytes(data[ipos:flen]) + bytes(56-(flen-ipos))
                 data_to_send = sdata
             self.update_progress_bar("Programming Rom", ipos, flen)
-            for i in range(len(sdata)):
-                txsum += sdata[i]
-            txsum &= 0xffff
+            txsum = (txsum + checksum16(sdata)) & 0xffff
             _, rx_pkt = self.send_cmd(self._cmd_packet(cmd_name, data_to_send), max_timeout=timeout)
             update_checksum = unpack_u16(rx_pkt.data)
             if update_checksum != txsum:
@@ -749,16 +817,58 @@ class NuvoISP(NuvoProg):
         self.update_progress_bar("Programming Rom", flen, flen)
         return True
 
+    def _update_flash_rle(self, addr, data, size, packets, mass_erase=False) -> bool:
+        """
+        update_flash() with CMD_UPDATE_RLE, sending the payloads from rle_packets()
+        """
+        flags = 0
+        if mass_erase:
+            self._fail_if_not_icp_bridge()
+            flags |= RLE_FLAG_MASS_ERASE
+        header = bytes([addr & 0xff, (addr >> 8) & 0xff, flags, 0]) + pack_u32(size)
+        page_size = self.get_device_info().page_size
+        txsum = 0
+        done = 0
+        for i, (payload, covered) in enumerate(packets):
+            self.update_progress_bar("Programming Rom", done, size)
+            # the device sums the expanded bytes, 0xFF runs included
+            txsum = (txsum + checksum16(memoryview(data)[done:done + covered])) & 0xffff
+            timeout = self._update_timeout(i == 0, pages_spanned(addr + done, covered, page_size))
+            done += covered
+            if i == 0:
+                pkt = self._cmd_packet(CMD_UPDATE_RLE, header + payload)
+            else:
+                pkt = self._cmd_packet(CMD_FORMAT2_CONTINUATION, payload)
+            _, rx_pkt = self.send_cmd(pkt, max_timeout=timeout)
+            update_checksum = unpack_u16(rx_pkt.data)
+            if update_checksum != txsum:
+                eprint("\nChecksum mismatch: {} != {}".format(update_checksum, txsum))
+                return False
+        self.update_progress_bar("Programming Rom", size, size)
+        return True
+
     def write_flash(self, addr, data) -> bool:
         self._fail_if_not_init()
         self.update_flash(addr, data, len(data), False)
 
     def update_progress_bar(self, name, step, total):
-        self._fail_if_not_init()
-        if not self.silent:
-            progress_bar(name, step, total)
+        self.progress.update(name, step, total)
 
     def dump_flash(self, start_addr=None, length=None) -> bytes:
+        return b"".join(self.iter_flash(start_addr, length))
+
+    def iter_flash(self, start_addr=None, length=None):
+        """
+        Read flash, yielding the data as it arrives (see pipeline.dump_to_file())
+
+        #### Keyword args:
+            start_addr (int) (=APROM start), length (int) (=whole flash):
+                Range to read
+
+        #### Yields:
+            bytes:
+                The next chunk, in address order (a whole stream window with CMD_STREAM_READ, otherwise one packet)
+        """
         self._fail_if_not_init()
         self._fail_if_not_extended()
         device_info: DeviceInfo = self.get_device_info()
@@ -766,8 +876,10 @@ class NuvoISP(NuvoProg):
             start_addr = device_info.aprom_addr
         if length is None:
             length = device_info.flash_size
+        if self.has_cap(CAP_STREAM_READ):
+            yield from self._stream_read(start_addr, length)
+            return
         step_size = DUMP_DATA_SIZE
-        data = bytes()
         first_packet = self._cmd_packet(CMD_READ_ROM, bytes([start_addr & 0xff, (start_addr >> 8) & 0xff]) +
                                         bytes(2) + bytes([length & 0xff, (length >> 8) & 0xff]))
         addr = start_addr
@@ -784,18 +896,65 @@ class NuvoISP(NuvoProg):
                 max_len = len(rx.data) 
             else:
                 max_len = end_addr - addr
-            data += rx.data[:max_len]
+            yield bytes(rx.data[:max_len])
             addr += step_size
-        return data
+        self.update_progress_bar("Dumping...", end_addr, end_addr)
 
-    def dump_flash_to_file(self, read_file) -> bool:
+    def _read_packet(self, max_timeout=None) -> ACKPacket:
+        # receive a packet that was not directly requested (e.g. during a stream read)
+        if not self._wait_for_packet(max_timeout):
+            raise TimeoutError("Device unresponsive, aborting!")
+        rx = self.read_serial(PACKSIZE)
+        if (len(rx) != PACKSIZE):
+            raise Exception("FAILED TO READ FROM SERIAL PORT!")
+        self.seq_num += 1
+        rx_pkt = ACKPacket.from_bytes(rx)
+        if CHECK_SEQUENCE_NO and rx_pkt.seq_num != self.seq_num:
+            raise ChecksumError("Invalid sequence number received!")
+        return rx_pkt
+
+    def _stream_read(self, start_addr, length):
+        """
+        Read flash with CMD_STREAM_READ: the device sends STREAM_WINDOW data packets back-to-back and the host only
+        answers once per window, so reads are not limited by the round-trip latency of every 56-byte chunk.
+        Yields the data of each window.
+        """
+        done = 0
+        checksum = 0
+        packets = math.ceil(length / DUMP_DATA_SIZE)
+        received = 0
+        tx = self._cmd_packet(CMD_STREAM_READ, bytes([start_addr & 0xff, (start_addr >> 8) & 0xff]) + bytes(2) +
+                              bytes([length & 0xff, (length >> 8) & 0xff]) + bytes(2) + bytes([STREAM_WINDOW]))
+        timeout = max(READ_ROM_TIMEOUT, self.serial_timeout)
+        while received < packets:
+            self.update_progress_bar("Dumping...", done, length)
+            # the first packet starts the stream; after that, one flow-control ACK per window
+            self.seq_num += 1
+            self._send_cmd(tx, timeout)
+            data = bytearray()
+            for _ in range(min(STREAM_WINDOW, packets - received)):
+                rx = self._read_packet(timeout)
+                chunk = rx.data[:min(DUMP_DATA_SIZE, length - done)]
+                checksum = (checksum + checksum16(chunk)) & 0xffff
+                if rx.checksum != checksum:
+                    raise ChecksumError("Stream read checksum mismatch at 0x%04X" % (start_addr + done))
+                data += chunk
+                done += len(chunk)
+                received += 1
+            yield bytes(data)
+            tx = self._cmd_packet(CMD_FORMAT2_CONTINUATION)
+            timeout = max(FORMAT2_TIMEOUT, self.serial_timeout)
+        self.update_progress_bar("Dumping...", length, length)
+
+    def dump_flash_to_file(self, read_file, fmt="bin") -> bool:
+        """
+        Dump the flash to `read_file` as "bin", "hex" or "srec" (erased records left out), encoding and hashing each
+        chunk on a worker thread while the next one is read
+        """
         self._fail_if_not_init()
         self._fail_if_not_extended()
-        f = open(read_file, "wb")
-        if (f == None):
-            print("Error opening file!")
-            return False
-        f.write(self.dump_flash())
+        digest = dump_to_file(self.iter_flash(), read_file, fmt=fmt, addr=self.get_device_info().aprom_addr)
+        self.print_vb("%s: SHA-256 %s" % (read_file, digest))
         return True
 
     def write_config(self, config_bytes: bytes):
@@ -811,9 +970,7 @@ class NuvoISP(NuvoProg):
     def _pad_if_necessary(self, data):
         if not data:
             return data
-        if len(data) % 1024 != 0:
-            data += bytes([0xFF]* (1024 - (len(data) % 1024)))
-        return data
+        return SparseImage.wrap(data).padded(len(data) + (-len(data) % 1024))
     def _check_ldrom_config(self, config: ConfigFlags, ldrom_size, ldrom_data=None, override=True) -> tuple[ConfigFlags, bytes]:
         self._fail_if_not_init()
         device_info = self.get_device_info()
@@ -832,9 +989,7 @@ class NuvoISP(NuvoProg):
                 if not (ldrom_data is None):
                     if len(ldrom_data) < config.get_ldrom_size():
                         self.print_vb("LDROM will be padded with 0xFF.")
-                        ldrom_data = ldrom_data + \
-                            bytes(
-                                [0xFF] * (config.get_ldrom_size() - len(ldrom_data)))
+                        ldrom_data = SparseImage.wrap(ldrom_data).padded(config.get_ldrom_size())
                     else:
                         self.print_vb("LDROM will be truncated.")
                         ldrom_data = ldrom_data[: config.get_ldrom_size()]
@@ -884,7 +1039,17 @@ class NuvoISP(NuvoProg):
             ldrom_data = bytes()
         return curr_config, ldrom_data
 
-    def program_all(self, aprom_data, ldrom_data=None, config: ConfigFlags = None, ldrom_config_override=True, verify_flash=None, _lock=False) -> bool:
+    def _transport(self) -> ISPTransport:
+        return ISPTransport(self.serial_rate, stream_window=STREAM_WINDOW if self.has_cap(CAP_STREAM_READ) else 1,
+                            pipelined=self.has_cap(CAP_PIPELINED))
+
+    def compile_plan(self, aprom_data, ldrom_data=None, config: ConfigFlags = None, ldrom_config_override=True, verify_flash=None, _lock=False) -> ProgrammingPlan:
+        """
+        Work out everything program_all() would do, without touching the flash
+
+        #### Returns:
+            ProgrammingPlan
+        """
         self._fail_if_not_init()
         update_flashrom = False
         read_config = self.read_config()
@@ -909,61 +1074,230 @@ class NuvoISP(NuvoProg):
                 len(aprom_data) / 1024, aprom_size / 1024))
             if aprom_size < len(aprom_data):
                 eprint("APROM will be truncated.")
-                aprom_data = aprom_data[:aprom_size]
+                aprom_data = SparseImage.wrap(aprom_data).truncated(aprom_size)
             else:
                 eprint("APROM will be padded with 0xFF.")
-                # Pad with 0xFF
-                aprom_data += bytes([0xFF] * (aprom_size - len(aprom_data)))
-        combined_data = aprom_data + ldrom_data
-        self.print_vb("Programming Rom (%d KB)..." % (len(combined_data) / 1024))
-        # no need to erase, as the update commands will do it for us
-        verified_success = self.update_flash(device_info.aprom_addr, combined_data, len(combined_data), update_flashrom)
-        self.program_config(config_to_write)
-
-        if not verified_success:
-            eprint("Device reported incorrect checksum, verification failed!")
-            # check if this is locked and the config unlocks it; if so, we should still write the config
-            if locked and config_to_write.is_locked() == False:
-                self.print_vb("Writing config anyway to ensure unlocked...")
-                self.program_config(config_to_write)
-            return False
-        self.print_vb("ROM programmed.")
+                aprom_data = SparseImage.wrap(aprom_data).padded(aprom_size)
         if verify_flash is None: # vs. False
             verify_flash = self.supports_extended_cmds
         if verify_flash:
             self._fail_if_not_extended()
-            self.print_vb("Verifying ROM data...")
-            if not self.verify_flash(combined_data, report_unmatched_bytes=True, rom_size=len(combined_data)):
-                self.print_vb("Verification failed.")
+        # joined without copying either image
+        rom_data = SparseImage.wrap(aprom_data) + ldrom_data
+        return build_isp_plan(device_info, config_to_write, rom_data, update_flashrom, verify_flash, self._transport(),
+                              can_mass_erase=self.is_icp_bridge)
+
+    def _run_plan_op(self, op: PlanOp) -> bool:
+        if op.kind == PlanOp.WRITE:
+            self.print_vb("Programming Rom (%d KB)..." % (len(op.data) / 1024))
+            # no need to erase, as the update commands will do it for us
+            if not self.update_flash(op.addr, op.data, len(op.data), op.region == "FLASH"):
+                eprint("Device reported incorrect checksum, verification failed!")
                 return False
-            self.print_vb("ROM data verified.")
+            self.print_vb("ROM programmed.")
+        elif op.kind == PlanOp.CONFIG:
+            self.program_config(op.config)
+        elif op.kind == PlanOp.MASS_ERASE:
+            self.mass_erase()
+        elif op.kind == PlanOp.PAGE_ERASE:
+            for page in op.pages:
+                self.page_erase(page)
+        elif op.region == "CONFIG":
             # check that the config was really written correctly (do this AFTER verifying the flash because the device may be locked after programming)
-            # self._disconnect()
-            # self._connect()
             new_config = self.read_config()
-            if str(new_config) != str(config_to_write):
+            if str(new_config) != str(op.config):
                 eprint("Config verification failed.")
                 if not self.silent:
                     self.print_vb("Expected:")
-                    config_to_write.print_config()
+                    op.config.print_config()
                     self.print_vb("Got:")
                     new_config.print_config()
                 return False
             self.print_vb("Config verified.")
-            verified_success = True
+        else:
+            self.print_vb("Verifying ROM data...")
+            result = self.verify_flash(op.data, report_unmatched_bytes=True, addr=op.addr, rom_size=op.addr + len(op.data))
+            if not result and self.supports_extended_cmds:
+                result = self.repair_pages(op.data, op.addr, result)
+            if not result:
+                self.print_vb("Verification failed.")
+                return False
+            self.print_vb("ROM data verified.")
+        return True
 
+    def program_all(self, aprom_data, ldrom_data=None, config: ConfigFlags = None, ldrom_config_override=True, verify_flash=None, _lock=False) -> bool:
+        plan = self.compile_plan(aprom_data, ldrom_data, config, ldrom_config_override, verify_flash, _lock)
+        self.print_vb("Erase strategy: " + plan.erase_strategy)
+        if not plan.run(self):
+            if plan.failed_op.kind == PlanOp.WRITE:
+                # write the config anyway, so that a locked chip with an unlocking config ends up unlocked
+                self.program_config(plan.config)
+            return False
         self.print_vb("\nResulting Device info:")
         devinfo = self.get_device_info()
         self.print_vb(devinfo)
         self.print_vb()
         if not self.silent:
-            config_to_write.print_config()
-        if verified_success:
+            plan.config.print_config()
+        if any(op.kind == PlanOp.VERIFY for op in plan):
             self.print_vb("Verification succeeded!")
         self.print_vb("Finished programming!\n")
         return True
 
-    def program_all_files(self, write_file, ldrom_file: str=None, config_file: str = "", ldrom_override=True, _no_ldrom=False, _lock=False) -> bool:
+    def compile_region_plan(self, addr, data, verify_flash=None) -> ProgrammingPlan:
+        """
+        Work out what program_region() would do, without touching the flash
+
+        #### Returns:
+            ProgrammingPlan:
+                The plan, or None if the range can't be programmed on its own
+        """
+        self._fail_if_not_init()
+        self._fail_if_not_extended()
+        device_info = self.get_device_info()
+        config = self.read_config()
+        if config.is_locked() or self.get_cid() == 0xFF:
+            eprint("ERROR: Device is locked, use program_all() instead.")
+            return None
+        layout = device_info.get_layout(config)
+        end = addr + len(data)
+        if layout.aprom_addr <= addr and end <= layout.aprom_addr + layout.aprom_size:
+            region = "APROM"
+        elif layout.ldrom_addr <= addr and end <= layout.ldrom_addr + layout.ldrom_size:
+            if not self.is_icp_bridge:
+                raise ExtendedCmdsNotSupported("Programming the LDROM is only supported when using the ICP bridge.")
+            region = "LDROM"
+        else:
+            eprint("ERROR: 0x%04X-0x%04X is not inside the APROM or the LDROM." % (addr, end - 1))
+            return None
+        # the update command erases whole pages, so keep what is already in the partial pages at either end
+        page_size = device_info.page_size
+        start = addr - addr % page_size
+        page_end = end + (-end % page_size)
+        head = self.dump_flash(start, addr - start) if addr > start else bytes()
+        tail = self.dump_flash(end, page_end - end) if page_end > end else bytes()
+        if verify_flash is None:
+            verify_flash = self.supports_extended_cmds
+        return build_isp_region_plan(device_info, config, region, start, head + bytes(data) + tail, verify_flash,
+                                     self._transport())
+
+    def program_region(self, addr, data, verify_flash=None) -> bool:
+        """
+        Program `data` at `addr`, leaving the rest of the flash and the config untouched
+        ------
+
+        Only the pages that `data` touches are erased and rewritten; the existing contents of the partial pages at
+        either end are read back and kept. The range must lie inside the APROM, or inside the LDROM when using the
+        ICP bridge.
+
+        #### Args:
+            addr (int):
+                Flash address to write to
+            data (bytes):
+                Data to write
+            verify_flash (bool):
+                Read back and compare the written pages (default: if supported)
+
+        #### Returns:
+            bool:
+                True if the data was written (and verified)
+        """
+        plan = self.compile_region_plan(addr, data, verify_flash)
+        if plan is None:
+            return False
+        self.print_vb("Erase strategy: " + plan.erase_strategy)
+        if not plan.run(self):
+            return False
+        self.print_vb("Finished programming!\n")
+        return True
+
+    def compile_segment_plan(self, segments, config: ConfigFlags = None, verify_flash=None) -> ProgrammingPlan:
+        """
+        Work out what program_segments() would do, without touching the flash
+
+        #### Returns:
+            ProgrammingPlan:
+                The plan, or None if the image can't be programmed page by page
+        """
+        self._fail_if_not_init()
+        self._fail_if_not_extended()
+        device_info = self.get_device_info()
+        current_config = self.read_config()
+        if current_config.is_locked() or self.get_cid() == 0xFF:
+            eprint("ERROR: Device is locked, use program_all() instead.")
+            return None
+        config = config or current_config
+        layout = device_info.get_layout(config)
+        image = segments if isinstance(segments, SparseImage) else SparseImage.from_segments(segments)
+        pages = image.pages(device_info.page_size)
+        if not self.is_icp_bridge and any(page >= layout.ldrom_addr for page in pages):
+            raise ExtendedCmdsNotSupported("Programming the LDROM is only supported when using the ICP bridge.")
+        if verify_flash is None:
+            verify_flash = self.supports_extended_cmds
+        try:
+            # the update command erases the pages it writes
+            return build_page_plan(device_info, layout, pages, config, current_config, verify_flash, self._transport(),
+                                   implicit_erase=True)
+        except ValueError as e:
+            eprint("ERROR: %s" % e)
+            return None
+
+    def program_segments(self, segments, config: ConfigFlags = None, verify_flash=None) -> bool:
+        """
+        Program a segment map (e.g. from a HEX file), erasing and writing only the pages it populates
+        ------
+
+        The rest of each populated page is filled with 0xFF; every other page keeps its contents. Pages in the LDROM
+        can only be written when using the ICP bridge.
+
+        #### Args:
+            segments (SparseImage or list[tuple[int, bytes]]):
+                The image, or (address, data) segments as returned by fileformats.load_segments()
+            config (ConfigFlags):
+                Config to write, if different from the chip's (default: leave the config alone)
+            verify_flash (bool):
+                Read back and compare the written pages (default: if supported)
+
+        #### Returns:
+            bool:
+                True if the pages were written (and verified)
+        """
+        plan = self.compile_segment_plan(segments, config, verify_flash)
+        if plan is None:
+            return False
+        self.print_vb("Erase strategy: " + plan.erase_strategy)
+        if not plan.run(self):
+            return False
+        self.print_vb("Finished programming!\n")
+        return True
+
+    def program_package(self, package: NuPackage, dry_run=False) -> bool:
+        """
+        Program a .nupkg package (see nupkg.py) with program_all(), once it has been checked against the chip
+        ------
+
+        The package's integrity is checked when it is opened; this checks that it was built for the connected
+        device before anything is erased. An LDROM image needs the ICP bridge.
+
+        #### Returns:
+            bool:
+                True if the package was programmed (or, with `dry_run`, its plan printed)
+        """
+        self._fail_if_not_init()
+        device_info = self.get_device_info()
+        try:
+            package.check_device(device_info)
+        except NuPackageError as e:
+            eprint("ERROR: %s" % e)
+            return False
+        config = package.get_config(device_info.device_id)
+        ldrom_data = package.ldrom if len(package.ldrom) else None
+        if dry_run:
+            print(self.compile_plan(package.aprom, ldrom_data, config=config, ldrom_config_override=config is None).describe())
+            return True
+        return self.program_all(package.aprom, ldrom_data, config=config, ldrom_config_override=config is None)
+
+    def program_all_files(self, write_file, ldrom_file: str=None, config_file: str = "", ldrom_override=True, _no_ldrom=False, _lock=False, dry_run=False) -> bool:
         """
         Program the device with the given files and config.
         ------
@@ -977,71 +1311,153 @@ class NuvoISP(NuvoProg):
 
         """
         self._fail_if_not_init()
+        # the files are read on a worker thread while the device ID is read
+        loader = ImageLoader(write_file, None if _no_ldrom else ldrom_file, config_file)
+        device_id = self.get_device_id() if config_file else None
         try:
-            wf = open(write_file, "rb")
+            images = loader.result()
         except OSError as e:
-            eprint("Could not open %s for reading." % write_file)
+            eprint("Could not open %s for reading." % e.filename)
             raise e
-
-        lf = None
-        ldrom_data = None
-        if _no_ldrom:
-            ldrom_data = bytes()
-        else:
-            if ldrom_file:
-                try:
-                    lf = open(ldrom_file, "rb")
-                except OSError as e:
-                    eprint("Could not open %s for reading." % ldrom_file)
-                    raise e
-
-            if lf:
-                ldrom_data = lf.read()
-                lf.close()
+        except FirmwareFileError as e:
+            eprint("ERROR: %s" % e)
+            return False
+        except ValueError:
+            eprint("Invalid config file.")
+            return False
+        # a HEX file on its own only programs the pages it populates; otherwise it is flattened into a full image
+        sparse = images.aprom_segments is not None and ldrom_file is None and not (_no_ldrom or _lock)
+        if images.aprom_segments is not None and not sparse:
+            images.aprom = SparseImage.from_segments(images.aprom_segments)
+        if images.ldrom_segments is not None:
+            images.ldrom = SparseImage.from_segments(images.ldrom_segments)
+        ldrom_data = bytes() if _no_ldrom else images.ldrom
         config = None
         if config_file:
-            config = ConfigFlags.from_json_file(config_file, self.get_device_id())
+            try:
+                config = ConfigFlags.from_json(images.config_json, device_id)
+            except Exception:
+                config = None
             if config is None:
                 eprint("Invalid config file.")
                 return False
-        aprom_data = wf.read()
-        wf.close()
-
+        for filename, digest in images.digests.items():
+            self.print_vb("%s: SHA-256 %s" % (filename, digest))
+        if sparse:
+            if dry_run:
+                plan = self.compile_segment_plan(images.aprom_segments, config)
+                if plan is None:
+                    return False
+                print(plan.describe())
+                return True
+            return self.program_segments(images.aprom_segments, config)
+        aprom_data = images.aprom
+
+        if dry_run:
+            print(self.compile_plan(aprom_data, ldrom_data, config=config, ldrom_config_override=ldrom_override, _lock=_lock).describe())
+            return True
         return self.program_all(aprom_data, ldrom_data, config=config, verify_flash=None, ldrom_config_override=ldrom_override, _lock=_lock)
 
-    def verify_flash(self, data, report_unmatched_bytes=False, addr=0, rom_size=None) -> bool:
+    def program_region_file(self, filename, addr=None, dry_run=False) -> bool:
+        """
+        Program a file at `addr` with program_region(); if `addr` is None, the file is written to the start of
+        the LDROM (ICP bridge only), leaving the APROM untouched. A HEX or S-record file is flattened, with its
+        addresses taken as offsets into the LDROM, so it can only be used without `addr`.
+        """
+        self._fail_if_not_init()
+        fmt = format_from_filename(filename)
+        if fmt != "bin" and addr is not None:
+            eprint("ERROR: --addr only applies to binary files; %s carries its own addresses." % filename)
+            return False
+        try:
+            if fmt != "bin":
+                data = SparseImage.from_segments(load_segments(filename, fmt))
+            else:
+                with open(filename, "rb") as f:
+                    data = f.read()
+        except FirmwareFileError as e:
+            eprint("ERROR: %s" % e)
+            return False
+        except OSError as e:
+            eprint("Could not open %s for reading." % filename)
+            raise e
+        if addr is None:
+            self._fail_if_not_icp_bridge()
+            addr = self.get_device_info().get_layout(self.read_config()).ldrom_addr
+        if dry_run:
+            plan = self.compile_region_plan(addr, data)
+            if plan is None:
+                return False
+            print(plan.describe())
+            return True
+        return self.program_region(addr, data)
+
+    def verify_flash(self, data, report_unmatched_bytes=False, addr=0, rom_size=None) -> VerifyResult:
         """
 
 
         #### Args:
-            data (bytes): 
+            data (bytes or SparseImage): 
                 bytes to verify
             report_unmatched_bytes (bool) (=False)):
-                If True, the number of unmatched bytes will be printed to stderr
+                If True, the mismatched bytes and pages will be printed to stderr
 
         #### Returns:
-            bool:
-                True if the data matches the flash, False otherwise
+            VerifyResult:
+                Truthy if the data matches the flash; otherwise it holds the mismatched ranges and pages
         """
         self._fail_if_not_init()
-        read_data = self.dump_flash()
-        if read_data == None:
-            return False
-        rom_size = len(read_data) if rom_size is None else rom_size
-        read_data = read_data[addr:rom_size]
+        if rom_size is None:
+            read_data = self.dump_flash()
+            if read_data == None:
+                return False
+            read_data = read_data[addr:]
+        else:
+            # only read back the range being verified
+            read_data = self.dump_flash(addr, rom_size - addr)
+            if read_data == None:
+                return False
 
         if len(read_data) > len(data):
-            return False
-        result = True
-        byte_errors = 0
-        for i in range(len(read_data)):
-            if read_data[i] != data[i]:
-                if not report_unmatched_bytes:
-                    return False
-                result = False
-                byte_errors += 1
-        if not result:
-            eprint("Verification failed. %d byte errors." % byte_errors)
+            # the image doesn't cover everything that was read back
+            return VerifyResult(addr, len(data), [(addr + len(data), addr + len(read_data))])
+        # only what was read back is compared; the rest of the image is past the end of the flash
+        result = compare(SparseImage.wrap(data).truncated(len(read_data)), read_data, addr,
+                         self.get_device_info().page_size)
+        if not result and report_unmatched_bytes:
+            eprint(result.describe())
+        return result
+
+    def _program_pages(self, pages: dict) -> bool:
+        for page in sorted(pages):
+            # CMD_UPDATE_APROM erases the pages it covers, as in program_region()
+            if not self.update_flash(page, pages[page], len(pages[page])):
+                return False
+        return True
+
+    def repair_pages(self, data, addr, result: VerifyResult, retries=None) -> VerifyResult:
+        """
+        Rewrite only the pages that a failed verify_flash() found, then verify those pages again.
+        Needs the extended commands (to read the flash back).
+
+        #### Args:
+            data (bytes), addr (int):
+                What was verified
+            result (VerifyResult):
+                The failed verify_flash() result
+            retries (int) (=self.repair_retries):
+                Maximum number of repair passes
+
+        #### Returns:
+            VerifyResult:
+                The result of the last verify; truthy if the repair succeeded
+        """
+        self._fail_if_not_init()
+        self._fail_if_not_extended()
+        result = repair(result, data, addr, self.get_device_info().page_size, self.dump_flash, self._program_pages,
+                        self.repair_retries if retries is None else retries, self.print_vb)
+        if result:
+            self.print_vb("Repair succeeded.")
         return result
 
 
@@ -1054,18 +1470,25 @@ def print_usage():
     print("\t-b, --baud=<baudrate>             baudrate to use (default: 115200)")
     print("\t-u, --status:                     print the connected device info and configuration and exit.")
     print("\t-r, --read=<filename>             read entire flash to file")
-    print("\t-w, --write=<filename>            write file to APROM")
-    print("\t-l, --ldrom=<filename>            write file to LDROM (Supported only when using Arduino ISP-to-ICP bridge)")
+    print("\t    --format=<bin|hex|srec>       file format for --read (default: bin); hex and srec leave out erased records")
+    print("\t-w, --write=<filename>            write file to APROM; a .hex/.ihx/.srec file is written at its own addresses,")
+    print("\t                                  erasing only the pages it populates;")
+    print("\t                                  a .nupkg package (see 'python -m nuvoprogpy pack') programs the whole job")
+    print("\t-l, --ldrom=<filename>            write file to LDROM; on its own, only the LDROM is rewritten (Supported only when using Arduino ISP-to-ICP bridge)")
     print("\t-n, --no-ldrom                    Overwrite LDROM space with full-size APROM (Supported only when using Arduino ISP-to-ICP bridge)")
     print("\t-k, --lock                        lock the chip after programming (default: False)")
     print("\t-c, --config <filename>           use config file for writing (overrides --lock)")
     print("\t-s, --silent                      silence all output except for errors")
+    print("\t    --progress=<tty|json|none>    progress output format (default: tty)")
+    print("\t    --addr=<addr>                 with -w, write the file at this address, only erasing the pages it covers")
+    print("\t    --dry-run                     with -w or -l, print the programming plan and estimated duration without writing")
+    print("\t    --batch=<manifest.json>       program boards continuously as they are connected (see nuvoprogpy/batch.py)")
 
 def main() -> int:
     argv = sys.argv[1:]
     try:
         opts, _ = getopt.getopt(argv, "hp:b:ur:w:l:sc:nk", [
-                                "help", "port=", "baud=", "status", "read=", "write=", "ldrom=", "silent", "config=", "no-ldrom", "lock"])
+                                "help", "port=", "baud=", "status", "read=", "write=", "ldrom=", "silent", "config=", "no-ldrom", "lock", "progress=", "batch=", "dry-run", "addr=", "format="])
     except getopt.GetoptError:
         eprint("Invalid command line arguments. Please refer to the usage documentation.")
         print_usage()
@@ -1084,7 +1507,12 @@ def main() -> int:
     config_file = ""
     lock_chip = False
     silent = False
+    progress = None
+    batch_file = None
+    dry_run = False
     no_ldrom = False
+    region_addr = None
+    fmt = "bin"
 
     brown_out_voltage: float = 2.2
     if len(opts) == 0:
@@ -1116,20 +1544,61 @@ def main() -> int:
             no_ldrom = True
         elif opt == "-k" or opt == "--lock":
             lock_chip = True
+        elif opt == "--progress":
+            progress = arg.strip()
+            if progress not in ("tty", "json", "none"):
+                eprint("ERROR: Invalid progress format: %s\n\n" % progress)
+                print_usage()
+                return 2
+        elif opt == "--format":
+            fmt = arg.strip()
+            if fmt not in FORMATS:
+                eprint("ERROR: Invalid file format: %s\n\n" % fmt)
+                print_usage()
+                return 2
+        elif opt == "--batch":
+            batch_file = arg.strip()
+        elif opt == "--dry-run":
+            dry_run = True
+        elif opt == "--addr":
+            try:
+                region_addr = int(arg.strip(), 0)
+            except ValueError:
+                eprint("ERROR: Invalid address: %s\n\n" % arg)
+                print_usage()
+                return 2
         else:
             print_usage()
             return 2
 
+    if batch_file:
+        if read or write or config_dump_cmd:
+            eprint("ERROR: --batch cannot be combined with -r, -w or -u.\n\n")
+            print_usage()
+            return 2
+        from ..batch import BatchManifest, BatchRunner, ISPStation
+        manifest = BatchManifest.from_file(batch_file)
+        station = ISPStation(NuvoISP(serial_port=port, serial_rate=baud, silent=silent, progress=progress), manifest.poll_interval)
+        return 0 if BatchRunner(manifest, station, silent).run() else 1
+
     if read and write:
         eprint("ERROR: Please specify either -r or -w, not both.\n\n")
         print_usage()
         return 2
 
-    if not (read or write or config_dump_cmd):
+    if ldrom_file and not (write or read or config_dump_cmd or no_ldrom or config_file or lock_chip):
+        # LDROM on its own: rewrite just the LDROM pages
+        write = True
+    elif not (read or write or config_dump_cmd):
         eprint("ERROR: Please specify either -r, -w, or -u.\n\n")
         print_usage()
         return 2
 
+    if region_addr is not None and (not write_file or ldrom_file or config_file or no_ldrom or lock_chip):
+        eprint("ERROR: --addr can only be used with -w.\n\n")
+        print_usage()
+        return 2
+
     # check to see if the files exist before we start the ISP
     for filename in [write_file, ldrom_file, config_file]:
         if filename and not os.path.isfile(filename):
@@ -1137,8 +1606,21 @@ def main() -> int:
             print_usage()
             return 2
 
+    package = None
+    if is_package_file(write_file) and not read:
+        if ldrom_file or config_file or no_ldrom or lock_chip or region_addr is not None:
+            eprint("ERROR: a package holds the whole job; it cannot be combined with -l, -c, -n, -k or --addr.\n\n")
+            print_usage()
+            return 2
+        # integrity problems show up before the serial port is even opened
+        try:
+            package = NuPackage.open(write_file)
+        except NuPackageError as e:
+            eprint("ERROR: %s" % e)
+            return 2
+
     try:
-        with NuvoISP(serial_port=port, serial_rate=baud, silent=silent) as nuvo:
+        with NuvoISP(serial_port=port, serial_rate=baud, silent=silent, progress=progress) as nuvo:
 
             devinfo = nuvo.get_device_info()
 
@@ -1167,12 +1649,20 @@ def main() -> int:
                 if cid == 0xFF or read_config.is_locked():
                     eprint("Error: Chip is locked, cannot read flash")
                     return 1
-                nuvo.dump_flash_to_file(read_file)
+                nuvo.dump_flash_to_file(read_file, fmt)
                 # remove extension from read_file
                 config_file = read_file.rsplit(".", 1)[0] + "-config.json"
                 read_config.to_json_file(config_file)
+            elif package is not None:
+                if not nuvo.program_package(package, dry_run=dry_run):
+                    eprint("Programming failed!!")
+                    return 1
+            elif write and (region_addr is not None or not write_file):
+                if not nuvo.program_region_file(write_file or ldrom_file, region_addr, dry_run=dry_run):
+                    eprint("Programming failed!!")
+                    return 1
             elif write:
-                if not nuvo.program_all_files(write_file, ldrom_file, config_file, _no_ldrom=no_ldrom, _lock=lock_chip):
+                if not nuvo.program_all_files(write_file, ldrom_file, config_file, _no_ldrom=no_ldrom, _lock=lock_chip, dry_run=dry_run):
                     eprint("Programming failed!!")
                     return 1
     except KeyboardInterrupt:
@@ -1180,6 +1670,9 @@ def main() -> int:
         return 3
     except Exception as e:
         raise e
+    finally:
+        if package is not None:
+            package.close()
 
     return 0
 
@@ -0,0 +1,108 @@
+"""
+0xFF run-length encoding for CMD_UPDATE_RLE
+------
+
+Padded images are mostly 0xFF, so the stream only compresses runs of 0xFF. Tokens:
+
+    0x00            end of the packet (the rest of the packet is padding)
+    0x01 - 0x7F     literal: that many data bytes follow
+    0x80 - 0xFF, n  run of ((token & 0x7F) << 8 | n) bytes of 0xFF
+
+Tokens never span packets, so the device can decode every packet on its own. The device does not write the 0xFF
+runs at all: the pages they cover are erased already.
+"""
+import re
+from typing import Iterator, Tuple
+
+RLE_END = 0x00
+RLE_MAX_LITERAL = 0x7F
+RLE_MAX_RUN = 0x7FFF
+# a run token costs 2 bytes plus the literal token it splits, so shorter runs stay in the literal
+RLE_MIN_RUN = 4
+
+_FF_RUN = re.compile(b"\xff{%d,}" % RLE_MIN_RUN)
+
+
+def rle_tokens(data) -> Iterator[Tuple[bool, int, int]]:
+    """
+    Yields (is_run, offset, length) spans covering `data`, without copying it
+    """
+    pos = 0
+    for match in _FF_RUN.finditer(data):
+        if match.start() > pos:
+            yield False, pos, match.start() - pos
+        yield True, match.start(), match.end() - match.start()
+        pos = match.end()
+    if pos < len(data):
+        yield False, pos, len(data) - pos
+
+
+def rle_packets(data, first_size=48, size=56) -> Iterator[Tuple[bytes, int]]:
+    """
+    Encode `data` into packet payloads
+    ------
+
+    #### Args:
+        data (bytes):
+            The image
+        first_size (int), size (int):
+            Payload size of the first packet and of the ones after it
+
+    #### Yields:
+        tuple[bytes, int]: (payload padded to its packet size, number of image bytes it covers)
+    """
+    view = memoryview(data)
+    buf = bytearray()
+    covered = 0
+    cap = first_size
+    for is_run, offset, length in rle_tokens(data):
+        while length > 0:
+            room = cap - len(buf)
+            if room < 2:
+                yield bytes(buf.ljust(cap, bytes([RLE_END]))), covered
+                buf = bytearray()
+                covered = 0
+                cap = size
+                room = cap
+            if is_run:
+                n = min(length, RLE_MAX_RUN)
+                buf += bytes([0x80 | (n >> 8), n & 0xFF])
+            else:
+                n = min(length, RLE_MAX_LITERAL, room - 1)
+                buf.append(n)
+                buf += view[offset:offset + n]
+            offset += n
+            length -= n
+            covered += n
+    if buf:
+        yield bytes(buf.ljust(cap, bytes([RLE_END]))), covered
+
+
+def pages_spanned(addr: int, length: int, page_size: int) -> int:
+    """
+    Number of pages that `length` bytes at `addr` touch; a lazily erasing device erases each of them before it ACKs
+    the packet, and one packet of 0xFF runs can cover kilobytes
+    """
+    if length <= 0:
+        return 0
+    return (addr + length - 1) // page_size - addr // page_size + 1
+
+
+def rle_decode(payload: bytes) -> bytes:
+    """
+    Decode one packet payload (what the firmware does)
+    """
+    out = bytearray()
+    i = 0
+    while i < len(payload):
+        token = payload[i]
+        i += 1
+        if token == RLE_END:
+            break
+        if token & 0x80:
+            out += b"\xff" * (((token & 0x7F) << 8) | payload[i])
+            i += 1
+        else:
+            out += payload[i:i + token]
+            i += token
+    return bytes(out)
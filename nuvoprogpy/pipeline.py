@@ -0,0 +1,230 @@
+"""
+Host-side pipelining
+------
+
+Overlaps the host's own work with device I/O. Image files are read and hashed on a worker thread while the
+programmer talks to the chip, and dumps are written to disk and hashed on a worker thread while the next chunk is
+still being read from the chip. The stages hand data over through bounded queues, so a slow SD card only holds up the
+stage that needs it, and a dump never has to sit in memory as a whole before the first byte is written.
+"""
+import hashlib
+import json
+import queue
+import threading
+from typing import Iterable
+
+try:
+    from .fileformats import FORMATS, FirmwareFileError, format_from_filename, get_encoder, read_segments
+except ImportError:
+    from fileformats import FORMATS, FirmwareFileError, format_from_filename, get_encoder, read_segments
+
+# chunks of the file being read or written that may be waiting between two stages
+DEFAULT_QUEUE_DEPTH = 8
+FILE_CHUNK_SIZE = 4096
+
+_DONE = object()
+
+
+class LoadedImages:
+    """
+    The result of an ImageLoader
+    ------
+
+    #### Attributes:
+        aprom (bytes), ldrom (bytes):
+            File contents (None if no file was given, or if it is a HEX or S-record file)
+        aprom_segments (list[tuple[int, bytes]]), ldrom_segments (list[tuple[int, bytes]]):
+            Segment map of a HEX or S-record file (see fileformats.read_segments()), otherwise None
+        config_json (dict):
+            The parsed config file (None if no file was given)
+        digests (dict[str, str]):
+            SHA-256 of each file that was read, by file name
+    """
+
+    def __init__(self):
+        self.aprom = None
+        self.ldrom = None
+        self.aprom_segments = None
+        self.ldrom_segments = None
+        self.config_json = None
+        self.digests = {}
+
+
+class ImageLoader:
+    """
+    Reads, parses and hashes the files for program_all_files() on a worker thread
+    ------
+
+    Construct it as early as possible, do the device I/O that doesn't need the images, then call result(). Files
+    with a HEX or S-record extension (see fileformats.format_from_filename()) are parsed into segment maps.
+
+    #### Args:
+        aprom_file (str), ldrom_file (str), config_file (str):
+            Files to load; empty or None to skip
+    """
+
+    def __init__(self, aprom_file: str = None, ldrom_file: str = None, config_file: str = None):
+        self.files = (aprom_file, ldrom_file, config_file)
+        self._images = LoadedImages()
+        self._error = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _read(self, filename) -> bytes:
+        digest = hashlib.sha256()
+        data = bytearray()
+        with open(filename, "rb") as f:
+            for chunk in iter(lambda: f.read(FILE_CHUNK_SIZE), b""):
+                digest.update(chunk)
+                data += chunk
+        self._images.digests[filename] = digest.hexdigest()
+        return bytes(data)
+
+    def _read_segments(self, filename):
+        digest = hashlib.sha256()
+
+        def lines(f):
+            for line in f:
+                digest.update(line)
+                yield line
+        with open(filename, "rb") as f:
+            try:
+                segments = read_segments(lines(f), format_from_filename(filename))
+            except FirmwareFileError as e:
+                raise FirmwareFileError("%s: %s" % (filename, e))
+        self._images.digests[filename] = digest.hexdigest()
+        return segments
+
+    def _run(self):
+        aprom_file, ldrom_file, config_file = self.files
+        try:
+            if aprom_file and format_from_filename(aprom_file) != "bin":
+                self._images.aprom_segments = self._read_segments(aprom_file)
+            elif aprom_file:
+                self._images.aprom = self._read(aprom_file)
+            if ldrom_file and format_from_filename(ldrom_file) != "bin":
+                self._images.ldrom_segments = self._read_segments(ldrom_file)
+            elif ldrom_file:
+                self._images.ldrom = self._read(ldrom_file)
+            if config_file:
+                self._images.config_json = json.loads(self._read(config_file))
+        except BaseException as e:
+            self._error = e
+
+    def result(self) -> LoadedImages:
+        """
+        Waits for the worker and returns the LoadedImages; re-raises its OSError or ValueError (FirmwareFileError for a
+        malformed HEX or S-record file) if loading failed
+        """
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        return self._images
+
+
+class DumpWriter:
+    """
+    Encodes chunks of a flash dump into a file and hashes them on a worker thread
+    ------
+
+    write() hands the chunk to the worker and returns; it only blocks while `queue_depth` chunks are already waiting.
+
+    #### Args:
+        filename (str):
+            File to create
+        queue_depth (int):
+            Chunks that may be waiting for the worker
+        fmt (str):
+            File format, one of fileformats.FORMATS
+        addr (int):
+            Flash address of the first chunk (used by the HEX and S-record formats)
+
+    #### Attributes:
+        size (int):
+            Bytes of flash data written so far
+        hexdigest (str):
+            SHA-256 of the flash data (not of the encoded file), once close() has returned
+    """
+
+    def __init__(self, filename: str, queue_depth=DEFAULT_QUEUE_DEPTH, fmt="bin", addr=0):
+        if fmt not in FORMATS:
+            raise ValueError("Unknown file format: %s (expected one of %s)" % (fmt, ", ".join(FORMATS)))
+        self.filename = filename
+        self.size = 0
+        self.hexdigest = None
+        self._file = open(filename, "wb")
+        self._encoder = get_encoder(fmt, self._file, addr)
+        self._hash = hashlib.sha256()
+        self._queue = queue.Queue(maxsize=queue_depth)
+        self._error = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            chunk = self._queue.get()
+            if chunk is _DONE:
+                return
+            if self._error is not None:
+                continue
+            try:
+                self._encoder.write(chunk)
+                self._hash.update(chunk)
+            except BaseException as e:
+                self._error = e
+
+    def write(self, chunk: bytes):
+        if self._error is not None:
+            raise self._error
+        self.size += len(chunk)
+        self._queue.put(chunk)
+
+    def close(self) -> str:
+        """
+        Waits for the worker to finish and closes the file
+
+        #### Returns:
+            str:
+                SHA-256 of the data written
+        """
+        if self._thread.is_alive():
+            self._queue.put(_DONE)
+            self._thread.join()
+        if not self._file.closed:
+            try:
+                if self._error is None:
+                    self._encoder.close()
+            except BaseException as e:
+                self._error = e
+            self._file.close()
+        if self._error is not None:
+            raise self._error
+        self.hexdigest = self._hash.hexdigest()
+        return self.hexdigest
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+            return
+        # the dump failed; stop the worker without masking the original error
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+def dump_to_file(chunks: Iterable[bytes], filename: str, queue_depth=DEFAULT_QUEUE_DEPTH, fmt="bin", addr=0) -> str:
+    """
+    Write `chunks` (e.g. from iter_flash(), starting at `addr`) to `filename` in format `fmt` as they are read
+
+    #### Returns:
+        str:
+            SHA-256 of the flash data
+    """
+    with DumpWriter(filename, queue_depth, fmt, addr) as writer:
+        for chunk in chunks:
+            writer.write(chunk)
+    return writer.hexdigest
@@ -0,0 +1,571 @@
+"""
+Programming plans
+------
+
+A ProgrammingPlan is the ordered list of erase, write, config and verify operations that programming a chip
+takes, compiled up front from the device info, the chip's current config and the target images. Nuvo51ICP and
+NuvoISP build their program_all() on top of it, and --dry-run prints it with a duration estimate instead of
+running it.
+"""
+import math
+from typing import Callable, Dict, List
+
+try:
+    from .config import ConfigFlags, DeviceInfo
+    from .image import SparseImage
+    from .imagetools import drop_blank_pages
+except ImportError:
+    from config import ConfigFlags, DeviceInfo
+    from image import SparseImage
+    from imagetools import drop_blank_pages
+
+
+class PlanOp:
+    """
+    A single step of a programming plan
+    ------
+
+    #### Attributes:
+        kind (str):
+            One of MASS_ERASE, PAGE_ERASE, WRITE, CONFIG, VERIFY
+        region (str):
+            "APROM", "LDROM", "CONFIG" or "FLASH"
+        addr (int), length (int):
+            The flash range the operation covers
+        data (bytes or SparseImage):
+            The data to write or verify against (None for erases)
+        pages (tuple[int]):
+            Page addresses to erase (PAGE_ERASE only)
+        config (ConfigFlags):
+            The config to write or verify (CONFIG and config VERIFY only)
+        erase (bool):
+            CONFIG only: erase the config page before writing
+        implicit (bool):
+            The programmer does this as part of another operation (e.g. the ISP update command erases the pages it
+            writes). Implicit steps are only listed and estimated, not run.
+    """
+    MASS_ERASE = "mass_erase"
+    PAGE_ERASE = "page_erase"
+    WRITE = "write"
+    CONFIG = "config"
+    VERIFY = "verify"
+
+    __slots__ = ("kind", "region", "addr", "length", "data", "pages", "config", "erase", "implicit")
+
+    def __init__(self, kind, region, addr=0, length=0, data=None, pages=(), config=None, erase=True, implicit=False):
+        self.kind = kind
+        self.region = region
+        self.addr = addr
+        self.length = length
+        self.data = data
+        self.pages = tuple(pages)
+        self.config = config
+        self.erase = erase
+        self.implicit = implicit
+
+    def __str__(self):
+        if self.kind == PlanOp.PAGE_ERASE:
+            detail = "%d pages" % len(self.pages)
+        elif self.kind in (PlanOp.MASS_ERASE, PlanOp.CONFIG):
+            detail = ""
+        else:
+            detail = "%d bytes" % self.length
+        span = ""
+        if self.length:
+            span = "0x%05X-0x%05X" % (self.addr, self.addr + self.length - 1)
+        text = "{:<11}{:<8}{:<16}{}".format(self.kind, self.region, span, detail)
+        if self.implicit:
+            text += " (implicit)"
+        return text
+
+
+class Transport:
+    """
+    Timing model for a programming link; all methods return seconds
+    """
+
+    def write(self, device_info: DeviceInfo, length: int) -> float:
+        raise NotImplementedError()
+
+    def read(self, device_info: DeviceInfo, length: int) -> float:
+        raise NotImplementedError()
+
+    def write_image(self, device_info: DeviceInfo, data) -> float:
+        """
+        Time to write `data` (bytes or SparseImage); by default every byte of it, gaps included
+        """
+        return self.write(device_info, len(data))
+
+    def page_erase(self, device_info: DeviceInfo, pages: int, implicit=False) -> float:
+        raise NotImplementedError()
+
+    def mass_erase(self, device_info: DeviceInfo, implicit=False) -> float:
+        raise NotImplementedError()
+
+    def config(self, device_info: DeviceInfo, erase=True) -> float:
+        return (self.page_erase(device_info, 1) if erase else 0) + self.write(device_info, device_info.config_len)
+
+
+class ICPTransport(Transport):
+    """
+    Bit-banged ICP, as done by libnuvo51icp
+    ------
+
+    #### Keyword args:
+        bit_us: float (=5.0):
+            Time per clocked bit, including GPIO call overhead (about 5us with gpiod on a Raspberry Pi, about 2us
+            on an Arduino)
+    """
+    COMMAND_BITS = 24
+
+    def __init__(self, bit_us=5.0):
+        self.bit_us = bit_us
+
+    def _command_us(self):
+        return self.COMMAND_BITS * self.bit_us
+
+    def write(self, device_info, length):
+        delay, hold = device_info.program_times
+        return (self._command_us() + length * (9 * self.bit_us + delay + hold)) / 1e6
+
+    def read(self, device_info, length):
+        return (self._command_us() + length * 12 * self.bit_us) / 1e6
+
+    def write_image(self, device_info, data):
+        if isinstance(data, SparseImage) and data.fill == 0xFF:
+            # Nuvo51ICP.write_flash() only writes the segments
+            return sum(self.write(device_info, len(segment)) for _, segment in data.segments)
+        return self.write(device_info, len(data))
+
+    def page_erase(self, device_info, pages, implicit=False):
+        delay, hold = device_info.page_erase_times
+        return pages * (self._command_us() + 9 * self.bit_us + delay + hold) / 1e6
+
+    def mass_erase(self, device_info, implicit=False):
+        delay, hold = device_info.mass_erase_times
+        return (self._command_us() + 9 * self.bit_us + delay + hold) / 1e6
+
+
+class ISPTransport(Transport):
+    """
+    The 64-byte packet ISP protocol over a UART
+    ------
+
+    #### Keyword args:
+        baud: int (=115200):
+            Serial baud rate
+        latency_s: float (=0.001):
+            Per-packet turnaround (USB-serial latency plus the device's processing)
+        stream_window: int (=1):
+            Read packets the device sends per host packet (more than 1 with CMD_STREAM_READ)
+        pipelined: bool (=False):
+            The device writes each update packet while the next one is on the wire (CAP_PIPELINED)
+    """
+    PACKSIZE = 64
+    FIRST_UPDATE_SIZE = 48
+    UPDATE_SIZE = 56
+    READ_SIZE = 56
+
+    def __init__(self, baud=115200, latency_s=0.001, stream_window=1, pipelined=False):
+        self.baud = baud
+        self.latency_s = latency_s
+        self.stream_window = stream_window
+        self.pipelined = pipelined
+
+    def _packets(self, count):
+        # every command packet is answered with a packet of the same size; 10 bits per byte on the wire
+        return count * (2 * self.PACKSIZE * 10.0 / self.baud + self.latency_s)
+
+    def write(self, device_info, length):
+        packets = 1 + max(0, math.ceil((length - self.FIRST_UPDATE_SIZE) / self.UPDATE_SIZE))
+        delay, hold = device_info.program_times
+        transfer, program = self._packets(packets), length * (delay + hold) / 1e6
+        if self.pipelined:
+            # only the slower of the two counts, apart from one packet's worth of the other
+            return max(transfer, program) + min(transfer, program) / packets
+        return transfer + program
+
+    def read(self, device_info, length):
+        packets = math.ceil(length / self.READ_SIZE)
+        # only one host packet (and one turnaround) per window
+        requests = math.ceil(packets / self.stream_window)
+        return packets * self.PACKSIZE * 10.0 / self.baud + requests * (self.PACKSIZE * 10.0 / self.baud + self.latency_s)
+
+    def page_erase(self, device_info, pages, implicit=False):
+        delay, hold = device_info.page_erase_times
+        return (0 if implicit else self._packets(pages)) + pages * (delay + hold) / 1e6
+
+    def mass_erase(self, device_info, implicit=False):
+        delay, hold = device_info.mass_erase_times
+        return (0 if implicit else self._packets(1)) + (delay + hold) / 1e6
+
+    def config(self, device_info, erase=True):
+        delay, hold = device_info.program_times
+        return self.page_erase(device_info, 1, True) + self._packets(1) + device_info.config_len * (delay + hold) / 1e6
+
+
+TRANSPORTS = {
+    "icp": ICPTransport,
+    "isp": ISPTransport,
+}
+
+
+class ProgrammingPlan:
+    """
+    An ordered list of PlanOps for one chip
+    ------
+
+    #### Attributes:
+        device_info (DeviceInfo):
+            The target device
+        config (ConfigFlags):
+            The config the chip will have once the plan has run
+        ops (list[PlanOp]):
+            The operations, in order
+        transport (Transport):
+            The timing model used by estimate() and describe() by default
+        erase_strategy (str):
+            How the plan erases the flash and why (e.g. "mass erase (0.066 s) instead of 144 page erases (0.887 s)")
+        failed_op (PlanOp):
+            The operation that failed during the last run(), or None
+    """
+
+    def __init__(self, device_info: DeviceInfo, config: ConfigFlags, ops: List[PlanOp], transport: Transport,
+                 erase_strategy: str = "none"):
+        self.device_info = device_info
+        self.config = config
+        self.ops = ops
+        self.transport = transport
+        self.erase_strategy = erase_strategy
+        self.failed_op = None
+
+    def __iter__(self):
+        return iter(self.ops)
+
+    def _sum(self, kind) -> int:
+        return sum(op.length for op in self.ops if op.kind == kind)
+
+    @property
+    def bytes_written(self) -> int:
+        return self._sum(PlanOp.WRITE)
+
+    @property
+    def bytes_verified(self) -> int:
+        return self._sum(PlanOp.VERIFY)
+
+    @property
+    def pages_erased(self) -> int:
+        return sum(len(op.pages) for op in self.ops if op.kind == PlanOp.PAGE_ERASE)
+
+    @property
+    def mass_erase(self) -> bool:
+        return any(op.kind == PlanOp.MASS_ERASE for op in self.ops)
+
+    def op_duration(self, op: PlanOp, transport: Transport = None) -> float:
+        """
+        Estimated seconds for a single operation
+        """
+        transport = transport or self.transport
+        dev = self.device_info
+        if op.kind == PlanOp.MASS_ERASE:
+            return transport.mass_erase(dev, op.implicit)
+        if op.kind == PlanOp.PAGE_ERASE:
+            return transport.page_erase(dev, len(op.pages), op.implicit)
+        if op.kind == PlanOp.WRITE:
+            if op.data is not None:
+                return transport.write_image(dev, op.data)
+            return transport.write(dev, op.length)
+        if op.kind == PlanOp.CONFIG:
+            return transport.config(dev, op.erase)
+        return transport.read(dev, op.length)
+
+    def estimate(self, transport: Transport = None) -> float:
+        """
+        Estimated total duration in seconds
+        """
+        return sum(self.op_duration(op, transport) for op in self.ops)
+
+    def describe(self, transport: Transport = None) -> str:
+        lines = ["Programming plan for %s:" % self.device_info.chip_name,
+                 "Erase strategy: %s" % self.erase_strategy]
+        for op in self.ops:
+            lines.append("  {:<60}{:>8.3f} s".format(str(op), self.op_duration(op, transport)))
+        lines.append("Total: %d bytes written, %d bytes verified, %s" % (
+            self.bytes_written, self.bytes_verified,
+            "mass erase" if self.mass_erase else "%d pages erased" % self.pages_erased))
+        lines.append("Estimated duration: %.2f s" % self.estimate(transport))
+        return "\n".join(lines)
+
+    def run(self, prog, before_config: Callable[[], bool] = None) -> bool:
+        """
+        Run the plan on a Nuvo51ICP or NuvoISP, stopping at the first operation that fails
+
+        #### Args:
+            before_config (Callable[[], bool]):
+                Called right before the config is written (which may lock the chip); the plan fails if it
+                returns False
+
+        #### Returns:
+            bool: True if every operation succeeded
+        """
+        self.failed_op = None
+        for op in self.ops:
+            if op.implicit:
+                continue
+            if op.kind == PlanOp.CONFIG and before_config is not None:
+                if not before_config():
+                    self.failed_op = op
+                    return False
+                before_config = None
+            if not prog._run_plan_op(op):
+                self.failed_op = op
+                return False
+        # a plan without a config write
+        if before_config is not None:
+            return before_config()
+        return True
+
+
+def erased_config(device_info: DeviceInfo) -> ConfigFlags:
+    """
+    The config a chip has after a mass erase
+    """
+    return ConfigFlags.from_bytes(bytes([0xFF] * device_info.config_len), device_info.device_id)
+
+
+def _with_data_verify(ops: List[PlanOp], config: ConfigFlags) -> List[PlanOp]:
+    """
+    `ops` with a verify op for every write, after the config write unless that config locks the chip (a locked
+    chip reads back as 0xFF, so the data could no longer be checked or repaired)
+    """
+    verify_ops = [PlanOp(PlanOp.VERIFY, op.region, op.addr, op.length, op.data) for op in ops if op.kind == PlanOp.WRITE]
+    at = len(ops)
+    if config.is_locked():
+        at = next((i for i, op in enumerate(ops) if op.kind == PlanOp.CONFIG), at)
+    return ops[:at] + verify_ops + ops[at:]
+
+
+def _pad(data, length: int):
+    if len(data) >= length:
+        return data
+    # the padding is virtual: the 0xFF bytes are never built, and the ICP doesn't write them
+    return SparseImage.wrap(data).padded(length)
+
+
+def _choose_erase(device_info: DeviceInfo, transport: Transport, pages: int, page_config_cost: float,
+                  mass_config_cost: float, mass_erase_ok: bool, why_not: str, implicit=False):
+    """
+    Pick between page erases and a mass erase by estimated cost; `implicit` means the erase is part of the update
+    command rather than a command of its own
+
+    #### Returns:
+        tuple[bool, str]: (use mass erase, description of the choice)
+    """
+    page_cost = transport.page_erase(device_info, pages, implicit) + page_config_cost
+    if not mass_erase_ok:
+        return False, "%d page erases (%.3f s); no mass erase: %s" % (pages, page_cost, why_not)
+    mass_cost = transport.mass_erase(device_info, implicit) + mass_config_cost
+    if mass_cost < page_cost:
+        return True, "mass erase (%.3f s) instead of %d page erases (%.3f s)" % (mass_cost, pages, page_cost)
+    return False, "%d page erases (%.3f s) instead of a mass erase (%.3f s)" % (pages, page_cost, mass_cost)
+
+
+def build_icp_plan(device_info: DeviceInfo, current_config: ConfigFlags, config: ConfigFlags, aprom_data: bytes,
+                   ldrom_data: bytes, locked=False, verify=True, pad=True, transport: Transport = None,
+                   allow_mass_erase=True) -> ProgrammingPlan:
+    """
+    Build the plan for Nuvo51ICP.program_all(); the config must already have passed the prechecks
+    ------
+
+    A mass erase is used instead of page erases when it is estimated to be faster and nothing would be lost: the
+    APROM is being written, the LDROM is either being written or has no space in the new config, and the chip has
+    no data flash region (which the mass erase would wipe). The config
+    is rewritten after a mass erase unless the new config is all 0xFF.
+
+    #### Args:
+        device_info (DeviceInfo):
+            The target device
+        current_config (ConfigFlags):
+            The config currently on the chip (ignored if locked)
+        config (ConfigFlags):
+            The config to program
+        aprom_data (bytes or SparseImage), ldrom_data (bytes or SparseImage):
+            The images (empty to leave the region alone)
+        locked (bool):
+            The chip is locked and must be mass erased
+        verify (bool):
+            Add verify steps
+        pad (bool):
+            Pad the images to their region size with 0xFF
+        transport (Transport):
+            Timing model (default: ICPTransport())
+        allow_mass_erase (bool):
+            If False, only a locked chip is mass erased (e.g. because the SPROM holds data)
+
+    #### Returns:
+        ProgrammingPlan
+    """
+    transport = transport or ICPTransport()
+    ops = []
+    layout = device_info.get_layout(config)
+    erased = erased_config(device_info)
+    pages = (len(layout.aprom_pages) if len(aprom_data) > 0 else 0) + (len(layout.ldrom_pages) if len(ldrom_data) > 0 else 0)
+    if locked:
+        mass_erase, reason = True, "mass erase (chip is locked)"
+    elif pages == 0:
+        mass_erase, reason = False, "none"
+    else:
+        config_changed = config.to_bytes() != current_config.to_bytes()
+        why_not = ""
+        if not allow_mass_erase:
+            why_not = "disallowed"
+        elif len(aprom_data) == 0:
+            why_not = "APROM is not being written"
+        elif len(ldrom_data) == 0 and layout.ldrom_size > 0:
+            why_not = "LDROM is not being written"
+        elif layout.dataflash_size > 0:
+            why_not = "data flash would be erased"
+        mass_erase, reason = _choose_erase(
+            device_info, transport, pages,
+            transport.config(device_info, True) if config_changed else 0,
+            transport.config(device_info, False) if config.to_bytes() != erased.to_bytes() else 0,
+            not why_not, why_not)
+    if mass_erase:
+        ops.append(PlanOp(PlanOp.MASS_ERASE, "FLASH"))
+        current_config = erased
+    if len(aprom_data) > 0:
+        if pad:
+            aprom_data = _pad(aprom_data, layout.aprom_size)
+        # the region is always erased first, so its blank pages don't need writing
+        aprom_data = drop_blank_pages(aprom_data, device_info.page_size)
+        if not mass_erase:
+            ops.append(PlanOp(PlanOp.PAGE_ERASE, "APROM", layout.aprom_addr, layout.aprom_size, pages=layout.aprom_pages))
+        ops.append(PlanOp(PlanOp.WRITE, "APROM", layout.aprom_addr, len(aprom_data), aprom_data))
+    if len(ldrom_data) > 0:
+        if pad:
+            ldrom_data = _pad(ldrom_data, layout.ldrom_size)
+        # the region is always erased first, so its blank pages don't need writing
+        ldrom_data = drop_blank_pages(ldrom_data, device_info.page_size)
+        if not mass_erase:
+            ops.append(PlanOp(PlanOp.PAGE_ERASE, "LDROM", layout.ldrom_addr, layout.ldrom_size, pages=layout.ldrom_pages))
+        ops.append(PlanOp(PlanOp.WRITE, "LDROM", layout.ldrom_addr, len(ldrom_data), ldrom_data))
+    if config.to_bytes() != current_config.to_bytes():
+        ops.append(PlanOp(PlanOp.CONFIG, "CONFIG", layout.config_addr, layout.config_len, config=config, erase=not mass_erase))
+    if verify:
+        ops = _with_data_verify(ops, config)
+        ops.append(PlanOp(PlanOp.VERIFY, "CONFIG", layout.config_addr, layout.config_len, config=config))
+    return ProgrammingPlan(device_info, config, ops, transport, reason)
+
+
+def build_isp_plan(device_info: DeviceInfo, config: ConfigFlags, rom_data: bytes, whole_rom=False, verify=True,
+                   transport: Transport = None, can_mass_erase=False) -> ProgrammingPlan:
+    """
+    Build the plan for NuvoISP.program_all(); the config and rom_data (APROM + optional LDROM) must already have
+    been checked by NuvoISP._check_config()
+    ------
+
+    The update commands erase the flash themselves, so the erase step is implicit. With can_mass_erase (the ICP
+    bridge), an APROM update that covers the whole flash uses the whole-ROM update (which starts with a mass
+    erase) when that is estimated to be faster than the bridge's page erases. Verification reads back the
+    APROM and LDROM data that was written.
+    """
+    transport = transport or ISPTransport()
+    ops = []
+    pages = math.ceil(len(rom_data) / device_info.page_size)
+    if whole_rom:
+        reason = "mass erase (whole-ROM update)"
+    else:
+        why_not = ""
+        if not can_mass_erase:
+            why_not = "not supported by this ISP firmware"
+        elif device_info.sprom_len > 0:
+            why_not = "the SPROM would be erased"
+        elif len(rom_data) < device_info.flash_size:
+            why_not = "the update does not cover the whole flash"
+        whole_rom, reason = _choose_erase(device_info, transport, pages, 0, 0, not why_not, why_not, True)
+    if whole_rom:
+        # the whole-ROM update command starts with a mass erase
+        ops.append(PlanOp(PlanOp.MASS_ERASE, "FLASH", implicit=True))
+    else:
+        page_range = range(device_info.aprom_addr, device_info.aprom_addr + len(rom_data), device_info.page_size)
+        ops.append(PlanOp(PlanOp.PAGE_ERASE, "APROM", device_info.aprom_addr, len(rom_data), pages=page_range,
+                          implicit=True))
+    ops.append(PlanOp(PlanOp.WRITE, "FLASH" if whole_rom else "APROM", device_info.aprom_addr, len(rom_data), rom_data))
+    ops.append(PlanOp(PlanOp.CONFIG, "CONFIG", device_info.config_addr, device_info.config_len, config=config))
+    if verify:
+        ops.append(PlanOp(PlanOp.VERIFY, "FLASH", device_info.aprom_addr, len(rom_data), rom_data))
+        ops.append(PlanOp(PlanOp.VERIFY, "CONFIG", device_info.config_addr, device_info.config_len, config=config))
+    return ProgrammingPlan(device_info, config, ops, transport, reason)
+
+
+def build_isp_region_plan(device_info: DeviceInfo, config: ConfigFlags, region: str, addr: int, data: bytes,
+                          verify=True, transport: Transport = None) -> ProgrammingPlan:
+    """
+    Build the plan for NuvoISP.program_region(); `addr` and `data` must already be aligned to whole pages
+    ------
+
+    The update command only erases the pages it covers, so the rest of the flash and the config are left alone.
+    """
+    transport = transport or ISPTransport()
+    pages = range(addr, addr + len(data), device_info.page_size)
+    ops = [
+        PlanOp(PlanOp.PAGE_ERASE, region, addr, len(data), pages=pages, implicit=True),
+        PlanOp(PlanOp.WRITE, region, addr, len(data), data),
+    ]
+    if verify:
+        ops.append(PlanOp(PlanOp.VERIFY, region, addr, len(data), data))
+    return ProgrammingPlan(device_info, config, ops, transport, "%d page erases (region update)" % len(pages))
+
+
+def build_page_plan(device_info: DeviceInfo, layout, pages: Dict[int, bytes], config: ConfigFlags,
+                    current_config: ConfigFlags, verify=True, transport: Transport = None,
+                    implicit_erase=False) -> ProgrammingPlan:
+    """
+    Build the plan for programming only the given pages (e.g. the pages a HEX file populates)
+    ------
+
+    Only those pages are erased; the rest of the flash is left alone, so a mass erase is never used. Runs of
+    consecutive pages are written with one update each, split where the APROM ends and the LDROM starts. The config
+    is only written if `config` differs from `current_config`.
+
+    #### Args:
+        layout (MemoryLayout):
+            The memory layout the pages must fit in
+        pages (dict[int, bytes]):
+            Page address -> full page contents
+        implicit_erase (bool):
+            The update command erases the pages it writes (ISP)
+
+    #### Returns:
+        ProgrammingPlan
+
+    #### Raises:
+        ValueError
+            If a page is outside both the APROM and the LDROM
+    """
+    transport = transport or ICPTransport()
+    regions = (("APROM", layout.aprom_addr, layout.aprom_size), ("LDROM", layout.ldrom_addr, layout.ldrom_size))
+    runs = []
+    for page in sorted(pages):
+        region = next((name for name, start, size in regions if start <= page < start + size), None)
+        if region is None:
+            raise ValueError("Page 0x%04X is outside the APROM and the LDROM." % page)
+        if runs and runs[-1][0] == region and runs[-1][1] + len(runs[-1][2]) == page:
+            runs[-1][2] += pages[page]
+        else:
+            runs.append([region, page, bytearray(pages[page])])
+    ops = []
+    for region, addr, data in runs:
+        ops.append(PlanOp(PlanOp.PAGE_ERASE, region, addr, len(data), pages=range(addr, addr + len(data), layout.page_size),
+                          implicit=implicit_erase))
+        ops.append(PlanOp(PlanOp.WRITE, region, addr, len(data), bytes(data)))
+    write_config = config.to_bytes() != current_config.to_bytes()
+    if write_config:
+        ops.append(PlanOp(PlanOp.CONFIG, "CONFIG", layout.config_addr, layout.config_len, config=config))
+    if verify:
+        ops = _with_data_verify(ops, config)
+        if write_config:
+            ops.append(PlanOp(PlanOp.VERIFY, "CONFIG", layout.config_addr, layout.config_len, config=config))
+    total = len(layout.aprom_pages) + len(layout.ldrom_pages)
+    return ProgrammingPlan(device_info, config, ops, transport,
+                           "%d page erases (only the populated pages; %d left alone)" % (len(pages), total - len(pages)))
@@ -0,0 +1,299 @@
+"""
+Prepared image cache
+------
+
+A long-running programmer (the station daemon) sees the same images over and over. PreparedImageCache keeps what
+a job derives from its files (the parsed images, the config bytes, the padded regions, their checksums and page
+CRCs), so a repeated job doesn't touch the files again beyond a stat():
+
+- files are remembered by path with their mtime and size; a file that changed on disk is read again
+- images are keyed by the SHA-256 of their contents, so the same image reached through different paths (or sent as
+  data by different clients) is held once, and every prepared entry that uses it shares that copy
+- prepared entries are keyed by (image digests, device ID, config, padding layout) and evicted least recently used
+  first once the cache holds more than `max_bytes` of image data
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+try:
+    from .config import ConfigFlags, DeviceInfo
+    from .fileformats import format_from_filename, load_segments
+    from .image import SparseImage
+    from .imagetools import checksum16, page_crcs
+    from .nupkg import NuPackage
+except ImportError:
+    from config import ConfigFlags, DeviceInfo
+    from fileformats import format_from_filename, load_segments
+    from image import SparseImage
+    from imagetools import checksum16, page_crcs
+    from nupkg import NuPackage
+
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+# file stat entries are tiny; past this many the table is just dropped and rebuilt
+MAX_FILES = 1024
+
+REGIONS = ("aprom", "ldrom")
+
+
+class PreparedImage:
+    """
+    Everything a job needs from its images, ready to hand to program_all()
+    ------
+
+    #### Attributes:
+        aprom (bytes or SparseImage), ldrom (bytes or SparseImage):
+            The images, padded (virtually) to their region size if a padding layout was given; empty if not used
+        config_bytes (bytes):
+            The config to program, or None
+        digests (dict[str, str]):
+            Region -> SHA-256 of its source image
+        checksums (dict[str, int]):
+            Region -> 16-bit byte sum of the (padded) image, as the ISP protocol computes it
+        page_crcs (dict[str, list[int]]):
+            Region -> CRC-32 of every page of the (padded) image
+    """
+
+    def __init__(self, device_info: DeviceInfo, images: Dict[str, object], digests: Dict[str, str],
+                 config_bytes: bytes, layout=None):
+        self.device_id = device_info.device_id
+        self.config_bytes = config_bytes
+        self.digests = digests
+        self.checksums = {}
+        self.page_crcs = {}
+        self.metadata_size = 0
+        for region in REGIONS:
+            image = images.get(region) or bytes()
+            size = getattr(layout, region + "_size", 0) if layout is not None else 0
+            if len(image) and len(image) < size:
+                image = SparseImage.wrap(image).padded(size)
+            setattr(self, region, image)
+            if len(image):
+                data = image.tobytes() if isinstance(image, SparseImage) else image
+                self.checksums[region] = checksum16(data)
+                self.page_crcs[region] = page_crcs(data, device_info.page_size)
+                self.metadata_size += 4 * len(self.page_crcs[region])
+
+    def get_config(self) -> ConfigFlags:
+        """
+        A fresh ConfigFlags (programming may modify it), or None if the job has no config
+        """
+        if self.config_bytes is None:
+            return None
+        return ConfigFlags.from_bytes(self.config_bytes, self.device_id)
+
+
+class PreparedImageCache:
+    """
+    Size-bounded LRU cache of loaded and prepared images; safe to share between threads
+    ------
+
+    #### Args:
+        max_bytes (int):
+            Image bytes (populated bytes of every distinct image, plus page CRC tables) to keep
+
+    #### Attributes:
+        hits (int), misses (int), evictions (int):
+            Counters for prepare()
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.RLock()
+        # path -> ((mtime_ns, size), digest)
+        self._files: Dict[str, Tuple[Tuple[int, int], str]] = {}
+        # digest -> [image, number of prepared entries using it]
+        self._images: Dict[str, list] = {}
+        self._prepared: "OrderedDict[tuple, PreparedImage]" = OrderedDict()
+        # (path, device_id) -> ((mtime_ns, size), config bytes)
+        self._configs: Dict[tuple, Tuple[Tuple[int, int], bytes]] = {}
+        # path -> ((mtime_ns, size), NuPackage)
+        self._packages: Dict[str, Tuple[Tuple[int, int], NuPackage]] = {}
+
+    @staticmethod
+    def _stat(path) -> Tuple[int, int]:
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+
+    @staticmethod
+    def _image_size(image) -> int:
+        return image.populated if isinstance(image, SparseImage) else len(image)
+
+    @property
+    def size(self) -> int:
+        """
+        Bytes currently accounted against max_bytes
+        """
+        return sum(self._image_size(image) for image, _ in self._images.values()) + \
+            sum(entry.metadata_size for entry in self._prepared.values())
+
+    def _intern(self, digest, image):
+        # the first copy of an image wins, so every user of the same contents shares it; the most recently used
+        # image moves to the end, where unused images are evicted last
+        if digest in self._images:
+            self._images[digest] = self._images.pop(digest)
+            return self._images[digest][0]
+        self._images[digest] = [image, 0]
+        return image
+
+    def load(self, source) -> Tuple[str, object]:
+        """
+        Load an image from a path (raw binary, or HEX/S-record by extension) or take it from bytes
+
+        A path whose mtime and size haven't changed since it was last loaded isn't read again, as long as its image
+        is still cached. Images that no prepared entry uses count against max_bytes too, and are evicted least
+        recently loaded first.
+
+        #### Returns:
+            tuple[str, bytes or SparseImage]: (SHA-256 of the contents, image)
+
+        #### Raises:
+            OSError, FirmwareFileError
+        """
+        with self._lock:
+            digest, image = self._load(source)
+            self._evict(keep=digest)
+            return digest, image
+
+    def _load(self, source) -> Tuple[str, object]:
+        if not isinstance(source, str):
+            digest = hashlib.sha256(source).hexdigest()
+            return digest, self._intern(digest, bytes(source))
+        stat = self._stat(source)
+        known = self._files.get(source)
+        if known is not None and known[0] == stat and known[1] in self._images:
+            return known[1], self._intern(known[1], None)
+        with open(source, "rb") as f:
+            raw = f.read()
+        digest = hashlib.sha256(raw).hexdigest()
+        if digest in self._images:
+            image = self._intern(digest, None)
+        elif format_from_filename(source) != "bin":
+            image = self._intern(digest, SparseImage.from_segments(load_segments(source)))
+        else:
+            image = self._intern(digest, raw)
+        if len(self._files) >= MAX_FILES:
+            self._files.clear()
+        self._files[source] = (stat, digest)
+        return digest, image
+
+    def load_config(self, path: str, device_id: int) -> bytes:
+        """
+        Config bytes from a config.json, parsed once per (path, device) until the file changes
+
+        #### Returns:
+            bytes: the config bytes, or None if the file couldn't be parsed
+        """
+        with self._lock:
+            stat = self._stat(path)
+            known = self._configs.get((path, device_id))
+            if known is not None and known[0] == stat:
+                return known[1]
+            config = ConfigFlags.from_json_file(path, device_id)
+            config_bytes = config.to_bytes() if config is not None else None
+            if len(self._configs) >= MAX_FILES:
+                self._configs.clear()
+            self._configs[(path, device_id)] = (stat, config_bytes)
+            return config_bytes
+
+    def open_package(self, path: str) -> NuPackage:
+        """
+        A NuPackage for `path`, mapped and verified once and reused until the file changes
+
+        #### Raises:
+            NuPackageError, OSError
+        """
+        with self._lock:
+            stat = self._stat(path)
+            known = self._packages.get(path)
+            if known is not None and known[0] == stat:
+                return known[1]
+            package = NuPackage.open(path)
+            if known is not None:
+                known[1].close()
+            if len(self._packages) >= MAX_FILES:
+                self._packages.clear()
+            self._packages[path] = (stat, package)
+            return package
+
+    def prepare(self, device_info: DeviceInfo, aprom=None, ldrom=None, config_bytes: bytes = None,
+                pad_config_bytes: bytes = None) -> PreparedImage:
+        """
+        The PreparedImage for a job
+
+        #### Args:
+            device_info (DeviceInfo):
+                The target device
+            aprom, ldrom (str or bytes):
+                Image paths or contents (None or empty to leave the region alone)
+            config_bytes (bytes):
+                The config to program, or None
+            pad_config_bytes (bytes):
+                Config whose layout the images are padded to; None to leave them unpadded (e.g. when the LDROM
+                size in the config may still be overridden)
+
+        #### Returns:
+            PreparedImage
+        """
+        with self._lock:
+            images = {}
+            digests = {}
+            for region, source in zip(REGIONS, (aprom, ldrom)):
+                if source is not None and len(source):
+                    # evicted only once the new entry holds its images
+                    digests[region], images[region] = self._load(source)
+            key = (device_info.device_id, digests.get("aprom"), digests.get("ldrom"),
+                   None if config_bytes is None else bytes(config_bytes),
+                   None if pad_config_bytes is None else bytes(pad_config_bytes))
+            entry = self._prepared.get(key)
+            if entry is not None:
+                self.hits += 1
+                self._prepared.move_to_end(key)
+                return entry
+            self.misses += 1
+            layout = None
+            if pad_config_bytes is not None:
+                layout = device_info.get_layout(ConfigFlags.from_bytes(pad_config_bytes, device_info.device_id))
+            entry = PreparedImage(device_info, images, digests, key[3], layout)
+            for digest in digests.values():
+                self._images[digest][1] += 1
+            self._prepared[key] = entry
+            self._evict()
+            return entry
+
+    def _evict(self, keep=None):
+        # images that no prepared entry uses go first, least recently used first (a file keeps its digest, so a
+        # later stat hit just reloads it); `keep` is the image load() is about to return
+        for digest in [d for d, (_, users) in self._images.items() if users == 0 and d != keep]:
+            if self.size <= self.max_bytes:
+                return
+            del self._images[digest]
+        # the entry just added is never evicted, even if it alone is over the budget
+        while len(self._prepared) > 1 and self.size > self.max_bytes:
+            _, entry = self._prepared.popitem(last=False)
+            self.evictions += 1
+            for digest in entry.digests.values():
+                self._images[digest][1] -= 1
+                if self._images[digest][1] == 0:
+                    del self._images[digest]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._prepared), "images": len(self._images), "bytes": self.size,
+                    "max_bytes": self.max_bytes, "hits": self.hits, "misses": self.misses,
+                    "evictions": self.evictions}
+
+    def clear(self):
+        with self._lock:
+            self._files.clear()
+            self._images.clear()
+            self._prepared.clear()
+            self._configs.clear()
+            for _, package in self._packages.values():
+                package.close()
+            self._packages.clear()
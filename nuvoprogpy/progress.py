@@ -0,0 +1,258 @@
+import json
+import sys
+import time
+from typing import Callable, Union
+
+
+class ProgressEvent:
+    """
+    A single progress update
+    ------
+
+    #### Attributes:
+        phase (str):
+            Name of the operation in progress (e.g. "Programming Rom")
+        done (int):
+            Number of bytes completed
+        total (int):
+            Total number of bytes for this phase
+        elapsed (float):
+            Seconds since the phase started
+        throughput (float):
+            Average bytes per second since the phase started
+        eta (float):
+            Estimated seconds remaining (None if unknown)
+    """
+    __slots__ = ("phase", "done", "total", "elapsed", "throughput", "eta")
+
+    def __init__(self, phase: str, done: int, total: int, elapsed: float):
+        self.phase = phase
+        self.done = done
+        self.total = total
+        self.elapsed = elapsed
+        self.throughput = (done / elapsed) if elapsed > 0 else 0.0
+        if self.throughput > 0 and total >= done:
+            self.eta = (total - done) / self.throughput
+        else:
+            self.eta = None
+
+    @property
+    def fraction(self) -> float:
+        if self.total <= 0:
+            return 1.0
+        return min(float(self.done) / self.total, 1.0)
+
+    @property
+    def finished(self) -> bool:
+        return self.done >= self.total
+
+    def to_dict(self) -> dict:
+        return {
+            "phase": self.phase,
+            "done": self.done,
+            "total": self.total,
+            "elapsed": round(self.elapsed, 3),
+            "throughput": round(self.throughput, 1),
+            "eta": None if self.eta is None else round(self.eta, 3),
+        }
+
+
+class ProgressRenderer:
+    """
+    Base class for progress renderers
+    ------
+
+    Renderers are only called at the rate allowed by ProgressReporter, so they are free to do slow console I/O.
+
+    #### Attributes:
+        split_transfers (bool):
+            Whether a transfer that the programmer could do in one call should be split up so this renderer
+            sees intermediate progress
+    """
+    split_transfers = True
+
+    def render(self, event: ProgressEvent):
+        pass
+
+    def log(self, text: str) -> bool:
+        """
+        Take a log message from the programmer; returns False if the programmer should print it itself
+        """
+        return False
+
+    def finish(self, event: ProgressEvent):
+        self.render(event)
+
+
+class SilentRenderer(ProgressRenderer):
+    pass
+
+
+class TTYRenderer(ProgressRenderer):
+    # a bar that only shows the start and the end of a transfer is not worth slowing the transfer down for
+    split_transfers = False
+
+    def __init__(self, stream=None, bar_length=54):
+        self.stream = stream
+        self.bar_length = bar_length
+
+    @staticmethod
+    def _format_rate(rate: float) -> str:
+        if rate >= 1024:
+            return "%.1f KB/s" % (rate / 1024)
+        return "%d B/s" % rate
+
+    def render(self, event: ProgressEvent):
+        stream = self.stream or sys.stdout
+        percent = event.fraction
+        arrow = '-' * int(round(percent * self.bar_length) - 1) + '>'
+        spaces = ' ' * (self.bar_length - len(arrow))
+        line = "\r{0}: [{1}] {2}%".format(event.phase, arrow + spaces, int(round(percent * 100)))
+        if event.throughput > 0:
+            line += " {}".format(self._format_rate(event.throughput))
+            if event.eta is not None and not event.finished:
+                line += " ETA {:.1f}s".format(event.eta)
+        # pad to clear any leftovers from a previously longer line
+        stream.write(line + "   ")
+        stream.flush()
+
+    def finish(self, event: ProgressEvent):
+        self.render(event)
+        stream = self.stream or sys.stdout
+        stream.write("\n")
+        stream.flush()
+
+
+class JSONLinesRenderer(ProgressRenderer):
+    """
+    Emits one JSON object per line, for consumption by station scripts.
+
+    Writes to stderr by default, so the stream is not mixed up with the tools' regular output on stdout;
+    log messages are emitted as `{"event": "log", "text": ...}` objects instead of being printed.
+    """
+
+    def __init__(self, stream=None):
+        self.stream = stream
+
+    def _write(self, obj: dict):
+        stream = self.stream or sys.stderr
+        stream.write(json.dumps(obj) + "\n")
+        stream.flush()
+
+    def _emit(self, event: ProgressEvent, kind: str):
+        obj = event.to_dict()
+        obj["event"] = kind
+        self._write(obj)
+
+    def log(self, text: str) -> bool:
+        self._write({"event": "log", "text": text})
+        return True
+
+    def render(self, event: ProgressEvent):
+        self._emit(event, "progress")
+
+    def finish(self, event: ProgressEvent):
+        self._emit(event, "done")
+
+
+class _CallbackRenderer(ProgressRenderer):
+    def __init__(self, callback: Callable[[ProgressEvent], None]):
+        self.callback = callback
+
+    def render(self, event: ProgressEvent):
+        self.callback(event)
+
+
+RENDERERS = {
+    "tty": TTYRenderer,
+    "json": JSONLinesRenderer,
+    "none": SilentRenderer,
+}
+
+
+def get_renderer(renderer: Union[ProgressRenderer, Callable, str, None], silent=False) -> ProgressRenderer:
+    """
+    Resolve a renderer name, callable or object to a ProgressRenderer
+    ------
+
+    #### Args:
+        renderer (ProgressRenderer | Callable | str | None):
+            "tty", "json", "none", a callable taking a ProgressEvent, or a ProgressRenderer.
+            None selects "tty", or "none" if silent is set.
+        silent (bool):
+            Used when renderer is None
+
+    #### Returns:
+        ProgressRenderer
+    """
+    if renderer is None:
+        renderer = "none" if silent else "tty"
+    if isinstance(renderer, ProgressRenderer):
+        return renderer
+    if isinstance(renderer, str):
+        if renderer not in RENDERERS:
+            raise ValueError("Unknown progress renderer: %s" % renderer)
+        return RENDERERS[renderer]()
+    if callable(renderer):
+        return _CallbackRenderer(renderer)
+    raise TypeError("Invalid progress renderer: %r" % (renderer,))
+
+
+class ProgressReporter:
+    """
+    Rate-limited progress reporter
+    ------
+
+    Callers may call update() as often as they like (e.g. once per packet); the renderer is only invoked
+    when the phase changes, when the phase completes, or when at least `min_interval` seconds have passed
+    since the previous render.
+    """
+    DEFAULT_INTERVAL = 0.1
+
+    def __init__(self, renderer: Union[ProgressRenderer, Callable, str, None] = None, silent=False, min_interval=DEFAULT_INTERVAL):
+        self.renderer = get_renderer(renderer, silent)
+        self.enabled = not isinstance(self.renderer, SilentRenderer)
+        self.min_interval = min_interval
+        self._phase = None
+        self._start = 0.0
+        self._last = 0.0
+
+    def start(self, phase: str, total: int):
+        self._phase = phase
+        self._start = time.monotonic()
+        self._last = self._start
+        if self.enabled:
+            self.renderer.render(ProgressEvent(phase, 0, total, 0.0))
+
+    def update(self, phase: str, done: int, total: int):
+        """
+        Report progress for a phase, starting it if it is not the current one
+        """
+        if not self.enabled:
+            return
+        if phase != self._phase:
+            self.start(phase, total)
+            if done == 0:
+                return
+        now = time.monotonic()
+        if done >= total:
+            self._phase = None
+            self.renderer.finish(ProgressEvent(phase, done, total, now - self._start))
+            return
+        if now - self._last < self.min_interval:
+            return
+        self._last = now
+        self.renderer.render(ProgressEvent(phase, done, total, now - self._start))
+
+    @property
+    def split_transfers(self) -> bool:
+        """
+        Whether callers should split large transfers into chunks to report progress on them
+        """
+        return self.enabled and self.renderer.split_transfers
+
+    def log(self, text: str) -> bool:
+        """
+        Hand a log message to the renderer; returns False if the caller should print it itself
+        """
+        return self.renderer.log(text)
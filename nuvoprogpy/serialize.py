@@ -0,0 +1,293 @@
+"""
+Per-board serialization
+------
+
+Patches per-board values (serial numbers, MAC addresses, UID-derived IDs) into APROM or SPROM without copying
+the base image for every board. A rendered ImageVariant only holds the patched bytes; the base image is shared.
+
+Templates (JSON objects, e.g. in a batch manifest's "serialize" section):
+
+    {
+        "name": "serial",           (used in logs)
+        "region": "aprom",          ("aprom" or "sprom"; address is relative to the start of the region)
+        "address": "0x47F0",        (int or hex string)
+        "length": 4,
+        "format": "le",             ("le"/"be" integer, "ascii" decimal, "hex" ascii hex, "raw" bytes)
+        "source": "counter",        ("counter" or "uid")
+        "start": 1000,              (counter only, default 0)
+        "step": 1,                  (counter only, default 1)
+        "prefix": "0242AC"          (optional hex bytes placed before the value, e.g. a MAC OUI)
+    }
+"""
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+
+try:
+    from .image import SparseImage
+    from .imagetools import is_blank
+except ImportError:
+    from image import SparseImage
+    from imagetools import is_blank
+
+REGIONS = ("aprom", "sprom")
+FORMATS = ("le", "be", "ascii", "hex", "raw")
+SOURCES = ("counter", "uid")
+
+
+class SerializationError(Exception):
+    pass
+
+
+def _parse_int(value) -> int:
+    if isinstance(value, str):
+        return int(value, 0)
+    return int(value)
+
+
+class PatchTemplate:
+    def __init__(self, template: dict):
+        self.name = template.get("name", "patch")
+        self.region = template.get("region", "aprom")
+        self.address = _parse_int(template["address"])
+        self.length = int(template["length"])
+        self.format = template.get("format", "le")
+        self.source = template.get("source", "counter")
+        self.start = _parse_int(template.get("start", 0))
+        self.step = _parse_int(template.get("step", 1))
+        self.prefix = bytes.fromhex(template.get("prefix", ""))
+        if self.region not in REGIONS:
+            raise SerializationError("%s: invalid region %s" % (self.name, self.region))
+        if self.format not in FORMATS:
+            raise SerializationError("%s: invalid format %s" % (self.name, self.format))
+        if self.source not in SOURCES:
+            raise SerializationError("%s: invalid source %s" % (self.name, self.source))
+        if len(self.prefix) >= self.length:
+            raise SerializationError("%s: prefix does not fit in %d bytes" % (self.name, self.length))
+
+    @property
+    def uses_uid(self) -> bool:
+        return self.source == "uid"
+
+    def render(self, counter: int, uid: bytes) -> bytes:
+        """
+        Returns the `length` bytes to patch in for the given board
+        """
+        size = self.length - len(self.prefix)
+        if self.source == "counter":
+            value = self.start + self.step * counter
+        else:
+            if uid is None:
+                raise SerializationError("%s: device UID is not available" % self.name)
+            value = uid
+        if self.format == "raw":
+            if isinstance(value, int):
+                value = value.to_bytes(size, "big")
+            data = bytes(value[:size]).ljust(size, b"\xff")
+        else:
+            if isinstance(value, (bytes, bytearray)):
+                value = int.from_bytes(value, "big")
+            if self.format in ("le", "be"):
+                data = (value & ((1 << (8 * size)) - 1)).to_bytes(size, "little" if self.format == "le" else "big")
+            elif self.format == "ascii":
+                data = str(value).zfill(size)[-size:].encode()
+            else:
+                data = "{:X}".format(value).zfill(size)[-size:].encode()
+        return self.prefix + data
+
+
+class ImageVariant:
+    """
+    One board's patches on top of a shared base image
+    ------
+
+    #### Attributes:
+        counter (int): The counter value this variant was rendered for
+        values (dict): Template name -> patched bytes (hex), for logging
+        patches (list[tuple[str, int, bytes]]): (region, address, data) for every template
+    """
+    __slots__ = ("counter", "values", "patches")
+
+    def __init__(self, counter: int, patches: List[Tuple[str, int, bytes]], values: dict):
+        self.counter = counter
+        self.patches = patches
+        self.values = values
+
+    def region_patches(self, region: str) -> List[Tuple[int, bytes]]:
+        return [(addr, data) for r, addr, data in self.patches if r == region]
+
+    def pages(self, base: bytes, region: str, page_size: int) -> Dict[int, bytes]:
+        """
+        Returns page address (relative to the region) -> patched page contents, for only the pages that are patched.
+        Bytes past the end of `base` are 0xFF.
+        """
+        pages = {}
+        for addr, data in self.region_patches(region):
+            for page in range(addr - addr % page_size, addr + len(data), page_size):
+                if page not in pages:
+                    pages[page] = bytearray(base[page:page + page_size].ljust(page_size, b"\xff"))
+        for addr, data in self.region_patches(region):
+            for i, b in enumerate(data):
+                page = (addr + i) - (addr + i) % page_size
+                pages[page][(addr + i) - page] = b
+        return {page: bytes(data) for page, data in pages.items()}
+
+    def overlay(self, base: bytes, region: str = "aprom") -> SparseImage:
+        """
+        Returns `base` with this variant's patches laid over it, as a SparseImage whose segments reference `base`
+        instead of copying it (for programming the whole image in one pass)
+        """
+        image = SparseImage(len(base))
+        view = memoryview(base)
+        pos = 0
+        for addr, data in sorted(self.region_patches(region)):
+            image.add(pos, view[pos:addr])
+            image.add(addr, data)
+            pos = max(pos, addr + len(data))
+        image.add(pos, view[pos:])
+        return image
+
+
+class Serializer:
+    """
+    Renders ImageVariants for consecutive boards
+    ------
+
+    The counter only advances when commit() is called after a board passed, so a failed board's serial number is
+    reused. If no template depends on the device UID, the next board's variant is rendered on a worker thread as
+    soon as the current one is committed.
+
+    #### Args:
+        templates (list[dict]):
+            Patch templates (see module docstring)
+        state_file (str):
+            Optional JSON file that persists the counter between runs
+        counter (int):
+            Initial counter if there is no state file
+    """
+
+    def __init__(self, templates: list, state_file: str = None, counter: int = 0):
+        self.templates = [PatchTemplate(t) for t in templates]
+        self.state_file = state_file
+        self.counter = counter
+        if state_file and os.path.isfile(state_file):
+            with open(state_file, "r") as f:
+                self.counter = int(json.load(f)["counter"])
+        self._uses_uid = any(t.uses_uid for t in self.templates)
+        self._executor = None
+        self._pending = None
+        if not self._uses_uid:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+            self._pending = self._executor.submit(self.render, self.counter, None)
+
+    @staticmethod
+    def from_manifest(section: dict, base_dir: str = ".") -> "Serializer":
+        state_file = section.get("state")
+        if state_file:
+            state_file = os.path.join(base_dir, state_file)
+        return Serializer(section.get("templates", []), state_file, int(section.get("counter", 0)))
+
+    @property
+    def uses_uid(self) -> bool:
+        return self._uses_uid
+
+    def render(self, counter: int, uid: bytes) -> ImageVariant:
+        patches = []
+        values = {}
+        for t in self.templates:
+            data = t.render(counter, uid)
+            patches.append((t.region, t.address, data))
+            values[t.name] = data.hex()
+        return ImageVariant(counter, patches, values)
+
+    def next_variant(self, uid: bytes = None) -> ImageVariant:
+        """
+        Returns the variant for the board currently being programmed
+        """
+        if self._pending is not None:
+            variant = self._pending.result()
+            if variant.counter == self.counter:
+                return variant
+        return self.render(self.counter, uid)
+
+    def commit(self):
+        """
+        Mark the current variant as used and start rendering the next one
+        """
+        self.counter += 1
+        if self.state_file:
+            tmp = self.state_file + ".tmp"
+            with open(tmp, "w") as f:
+                json.dump({"counter": self.counter}, f)
+            os.replace(tmp, self.state_file)
+        if self._executor is not None:
+            self._pending = self._executor.submit(self.render, self.counter, None)
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+def program_variant_icp(nuvo, variant: ImageVariant, base_aprom: bytes, verify=True) -> bool:
+    """
+    Apply a variant on a chip whose APROM already holds `base_aprom`, using Nuvo51ICP
+    ------
+
+    Patches that land on erased bytes are written directly; otherwise only the affected pages are erased and
+    rewritten. SPROM patches go through write_sprom().
+
+    #### Returns:
+        bool: True if all patches were written (and verified)
+    """
+    device_info = nuvo.get_device_info()
+    sprom_patches = variant.region_patches("sprom")
+    if sprom_patches and device_info.sprom_len == 0:
+        nuvo.print_err("ERROR: Device does not have SPROM.")
+        return False
+    page_size = device_info.page_size
+    direct = []
+    for addr, data in variant.region_patches("aprom"):
+        if is_blank(base_aprom[addr:addr + len(data)]):
+            direct.append((addr, data))
+    direct_addrs = {addr for addr, _ in direct}
+    pages = {}
+    if len(direct) != len(variant.region_patches("aprom")):
+        all_pages = variant.pages(base_aprom, "aprom", page_size)
+        for addr, data in variant.region_patches("aprom"):
+            if addr in direct_addrs:
+                continue
+            for page in range(addr - addr % page_size, addr + len(data), page_size):
+                pages[device_info.aprom_addr + page] = all_pages[page]
+    for addr, data in direct:
+        nuvo.write_flash(device_info.aprom_addr + addr, data)
+    if pages and not nuvo.program_pages(pages, verify=verify):
+        return False
+
+    if sprom_patches:
+        current = nuvo.read_sprom(0, device_info.sprom_len)
+        if all(is_blank(current[addr:addr + len(data)]) for addr, data in sprom_patches):
+            for addr, data in sprom_patches:
+                nuvo.write_sprom(addr, data)
+        else:
+            merged = bytearray(current)
+            for addr, data in sprom_patches:
+                merged[addr:addr + len(data)] = data
+            nuvo.erase_sprom(0)
+            nuvo.write_sprom(0, bytes(merged))
+
+    if verify:
+        # patches tend to sit next to each other, so they are read back together
+        ranges = [(device_info.aprom_addr + addr, len(data)) for addr, data in direct]
+        ranges += [(device_info.sprom_addr + addr, len(data)) for addr, data in sprom_patches]
+        read_back = nuvo.read_ranges(ranges)
+        for (addr, data), got in zip(direct, read_back):
+            if got != data:
+                nuvo.print_err("Serialization verify failed at 0x%04X" % addr)
+                return False
+        for (addr, data), got in zip(sprom_patches, read_back[len(direct):]):
+            if got != data:
+                nuvo.print_err("SPROM serialization verify failed at 0x%02X" % addr)
+                return False
+    return True
@@ -0,0 +1,182 @@
+"""
+Flash verification
+------
+
+Compares what was read back from the chip with what was written. The common case (everything matches) costs a
+single bytes comparison; only a failed verify looks for the mismatched ranges (see imagetools.diff_ranges(), which
+uses numpy if it is installed). A SparseImage is compared segment by segment, and its gaps only have to read back
+as the fill byte, so the padding is never built.
+"""
+from typing import Callable, Dict, List, Tuple
+
+try:
+    from .image import SparseImage
+    from .imagetools import diff_ranges, is_blank
+except ImportError:
+    from image import SparseImage
+    from imagetools import diff_ranges, is_blank
+
+
+class VerifyResult:
+    """
+    The outcome of a verify
+    ------
+
+    Truthy when the flash matched, so `if not nuvo.verify_flash(...)` works as before.
+
+    #### Attributes:
+        addr (int):
+            Address of the first byte compared
+        length (int):
+            Number of bytes expected
+        ranges (list[tuple[int, int]]):
+            Mismatched (start, end) address ranges, end exclusive; bytes that could not be read count as mismatched
+        byte_errors (int):
+            Number of mismatched bytes
+        pages (list[int]):
+            Start addresses of the pages the mismatches fall in
+    """
+    __slots__ = ("addr", "length", "ranges", "byte_errors", "pages")
+
+    def __init__(self, addr: int, length: int, ranges: List[Tuple[int, int]], page_size: int = 128):
+        self.addr = addr
+        self.length = length
+        self.ranges = ranges
+        self.byte_errors = sum(end - start for start, end in ranges)
+        pages = set()
+        for start, end in ranges:
+            pages.update(range(start - start % page_size, end, page_size))
+        self.pages = sorted(pages)
+
+    @property
+    def ok(self) -> bool:
+        return not self.ranges
+
+    def __bool__(self) -> bool:
+        return self.ok
+
+    def describe(self, max_ranges=8) -> str:
+        if self.ok:
+            return "Verified %d bytes at 0x%04X." % (self.length, self.addr)
+        lines = ["Verification failed. %d byte errors in %d page(s): %s" % (
+            self.byte_errors, len(self.pages), ", ".join("0x%04X" % p for p in self.pages))]
+        for start, end in self.ranges[:max_ranges]:
+            lines.append("  0x%04X-0x%04X (%d bytes)" % (start, end - 1, end - start))
+        if len(self.ranges) > max_ranges:
+            lines.append("  ... and %d more ranges" % (len(self.ranges) - max_ranges))
+        return "\n".join(lines)
+
+    def __str__(self):
+        return self.describe()
+
+
+def _diff_offsets_image(image: SparseImage, actual):
+    ranges = []
+    for start, length, data in image.pieces(0, len(actual)):
+        got = actual[start:start + length]
+        if data is None:
+            if is_blank(got, image.fill):
+                continue
+            data = bytes([image.fill]) * length
+        elif data == got:
+            continue
+        for diff_start, diff_end in diff_ranges(data, got):
+            if ranges and ranges[-1][1] == start + diff_start:
+                ranges[-1] = (ranges[-1][0], start + diff_end)
+            else:
+                ranges.append((start + diff_start, start + diff_end))
+    return ranges
+
+
+def compare(expected, actual, addr: int = 0, page_size: int = 128) -> VerifyResult:
+    """
+    Compare the expected image with the data read back from `addr`
+
+    #### Args:
+        expected (bytes-like or SparseImage):
+            The data that should be in the flash
+        actual (bytes-like):
+            The data that was read back; if it is shorter than `expected`, the missing bytes count as mismatched
+
+    #### Keyword args:
+        addr (int) (=0):
+            Flash address of the first byte, used for the reported ranges and pages
+        page_size (int) (=128):
+            Flash page size
+
+    #### Returns:
+        VerifyResult
+    """
+    actual = memoryview(actual).cast("B")
+    length = len(expected)
+    common = min(length, len(actual))
+    if isinstance(expected, SparseImage):
+        offsets = _diff_offsets_image(expected, actual[:common])
+    else:
+        expected = memoryview(expected).cast("B")
+        if common == length and expected == actual[:length]:
+            return VerifyResult(addr, length, [], page_size)
+        offsets = diff_ranges(expected[:common], actual[:common])
+    ranges = [(addr + start, addr + end) for start, end in offsets]
+    if common < length:
+        if ranges and ranges[-1][1] == addr + common:
+            ranges[-1] = (ranges[-1][0], addr + length)
+        else:
+            ranges.append((addr + common, addr + length))
+    return VerifyResult(addr, length, ranges, page_size)
+
+
+def page_images(result: VerifyResult, data, addr: int, page_size: int, read: Callable[[int, int], bytes]) -> Dict[int, bytes]:
+    """
+    Full contents of each page in `result.pages`: the expected bytes, plus what the flash currently holds in the
+    part of the page that `data` doesn't cover (read with `read(addr, length)`)
+    """
+    end = addr + len(data)
+    pages = {}
+    for page in result.pages:
+        start, stop = max(page, addr), min(page + page_size, end)
+        head = read(page, start - page) if start > page else bytes()
+        tail = read(stop, page + page_size - stop) if stop < page + page_size else bytes()
+        pages[page] = bytes(head) + bytes(data[start - addr:stop - addr]) + bytes(tail)
+    return pages
+
+
+def repair(result: VerifyResult, data, addr: int, page_size: int, read: Callable[[int, int], bytes],
+           program_pages: Callable[[Dict[int, bytes]], bool], retries: int, log: Callable = None) -> VerifyResult:
+    """
+    Reprogram only the pages a failed verify found, and verify those pages again, up to `retries` times
+    ------
+
+    #### Args:
+        result (VerifyResult):
+            The failed verify of `data` at `addr`
+        read (Callable[[int, int], bytes]):
+            Reads (addr, length) from the flash
+        program_pages (Callable[[dict[int, bytes]], bool]):
+            Erases and writes whole pages (page address -> contents)
+        retries (int):
+            Maximum number of repair passes
+        log (Callable):
+            Called with a status message before each pass
+
+    #### Returns:
+        VerifyResult:
+            The result of the last verify; truthy if the repair succeeded
+    """
+    if not isinstance(data, SparseImage):
+        data = memoryview(data).cast("B")
+    end = addr + len(data)
+    for attempt in range(retries):
+        if result:
+            break
+        if log is not None:
+            log("Repairing %d page(s): %s (attempt %d of %d)" % (
+                len(result.pages), ", ".join("0x%04X" % p for p in result.pages), attempt + 1, retries))
+        pages = page_images(result, data, addr, page_size, read)
+        program_pages(pages)
+        ranges = []
+        for page in sorted(pages):
+            start, stop = max(page, addr), min(page + page_size, end)
+            ranges += compare(data[start - addr:stop - addr], read(start, stop - start), start, page_size).ranges
+        result = VerifyResult(result.addr, result.length, ranges, page_size)
+    return result
@@ -0,0 +1,75 @@
+from nuvoprogpy.nuvo51icpy.libicp_iface import ICPLibInterface
+
+CONFIG_ADDR = 0x30000
+
+
+class FakeICP(ICPLibInterface):
+    """
+    In-memory ICP target: programming only clears bits, erases work on 128-byte pages.
+    Once a config with the LOCK bit cleared is written, any further write or erase fails the test.
+    """
+
+    def __init__(self, device_id=0x3650, size=0x30200):
+        self.device_id = device_id
+        self.flash = bytearray(b"\xff" * size)
+        self.calls = []
+        self.locked = False
+
+    def _check_unlocked(self, addr):
+        assert not self.locked, "0x%04X changed after the chip was locked" % addr
+
+    def init(self):
+        return True
+
+    def deinit(self, leave_reset_high):
+        return True
+
+    def entry(self, do_reset=True):
+        return self.device_id
+
+    def exit(self):
+        return True
+
+    def reentry(self, delay1=5000, delay2=1000, delay3=10):
+        return True
+
+    def read_device_id(self):
+        return self.device_id
+
+    def read_pid(self):
+        return 0
+
+    def read_cid(self):
+        return 0xDA
+
+    def read_uid(self):
+        return bytes(12)
+
+    def read_ucid(self):
+        return bytes(16)
+
+    def read_flash(self, addr, length):
+        self.calls.append(("read", addr, length))
+        return bytes(self.flash[addr:addr + length])
+
+    def write_flash(self, addr, data):
+        self._check_unlocked(addr)
+        self.calls.append(("write", addr, len(data)))
+        for i, b in enumerate(bytes(data)):
+            self.flash[addr + i] &= b
+        if addr == CONFIG_ADDR and not self.flash[CONFIG_ADDR] & 0x02:
+            self.locked = True
+        return addr + len(data)
+
+    def mass_erase(self):
+        self.calls.append(("mass_erase",))
+        self.flash[:] = b"\xff" * len(self.flash)
+        self.locked = False
+        return True
+
+    def page_erase(self, addr):
+        self._check_unlocked(addr)
+        self.calls.append(("page_erase", addr))
+        page = addr - addr % 128
+        self.flash[page:page + 128] = b"\xff" * 128
+        return True
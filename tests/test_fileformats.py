@@ -0,0 +1,79 @@
+import io
+
+from nuvoprogpy.fileformats import (FirmwareFileError, IntelHexEncoder, SRecordEncoder, format_from_filename,
+                                    get_encoder, read_segments, segment_pages)
+
+
+def _encode(cls, data, addr, chunk=7):
+    f = io.BytesIO()
+    enc = cls(f, addr)
+    for i in range(0, len(data), chunk):
+        enc.write(data[i:i + chunk])
+    enc.close()
+    return f.getvalue().decode().splitlines()
+
+
+def test_ihex_skips_erased_records():
+    data = bytes(range(16)) + b"\xff" * 32 + b"\x01\x02"
+    lines = _encode(IntelHexEncoder, data, 0x0008)
+    # first record is short so the rest are 16-byte aligned
+    assert lines[0] == ":080008000001020304050607D4"
+    assert lines[1].startswith(":10001000")
+    # 0x20-0x2F is all 0xFF and left out
+    assert lines[2].startswith(":0A003000")
+    assert lines[-1] == ":00000001FF"
+    for line in lines:
+        assert sum(bytes.fromhex(line[1:])) & 0xFF == 0
+
+
+def test_ihex_extended_address():
+    lines = _encode(IntelHexEncoder, b"\x12", 0x30000)
+    assert lines[0] == ":020000040003F7"
+    assert lines[1].startswith(":01000000")
+
+
+def test_srec_checksums():
+    lines = _encode(SRecordEncoder, b"\xaa" * 20 + b"\xff" * 16, 0xFFF8)
+    assert lines[0].startswith("S0")
+    assert lines[1].startswith("S1")
+    assert lines[2].startswith("S2")
+    assert lines[-1].startswith("S8")
+    for line in lines:
+        body = bytes.fromhex(line[2:])
+        assert body[0] == len(body) - 1
+        assert sum(body) & 0xFF == 0xFF
+
+
+def test_format_lookup():
+    assert format_from_filename("dump.IHX") == "hex"
+    assert format_from_filename("dump.s19") == "srec"
+    try:
+        get_encoder("elf", io.BytesIO())
+    except ValueError:
+        pass
+    else:
+        assert False
+
+
+def test_hex_and_srec_load_into_segments():
+    data = bytes(range(40)) + b"\xff" * 32 + bytes(range(10))
+    for cls, fmt in ((IntelHexEncoder, "hex"), (SRecordEncoder, "srec")):
+        segments = read_segments(_encode(cls, data, 0xFFF0), fmt)
+        # the erased records are gaps in the segment map
+        assert segments == [(0xFFF0, data[:48]), (0xFFF0 + 64, data[64:])]
+
+
+def test_segment_pages_fill_partial_pages():
+    pages = segment_pages([(0x7E, b"\x01\x02\x03"), (0x200, b"\x04")], 128)
+    assert sorted(pages) == [0, 0x80, 0x200]
+    assert pages[0][-2:] == b"\x01\x02" and pages[0x80][:2] == b"\x03\xff"
+
+
+def test_bad_records_are_rejected():
+    for lines in ([":0100000000FE"], [":0100000000FF", ":0100000001FE"]):
+        try:
+            read_segments(lines)
+        except FirmwareFileError:
+            pass
+        else:
+            assert False
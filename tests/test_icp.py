@@ -0,0 +1,101 @@
+import io
+
+from fake_icp import FakeICP
+from nuvoprogpy.nuvo51icpy.nuvo51icpy import Nuvo51ICP
+from nuvoprogpy.progress import JSONLinesRenderer, TTYRenderer
+
+
+def make_icp(icp):
+    nuvo = Nuvo51ICP(silent=True, library=icp, progress="none")
+    nuvo.init()
+    icp.calls.clear()
+    return nuvo
+
+
+def test_read_ranges_merges_nearby_ranges():
+    icp = FakeICP()
+    icp.flash[:0x400] = bytes(i & 0xFF for i in range(0x400))
+    nuvo = make_icp(icp)
+    ranges = [(0x300, 4), (0x10, 8), (0x14, 8), (0x200, 0), (0x20, 2), (0x40, 3)]
+    results = nuvo.read_ranges(ranges)
+    # results come back in the caller's order, overlapping ranges see the same bytes
+    assert [bytes(r) for r in results] == [bytes(icp.flash[a:a + n]) for a, n in ranges]
+    # 0x10-0x1C and 0x20 are less than READ_MERGE_GAP apart, 0x40 and 0x300 are not; the empty range isn't read
+    assert icp.calls == [("read", 0x10, 0x12), ("read", 0x40, 3), ("read", 0x300, 4)]
+    assert nuvo.read_ranges([(0x40, 3), (0x10, 2)], max_gap=0x100)[0] == icp.flash[0x40:0x43]
+    assert icp.calls[-1] == ("read", 0x10, 0x33)
+
+
+def test_transfers_are_only_split_for_progress_consumers():
+    icp = FakeICP()
+    nuvo = Nuvo51ICP(silent=True, library=icp, progress=TTYRenderer(io.StringIO()))
+    nuvo.init()
+    icp.calls.clear()
+    nuvo.read_flash(0, 0x1000)
+    nuvo.write_flash(0, b"\x00" * 0x1000)
+    assert icp.calls == [("read", 0, 0x1000), ("write", 0, 0x1000)]
+    nuvo.progress.renderer = JSONLinesRenderer(io.StringIO())
+    icp.calls.clear()
+    nuvo.read_flash(0, 0x1000)
+    assert len(icp.calls) == 0x1000 // nuvo.PROGRESS_CHUNK_SIZE
+
+
+class JitterICP(FakeICP):
+    """
+    Writes to the pages in `glitches` report 400us of jitter and leave bit 4 of their first byte set, once or on
+    every write ("stuck")
+    """
+
+    def __init__(self, glitches):
+        super().__init__()
+        self.glitches = dict(glitches)
+        self.realtime = []
+        self.jitter = 0
+
+    def set_realtime(self, enable, cpu=-1):
+        self.realtime.append((enable, cpu))
+        return True
+
+    def reset_jitter(self):
+        self.jitter = 0
+        return True
+
+    def get_max_jitter(self):
+        return self.jitter
+
+    def write_flash(self, addr, data):
+        mode = self.glitches.get(addr)
+        if mode is not None:
+            self.jitter = 400
+            data = bytes([data[0] | 0x10]) + bytes(data[1:])
+            if mode == "once":
+                del self.glitches[addr]
+        return super().write_flash(addr, data)
+
+
+def make_realtime_icp(glitches):
+    icp = JitterICP(glitches)
+    nuvo = Nuvo51ICP(silent=True, library=icp, progress="none", realtime=3)
+    nuvo.init()
+    icp.calls.clear()
+    return icp, nuvo
+
+
+def test_realtime_write_splits_pages_and_repairs_jitter_hits():
+    icp, nuvo = make_realtime_icp({0x200: "once"})
+    data = bytes(0x100)
+    assert nuvo.write_flash(0x1F0, data)
+    writes = [call for call in icp.calls if call[0] == "write"]
+    # the first page is partial; the glitched page is read back, erased and rewritten
+    assert writes == [("write", 0x1F0, 0x10), ("write", 0x200, 0x80), ("write", 0x200, 0x80), ("write", 0x280, 0x70)]
+    assert ("page_erase", 0x200) in icp.calls and icp.flash[0x1F0:0x2F0] == data
+    assert nuvo.jitter_reverified == 1
+    nuvo.close()
+    assert icp.realtime == [(True, 3), (False, -1)]
+
+
+def test_realtime_write_fails_when_a_jitter_hit_cannot_be_repaired():
+    icp, nuvo = make_realtime_icp({0x200: "stuck"})
+    assert not nuvo.write_flash(0x200, bytes(0x100))
+    # the next page is never written
+    assert not any(call[0] == "write" and call[1] == 0x280 for call in icp.calls)
@@ -0,0 +1,33 @@
+import hashlib
+
+from nuvoprogpy.image import SparseImage
+from nuvoprogpy.verify import compare
+
+
+def test_virtual_padding_and_concatenation():
+    aprom = b"\x01\x02\x03"
+    image = SparseImage.wrap(aprom).padded(8) + b"\xaa\xbb"
+    assert len(image) == 10 and image.populated == 5
+    assert image.tobytes() == aprom + b"\xff" * 5 + b"\xaa\xbb"
+    assert image[2:5] == b"\x03\xff\xff" and image[8] == 0xAA
+    assert image.truncated(4).tobytes() == aprom + b"\xff"
+    assert image.hexdigest() == hashlib.sha256(image.tobytes()).hexdigest()
+
+
+def test_content_equality_ignores_segmentation():
+    a = SparseImage.from_segments([(0, b"ab"), (4, b"\xff\xffc")], size=8)
+    b = SparseImage.from_segments([(0, b"a"), (1, b"b"), (6, b"c")], size=8)
+    assert a == b and a == b.tobytes()
+    assert a != SparseImage.from_segments([(0, b"ab")], size=8)
+    assert a.pages(4) == {0: b"ab\xff\xff", 4: b"\xff\xffc\xff"}
+
+
+def test_compare_checks_gaps_against_fill():
+    image = SparseImage.from_segments([(0, b"\x00" * 4), (100, b"\x11" * 4)], size=128)
+    flash = bytearray(image.tobytes())
+    assert compare(image, flash)
+    flash[50] = 0
+    flash[101] = 0
+    result = compare(image, flash, addr=0x100, page_size=64)
+    assert result.ranges == [(0x100 + 50, 0x100 + 51), (0x100 + 101, 0x100 + 102)]
+    assert result.pages == [0x100, 0x140]
@@ -0,0 +1,58 @@
+import random
+
+import pytest
+
+from nuvoprogpy import imagetools
+from nuvoprogpy.image import SparseImage
+
+
+def _image(size=0x10000):
+    rng = random.Random(1)
+    data = bytearray(b"\xff" * size)
+    data[:size // 2] = bytes(rng.randrange(256) for _ in range(size // 2))
+    return bytes(data)
+
+
+def test_backends_agree():
+    pytest.importorskip("numpy")
+    data = _image()
+    other = bytearray(data)
+    other[0x1234] ^= 1
+    other[0x8000:0x8003] = b"\x00\x00\x00"
+    other = bytes(other)
+    assert imagetools._checksum16_numpy(data) == imagetools._checksum16_python(data) == sum(data) & 0xFFFF
+    assert imagetools._page_sums_numpy(data, 128, 0xFF) == imagetools._page_sums_python(data, 128, 0xFF)
+    assert imagetools._blank_pages_numpy(data, 128, 0xFF) == imagetools._blank_pages_python(data, 128, 0xFF)
+    assert imagetools._page_diff_numpy(data, other, 128) == imagetools._page_diff_python(data, other, 128) == \
+        [0x1200, 0x8000]
+    assert imagetools._diff_ranges_numpy(data, other) == imagetools._diff_ranges_python(data, other) == \
+        [(0x1234, 0x1235), (0x8000, 0x8003)]
+
+
+def test_page_maps_pad_the_last_page():
+    data = b"\x01\x02" + b"\xff" * 6 + b"\x03"
+    assert imagetools.page_sums(data, 4) == [0x1FE + 3, 0x3FC, 3 + 0xFF * 3]
+    assert imagetools.blank_pages(data, 4) == [False, True, False]
+    assert imagetools.page_diff(data, data[:5], 4) == [4, 8]
+    sparse = SparseImage.from_segments([(4, b"\xff\xff"), (9, b"\x00")], size=16)
+    assert imagetools.blank_pages(sparse, 4) == [True, True, False, True]
+
+
+def test_drop_blank_pages():
+    data = b"\x00" * 8 + b"\xff" * 16 + b"\x11" * 3 + b"\xff" * 5
+    image = imagetools.drop_blank_pages(data, 8)
+    assert [(addr, bytes(segment)) for addr, segment in image.segments] == [(0, b"\x00" * 8), (24, data[24:])]
+    assert image == data and len(image) == len(data)
+
+
+
+def test_small_inputs_skip_numpy(monkeypatch):
+    def fail(*args):
+        raise AssertionError("numpy path used below NUMPY_MIN_SIZE")
+    for name in ("_checksum16_numpy", "_page_sums_numpy", "_blank_pages_numpy", "_page_diff_numpy", "_diff_ranges_numpy"):
+        monkeypatch.setattr(imagetools, name, fail)
+    data, other = b"\x00" * 256, b"\x00" * 255 + b"\x01"
+    assert imagetools.checksum16(data) == 0 and imagetools.page_sums(data, 128) == [0, 0]
+    assert imagetools.blank_pages(data, 128) == [False, False]
+    assert imagetools.page_diff(data, other, 128) == [128]
+    assert imagetools.diff_ranges(data, other) == [(255, 256)]
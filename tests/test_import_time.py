@@ -0,0 +1,49 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Seconds allowed for importing a CLI module in a fresh interpreter; the timing check only runs when this is set,
+# since wall-clock budgets are flaky on loaded CI machines (e.g. NUVOPROG_IMPORT_BUDGET=0.25)
+IMPORT_BUDGET = os.environ.get("NUVOPROG_IMPORT_BUDGET")
+ROOT = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..")
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+import nuvoprogpy.PartNumID, nuvoprogpy.config
+print(json.dumps({{
+    "elapsed": elapsed,
+    "modules": [m for m in ("zmq", "curses", "serial", "numpy", "nuvoprogpy.Flash") if m in sys.modules],
+    "partnum_built": nuvoprogpy.PartNumID._part_num_ids is not None,
+    "flash_built": nuvoprogpy.config._flash_8051 is not None,
+}}))
+"""
+
+
+def _probe(module, runs):
+    # best of `runs`, so a cold page cache doesn't fail a timing run
+    results = []
+    for _ in range(runs):
+        out = subprocess.check_output([sys.executable, "-c", PROBE.format(module=module)], cwd=ROOT)
+        results.append(json.loads(out))
+    return min(results, key=lambda r: r["elapsed"])
+
+
+@pytest.mark.parametrize("module", ["nuvoprogpy.nuvoispy", "nuvoprogpy.nuvo51icpy"])
+def test_cli_import_is_lazy(module):
+    result = _probe(module, 1)
+    assert result["modules"] == []
+    assert not result["partnum_built"]
+    assert not result["flash_built"]
+
+
+@pytest.mark.skipif(IMPORT_BUDGET is None, reason="NUVOPROG_IMPORT_BUDGET not set")
+@pytest.mark.parametrize("module", ["nuvoprogpy.nuvoispy", "nuvoprogpy.nuvo51icpy"])
+def test_cli_import_budget(module):
+    result = _probe(module, 3)
+    assert result["elapsed"] < float(IMPORT_BUDGET), "importing %s took %.3fs" % (module, result["elapsed"])
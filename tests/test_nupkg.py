@@ -0,0 +1,37 @@
+import mmap
+
+import pytest
+
+from nuvoprogpy.config import ConfigFlags, DeviceInfo
+from nuvoprogpy.image import SparseImage
+from nuvoprogpy.nupkg import NuPackage, NuPackageError, build_package
+
+N76E003 = 0x3650
+
+
+def test_package_round_trip(tmp_path):
+    aprom = SparseImage.from_segments([(0, bytes(range(200))), (0x1000, b"\x12\x34")])
+    config = ConfigFlags.from_bytes(bytes([0xFF, 0xFF, 0xFF, 0xFF, 0xFF]), N76E003)
+    path = tmp_path / "job.nupkg"
+    path.write_bytes(build_package(N76E003, aprom, config=config))
+    with NuPackage.open(str(path)) as package:
+        layout = DeviceInfo(N76E003).get_layout(config)
+        assert package.aprom == aprom.padded(layout.aprom_size) and len(package.ldrom) == 0
+        # the images are views into the mapped file, not copies
+        assert isinstance(package.aprom.segments[0][1].obj, mmap.mmap)
+        assert package.get_config().to_bytes() == config.to_bytes()
+        assert len(package.page_crcs("aprom")) == layout.aprom_size // 128
+        package.check_device(DeviceInfo(N76E003))
+        with pytest.raises(NuPackageError):
+            package.check_device(DeviceInfo(0x3640))
+
+
+def test_corrupt_package_names_the_damaged_page(tmp_path):
+    data = bytearray(build_package(N76E003, b"\x00" * 1000))
+    data[128 + 900] ^= 1  # the APROM section starts right after the header and index
+    path = tmp_path / "bad.nupkg"
+    path.write_bytes(bytes(data))
+    with pytest.raises(NuPackageError, match="APROM page 7"):
+        NuPackage.open(str(path))
+    with pytest.raises(NuPackageError, match="needs a config"):
+        build_package(N76E003, b"\x00", b"\x00")
@@ -0,0 +1,26 @@
+from nuvoprogpy.PartNumID import ChipType, PartNumIDs, lookup_name_and_type
+from nuvoprogpy.config import get_flash_info
+
+
+def test_exact_and_did_lookup():
+    assert lookup_name_and_type(0x3650) == ["N76E003", ChipType.N76E003]
+    # unknown PID with a known DID falls back to the DID entry
+    assert lookup_name_and_type(0x12343650) == ["N76E003", ChipType.N76E003]
+
+
+def test_unknown_variant_uses_first_matching_type():
+    # 0x0001 only exists combined with a PID, shared by several chip types
+    did = 0x0001
+    assert did not in PartNumIDs
+    first = next(key for key in PartNumIDs if key & 0xFFFF == did)
+    name, chip_type = lookup_name_and_type(0xAB000000 | did)
+    assert chip_type == PartNumIDs[first][1]
+    assert name == chip_type.name + "_UNKNOWN"
+
+
+def test_not_found():
+    assert lookup_name_and_type(0x0000BEEF) == ("UNKNOWN", ChipType.UNKNOWN)
+
+
+def test_flash_info_memoized():
+    assert get_flash_info(0x3650) is get_flash_info(0x3650)
@@ -0,0 +1,36 @@
+import hashlib
+import json
+
+import pytest
+
+from nuvoprogpy.pipeline import DumpWriter, ImageLoader, dump_to_file
+
+
+def test_dump_to_file_writes_and_hashes(tmp_path):
+    chunks = [bytes([i]) * 56 for i in range(40)]
+    path = str(tmp_path / "dump.bin")
+    digest = dump_to_file(iter(chunks), path, queue_depth=2)
+    with open(path, "rb") as f:
+        assert f.read() == b"".join(chunks)
+    assert digest == hashlib.sha256(b"".join(chunks)).hexdigest()
+
+
+def test_dump_writer_keeps_the_original_error(tmp_path):
+    def chunks():
+        yield b"\x00" * 16
+        raise TimeoutError("Device unresponsive, aborting!")
+
+    with pytest.raises(TimeoutError):
+        dump_to_file(chunks(), str(tmp_path / "dump.bin"))
+
+
+def test_image_loader(tmp_path):
+    aprom, config = tmp_path / "aprom.bin", tmp_path / "config.json"
+    aprom.write_bytes(b"\x02\x00\x03" * 1000)
+    config.write_text(json.dumps({"lock": False}))
+    images = ImageLoader(str(aprom), None, str(config)).result()
+    assert images.aprom == b"\x02\x00\x03" * 1000 and images.ldrom is None
+    assert images.config_json == {"lock": False}
+    assert images.digests[str(aprom)] == hashlib.sha256(images.aprom).hexdigest()
+    with pytest.raises(OSError):
+        ImageLoader(str(tmp_path / "missing.bin")).result()
@@ -0,0 +1,103 @@
+from nuvoprogpy.config import ConfigFlags, DeviceInfo
+from nuvoprogpy.plan import (ICPTransport, ISPTransport, PlanOp, build_icp_plan, build_isp_plan, build_isp_region_plan,
+                             build_page_plan, erased_config)
+
+
+def test_icp_plan_ops_and_estimate():
+    devinfo = DeviceInfo(0x3650, 0)
+    current = erased_config(devinfo)
+    config = ConfigFlags.from_bytes(bytes([0x7F, 0xFC, 0xFF, 0xFF, 0xFF]), 0x3650)
+    plan = build_icp_plan(devinfo, current, config, bytes(1000), bytes(1024), allow_mass_erase=False)
+    kinds = [(op.kind, op.region) for op in plan]
+    assert kinds == [
+        (PlanOp.PAGE_ERASE, "APROM"), (PlanOp.WRITE, "APROM"),
+        (PlanOp.PAGE_ERASE, "LDROM"), (PlanOp.WRITE, "LDROM"),
+        (PlanOp.CONFIG, "CONFIG"),
+        (PlanOp.VERIFY, "APROM"), (PlanOp.VERIFY, "LDROM"), (PlanOp.VERIFY, "CONFIG"),
+    ]
+    # APROM is padded to fill the space the config leaves it
+    assert plan.bytes_written == devinfo.flash_size
+    assert plan.pages_erased == devinfo.flash_size // devinfo.page_size
+    assert plan.estimate(ICPTransport(bit_us=0)) > plan.pages_erased * sum(devinfo.page_erase_times) / 1e6
+
+
+def test_data_is_verified_before_a_locking_config():
+    devinfo = DeviceInfo(0x3650, 0)
+    config = ConfigFlags.from_bytes(bytes([0x7D, 0xFF, 0xFF, 0xFF, 0xFF]), 0x3650)
+    assert config.is_locked()
+    plan = build_icp_plan(devinfo, erased_config(devinfo), config, bytes(1000), bytes(), allow_mass_erase=False)
+    assert [(op.kind, op.region) for op in plan] == [
+        (PlanOp.PAGE_ERASE, "APROM"), (PlanOp.WRITE, "APROM"), (PlanOp.VERIFY, "APROM"),
+        (PlanOp.CONFIG, "CONFIG"), (PlanOp.VERIFY, "CONFIG"),
+    ]
+    plan = build_page_plan(devinfo, devinfo.get_layout(config), {0: bytes(128)}, config, erased_config(devinfo))
+    assert [op.kind for op in plan] == [PlanOp.PAGE_ERASE, PlanOp.WRITE, PlanOp.VERIFY, PlanOp.CONFIG, PlanOp.VERIFY]
+
+
+def test_locked_plan_mass_erases_and_skips_unchanged_config():
+    devinfo = DeviceInfo(0x3650, 0)
+    config = erased_config(devinfo)
+    plan = build_icp_plan(devinfo, None, config, bytes(100), bytes(), locked=True, verify=False)
+    assert [op.kind for op in plan] == [PlanOp.MASS_ERASE, PlanOp.WRITE]
+
+
+def test_erase_strategy_by_cost():
+    devinfo = DeviceInfo(0x3650, 0)
+    current = erased_config(devinfo)
+    config = ConfigFlags.from_bytes(bytes([0x7F, 0xFC, 0xFF, 0xFF, 0xFF]), 0x3650)
+    # full reflash: one mass erase plus a config write beats 144 page erases
+    plan = build_icp_plan(devinfo, current, config, bytes(1000), bytes(1024), verify=False)
+    assert [op.kind for op in plan] == [PlanOp.MASS_ERASE, PlanOp.WRITE, PlanOp.WRITE, PlanOp.CONFIG]
+    assert not plan.ops[-1].erase and plan.erase_strategy.startswith("mass erase")
+    # the LDROM is kept, so only the APROM pages can be erased
+    plan = build_icp_plan(devinfo, config, config, bytes(1000), bytes(), verify=False)
+    assert [op.kind for op in plan] == [PlanOp.PAGE_ERASE, PlanOp.WRITE]
+    assert "LDROM is not being written" in plan.erase_strategy
+
+
+def test_data_flash_is_never_mass_erased():
+    devinfo = DeviceInfo(0x2140, 0)  # N76E884: 8 KB APROM, 10 KB data flash
+    config = erased_config(devinfo)
+    assert devinfo.get_layout(config).dataflash_size > 0
+    plan = build_icp_plan(devinfo, config, config, bytes(1000), bytes(), verify=False)
+    assert not plan.mass_erase and "data flash would be erased" in plan.erase_strategy
+
+
+def test_isp_region_plan_only_erases_covered_pages():
+    devinfo = DeviceInfo(0x3650, 0)
+    plan = build_isp_region_plan(devinfo, erased_config(devinfo), "APROM", 0x1200, bytes(0x880))
+    assert [op.kind for op in plan] == [PlanOp.PAGE_ERASE, PlanOp.WRITE, PlanOp.VERIFY]
+    assert list(plan.ops[0].pages) == list(range(0x1200, 0x1A80, devinfo.page_size))
+
+
+def test_isp_plan_verifies_what_was_written():
+    devinfo = DeviceInfo(0x3650, 0)
+    plan = build_isp_plan(devinfo, erased_config(devinfo), bytes(0x3800))
+    verify = [op for op in plan if op.kind == PlanOp.VERIFY and op.region == "FLASH"]
+    assert [(op.addr, op.length) for op in verify] == [(devinfo.aprom_addr, 0x3800)]
+
+
+def test_isp_stream_read_estimate():
+    devinfo = DeviceInfo(0x3650, 0)
+    assert ISPTransport().read(devinfo, 56) == ISPTransport(stream_window=16).read(devinfo, 56)
+    assert ISPTransport(stream_window=16).read(devinfo, devinfo.flash_size) < ISPTransport().read(devinfo, devinfo.flash_size) / 1.5
+
+
+def test_isp_pipelined_write_estimate():
+    devinfo = DeviceInfo(0x3650, 0)
+    plain, pipelined = ISPTransport().write(devinfo, 0x4000), ISPTransport(pipelined=True).write(devinfo, 0x4000)
+    assert pipelined < plain and pipelined >= plain / 2
+
+
+def test_page_plan_only_erases_populated_pages():
+    devinfo = DeviceInfo(0x3650, 0)
+    config = ConfigFlags.from_bytes(bytes([0x7F, 0xFC, 0xFF, 0xFF, 0xFF]), 0x3650)
+    layout = devinfo.get_layout(config)
+    pages = {0: bytes(128), 128: bytes(128), 0x1000: bytes(128), layout.ldrom_addr: bytes(128)}
+    plan = build_page_plan(devinfo, layout, pages, config, config)
+    assert [(op.kind, op.region, op.addr) for op in plan if op.kind != PlanOp.VERIFY] == [
+        (PlanOp.PAGE_ERASE, "APROM", 0), (PlanOp.WRITE, "APROM", 0),
+        (PlanOp.PAGE_ERASE, "APROM", 0x1000), (PlanOp.WRITE, "APROM", 0x1000),
+        (PlanOp.PAGE_ERASE, "LDROM", layout.ldrom_addr), (PlanOp.WRITE, "LDROM", layout.ldrom_addr),
+    ]
+    assert plan.pages_erased == 4 and plan.bytes_written == 512 and not plan.mass_erase
@@ -0,0 +1,59 @@
+import os
+
+from nuvoprogpy.config import ConfigFlags, DeviceInfo
+from nuvoprogpy.fileformats import get_encoder
+from nuvoprogpy.prepcache import PreparedImageCache
+
+N76E003 = DeviceInfo(0x3650)
+ERASED = bytes([0xFF] * 5)
+
+
+def test_identical_images_share_one_entry(tmp_path):
+    a, b = tmp_path / "a.bin", tmp_path / "b.bin"
+    a.write_bytes(b"\x01" * 1000)
+    b.write_bytes(b"\x01" * 1000)
+    cache = PreparedImageCache()
+    first = cache.prepare(N76E003, str(a), pad_config_bytes=ERASED)
+    assert cache.prepare(N76E003, str(b), pad_config_bytes=ERASED) is first
+    assert cache.prepare(N76E003, b"\x01" * 1000, pad_config_bytes=ERASED) is first
+    layout = N76E003.get_layout(ConfigFlags.from_bytes(ERASED, N76E003.device_id))
+    assert len(first.aprom) == layout.aprom_size and len(first.page_crcs["aprom"]) == layout.aprom_size // 128
+    assert cache.stats()["images"] == 1 and cache.hits == 2
+
+
+def test_changed_file_is_reloaded(tmp_path):
+    path = tmp_path / "a.bin"
+    path.write_bytes(b"\x01" * 1000)
+    cache = PreparedImageCache()
+    first = cache.prepare(N76E003, str(path))
+    path.write_bytes(b"\x02" * 1000)
+    os.utime(path, ns=(0, 0))
+    second = cache.prepare(N76E003, str(path))
+    assert second is not first and second.aprom == b"\x02" * 1000
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = PreparedImageCache(max_bytes=12000)
+    images = [bytes([i]) * 5000 for i in range(3)]
+    first = cache.prepare(N76E003, images[0])
+    cache.prepare(N76E003, images[1])
+    assert cache.prepare(N76E003, images[0]) is first
+    cache.prepare(N76E003, images[2])
+    assert cache.evictions == 1 and cache.size <= 12000
+    assert cache.prepare(N76E003, images[0]) is first
+
+
+def test_images_loaded_without_prepare_are_evicted(tmp_path):
+    # the daemon programs HEX and S-record images straight from load()
+    cache = PreparedImageCache(max_bytes=4096)
+    for i in range(50):
+        path = tmp_path / ("unit%d.hex" % i)
+        with open(path, "wb") as f:
+            encoder = get_encoder("hex", f)
+            encoder.write(bytes([i]) * 2048)
+            encoder.close()
+        digest, image = cache.load(str(path))
+        assert image.tobytes() == bytes([i]) * 2048
+    assert cache.size <= 4096 and cache.stats()["images"] == 2
+    # the most recently loaded image is still cached
+    assert cache.load(str(path))[0] == digest
@@ -0,0 +1,47 @@
+import io
+import json
+
+from nuvoprogpy.progress import ProgressReporter, JSONLinesRenderer
+
+
+def test_rate_limited_updates():
+    events = []
+    reporter = ProgressReporter(events.append, min_interval=60)
+    for done in range(0, 18 * 1024, 56):
+        reporter.update("Programming Rom", done, 18 * 1024)
+    reporter.update("Programming Rom", 18 * 1024, 18 * 1024)
+    # start and finish only, everything in between is throttled
+    assert [e.done for e in events] == [0, 18 * 1024]
+    assert events[-1].finished
+
+
+def test_silent_reporter_is_disabled():
+    reporter = ProgressReporter(silent=True)
+    assert not reporter.enabled
+    reporter.update("Dumping...", 10, 100)
+
+
+def test_json_lines():
+    stream = io.StringIO()
+    reporter = ProgressReporter(JSONLinesRenderer(stream), min_interval=0)
+    reporter.update("Dumping...", 0, 100)
+    reporter.update("Dumping...", 50, 100)
+    reporter.update("Dumping...", 100, 100)
+    lines = [json.loads(l) for l in stream.getvalue().splitlines()]
+    assert [l["done"] for l in lines] == [0, 50, 100]
+    assert lines[-1]["event"] == "done"
+    assert lines[0]["phase"] == "Dumping..."
+
+
+def test_json_lines_take_log_messages():
+    stream = io.StringIO()
+    reporter = ProgressReporter(JSONLinesRenderer(stream))
+    assert reporter.log("Erasing flash...")
+    assert reporter.split_transfers
+    assert json.loads(stream.getvalue()) == {"event": "log", "text": "Erasing flash..."}
+
+
+def test_tty_does_not_split_transfers():
+    reporter = ProgressReporter("tty")
+    assert not reporter.split_transfers
+    assert not reporter.log("Erasing flash...")
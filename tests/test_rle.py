@@ -0,0 +1,22 @@
+from nuvoprogpy.nuvoispy.rle import pages_spanned, rle_decode, rle_packets
+
+
+def test_rle_round_trip():
+    image = bytes(range(200)) + b"\xff" * 3000 + b"\x01\xff\xff\xff\x02" * 40 + b"\xff" * 0x9000 + b"\x5a"
+    packets = list(rle_packets(image))
+    assert len(packets[0][0]) == 48 and all(len(payload) == 56 for payload, _ in packets[1:])
+    assert b"".join(rle_decode(payload) for payload, _ in packets) == image
+    assert [len(rle_decode(payload)) for payload, _ in packets] == [covered for _, covered in packets]
+    assert len(packets) < len(image) // 56
+
+
+def test_packet_page_span():
+    image = bytes(100) + b"\xff" * 0x9000 + bytes(100)
+    spans = []
+    done = 0
+    for _, covered in rle_packets(image):
+        spans.append(pages_spanned(0x80 + done, covered, 128))
+        done += covered
+    # a single run token covers up to 0x7FFF bytes, so the device erases hundreds of pages before it ACKs
+    assert max(spans) > 0x7FFF // 128 and sum(spans) >= len(image) // 128
+    assert pages_spanned(0x7F, 2, 128) == 2 and pages_spanned(0x80, 128, 128) == 1 and pages_spanned(0, 0, 128) == 0
@@ -0,0 +1,56 @@
+from nuvoprogpy.serialize import PatchTemplate, Serializer
+
+
+def test_template_formats():
+    assert PatchTemplate({"address": 0, "length": 4, "start": 0x1234}).render(1, None) == bytes([0x35, 0x12, 0, 0])
+    mac = PatchTemplate({"address": 0, "length": 6, "format": "be", "prefix": "0242AC", "start": 1})
+    assert mac.render(2, None) == bytes.fromhex("0242AC000003")
+    assert PatchTemplate({"address": 0, "length": 6, "format": "ascii", "start": 42}).render(0, None) == b"000042"
+    uid = PatchTemplate({"address": 0, "length": 4, "format": "hex", "source": "uid"})
+    assert uid.render(0, bytes([0x00, 0xAB, 0xCD])) == b"ABCD"
+
+
+def test_variant_pages_and_overlay():
+    serializer = Serializer([{"address": "0x7E", "length": 4, "format": "be", "start": 0x11223344}])
+    variant = serializer.next_variant()
+    base = bytes(range(0x80))
+    pages = variant.pages(base, "aprom", 0x80)
+    assert sorted(pages) == [0x00, 0x80]
+    assert pages[0x00][0x7E:] == b"\x11\x22" and pages[0x00][:0x7E] == base[:0x7E]
+    assert pages[0x80][:2] == b"\x33\x44" and pages[0x80][2:] == b"\xff" * 0x7E
+    image = variant.overlay(base)
+    assert image[0x7C:] == base[0x7C:0x7E] + b"\x11\x22\x33\x44"
+    # the base is referenced, not copied
+    assert image.segments[0][1].obj is base
+    serializer.commit()
+    assert serializer.next_variant().counter == 1
+    serializer.close()
+
+
+def test_icp_station_patches_before_locking(tmp_path):
+    from fake_icp import FakeICP
+    from nuvoprogpy.batch import BatchManifest, ICPStation
+    from nuvoprogpy.config import ConfigFlags
+    from nuvoprogpy.nuvo51icpy.nuvo51icpy import Nuvo51ICP
+
+    device_id = 0x4832  # has SPROM
+    config = ConfigFlags.from_bytes(bytes([0xFF] * 5), device_id)
+    config.set_lock(True)
+    config.to_json_file(str(tmp_path / "config.json"))
+    (tmp_path / "aprom.bin").write_bytes(bytes(range(256)))
+    manifest = BatchManifest({"aprom": "aprom.bin", "config": "config.json"}, str(tmp_path))
+    serializer = Serializer([{"address": "0x10", "length": 2, "format": "be", "start": 0x0102},
+                             {"region": "sprom", "address": 0, "length": 2, "format": "be", "start": 0x0304}])
+    variant = serializer.next_variant()
+    serializer.close()
+
+    icp = FakeICP(device_id)
+    nuvo = Nuvo51ICP(silent=True, library=icp, progress="none")
+    nuvo.init()
+    # FakeICP fails the test on any write after the locking config
+    assert ICPStation(nuvo).program(manifest, manifest.aprom_data, manifest.ldrom_data, variant)
+    sprom_addr = nuvo.get_device_info().sprom_addr
+    assert icp.locked and icp.flash[0x10:0x12] == b"\x01\x02" and icp.flash[sprom_addr:sprom_addr + 2] == b"\x03\x04"
+    assert icp.flash[:0x10] == bytes(range(0x10)) and icp.flash[0x12:0x100] == bytes(range(0x12, 0x100))
+    # the image is written once, with the patches laid over it
+    assert sum(call[2] for call in icp.calls if call[0] == "write" and call[1] < 0x100) == 0x100
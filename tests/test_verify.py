@@ -0,0 +1,39 @@
+from nuvoprogpy.imagetools import _diff_ranges_python
+from nuvoprogpy.verify import compare, repair
+
+
+def test_compare_reports_ranges_and_pages():
+    expected = bytes(range(256)) * 64
+    actual = bytearray(expected)
+    actual[0x10:0x13] = b"\x00\x00\x00"
+    actual[0x3FFF] ^= 0xFF
+    assert compare(expected, expected, 0x100)
+    result = compare(expected, bytes(actual), 0x100)
+    assert not result
+    assert result.ranges == [(0x110, 0x113), (0x40FF, 0x4100)]
+    assert result.byte_errors == 4 and result.pages == [0x100, 0x4080]
+    assert _diff_ranges_python(memoryview(expected), memoryview(actual)) == [(0x10, 0x13), (0x3FFF, 0x4000)]
+
+
+def test_compare_short_read():
+    result = compare(b"\xff" * 300, b"\xff" * 250 + b"\x00" * 10)
+    assert result.ranges == [(250, 300)] and result.pages == [128, 256]
+
+
+def test_repair_rewrites_only_failed_pages():
+    flash = bytearray(b"\xaa" * 0x400)
+    data = bytes(range(200)) * 2
+    flash[0x50:0x50 + len(data)] = data
+    flash[0x100] ^= 0xFF
+    written = []
+
+    def program_pages(pages):
+        written.extend(pages)
+        for page, contents in pages.items():
+            flash[page:page + len(contents)] = contents
+        return True
+
+    read = lambda addr, length: bytes(flash[addr:addr + length])
+    result = repair(compare(data, read(0x50, len(data)), 0x50), data, 0x50, 128, read, program_pages, retries=2)
+    assert result and written == [0x100]
+    assert flash[:0x50] == b"\xaa" * 0x50 and flash[0x50:0x50 + len(data)] == data